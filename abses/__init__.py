@@ -21,8 +21,10 @@ __all__ = [
     "BaseNature",
     "PatchModule",
     "Actor",
+    "SlotActor",
     "ActorsList",
     "PatchCell",
+    "SlotPatchCell",
     "perception",
     "alive_required",
     "time_condition",
@@ -30,10 +32,13 @@ __all__ = [
     "load_data",
     "ABSESpyError",
     "raster_attribute",
+    "buffered",
 ]
 
 import warnings
+from importlib import import_module
 from importlib.metadata import PackageNotFoundError, version
+from typing import TYPE_CHECKING, Any, List
 
 try:
     __version__ = f"v{version('abses')}"
@@ -41,13 +46,51 @@ except PackageNotFoundError:
     __version__ = "v0.10.0-dev"
     warnings.warn(f"Package metadata not found, using fallback version {__version__}")
 
-from .agents.actor import Actor, alive_required, perception
-from .agents.sequences import ActorsList
-from .core.experiment import Experiment
-from .core.model import MainModel
-from .core.time_driver import time_condition
-from .human.human import BaseHuman
-from .space.cells import PatchCell, raster_attribute
-from .space.nature import BaseNature, PatchModule
-from .utils.data import load_data
-from .utils.errors import ABSESpyError
+# Public names are imported on first access (PEP 562), so that importing
+# `abses` does not load heavy dependencies, e.g. `Experiment` needs Hydra.
+_LAZY_IMPORTS = {
+    "Actor": ".agents.actor",
+    "SlotActor": ".agents.actor",
+    "alive_required": ".agents.actor",
+    "perception": ".agents.actor",
+    "ActorsList": ".agents.sequences",
+    "buffered": ".core.buffers",
+    "Experiment": ".core.experiment",
+    "MainModel": ".core.model",
+    "time_condition": ".core.time_driver",
+    "BaseHuman": ".human.human",
+    "PatchCell": ".space.cells",
+    "SlotPatchCell": ".space.cells",
+    "raster_attribute": ".space.cells",
+    "BaseNature": ".space.nature",
+    "PatchModule": ".space.nature",
+    "load_data": ".utils.data",
+    "ABSESpyError": ".utils.errors",
+}
+
+if TYPE_CHECKING:
+    from .agents.actor import Actor, SlotActor, alive_required, perception
+    from .agents.sequences import ActorsList
+    from .core.buffers import buffered
+    from .core.experiment import Experiment
+    from .core.model import MainModel
+    from .core.time_driver import time_condition
+    from .human.human import BaseHuman
+    from .space.cells import PatchCell, SlotPatchCell, raster_attribute
+    from .space.nature import BaseNature, PatchModule
+    from .utils.data import load_data
+    from .utils.errors import ABSESpyError
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module 'abses' has no attribute '{name}'") from None
+    value = getattr(import_module(module, __name__), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> List[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -12,13 +12,21 @@ This module contains classes and utilities for managing actors/agents
 in agent-based models.
 """
 
-from .actor import Actor, alive_required, perception
+from .actor import Actor, SlotActor, alive_required, perception
+from .collection import ActorCollection
 from .container import _CellAgentsContainer, _ModelAgentsContainer
+from .pool import ActorPool, ActorRef
+from .scheduler import BreedScheduler
 from .sequences import ActorsList
 
 __all__ = [
     "Actor",
+    "SlotActor",
     "ActorsList",
+    "ActorCollection",
+    "ActorPool",
+    "ActorRef",
+    "BreedScheduler",
     "alive_required",
     "perception",
     "_ModelAgentsContainer",
@@ -16,6 +16,7 @@ from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
+    FrozenSet,
     Optional,
     Sequence,
     cast,
@@ -23,16 +24,19 @@ from typing import (
 
 import mesa_geo as mg
 import numpy as np
+from pyproj import CRS
 from shapely import Point
 from shapely.geometry.base import BaseGeometry
 
 from abses.core.base import BaseModelElement
 from abses.core.protocols import ActorProtocol
-from abses.human.links import _LinkNodeActor
+from abses.core.slots import LazySlot
+from abses.human.links import _LinkNodeActor, _LinkProxy
 from abses.utils.errors import ABSESpyError
 
 if TYPE_CHECKING:
     from abses import MainModel
+    from abses.agents.pool import ActorRef
     from abses.core.types import GeoType, TargetName
     from abses.space.cells import PatchCell, Pos
     from abses.space.move import _Movements
@@ -185,6 +189,7 @@ class Actor(mg.GeoAgent, _LinkNodeActor, BaseModelElement, ActorProtocol):
         alive: Whether the actor is alive (not removed from the model).
         unique_id: Unique identifier automatically assigned by Mesa.
         crs: Coordinate reference system for the actor's geometry.
+        generation: How many times this object has been recycled.
 
     Example:
         ```python
@@ -198,6 +203,19 @@ class Actor(mg.GeoAgent, _LinkNodeActor, BaseModelElement, ActorProtocol):
         ```
     """
 
+    _generation: int = 0
+    # Attributes kept by a pool when the object is reused (see `_reuse`).
+    _kept_on_reuse: FrozenSet[str] = frozenset(
+        {
+            "_model",
+            "_name",
+            "_observers",
+            "_dynamic_variables",
+            "_updated_ticks",
+            "_generation",
+        }
+    )
+
     def __init__(self, model: MainModel, observer: bool = True, **kwargs) -> None:
         """Initialize an actor instance.
 
@@ -210,11 +228,11 @@ class Actor(mg.GeoAgent, _LinkNodeActor, BaseModelElement, ActorProtocol):
                 - geometry: Shapely geometry for the actor. Defaults to None.
         """
         BaseModelElement.__init__(self, model)
+        self._cell: Optional[PatchCell] = None
         crs = kwargs.pop("crs", model.nature.crs)
         geometry = kwargs.pop("geometry", None)
         mg.GeoAgent.__init__(self, model=model, geometry=geometry, crs=crs)
         _LinkNodeActor.__init__(self)
-        self._cell: Optional[PatchCell] = None
         self._alive: bool = True
         self._birth_tick: int = self.time.tick
         self._setup()
@@ -256,12 +274,64 @@ class Actor(mg.GeoAgent, _LinkNodeActor, BaseModelElement, ActorProtocol):
         if not isinstance(value, BaseGeometry) and value is not None:
             raise TypeError(f"{value} is not a valid geometry.")
         self._geometry = value
+        self.model.agents._touch(self)
 
     @property
     def alive(self) -> bool:
         """Whether the actor is alive."""
         return self._alive
 
+    @property
+    def generation(self) -> int:
+        """How many times this object has been recycled by an actor pool.
+
+        It changes when a pooled actor dies, so that references taken by
+        `ref()` become stale even if the object is reused for a new actor.
+        """
+        return self._generation
+
+    def ref(self) -> ActorRef:
+        """A reference to this actor, which becomes invalid once it dies.
+
+        Returns:
+            An `ActorRef`; `ref.get()` returns the actor while it is alive,
+            None after it died or was recycled as another actor.
+        """
+        from abses.agents.pool import ActorRef
+
+        return ActorRef(self)
+
+    def _reuse(self, model: MainModel, **kwargs) -> None:
+        """Start a new life of an actor recycled by a pool.
+
+        Instead of running `__init__` again, the model element's containers
+        are emptied in place and only the state of a life is reset: a fresh
+        `unique_id`, location, geometry and birth tick. The actor is then
+        registered again and `setup()` runs.
+
+        Parameters:
+            model: The model where the actor is born.
+            **kwargs: The `crs` and `geometry` of the actor, as in `__init__`.
+        """
+        self._observers.clear()
+        self._dynamic_variables.clear()
+        self._updated_ticks.clear()
+        crs = kwargs.pop("crs", model.nature.crs)
+        self._start_life(model, crs=crs, geometry=kwargs.pop("geometry", None))
+
+    def _start_life(
+        self, model: MainModel, crs: Any, geometry: Optional[BaseGeometry]
+    ) -> None:
+        """Reset the state of a life, register the actor and set it up."""
+        self.unique_id = next(self._ids[model])
+        self._cell = None
+        self._alive = True
+        self.crs = crs
+        self.geometry = geometry
+        self._birth_tick = self.time.tick
+        model.register_agent(self)
+        self._setup()
+
     @property
     def layer(self) -> Optional[PatchModule]:
         """Get the layer where the actor is located."""
@@ -286,11 +356,13 @@ class Actor(mg.GeoAgent, _LinkNodeActor, BaseModelElement, ActorProtocol):
             )
         self._cell = cell
         self.crs = cell.crs
+        self.model.agents._touch(self)
 
     @at.deleter
     def at(self) -> None:
         """Remove the agent from the located cell."""
         self._cell = None
+        self.model.agents._touch(self)
 
     @property
     def pos(self) -> Optional[Pos]:
@@ -371,6 +443,7 @@ class Actor(mg.GeoAgent, _LinkNodeActor, BaseModelElement, ActorProtocol):
             ABSESpyError: If the attribute is protected.
         """
         super().set(*args, **kwargs)
+        self.model.agents._touch(self)
 
     def remove(self) -> None:
         """Remove the actor from the model.
@@ -400,14 +473,27 @@ class Actor(mg.GeoAgent, _LinkNodeActor, BaseModelElement, ActorProtocol):
         2. Removing the actor from its spatial cell (if positioned)
         3. Removing the actor from the model's agent registry
         4. Setting the actor's alive status to False
+        5. Handing the actor to its breed's pool, if recycling is enabled
+
+        When removals are deferred (see `model.agents.deferred_removal()`),
+        the actor is only taken off its cell and marked as dead here; steps
+        1, 3 and 5 happen in bulk when the deferred block ends.
 
         After calling this method, the actor should no longer be used.
         """
+        agents = self.model.agents
+        if agents.is_deferring:
+            if self.on_earth:
+                self.move.off()
+            self._alive = False
+            agents._defer(self)
+            return
         self.link.clean()  # 从链接中移除
         if self.on_earth:  # 如果在地上，那么从地块上移除
             self.move.off()
         super().remove()  # 从总模型里移除
         self._alive = False  # 设置为死亡状态
+        agents._recycle(self)  # 如果启用了对象池，回收以便复用
         del self
 
     def _setup(self) -> None:
@@ -542,3 +628,97 @@ class Actor(mg.GeoAgent, _LinkNodeActor, BaseModelElement, ActorProtocol):
             return None
         idx = int(np.argmax(scores)) if how == "max" else int(np.argmin(scores))
         return seq[idx] if not is_actors_list else seq[idx]
+
+
+class SlotActor(Actor):
+    """A memory-lean `Actor` storing its core state in `__slots__`.
+
+    Use it as a drop-in base class when a model holds very many actors.
+    Compared with `Actor`, a `SlotActor`:
+
+    - keeps identity, location and life-cycle state in slots;
+    - does not store a CRS unless it differs from the one of its cell
+      (or the model's nature), the shared CRS is looked up instead;
+    - runs the same `__init__` chain as `Actor`, but creates the observers,
+      dynamic variables and updated ticks containers only when used;
+    - returns new, uncached `move` and `link` proxies on each access.
+
+    Ad-hoc attributes (e.g., `self.wealth = 100` in `setup`) still work.
+    Subclasses can declare their own fields in `__slots__` to store them
+    without a per-instance dictionary entry.
+
+    Example:
+        ```python
+        class Farmer(SlotActor):
+            __slots__ = ("wealth",)
+
+            def setup(self):
+                self.wealth = 100
+        ```
+    """
+
+    __slots__ = (
+        "_model",
+        "_name",
+        "_cell",
+        "_alive",
+        "_birth_tick",
+        "_geometry",
+        "_crs",
+        "unique_id",
+        "_lazy_observers",
+        "_lazy_dynamic_variables",
+        "_lazy_updated_ticks",
+    )
+
+    _observers = LazySlot("_lazy_observers", lambda _: set())
+    _dynamic_variables = LazySlot("_lazy_dynamic_variables", lambda _: {})
+    _updated_ticks = LazySlot("_lazy_updated_ticks", lambda _: [])
+
+    def __init__(self, model: MainModel, observer: bool = True, **kwargs) -> None:
+        kwargs.setdefault("crs", None)
+        super().__init__(model, observer=observer, **kwargs)
+
+    def _create_containers(self) -> None:
+        """Skipped: the containers are lazy slots."""
+
+    _kept_on_reuse = frozenset({"_model", "_name", "_generation"})
+
+    def _reuse(self, model: MainModel, **kwargs) -> None:
+        """Start a new life of an actor recycled by a pool (see `Actor._reuse`).
+
+        The lazy observers and dynamic variables were dropped by the pool.
+        """
+        crs = kwargs.pop("crs", None)
+        self._start_life(model, crs=crs, geometry=kwargs.pop("geometry", None))
+
+    @property
+    def crs(self) -> Optional[CRS]:
+        """Coordinate reference system, shared with the cell or the nature."""
+        if self._crs is not None:
+            return self._crs
+        if self._cell is not None:
+            return self._cell.crs
+        return self.model.nature.crs
+
+    @crs.setter
+    def crs(self, crs: Any) -> None:
+        if crs is not None and not isinstance(crs, CRS):
+            crs = CRS.from_user_input(crs)
+        if crs is self.model.nature.crs:
+            crs = None
+        elif self._cell is not None and crs is self._cell.crs:
+            crs = None
+        self._crs = crs
+
+    @property
+    def move(self) -> _Movements:
+        """A proxy for manipulating actor's location (not cached)."""
+        from abses.space.move import _Movements
+
+        return _Movements(self)
+
+    @property
+    def link(self) -> _LinkProxy:
+        """A proxy for manipulating actor's links (not cached)."""
+        return _LinkProxy(self, self._model)
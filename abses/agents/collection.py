@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Materialized collections of actors.
+
+A collection keeps the members of a selection (see `_AgentsContainer.select`)
+as a live set, instead of scanning the whole population at each access.
+The model's agents container notifies its collections when an actor is
+registered (born or reused from a pool) or deregistered (dead), and when an
+actor's attribute is changed through `Actor.set` or `ActorsList.update`,
+or it moves to or off a cell. Notified actors are only queued, and evaluated against the selection at the
+next access, because a newborn actor's attributes are not set up yet when it
+is registered.
+
+Attributes changed by plain assignment (`actor.wealth = 0`) are not
+observed: call `touch(actor)` or `invalidate()` after such changes, when the
+selection depends on them. Neither are the attributes a selection function
+reads, which is why `HumanModule.define` only materializes attribute
+selections on request, and never selection functions.
+"""
+
+from __future__ import annotations
+
+from functools import partial
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Type, Union
+
+if TYPE_CHECKING:
+    from abses.agents.container import _ModelAgentsContainer
+    from abses.core.protocols import ActorProtocol
+
+Selection = Union[Callable[..., bool], str, Dict[str, Any], None]
+
+
+def _check_attr(agent: ActorProtocol, attr: str, value: Any = True) -> bool:
+    return getattr(agent, attr) == value
+
+
+def _check_attrs(agent: ActorProtocol, attrs: Dict[str, Any]) -> bool:
+    return all(getattr(agent, attr) == value for attr, value in attrs.items())
+
+
+def _on_earth_and(
+    agent: ActorProtocol, predicate: Optional[Callable[[Any], bool]]
+) -> bool:
+    return agent.on_earth and (predicate is None or bool(predicate(agent)))
+
+
+class ActorCollection:
+    """A live set of the actors satisfying a selection.
+
+    Parameters:
+        agents:
+            The model's agents container, notifying the collection of changes.
+        selection:
+            The selection criteria, as in `select`: an attribute name, a dict
+            of attribute values, or a function of an actor. None for all.
+        agent_type:
+            Only select actors of this breed (or its subclasses).
+
+    Plain attribute assignment (`actor.wealth = 0`) neither notifies the
+    collection nor bumps the agents' version, so the collection may keep
+    stale members: use `Actor.set`, or call `touch(actor)` or `invalidate()`
+    after such changes.
+
+    Attributes:
+        materializations:
+            Number of full scans of the population.
+        updates:
+            Number of actors evaluated incrementally.
+        seconds:
+            Total time spent in full scans and incremental updates.
+    """
+
+    def __init__(
+        self,
+        agents: _ModelAgentsContainer,
+        selection: Selection = None,
+        agent_type: Optional[Type[ActorProtocol]] = None,
+    ) -> None:
+        if isinstance(selection, str):
+            predicate: Optional[Callable[[Any], bool]] = partial(
+                _check_attr, attr=selection
+            )
+        elif isinstance(selection, dict):
+            predicate = partial(_check_attrs, attrs=dict(selection))
+        elif selection is None or callable(selection):
+            predicate = selection
+        else:
+            raise TypeError(f"{selection} is not valid selection criteria.")
+        self._agents = agents
+        self._predicate = predicate
+        self.agent_type = agent_type
+        self._members: Dict[ActorProtocol, None] = {}
+        self._pending: Dict[ActorProtocol, None] = {}
+        self._version = -1
+        self.materializations = 0
+        self.updates = 0
+        self.seconds = 0.0
+
+    def __len__(self) -> int:
+        return len(self.members())
+
+    def __repr__(self) -> str:
+        return f"<ActorCollection [{len(self._members)}]>"
+
+    @property
+    def attribute_based(self) -> bool:
+        """Whether the selection depends on the actors' attributes."""
+        return self._predicate is not None
+
+    @property
+    def is_stale(self) -> bool:
+        """Whether the collection missed some changes and needs a full scan."""
+        return self._version != self._agents.version
+
+    def _match(self, agent: ActorProtocol) -> bool:
+        if self.agent_type is not None and not isinstance(agent, self.agent_type):
+            return False
+        return self._predicate is None or bool(self._predicate(agent))
+
+    def materialize(self) -> None:
+        """Rebuild the members by scanning the whole population."""
+        start = perf_counter()
+        self._members = dict.fromkeys(a for a in self._agents if self._match(a))
+        self._pending.clear()
+        self._version = self._agents.version
+        self.materializations += 1
+        self.seconds += perf_counter() - start
+
+    def invalidate(self) -> None:
+        """Force a full scan at the next access."""
+        self._version = -1
+
+    def touch(self, agent: ActorProtocol) -> None:
+        """Re-evaluate an actor at the next access, e.g. after changing one of
+        its attributes used by the selection."""
+        if self.attribute_based or agent not in self._members:
+            self._pending[agent] = None
+
+    def _on_register(self, agent: ActorProtocol, version: int) -> None:
+        if self._version == version - 1:
+            self._pending[agent] = None
+            self._version = version
+
+    def _on_deregister(self, agent: ActorProtocol, version: int) -> None:
+        if self._version == version - 1:
+            self._members.pop(agent, None)
+            self._pending.pop(agent, None)
+            self._version = version
+
+    def members(self) -> List[ActorProtocol]:
+        """The current members, in order of joining the collection."""
+        if self.is_stale:
+            self.materialize()
+        elif self._pending:
+            start = perf_counter()
+            for agent in self._pending:
+                if self._match(agent):
+                    self._members[agent] = None
+                else:
+                    self._members.pop(agent, None)
+            self.updates += len(self._pending)
+            self._pending.clear()
+            self.seconds += perf_counter() - start
+        return list(self._members)
+
+    def on_earth(self) -> ActorCollection:
+        """A live collection of the members standing on a cell.
+
+        Actors notify the collections when they move to or off a cell, or
+        change their geometry, so this one is maintained incrementally too.
+        """
+        return self._agents.collection(
+            partial(_on_earth_and, predicate=self._predicate),
+            agent_type=self.agent_type,
+        )
+
+    def stats(self) -> dict[str, Any]:
+        """Statistics of this collection."""
+        return {
+            "size": len(self._members),
+            "materializations": self.materializations,
+            "updates": self.updates,
+            "seconds": self.seconds,
+        }
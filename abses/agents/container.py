@@ -12,6 +12,8 @@ Container for actors.
 from __future__ import annotations
 
 import logging
+import weakref
+from contextlib import contextmanager
 from functools import partial
 from typing import (
     TYPE_CHECKING,
@@ -19,6 +21,7 @@ from typing import (
     Callable,
     Dict,
     Iterator,
+    List,
     Optional,
     Type,
     Union,
@@ -26,12 +29,16 @@ from typing import (
 )
 
 import geopandas as gpd
+import pandas as pd
 import pyproj
 from mesa import Model
 from mesa.agent import AgentSet
 from shapely.geometry.base import BaseGeometry
 
 from abses.agents.actor import Actor
+from abses.agents.collection import ActorCollection
+from abses.agents.pool import ActorPool
+from abses.agents.scheduler import BreedScheduler
 from abses.agents.sequences import ActorsList
 from abses.core.protocols import ActorProtocol, MainModelProtocol
 from abses.utils.errors import ABSESpyError
@@ -74,6 +81,7 @@ class _AgentsContainer:
         self._model: MainModelProtocol = model
         self._agents = model._all_agents
         self._max_length = max_len
+        self._random: Optional[ListRandom] = None
 
     def __getattr__(self, name: str) -> Any:
         """Get an attribute from the container."""
@@ -128,7 +136,9 @@ class _AgentsContainer:
         breed_type = self._get_breed_type(breeds)
         try:
             return ActorsList(
-                model=self.model, objs=self._model.agents_by_type[breed_type]
+                model=self.model,
+                objs=self._model.agents_by_type[breed_type],
+                breed=breed_type,
             )
         except KeyError:
             return ActorsList(model=self.model, objs=[])
@@ -145,8 +155,10 @@ class _AgentsContainer:
 
     @property
     def random(self) -> ListRandom:
-        """The random number generator."""
-        return ListRandom(actors=self, model=self.model)
+        """The random number generator, using the model's "agents" stream."""
+        if self._random is None:
+            self._random = ListRandom(actors=self, model=self.model, stream=("agents",))
+        return self._random
 
     @property
     def is_full(self) -> bool:
@@ -227,9 +239,11 @@ class _AgentsContainer:
         if not isinstance(agent_cls, type):
             raise ABSESpyError(f"{agent_cls} is not a type")
 
-        agent = agent_cls(
-            model=self.model, geometry=geometry, crs=self.model.nature.crs, **kwargs
-        )
+        init_kwargs = dict(geometry=geometry, crs=self.model.nature.crs, **kwargs)
+        pool = self.model.agents.pools.get(agent_cls)
+        agent = None if pool is None else pool.acquire(self.model, **init_kwargs)
+        if agent is None:
+            agent = agent_cls(model=self.model, **init_kwargs)
         self.add(agent)
         return agent
 
@@ -425,8 +439,252 @@ class _ModelAgentsContainer(_AgentsContainer):
     The container ensures that all geospatial data is properly aligned with the
     model's coordinate system before creating agents, maintaining spatial consistency
     across the entire model.
+
+    It also holds the opt-in recycling pools of actors (see `enable_pool`),
+    the queue of deferred removals (see `deferred_removal`), and notifies the
+    materialized collections of actors (see `collection`) of changes.
+
+    Attributes:
+        scheduler:
+            The breed-level activation scheduler (see `do_by_breed`).
+        version:
+            Incremented each time an actor is registered or deregistered.
+        defer_removal:
+            If True, actors dying during `shuffle_do` or `do` activations of
+            an `ActorsList` are removed in bulk at the end of the activation.
     """
 
+    def __init__(self, model: MainModelProtocol, max_len: None | Number = None):
+        super().__init__(model, max_len)
+        self._pools: Dict[Type[ActorProtocol], ActorPool] = {}
+        self._removal_queue: List[ActorProtocol] = []
+        self._deferring: int = 0
+        self.defer_removal: bool = False
+        self.scheduler = BreedScheduler(self)
+        self.version: int = 0
+        self._collections: weakref.WeakSet[ActorCollection] = weakref.WeakSet()
+
+    def __getstate__(self) -> Dict[str, Any]:
+        state = self.__dict__.copy()
+        state["_collections"] = list(self._collections)
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        collections = state.pop("_collections")
+        self.__dict__.update(state)
+        self._collections = weakref.WeakSet(collections)
+
+    def do_by_breed(
+        self,
+        method: str = "step",
+        *args: Any,
+        order: Optional[Breeds] = None,
+        shuffle: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Activate all the actors breed by breed.
+
+        A breed defining a classmethod `<method>_batch` (e.g., `step_batch`)
+        gets all its alive actors at once, as an `ActorsList`. Otherwise,
+        `method` is called on each actor of the breed. Time spent by each
+        breed is recorded in `model.agents.scheduler.timings`.
+
+        Parameters:
+            method:
+                Name of the actors' method to activate.
+            *args:
+                Positional arguments passed to the method or the batch hook.
+            order:
+                Breeds activated first, in this order.
+                Defaults to `model.agents.scheduler.order`.
+            shuffle:
+                Whether to randomize the actors' order inside each breed.
+                Defaults to `model.agents.scheduler.shuffle`.
+            **kwargs:
+                Keyword arguments passed to the method or the batch hook.
+
+        Example:
+            ```python
+            class Sheep(Actor):
+                @classmethod
+                def step_batch(cls, agents):
+                    agents.update("energy", agents.array("energy") - 1)
+
+            class Model(MainModel):
+                def step(self):
+                    self.agents.do_by_breed("step", order=["Wolf", "Sheep"])
+            ```
+        """
+        self.scheduler.do(method, *args, order=order, shuffle=shuffle, **kwargs)
+
+    @property
+    def is_deferring(self) -> bool:
+        """Whether removals of dead actors are currently deferred."""
+        return self._deferring > 0
+
+    @contextmanager
+    def deferred_removal(self) -> Iterator[List[ActorProtocol]]:
+        """Defer the removal of dying actors until the end of the block.
+
+        Inside the block, `actor.die()` only takes the actor off its cell,
+        marks it as dead (so `alive_required` methods are skipped) and queues
+        it. Its links are cleaned and it is deregistered from the model in one
+        bulk pass when the outermost block exits. Until then, dead actors are
+        still counted in the model's agent sets.
+
+        Yields:
+            The queue of dead actors waiting for removal.
+
+        Example:
+            ```python
+            with model.agents.deferred_removal():
+                model.agents.shuffle_do("step")  # some actors die here
+            # all the dead actors are removed now
+            ```
+        """
+        self._deferring += 1
+        try:
+            yield self._removal_queue
+        finally:
+            self._deferring -= 1
+            if not self._deferring:
+                self._flush_removals()
+
+    def _defer(self, agent: ActorProtocol) -> None:
+        """Queue a dead agent for the bulk removal."""
+        self._removal_queue.append(agent)
+
+    def _flush_removals(self) -> None:
+        """Remove all the queued dead agents from the model at once."""
+        queue, self._removal_queue = self._removal_queue, []
+        if not queue:
+            return
+        model = self._model
+        for agent in queue:
+            agent.link.clean()
+        for agent in queue:
+            model.deregister_agent(agent)
+        for agent in queue:
+            self._recycle(agent)
+        logger.debug(f"{self} removed {len(queue)} dead agents in bulk.")
+
+    def collection(
+        self,
+        selection: Callable | str | Dict[str, Any] | None = None,
+        agent_type: Optional[Type[ActorProtocol] | str] = None,
+    ) -> ActorCollection:
+        """Create a materialized collection of the actors matching a selection.
+
+        Unlike `select`, which scans all the actors at each call, the
+        collection is maintained incrementally when actors are born, die, or
+        change attributes through `Actor.set`.
+
+        Parameters:
+            selection:
+                The selection criteria, as in `select`.
+            agent_type:
+                Filter by agent breed type, as in `select`.
+
+        Returns:
+            The live collection, see `ActorCollection`.
+        """
+        if isinstance(agent_type, (str, type)):
+            agent_type = self._get_breed_type(agent_type)
+        collection = ActorCollection(self, selection, agent_type=agent_type)
+        self._collections.add(collection)
+        return collection
+
+    def _on_register(self, agent: ActorProtocol) -> None:
+        """Notify the collections of a newly registered actor."""
+        self.version += 1
+        for collection in self._collections:
+            collection._on_register(agent, self.version)
+
+    def _on_deregister(self, agent: ActorProtocol) -> None:
+        """Notify the collections of a deregistered actor."""
+        self.version += 1
+        for collection in self._collections:
+            collection._on_deregister(agent, self.version)
+
+    def _touch(self, *agents: ActorProtocol) -> None:
+        """Notify the collections that some actors' attributes changed."""
+        if not self._collections:
+            return
+        registered = [agent for agent in agents if agent in self._agents]
+        for collection in self._collections:
+            for agent in registered:
+                collection.touch(agent)
+
+    @property
+    def pools(self) -> Dict[Type[ActorProtocol], ActorPool]:
+        """Recycling pools of actors, by breed."""
+        return self._pools
+
+    def enable_pool(
+        self, breed: Type[ActorProtocol], max_size: Optional[int] = None
+    ) -> ActorPool:
+        """Recycle dead actors of a breed for its next births.
+
+        When a pooled actor dies, it is kept instead of being garbage collected.
+        The next `new()` of the same breed resets it without `__init__`:
+        attributes are cleared, `setup()` runs again and a fresh `unique_id`
+        and birth tick are assigned. Subclasses of the breed are not pooled.
+
+        Parameters:
+            breed:
+                The actor class to recycle.
+            max_size:
+                Maximum number of dead actors kept. None for no limit.
+
+        Returns:
+            The recycling pool of this breed.
+
+        Example:
+            ```python
+            model.agents.enable_pool(Sheep)
+            sheep.die()  # kept in the pool
+            lamb = model.agents.new(Sheep, singleton=True)  # reuses the object
+            ```
+        """
+        if not isinstance(breed, type) or not issubclass(breed, Actor):
+            raise TypeError(f"Only Actor subclasses can be pooled, got {breed}.")
+        if breed not in self._pools:
+            self._pools[breed] = ActorPool(breed, max_size=max_size)
+        else:
+            self._pools[breed].max_size = max_size
+        return self._pools[breed]
+
+    def disable_pool(self, breed: Type[ActorProtocol]) -> None:
+        """Stop recycling a breed and drop its dead actors.
+
+        Parameters:
+            breed:
+                The actor class which is no longer recycled.
+        """
+        pool = self._pools.pop(breed, None)
+        if pool is not None:
+            pool.clear()
+
+    def pool_stats(self) -> pd.DataFrame:
+        """Statistics of the recycling pools.
+
+        Returns:
+            A table indexed by breed name, with the pool size, hits, misses,
+            hit rate, released and discarded actors.
+        """
+        return pd.DataFrame.from_dict(
+            {breed.__name__: pool.stats() for breed, pool in self._pools.items()},
+            orient="index",
+        )
+
+    def _recycle(self, agent: ActorProtocol) -> bool:
+        """Keep a dead agent in its breed's pool if it is pooled."""
+        pool = self._pools.get(type(agent))
+        if pool is None:
+            return False
+        self._model.human._node_cache.pop(agent.unique_id, None)
+        return pool.release(agent)
+
     def _check_crs(self, gdf: gpd.GeoDataFrame) -> bool:
         """Check and align the GeoDataFrame's CRS with the model's CRS.
 
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Recycling pools for actors.
+
+In models with a high birth/death churn (e.g., wolf-sheep), actors which die
+can be kept in a per-breed pool and reused for the next births of the same
+breed. A reused actor is reset before reuse, without running `__init__`
+again: the attributes of its previous life are dropped, it gets a fresh
+`unique_id` and `_birth_tick`, is registered again and its `setup()` runs.
+Breeds which override `__init__` are fully re-initialized instead.
+
+Because the same Python object may represent different actors over time,
+each reuse bumps the actor's `generation`. Keep an `ActorRef` (see
+`Actor.ref()`) instead of the actor itself when a reference may outlive it.
+"""
+
+from __future__ import annotations
+
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    FrozenSet,
+    Generic,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
+
+if TYPE_CHECKING:
+    from abses.agents.actor import Actor
+    from abses.core.protocols import MainModelProtocol
+
+A = TypeVar("A", bound="Actor")
+
+
+class ActorRef(Generic[A]):
+    """A reference to an actor which becomes invalid once the actor dies.
+
+    Parameters:
+        actor:
+            The referred actor.
+
+    Example:
+        ```python
+        ref = wolf.ref()
+        wolf.die()
+        >>> ref.get()
+        None
+        ```
+    """
+
+    __slots__ = ("_actor", "_generation")
+
+    def __init__(self, actor: A) -> None:
+        self._actor = actor
+        self._generation = actor.generation
+
+    def __repr__(self) -> str:
+        return f"<ActorRef {self._actor.breed} [{'valid' if self else 'stale'}]>"
+
+    def __bool__(self) -> bool:
+        actor = self._actor
+        return actor.alive and actor.generation == self._generation
+
+    def get(self, default: Any = None) -> A | Any:
+        """The referred actor, or `default` if it is dead or reused."""
+        return self._actor if self else default
+
+
+class ActorPool(Generic[A]):
+    """A recycling pool of dead actors for one breed.
+
+    Parameters:
+        breed:
+            The actor class recycled by this pool.
+        max_size:
+            Maximum number of dead actors kept. None for no limit.
+
+    Attributes:
+        hits: Number of births served by a recycled actor.
+        misses: Number of births which required a new actor.
+        released: Number of dead actors kept in the pool.
+        discarded: Number of dead actors dropped because the pool was full.
+    """
+
+    def __init__(self, breed: Type[A], max_size: Optional[int] = None) -> None:
+        if max_size is not None and max_size < 0:
+            raise ValueError(f"Pool size must be non-negative, got {max_size}.")
+        self.breed = breed
+        self.max_size = max_size
+        self._free: List[A] = []
+        self.hits = 0
+        self.misses = 0
+        self.released = 0
+        self.discarded = 0
+        # How recycled actors are reset, resolved once for the breed.
+        self._custom_init = _custom_init(breed)
+        self._kept = (
+            frozenset({"_generation"}) if self._custom_init else breed._kept_on_reuse
+        )
+        self._slots = tuple(n for n in _slot_names(breed) if n not in self._kept)
+
+    def __len__(self) -> int:
+        return len(self._free)
+
+    def __repr__(self) -> str:
+        return f"<ActorPool {self.breed.__name__} [{len(self)}]>"
+
+    @property
+    def hit_rate(self) -> float:
+        """Share of births served by recycled actors."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def release(self, actor: A) -> bool:
+        """Keep a dead actor for reuse.
+
+        Parameters:
+            actor:
+                An actor of this pool's breed, which has just died.
+
+        Returns:
+            True if the actor is kept, False if the pool is full.
+        """
+        actor._generation = actor.generation + 1
+        if self.max_size is not None and len(self._free) >= self.max_size:
+            self.discarded += 1
+            return False
+        self._free.append(actor)
+        self.released += 1
+        return True
+
+    def acquire(self, model: MainModelProtocol, **kwargs: Any) -> Optional[A]:
+        """Reset a recycled actor for a new life, if any.
+
+        Parameters:
+            model:
+                The model where the actor is born.
+            **kwargs:
+                Keyword arguments of the actor's `__init__`.
+
+        Returns:
+            The recycled actor, or None if the pool is empty.
+        """
+        if not self._free:
+            self.misses += 1
+            return None
+        actor = self._free.pop()
+        self.hits += 1
+        _reset_attributes(actor, self._kept, self._slots)
+        if self._custom_init:
+            self.breed.__init__(actor, model=model, **kwargs)
+        else:
+            actor._reuse(model, **kwargs)
+        return actor
+
+    def clear(self) -> None:
+        """Drop all the recycled actors."""
+        self._free.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Statistics of this pool."""
+        return {
+            "size": len(self),
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+            "released": self.released,
+            "discarded": self.discarded,
+        }
+
+
+def _custom_init(breed: type) -> bool:
+    """Whether a breed overrides the `__init__` of the actor base classes."""
+    from abses.agents.actor import Actor, SlotActor
+
+    return breed.__init__ not in (Actor.__init__, SlotActor.__init__)
+
+
+def _slot_names(breed: type) -> List[str]:
+    """Names of the instance slots declared by a breed and its bases."""
+    names = []
+    for cls in breed.__mro__:
+        slots = cls.__dict__.get("__slots__", ())
+        for name in (slots,) if isinstance(slots, str) else slots:
+            if name not in ("__dict__", "__weakref__"):
+                names.append(name)
+    return names
+
+
+def _reset_attributes(
+    actor: Actor, keep: FrozenSet[str], slots: Tuple[str, ...]
+) -> None:
+    """Drop the instance attributes and slots of an actor, except the kept ones."""
+    names = getattr(actor, "__dict__", {})
+    for name in [name for name in names if name not in keep]:
+        del names[name]
+    for name in slots:
+        try:
+            object.__delattr__(actor, name)
+        except AttributeError:
+            pass
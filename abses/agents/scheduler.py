@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Breed-level activation of actors.
+
+Instead of dispatching one Python call per actor, a breed can define a batch
+hook as a classmethod named `<method>_batch` (e.g., `step_batch`) operating on
+all its actors at once, typically with vectorized array code:
+
+```python
+class Sheep(Actor):
+    @classmethod
+    def step_batch(cls, agents: ActorsList) -> None:
+        energy = agents.array("energy") - 1
+        agents.update("energy", energy)
+```
+
+Breeds are activated one after another, in a configurable order. Breeds
+without a batch hook fall back to calling the method on each actor.
+"""
+
+from __future__ import annotations
+
+import logging
+from time import perf_counter_ns
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+)
+
+import pandas as pd
+
+from abses.agents.sequences import ActorsList
+from abses.utils.errors import ABSESpyError
+
+if TYPE_CHECKING:
+    from abses.agents.container import _ModelAgentsContainer
+    from abses.core.protocols import ActorProtocol
+    from abses.core.types import Breeds
+
+logger = logging.getLogger(__name__)
+
+
+class BreedScheduler:
+    """Activates actors breed by breed, using batch hooks when available.
+
+    Parameters:
+        agents:
+            The model's agents container.
+
+    Attributes:
+        order:
+            Breeds (classes or names) activated first, in this order.
+            The other breeds follow in their registration order.
+        shuffle:
+            Whether to randomize the actors' order inside each breed.
+    """
+
+    def __init__(self, agents: _ModelAgentsContainer) -> None:
+        self._agents = agents
+        self.order: List[str | Type[ActorProtocol]] = []
+        self.shuffle: bool = True
+        self._timings: Dict[Tuple[str, str], Dict[str, Any]] = {}
+
+    def __repr__(self) -> str:
+        return f"<BreedScheduler of {self._agents.model.name}>"
+
+    @property
+    def timings(self) -> pd.DataFrame:
+        """Time spent by each breed, for each activated method.
+
+        Returns:
+            A table indexed by (breed, method), with the number of calls,
+            the number of actors and batch usage in the last call, and the
+            last and total time (in seconds).
+        """
+        columns = ["n_agents", "batched", "calls", "last_time", "total_time"]
+        if not self._timings:
+            return pd.DataFrame(columns=columns)
+        data = pd.DataFrame.from_dict(self._timings, orient="index")
+        data.index.names = ["breed", "method"]
+        # Recorded in nanoseconds, as by the profiler.
+        data["last_time"] = data["last_time"] / 1e9
+        data["total_time"] = data["total_time"] / 1e9
+        return data[columns]
+
+    def reset_timings(self) -> None:
+        """Forget all recorded timings."""
+        self._timings.clear()
+
+    def breeds(
+        self, order: Optional[Iterable[str | Type[ActorProtocol]]] = None
+    ) -> List[Type[ActorProtocol]]:
+        """Breeds in their activation order.
+
+        Parameters:
+            order:
+                Breeds activated first. Defaults to `self.order`.
+
+        Returns:
+            All the registered breeds, the ordered ones first.
+        """
+        registered = list(self._agents.model.agents_by_type)
+        first: List[Type[ActorProtocol]] = []
+        for breed in self.order if order is None else order:
+            breed_type = self._agents._get_breed_type(breed)
+            if breed_type in first:
+                raise ABSESpyError(f"Breed {breed_type.__name__} ordered twice.")
+            first.append(breed_type)
+        return first + [breed for breed in registered if breed not in first]
+
+    def do(
+        self,
+        method: str = "step",
+        *args: Any,
+        order: Optional[Breeds] = None,
+        shuffle: Optional[bool] = None,
+        **kwargs: Any,
+    ) -> None:
+        """Activate all the actors breed by breed.
+
+        For each breed, calls the classmethod `<method>_batch` with all its
+        alive actors if it exists, otherwise calls `method` on each actor.
+
+        Parameters:
+            method:
+                Name of the actors' method to activate.
+            *args:
+                Positional arguments passed to the method or the batch hook.
+            order:
+                Breeds (classes or names) activated first, in this order.
+                Defaults to `self.order`.
+            shuffle:
+                Whether to randomize the actors' order inside each breed.
+                It uses a single permutation of the breed's random stream
+                (see `model.random_streams`). Defaults to `self.shuffle`.
+            **kwargs:
+                Keyword arguments passed to the method or the batch hook.
+
+        Note:
+            If `model.agents.defer_removal` is True, actors dying during the
+            activation are removed in bulk once all breeds are activated.
+        """
+        if isinstance(order, (str, type)):
+            order = [order]
+        shuffle = self.shuffle if shuffle is None else shuffle
+        breeds = self.breeds(order)
+        if not self._agents.defer_removal:
+            for breed in breeds:
+                self._do_breed(breed, method, shuffle, *args, **kwargs)
+            return
+        with self._agents.deferred_removal():
+            for breed in breeds:
+                self._do_breed(breed, method, shuffle, *args, **kwargs)
+
+    def _do_breed(
+        self,
+        breed: Type[ActorProtocol],
+        method: str,
+        shuffle: bool,
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Activate all the alive actors of one breed."""
+        model = self._agents.model
+        agentset = model.agents_by_type.get(breed)
+        actors: Sequence[ActorProtocol] = (
+            [] if agentset is None else [a for a in agentset if a.alive]
+        )
+        if not actors:
+            return
+        if shuffle:
+            rng = model.random_streams.generator("breed", breed.__name__)
+            actors = [actors[i] for i in rng.permutation(len(actors))]
+        batch = getattr(breed, f"{method}_batch", None)
+        start = perf_counter_ns()
+        if batch is not None:
+            batch(ActorsList(model, actors), *args, **kwargs)
+        else:
+            for actor in actors:
+                if actor.alive:
+                    getattr(actor, method)(*args, **kwargs)
+        self._record(breed, method, len(actors), batch is not None, start)
+
+    def _record(
+        self,
+        breed: Type[ActorProtocol],
+        method: str,
+        n_agents: int,
+        batched: bool,
+        start: int,
+    ) -> None:
+        """Record the time spent by one breed, since `start` (ns)."""
+        elapsed = perf_counter_ns() - start
+        record = self._timings.setdefault(
+            (breed.__name__, method), {"calls": 0, "total_time": 0}
+        )
+        record.update(n_agents=n_agents, batched=batched, last_time=elapsed)
+        record["calls"] += 1
+        record["total_time"] += elapsed
+        profiler = vars(self._agents.model).get("profiler")
+        if profiler is not None:
+            timing = profiler.record_of(("breed", f"{breed.__name__}.{method}"))
+            timing[0] += elapsed
+            timing[1] += n_agents
+        logger.debug(
+            f"{breed.__name__}.{method}: {n_agents} agents, {elapsed / 1e9:.6f}s."
+        )
@@ -12,7 +12,10 @@ It's used to manipulate the actors quickly in batch.
 from __future__ import annotations
 
 from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from numbers import Number
+from time import perf_counter_ns
 from typing import (
     TYPE_CHECKING,
     Any,
@@ -41,6 +44,22 @@ if TYPE_CHECKING:
     from abses.core.types import HOW_TO_SELECT
 
 
+def _call_chunk(
+    method: str | Callable[..., Any],
+    args: tuple,
+    kwargs: Dict[str, Any],
+    actors: List[Any],
+) -> None:
+    """Call `method` on the alive actors of a chunk, see `ActorsList.sync_do`."""
+    for actor in actors:
+        if not getattr(actor, "_alive", True):
+            continue
+        if isinstance(method, str):
+            getattr(actor, method)(*args, **kwargs)
+        else:
+            method(actor, *args, **kwargs)
+
+
 class ActorsList(AgentSet, Generic[A]):
     """Extended agent set specifically designed for managing Actor collections.
 
@@ -63,21 +82,31 @@ class ActorsList(AgentSet, Generic[A]):
 
     Attributes:
         _model: The ABSESpy model this list belongs to.
+        _breed: The breed of all the actors, when the list was selected by breed.
+        _version: Number of in-place changes of the members or their order
+            (e.g., to rebuild the alias tables of its random facade).
     """
 
+    _version: int = 0
+
     def __init__(
         self,
         model: MainModelProtocol,
         objs: Iterable[A] = (),
+        breed: Optional[type] = None,
     ) -> None:
         """Initialize an ActorsList instance.
 
         Parameters:
             model: The ABSESpy model this list belongs to.
             objs: Iterable of actors to include in the list. Defaults to empty.
+            breed: The breed of all the actors, if known (e.g., a breed's
+                actors from the container). Its random facade then uses the
+                breed's random stream.
         """
         super().__init__(objs, random=model.random)
         self._model = model
+        self._breed = breed
 
     def __repr__(self) -> str:
         """Return a string representation of the ActorsList.
@@ -90,6 +119,33 @@ class ActorsList(AgentSet, Generic[A]):
         results = [f"({len(v)}){k}" for k, v in self.to_dict().items()]
         return f"<ActorsList: {'; '.join(results)}>"
 
+    def add(self, agent: A) -> None:
+        """Add an actor to the list."""
+        super().add(agent)
+        self._version += 1
+
+    def discard(self, agent: A) -> None:
+        """Remove an actor from the list, if it is in it."""
+        super().discard(agent)
+        self._version += 1
+
+    def remove(self, agent: A) -> None:
+        """Remove an actor from the list."""
+        super().remove(agent)
+        self._version += 1
+
+    def _update(self, agents: Iterable[A]) -> ActorsList[A]:
+        result = super()._update(agents)
+        self._version += 1
+        return result
+
+    def shuffle(self, inplace: bool = False) -> ActorsList[A]:
+        """Shuffle the actors (in place, or as a new list)."""
+        result = super().shuffle(inplace=inplace)
+        if inplace:
+            self._version += 1
+        return result
+
     @overload
     def __getitem__(self, other: int) -> A: ...
 
@@ -108,6 +164,165 @@ class ActorsList(AgentSet, Generic[A]):
         results = super().__getitem__(index)
         return ActorsList(self._model, results) if isinstance(index, slice) else results
 
+    def shuffle_do(
+        self, method: str | Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> ActorsList[A]:
+        """Shuffle the actors and then invoke a method or function on each.
+
+        When `model.agents.defer_removal` is True, actors dying during the
+        activation are removed in bulk at its end, and actors which already
+        died in this activation are skipped.
+
+        Parameters:
+            method:
+                The name of the method to call, or a function taking an actor.
+            *args:
+                Positional arguments passed to the method.
+            **kwargs:
+                Keyword arguments passed to the method.
+
+        Returns:
+            This list itself.
+        """
+        if not self._model.agents.defer_removal and not self._profiling:
+            return super().shuffle_do(method, *args, **kwargs)
+        weakrefs = list(self._agents.keyrefs())
+        self.random.shuffle(weakrefs)
+        self._activate(weakrefs, method, *args, **kwargs)
+        return self
+
+    def do(
+        self, method: str | Callable[..., Any], *args: Any, **kwargs: Any
+    ) -> ActorsList[A]:
+        """Invoke a method or function on each actor.
+
+        When `model.agents.defer_removal` is True, removals of dying actors
+        are deferred to the end of the activation, as in `shuffle_do`.
+
+        Parameters:
+            method:
+                The name of the method to call, or a function taking an actor.
+            *args:
+                Positional arguments passed to the method.
+            **kwargs:
+                Keyword arguments passed to the method.
+
+        Returns:
+            This list itself.
+        """
+        if not self._model.agents.defer_removal and not self._profiling:
+            return super().do(method, *args, **kwargs)
+        self._activate(list(self._agents.keyrefs()), method, *args, **kwargs)
+        return self
+
+    def sync_do(
+        self,
+        method: str | Callable[..., Any],
+        *args: Any,
+        workers: Optional[int] = None,
+        chunk_size: Optional[int] = None,
+        **kwargs: Any,
+    ) -> ActorsList[A]:
+        """Invoke a method or function on each actor, synchronously.
+
+        Runs in a synchronous phase of the model (see `MainModel.synchronous`):
+        the actors' buffered fields (see `abses.core.buffers`) read the values
+        from before the phase, whatever the order of the actors, which are
+        therefore not shuffled. The written values are swapped in at the end
+        of the tick while the model steps, at the end of this call otherwise.
+
+        Parameters:
+            method:
+                The name of the method to call, or a function taking an actor.
+            *args:
+                Positional arguments passed to the method.
+            workers:
+                Number of threads running the actors by chunks. None runs
+                them in the calling thread. Threads only speed up methods
+                releasing the GIL, e.g. numpy operations.
+            chunk_size:
+                Number of actors per chunk. Defaults to splitting the actors
+                evenly between the workers.
+            **kwargs:
+                Keyword arguments passed to the method.
+
+        Returns:
+            This list itself.
+        """
+        model = self._model
+        with model.synchronous():
+            if workers is None or workers <= 1:
+                self._activate(list(self._agents.keyrefs()), method, *args, **kwargs)
+                return self
+            actors = list(self)
+            size = chunk_size or max(1, -(-len(actors) // workers))
+            chunks = [actors[i : i + size] for i in range(0, len(actors), size)]
+            call = partial(_call_chunk, method, args, kwargs)
+            with model.agents.deferred_removal():
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    list(pool.map(call, chunks))
+        return self
+
+    def _activate(
+        self,
+        weakrefs: List[Any],
+        method: str | Callable[..., Any],
+        *args: Any,
+        **kwargs: Any,
+    ) -> None:
+        """Call `method` on alive actors, deferring removals of the dying."""
+        if not self._model.agents.defer_removal:
+            self._call_each(weakrefs, method, False, args, kwargs)
+            return
+        with self._model.agents.deferred_removal():
+            self._call_each(weakrefs, method, True, args, kwargs)
+
+    @property
+    def _profiling(self) -> bool:
+        """Whether the model records the time of the actors' methods."""
+        return vars(self._model).get("profiler") is not None
+
+    def _call_each(
+        self,
+        weakrefs: List[Any],
+        method: str | Callable[..., Any],
+        skip_dead: bool,
+        args: tuple,
+        kwargs: Dict[str, Any],
+    ) -> None:
+        """Call `method` on each actor, timed by breed when profiling."""
+        profiler = vars(self._model).get("profiler")
+        by_name = isinstance(method, str)
+        if profiler is None:
+            for ref in weakrefs:
+                agent = ref()
+                if agent is None or (skip_dead and not getattr(agent, "_alive", True)):
+                    continue
+                if by_name:
+                    getattr(agent, method)(*args, **kwargs)
+                else:
+                    method(agent, *args, **kwargs)
+            return
+        name = method if by_name else method.__name__
+        records: Dict[type, List[int]] = {}
+        for ref in weakrefs:
+            agent = ref()
+            if agent is None or (skip_dead and not getattr(agent, "_alive", True)):
+                continue
+            start = perf_counter_ns()
+            if by_name:
+                getattr(agent, method)(*args, **kwargs)
+            else:
+                method(agent, *args, **kwargs)
+            elapsed = perf_counter_ns() - start
+            breed = agent.__class__
+            record = records.get(breed)
+            if record is None:
+                key = ("breed", f"{breed.__name__}.{name}")
+                record = records[breed] = profiler.record_of(key)
+            record[0] += elapsed
+            record[1] += 1
+
     def _is_same_length(self, length: Sized, rep_error: bool = False) -> bool:
         """Check if the length of input matches the number of actors.
 
@@ -326,6 +541,9 @@ class ActorsList(AgentSet, Generic[A]):
         self._is_same_length(cast(Sized, values), rep_error=True)
         for agent, val in zip(self, values):
             setattr(agent, attr, val)
+        touch = getattr(self._model.agents, "_touch", None)
+        if touch is not None:
+            touch(*self)
 
     def split(self, where: NDArray[Any]) -> List[ActorsList[A]]:
         """Split actors into N+1 groups at specified positions.
@@ -346,6 +564,78 @@ class ActorsList(AgentSet, Generic[A]):
         split: List[NDArray[Any]] = np.hsplit(np.array(self), where)
         return [ActorsList(self._model, group) for group in split]
 
+    def get(  # type: ignore[override]
+        self,
+        attr_names: str | List[str],
+        handle_missing: str = "error",
+        default_value: Any = None,
+        *,
+        target: Optional[str] = None,
+        default: Any = ...,
+    ) -> List[Any]:
+        """获取每个 actor 的属性值。
+
+        不指定 `target` 和 `default` 时，与 mesa 的 `AgentSet.get` 相同。
+        否则，结果与逐个调用 `actor.get(attr, target=target, default=default)`
+        相同，例如 `target="cell"` 获取每个主体所在斑块的属性，
+        但每种类型的访问路径只解析一次。
+
+        Parameters:
+            attr_names:
+                属性名称（指定 `target` 时只能是一个）。
+            handle_missing:
+                见 `AgentSet.get`。
+            default_value:
+                见 `AgentSet.get`。
+            target:
+                从哪里获取属性，见 `Actor.get`。
+            default:
+                如果未找到属性，则返回的值。
+
+        Returns:
+            每个 actor 的属性值列表。
+        """
+        if target is None and default is ...:
+            return super().get(attr_names, handle_missing, default_value)
+        if not isinstance(attr_names, str):
+            raise TypeError("Only one attribute can be retrieved from a target.")
+        getters: Dict[type, Callable[[Any, Any], Any]] = {}
+        values = []
+        for agent in self:
+            cls = type(agent)
+            getter = getters.get(cls)
+            if getter is None:
+                getter = getters[cls] = cls._getter(attr_names, target)
+            alive = getattr(agent, "alive", True)
+            values.append(getter(agent, default) if alive else None)
+        return values
+
+    def set(  # type: ignore[override]
+        self,
+        attr_name: str,
+        value: Any,
+        *,
+        target: Optional[str] = None,
+        new: bool = False,
+    ) -> ActorsList[A]:
+        """设置每个 actor 的属性值。
+
+        不指定 `target` 和 `new` 时，与 mesa 的 `AgentSet.set` 相同。
+        否则，与逐个调用 `actor.set(attr, value, target=target, new=new)` 相同。
+
+        Returns:
+            此列表本身。
+        """
+        if target is None and not new:
+            super().set(attr_name, value)
+            touch = getattr(self._model.agents, "_touch", None)
+            if touch is not None:
+                touch(*self)
+            return self
+        for agent in self:
+            agent.set(attr_name, value, target=target, new=new)
+        return self
+
     def array(self, attr: str) -> np.ndarray:
         """将所有 actor 的指定属性转换为 numpy 数组。
 
@@ -426,10 +716,16 @@ class ActorsList(AgentSet, Generic[A]):
     def random(self) -> ListRandom:
         """返回一个 ListRandom 实例，用于随机操作。
 
+        实例在第一次访问时创建并缓存，不复制主体列表。
+        如果列表是按品种选出的，使用该品种的随机数流。
+
         Returns:
-            ListRandom: 用于随机操作的实例，使用与 AgentSet 相同的随机数生成器。
+            ListRandom: 用于随机操作的实例。
         """
-        return ListRandom(self._model, self)
+        facade = self.__dict__.get("_random_facade")
+        if facade is None:
+            facade = self.__dict__["_random_facade"] = ListRandom(self._model, self)
+        return facade
 
     @random.setter
     def random(self, random: np.random.Generator) -> None:
@@ -16,8 +16,19 @@ from __future__ import annotations
 
 import warnings
 from abc import ABC
-from typing import Any, Callable, Dict, List, Optional, final
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Dict,
+    List,
+    Mapping,
+    Optional,
+    Union,
+    final,
+)
 
+import numpy as np
 from omegaconf import DictConfig
 
 from abses.core.base_observable import BaseObservable
@@ -32,8 +43,48 @@ from abses.core.protocols import (
     StateManagerProtocol,
     TimeDriverProtocol,
 )
+from abses.utils.config import FrozenParams
 from abses.utils.regex import is_snake_name
 
+if TYPE_CHECKING:
+    from datetime import timedelta
+
+    from abses.core.events import Event
+
+StepFrequency = Union[int, Mapping[str, Any], None]
+
+
+def _resolve_frequency(
+    every: StepFrequency,
+) -> Optional[Callable[[BaseModule], bool]]:
+    """Resolve a step frequency into a function telling if a module is due.
+
+    Args:
+        every: Number of ticks between steps, a calendar rule, or None.
+
+    Returns:
+        None if the module steps at every tick, else the function.
+
+    Raises:
+        ValueError: If the number of ticks is not positive.
+        TypeError: If the frequency is neither an int nor a mapping.
+    """
+    if every is None:
+        return None
+    if isinstance(every, int) and not isinstance(every, bool):
+        if every < 1:
+            raise ValueError(f"Step frequency must be a positive int, got {every}.")
+        if every == 1:
+            return None
+        return lambda module: module.time.tick % every == 0
+    if isinstance(every, Mapping):
+        from abses.core.time_driver import _condition_key
+
+        rule = dict(every)
+        key = _condition_key(rule)
+        return lambda module: module.time.match(rule, key=key)
+    raise TypeError(f"Step frequency must be an int or a mapping, got {every}.")
+
 
 class BaseModelElement(BaseObservable, ABC, ModelElement):
     """Base model element implementation.
@@ -60,9 +111,17 @@ class BaseModelElement(BaseObservable, ABC, ModelElement):
             model: Parent ABSESpy model.
             name: Optional name for this element.
         """
-        BaseObservable.__init__(self)
         self._model = model
         self._name = name
+        self._create_containers()
+
+    def _create_containers(self) -> None:
+        """Create the observers, dynamic variables and updated ticks.
+
+        Slot-based elements (e.g., `SlotActor`) override it to do nothing,
+        as their containers are created on first access instead.
+        """
+        BaseObservable.__init__(self)
         self._dynamic_variables: Dict[str, DynamicVariableProtocol] = {}
         self._updated_ticks: List[int] = []
 
@@ -103,7 +162,7 @@ class BaseModelElement(BaseObservable, ABC, ModelElement):
         return self._name
 
     @property
-    def params(self) -> DictConfig:
+    def params(self) -> DictConfig | FrozenParams:
         """Get component parameters with backward compatibility.
 
         Returns configuration from model settings for this component's name.
@@ -130,7 +189,24 @@ class BaseModelElement(BaseObservable, ABC, ModelElement):
                 def setup(self):
                     capital = self.params.initial_capital  # Works with both
             ```
+
+        Note:
+            While the model steps, parameters are resolved once into a
+            read-only `FrozenParams` snapshot, cached per class and name, so
+            that reading them in hot paths is fast. Call `refresh_params()`
+            after changing the model's settings at runtime.
         """
+        cache = vars(self.model).get("_params_cache")
+        if cache is None:
+            return self._lookup_params()
+        key = (self.__class__, self._name)
+        params = cache.get(key)
+        if params is None:
+            params = cache[key] = FrozenParams(self._lookup_params())
+        return params
+
+    def _lookup_params(self) -> DictConfig:
+        """Find this component's parameters in the model's settings."""
         # Try original name first (e.g., 'Farmer', 'farmland', 'nature')
         params = self.model.settings.get(self.name, None)
 
@@ -161,6 +237,16 @@ class BaseModelElement(BaseObservable, ABC, ModelElement):
     # Alias for params
     p = params
 
+    def refresh_params(self) -> None:
+        """Drop the snapshot of this component's parameters, if any.
+
+        The parameters are resolved again from the model's settings at the
+        next access. See `MainModel.refresh_params` to refresh all components.
+        """
+        cache = vars(self.model).get("_params_cache")
+        if cache is not None:
+            cache.pop((self.__class__, self._name), None)
+
     @property
     def datasets(self) -> DictConfig:
         """Get datasets from the parent model.
@@ -194,6 +280,33 @@ class BaseModelElement(BaseObservable, ABC, ModelElement):
         """
         return self.model.time
 
+    def schedule(
+        self,
+        method: str | Callable[..., Any],
+        at_tick: Optional[int] = None,
+        after: Optional[int | timedelta] = None,
+        priority: int = 0,
+        **kwargs: Any,
+    ) -> Event:
+        """Schedule one of this element's methods to be called at a later tick.
+
+        Only due events are run at each tick, so an actor waiting for
+        something does not need to be stepped meanwhile.
+
+        Args:
+            method: Name of the method, or a callable taking this element.
+            at_tick: The tick when the method is called.
+            after: Delay in ticks, or as a duration (e.g. `pendulum.duration(days=30)`).
+            priority: Events of the same tick run by ascending priority.
+            **kwargs: Keyword arguments of the method.
+
+        Returns:
+            The scheduled event, which can be cancelled.
+        """
+        return self.model.events.schedule(
+            self, method, at_tick=at_tick, after=after, priority=priority, kwargs=kwargs
+        )
+
     @property
     def dynamic_variables(self) -> Dict[str, DynamicVariableProtocol]:
         """Get read-only dynamic variables dictionary.
@@ -326,13 +439,25 @@ class BaseModule(BaseModelElement, BaseStateManager, Observer, ModuleProtocol, A
     Combines model element, state management, and observer capabilities.
     Provides lifecycle management with automatic wrapping of user methods.
 
+    A module can declare how often it steps with the class attribute
+    `step_every`, or the `step_every` parameter in its configuration:
+    every n ticks (e.g. `24`), or at the ticks whose datetime matches a
+    calendar rule (e.g. `{"month": 1, "day": 1}`). The frequency is resolved
+    once, and `MainModel.do_each("step")` skips the modules which are not due
+    without invoking them. Modules of a subsystem are stepped by `do_each`
+    only when they declare a frequency.
+
     Attributes:
         model: Parent ABSESpy model.
         name: Module name.
         state: Current lifecycle state.
         opening: Whether module is active.
+        step_every: Declared step frequency, None for every tick.
+        executions: Number of steps run by `do_each`.
     """
 
+    step_every: StepFrequency = None
+
     def __init__(
         self,
         model: MainModelProtocol,
@@ -347,6 +472,8 @@ class BaseModule(BaseModelElement, BaseStateManager, Observer, ModuleProtocol, A
         """
         BaseModelElement.__init__(self, model, name)
         BaseStateManager.__init__(self)
+        self.executions = 0
+        self.set_step_every(self.params.get("step_every", self.step_every))
 
     def __repr__(self) -> str:
         flag = "open" if self.opening else "closed"
@@ -355,6 +482,31 @@ class BaseModule(BaseModelElement, BaseStateManager, Observer, ModuleProtocol, A
     def __str__(self) -> str:
         return self.name
 
+    def set_step_every(self, every: StepFrequency) -> None:
+        """Set how often this module steps.
+
+        Args:
+            every: Number of ticks between steps, a calendar rule of the
+                datetime's fields (e.g. `{"month": 1}`), or None for every tick.
+        """
+        self._due = _resolve_frequency(every)
+        self.step_every = every
+
+    @property
+    def rng(self) -> np.random.Generator:
+        """This module's random generator.
+
+        A stream of `model.random_streams` keyed by the module's name, so its
+        draws do not change when other modules or breeds draw numbers.
+        """
+        return self.model.random_streams.generator("module", self.name)
+
+    @property
+    def is_due(self) -> bool:
+        """Whether this module should step at the current tick."""
+        due = self._due
+        return due is None or due(self)
+
     @final
     def _initialize(self):
         """Internal initialization before handling parameters.
@@ -390,7 +542,15 @@ class BaseModule(BaseModelElement, BaseStateManager, Observer, ModuleProtocol, A
             *args: Positional arguments for user step.
             **kwargs: Keyword arguments for user step.
         """
-        self._user_step(*args, **kwargs)
+        profiler = vars(self.model).get("profiler")
+        if profiler is None:
+            self._user_step(*args, **kwargs)
+            return
+        start = profiler.start()
+        try:
+            self._user_step(*args, **kwargs)
+        finally:
+            profiler.stop("module", self.name, start)
 
     @final
     def _end(self, *args, **kwargs):
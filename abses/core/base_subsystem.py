@@ -154,6 +154,9 @@ class BaseSubSystem(BaseModule, SubSystemProtocol, ABC):
         Raises:
             AttributeError: If attribute not found in modules or major layer.
         """
+        if name.startswith("_"):
+            # Private names are never delegated, e.g. while unpickling.
+            return super().__getattribute__(name)
         try:
             return super().__getattribute__(name)
         except AttributeError as e:
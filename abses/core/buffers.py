@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Double-buffered fields, for synchronous updates of cells and actors.
+
+A field declared with `buffered` on a cell or actor class is read from the
+current buffer, while the values written during a synchronous phase go to a
+next buffer, swapped in at the end of the phase. While the model steps, each
+tick is a synchronous phase, so rules like cellular automata read their
+neighbors' values of the previous tick, whatever the order of the updates:
+
+```python
+class Forest(PatchCell):
+    state = buffered(0)
+
+    def step(self):
+        if any(cell.state == 2 for cell in self.neighboring()):
+            self.state = 2  # seen by the other cells at the next tick
+```
+
+As the order does not matter, `ActorsList.sync_do` runs such steps without
+shuffling, optionally in chunks on a thread pool.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Dict, Generic, Optional, Tuple, TypeVar
+
+if TYPE_CHECKING:
+    from abses.core.protocols import MainModelProtocol
+
+T = TypeVar("T")
+
+
+class WriteBuffer:
+    """The values written to buffered fields during a synchronous phase.
+
+    Attributes:
+        swaps:
+            Number of values written by `swap` so far.
+    """
+
+    __slots__ = ("_pending", "swaps")
+
+    def __init__(self) -> None:
+        self._pending: Dict[Tuple[int, str], Tuple[Any, Any]] = {}
+        self.swaps = 0
+
+    def __len__(self) -> int:
+        return len(self._pending)
+
+    def __repr__(self) -> str:
+        return f"<WriteBuffer: {len(self)} pending>"
+
+    def stage(self, obj: Any, storage: str, value: Any) -> None:
+        """Write a value to the next buffer; the last write wins."""
+        self._pending[(id(obj), storage)] = (obj, value)
+
+    def pending(self, obj: Any, storage: str, default: Any = None) -> Any:
+        """The value written to the next buffer, if any."""
+        return self._pending.get((id(obj), storage), (None, default))[1]
+
+    def swap(self) -> int:
+        """Make the written values current.
+
+        Returns:
+            The number of values written.
+        """
+        pending, self._pending = self._pending, {}
+        for (_, storage), (obj, value) in pending.items():
+            object.__setattr__(obj, storage, value)
+        self.swaps += len(pending)
+        return len(pending)
+
+    def discard(self) -> None:
+        """Drop the written values."""
+        self._pending.clear()
+
+
+def active_buffer(model: MainModelProtocol) -> Optional[WriteBuffer]:
+    """The write buffer of the model's current synchronous phase, if any."""
+    return vars(model).get("_write_buffer")
+
+
+class BufferedField(Generic[T]):
+    """A double-buffered field of cells or actors (see `buffered`).
+
+    The current value is stored in the attribute `_buffered_<name>`, which
+    slotted classes must declare in their `__slots__`.
+    """
+
+    def __init__(self, default: Optional[T] = None) -> None:
+        self.default = default
+        self.name = ""
+        self.storage = ""
+
+    def __set_name__(self, owner: type, name: str) -> None:
+        self.name = name
+        self.storage = f"_buffered_{name}"
+
+    def __repr__(self) -> str:
+        return f"<BufferedField {self.name}>"
+
+    def __get__(self, obj: Any, objtype: Optional[type] = None) -> Any:
+        if obj is None:
+            return self
+        return getattr(obj, self.storage, self.default)
+
+    def __set__(self, obj: Any, value: T) -> None:
+        buffer = active_buffer(obj.model)
+        if buffer is None:
+            object.__setattr__(obj, self.storage, value)
+        else:
+            buffer.stage(obj, self.storage, value)
+
+    def next_value(self, obj: Any) -> Any:
+        """The value the field will have after the swap."""
+        buffer = active_buffer(obj.model)
+        current = self.__get__(obj)
+        return current if buffer is None else buffer.pending(obj, self.storage, current)
+
+
+def buffered(default: Any = None) -> Any:
+    """Declare a double-buffered field on a cell or actor class.
+
+    Outside of a synchronous phase, writes are immediate. During one (each
+    tick of `MainModel.run_model`, or `ActorsList.sync_do`), reads see the
+    values of the previous phase and writes are applied at its end. Buffered
+    fields of cells can be read with `PatchModule.get_raster`.
+
+    Parameters:
+        default:
+            The value before the first write.
+
+    Example:
+        ```python
+        class Farmer(Actor):
+            wealth = buffered(0.0)
+        ```
+    """
+    return BufferedField(default)
@@ -0,0 +1,210 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Discrete-event scheduling of actors' methods.
+
+Instead of stepping every actor at every tick, an actor waiting for
+something (a crop growing, a cooldown) can schedule a method to be called at
+a later tick: `actor.schedule("harvest", after=120)`. The model keeps the
+events in a priority queue, and runs only the due events at each tick, after
+stepping its components (see `MainModel.run_model`).
+
+Events due at the same tick run by ascending priority, then in the order
+they were scheduled, so runs are reproducible. Events of actors which died
+(or were reused from a pool) in the meantime are dropped.
+"""
+
+from __future__ import annotations
+
+import heapq
+from datetime import timedelta
+from itertools import count
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+
+from abses.agents.pool import ActorRef
+
+if TYPE_CHECKING:
+    from abses.core.protocols import MainModelProtocol
+
+Target = Callable[..., Any] | str
+
+
+class Event:
+    """A method call scheduled at a tick.
+
+    Attributes:
+        tick:
+            The tick when the method is called.
+        priority:
+            Events of the same tick run by ascending priority.
+        method:
+            The method's name, or a callable taking the owner as first argument.
+    """
+
+    __slots__ = ("tick", "priority", "method", "args", "kwargs", "_owner", "cancelled")
+
+    def __init__(
+        self,
+        tick: int,
+        owner: Any,
+        method: Target,
+        priority: int = 0,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        self.tick = tick
+        self.priority = priority
+        self.method = method
+        self.args = args
+        self.kwargs = kwargs or {}
+        # Actors are referred to by `ActorRef`, which is invalid once they die.
+        make_ref = getattr(owner, "ref", None)
+        self._owner = make_ref() if callable(make_ref) else owner
+        self.cancelled = False
+
+    def __repr__(self) -> str:
+        name = getattr(self.method, "__name__", self.method)
+        return f"<Event {name} at tick {self.tick}>"
+
+    @property
+    def owner(self) -> Any:
+        """The object whose method is called, None if it is a dead actor."""
+        owner = self._owner
+        return owner.get() if isinstance(owner, ActorRef) else owner
+
+    def cancel(self) -> None:
+        """Do not run this event."""
+        self.cancelled = True
+
+    def run(self) -> Any:
+        """Call the method, unless the event is cancelled or its actor died."""
+        owner = self.owner
+        if self.cancelled or owner is None:
+            return None
+        if isinstance(self.method, str):
+            return getattr(owner, self.method)(*self.args, **self.kwargs)
+        return self.method(owner, *self.args, **self.kwargs)
+
+
+class EventScheduler:
+    """Priority queue of the events of a model.
+
+    Parameters:
+        model:
+            The model, whose time driver gives the current tick.
+
+    Attributes:
+        executed:
+            Number of events run so far.
+    """
+
+    def __init__(self, model: MainModelProtocol) -> None:
+        self.model = model
+        self._queue: List[Tuple[int, int, int, Event]] = []
+        self._counter = count()
+        self.executed = 0
+
+    def __len__(self) -> int:
+        return len(self._queue)
+
+    def __repr__(self) -> str:
+        return f"<EventScheduler: {len(self)} events>"
+
+    def _to_tick(self, at_tick: Optional[int], after: Any) -> int:
+        """The tick of an event, from an absolute tick or a delay."""
+        now = self.model.time.tick
+        if (at_tick is None) == (after is None):
+            raise ValueError("Specify either `at_tick` or `after`.")
+        if after is not None:
+            if isinstance(after, timedelta):
+                return now + self.model.time.ticks_after(after)
+            if not isinstance(after, int) or after < 0:
+                raise ValueError(f"Delay must be a non-negative int, got {after}.")
+            return now + after
+        if not isinstance(at_tick, int):
+            raise TypeError(f"Tick must be an int, got {type(at_tick)}.")
+        if at_tick < now:
+            raise ValueError(f"Cannot schedule at tick {at_tick}, now is {now}.")
+        return at_tick
+
+    def schedule(
+        self,
+        owner: Any,
+        method: Target,
+        at_tick: Optional[int] = None,
+        after: Optional[int | timedelta] = None,
+        priority: int = 0,
+        args: Tuple[Any, ...] = (),
+        kwargs: Optional[Dict[str, Any]] = None,
+    ) -> Event:
+        """Schedule a method call.
+
+        Parameters:
+            owner:
+                The object whose method is called, e.g. an actor.
+            method:
+                The method's name, or a callable taking `owner` as first argument.
+            at_tick:
+                The tick when the method is called.
+            after:
+                Delay before the call, as a number of ticks or as a duration
+                (e.g. `pendulum.duration(months=3)`), converted to the number
+                of ticks needed to reach it.
+            priority:
+                Events of the same tick run by ascending priority, then in
+                the order they were scheduled.
+            args:
+                Positional arguments of the method.
+            kwargs:
+                Keyword arguments of the method.
+
+        Returns:
+            The event, which can be cancelled.
+
+        Raises:
+            ValueError:
+                If both or none of `at_tick` and `after` are given, or the
+                tick is in the past.
+        """
+        tick = self._to_tick(at_tick, after)
+        event = Event(tick, owner, method, priority, args, kwargs)
+        heapq.heappush(self._queue, (tick, priority, next(self._counter), event))
+        return event
+
+    @property
+    def next_tick(self) -> Optional[int]:
+        """The tick of the next event, None if there is no event."""
+        return self._queue[0][0] if self._queue else None
+
+    def run_due(self, tick: Optional[int] = None) -> int:
+        """Run the events due at (or before) a tick, including the events
+        they schedule for that tick.
+
+        Parameters:
+            tick:
+                The tick. Defaults to the current one.
+
+        Returns:
+            The number of events run.
+        """
+        if tick is None:
+            tick = self.model.time.tick
+        queue = self._queue
+        executed = 0
+        while queue and queue[0][0] <= tick:
+            event = heapq.heappop(queue)[3]
+            if event.cancelled or event.owner is None:
+                continue
+            event.run()
+            executed += 1
+        self.executed += executed
+        return executed
+
+    def clear(self) -> None:
+        """Drop all the events."""
+        self._queue.clear()
@@ -14,7 +14,9 @@ import inspect
 import itertools
 import logging
 import os
-import random
+import pickle
+import sys
+import traceback
 from copy import deepcopy
 from numbers import Number
 from pathlib import Path
@@ -37,6 +39,12 @@ try:
 except ImportError:
     from typing_extensions import TypeAlias
 
+try:
+    # Pickles closures too, e.g. data reporters (as joblib's loky backend).
+    import cloudpickle as checkpoint_pickler
+except ImportError:
+    checkpoint_pickler = pickle
+
 import numpy as np
 import pandas as pd
 from hydra import compose, initialize
@@ -48,8 +56,10 @@ from tqdm.auto import tqdm
 
 from abses.core.job_manager import ExperimentManager
 from abses.core.model import MainModel
+from abses.core.primitives import DEFAULT_RUN_ORDER
 from abses.utils.exp_logging import EXP_LOGGER_NAME, setup_exp_logger
 from abses.utils.log_parser import get_file_config, get_log_mode
+from abses.utils.random import RandomStreams, sequence_seed
 
 # Use experiment-level logger, separate from model run loggers
 logger = logging.getLogger(EXP_LOGGER_NAME)
@@ -57,6 +67,8 @@ logger = logging.getLogger(EXP_LOGGER_NAME)
 Configurations: TypeAlias = DictConfig | str | Dict[str, Any]
 T = TypeVar("T")
 HookFunc: TypeAlias = Callable[[MainModel, Optional[int], Optional[int]], Any]
+BranchResult: TypeAlias = Tuple[Tuple[int, int], Optional[int], Dict[str, Any]]
+BRANCH_METHODS = ("auto", "fork", "checkpoint")
 
 if TYPE_CHECKING:
     from abses.core.protocols import MainModelProtocol
@@ -108,17 +120,17 @@ def run_single(
     model_cls: Type[MainModelProtocol],
     cfg: DictConfig,
     key: Tuple[int, int],
-    seed: Optional[int] = None,
+    seed: Optional[int | np.random.SeedSequence] = None,
     hooks: Optional[Dict[str, HookFunc]] = None,
     **kwargs,
 ) -> Tuple[Tuple[int, int], Optional[int], pd.DataFrame]:
-    """Run model once, return the key, seed, and results.
+    """Run model once, return the key, (integer) seed, and results.
 
     Args:
         key:
             The key of the experiment.
         seed:
-            The seed of the experiment.
+            The seed, or seed sequence, of the model.
         hooks:
             The hooks to run after the model is run.
     """
@@ -137,7 +149,122 @@ def run_single(
             _call_hook_with_optional_args(
                 hook_func, model, job_id=job_id, run_id=run_id
             )
-    return key, seed, results
+    return key, getattr(model, "_seed", seed), results
+
+
+def branch_seed(model: MainModelProtocol, job_id: int) -> np.random.SeedSequence:
+    """Derive the seed sequence of a branch from a spun-up model.
+
+    The sequence is a child of the model's random streams' root, and only
+    depends on the model's own seed (or initial random state) and the
+    branch's job id, so branching is reproducible.
+    """
+    return RandomStreams.from_model(model).spawn("branch", job_id)
+
+
+def _reseed(model: MainModelProtocol, seed: int | np.random.SeedSequence) -> None:
+    """Re-seed the random generators of a model in place.
+
+    The generators are kept (only their states change), as other objects,
+    e.g. the random facades of the actors' lists and modules, hold
+    references to them. A seed sequence becomes the root of the model's
+    random streams.
+    """
+    sequence = None
+    if isinstance(seed, np.random.SeedSequence):
+        sequence, seed = seed, sequence_seed(seed)
+    model._seed_sequence = sequence
+    model.random.seed(seed)
+    model.rng.bit_generator.state = np.random.default_rng(seed).bit_generator.state
+    model._seed = seed
+    streams = model.__dict__.get("random_streams")
+    if streams is not None:
+        streams.reseed(RandomStreams.from_model(model).root)
+
+
+def run_branch(
+    model: MainModelProtocol,
+    key: Tuple[int, int],
+    overrides: Dict[str, Any],
+    seed: int | np.random.SeedSequence,
+    hooks: Optional[Dict[str, HookFunc]] = None,
+) -> BranchResult:
+    """Run a spun-up model to its end, with some overridden parameters.
+
+    Args:
+        model:
+            The spun-up model, consumed by this branch.
+        key:
+            The key of the branch, as (job_id, run_id).
+        overrides:
+            Parameters to override, e.g. `{"nature.rain": 1.2}`.
+        seed:
+            The seed (or seed sequence) of the branch's random generators.
+        hooks:
+            The hooks to run after the model is run.
+    """
+    job_id, run_id = key
+    for name, value in overrides.items():
+        OmegaConf.update(model.settings, key=name, value=value, merge=True)
+    _reseed(model, seed)
+    model._run_steps(order=DEFAULT_RUN_ORDER)
+    model.do_each("end", order=DEFAULT_RUN_ORDER)
+    results = model.datacollector.get_final_vars_report(model)
+    if hooks is not None:
+        for hook_name, hook_func in hooks.items():
+            logger.info(f"Running hook {hook_name}.")
+            _call_hook_with_optional_args(
+                hook_func, model, job_id=job_id, run_id=run_id
+            )
+    return key, getattr(model, "_seed", None), results
+
+
+def _fork_branch(
+    model: MainModelProtocol,
+    key: Tuple[int, int],
+    overrides: Dict[str, Any],
+    seed: int | np.random.SeedSequence,
+    hooks: Optional[Dict[str, HookFunc]] = None,
+) -> Tuple[int, int]:
+    """Run a branch in a forked (copy-on-write) child process.
+
+    Returns:
+        The child's pid, and the file descriptor to read its pickled result.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid:
+        os.close(write_fd)
+        return pid, read_fd
+    # Child process: never returns into the caller's code.
+    os.close(read_fd)
+    code = 0
+    try:
+        payload = pickle.dumps(run_branch(model, key, overrides, seed, hooks))
+    except BaseException:  # pylint: disable=broad-except
+        code = 1
+        payload = pickle.dumps(traceback.format_exc())
+    with os.fdopen(write_fd, "wb") as file:
+        file.write(payload)
+    os._exit(code)
+
+
+def _join_branch(pid: int, read_fd: int, key: Tuple[int, int]) -> BranchResult:
+    """Wait for a forked branch and load its result.
+
+    Raises:
+        RuntimeError:
+            If the branch failed.
+    """
+    with os.fdopen(read_fd, "rb") as file:
+        payload = file.read()
+    _, status = os.waitpid(pid, 0)
+    if os.waitstatus_to_exitcode(status) != 0 or not payload:
+        detail = pickle.loads(payload) if payload else "no result."
+        raise RuntimeError(f"Branch {key} failed: {detail}")
+    return pickle.loads(payload)
 
 
 class Experiment:
@@ -154,6 +281,7 @@ class Experiment:
         self._extra_kwargs = kwargs
         self._overrides: Dict[str, Any] = {}
         self._base_seed = seed
+        self._seeds = None if seed is None else RandomStreams(seed)
         self._manager = ExperimentManager(model_cls)
         self.cfg = cfg
 
@@ -370,29 +498,30 @@ class Experiment:
 
         return cfg
 
-    def _get_seed(self, run_id: int, job_id: Optional[int] = None) -> Optional[int]:
-        """获取每次运行的随机种子
+    def _get_seed(
+        self, run_id: int, job_id: Optional[int] = None
+    ) -> Optional[np.random.SeedSequence]:
+        """获取每次运行的随机种子序列
 
-        使用基础种子初始化随机数生成器，为每次运行生成唯一的随机种子。
-        这样可以保证：
+        随机种子构成一棵 `numpy.random.SeedSequence` 树：
+        实验（基础种子）→ 任务（job_id）→ 运行（run_id）→ 子系统、模块、主体种类
+        （见 `MainModel.random_streams`）。这样可以保证：
         1. 如果基础种子相同，生成的种子序列也相同
-        2. 不同的 job_id 和 run_id 组合会得到不同的种子
-        3. 种子序列具有更好的随机性
+        2. 不同的 job_id 和 run_id 组合会得到相互独立的种子序列
+        3. 模型中各组件的随机数流彼此独立，不受其他组件的影响
 
         Args:
             run_id: 重复实验的ID
+            job_id: 任务的ID，默认为当前任务
 
         Returns:
-            如果没有设置基础种子则返回 None，否则返回生成的随机种子
+            如果没有设置基础种子则返回 None，否则返回这次运行的种子序列
         """
-        if self._base_seed is None:
+        if self._seeds is None:
             return None
-
         if job_id is None:
             job_id = self.job_id
-        # 使用基础种子和 job_id 创建随机数生成器
-        r = random.Random(self._base_seed + job_id * 1000 + run_id)
-        return r.randrange(2**32)
+        return self._seeds.spawn(job_id, run_id)
 
     def _get_logging_mode(self) -> str:
         """Get logging mode from experiment configuration.
@@ -595,6 +724,152 @@ class Experiment:
             self._job_id += 1
         self.overrides = {}
 
+    def branch_run(
+        self,
+        spin_up: int,
+        overrides: Optional[Dict[str, str | Iterable[Number]]] = None,
+        repeats: int = 1,
+        parallels: Optional[int] = None,
+        method: str = "auto",
+        display_progress: bool = True,
+    ) -> None:
+        """Run scenarios branching from a shared spin-up.
+
+        For each repeat, the model is set up and stepped `spin_up` times
+        only once. Then, for each combination of `overrides`, a branch of
+        this spun-up model is run to its end, with the overridden
+        parameters and a random seed derived from the repeat's seed and the
+        branch's job id (see `branch_seed`). The results are merged into the
+        experiment's summary, as with `batch_run`.
+
+        Since the branches are created after the model's initialization,
+        overrides only affect parameters read while the model is running
+        (e.g. in `step`), not the components created during the spin-up.
+
+        Parameters:
+            spin_up:
+                Number of steps shared by all the scenarios.
+            overrides:
+                Parameters of the scenarios, as in `batch_run`.
+            repeats:
+                Number of spin-ups, each with its own seed.
+            parallels:
+                Maximum number of branches running at the same time when
+                forking. Defaults to the number of CPUs.
+            method:
+                How to copy the spun-up model into branches. "fork" uses
+                copy-on-write `os.fork` (Linux only), "checkpoint" pickles
+                the spun-up model to a file and loads it for each branch.
+                "auto" forks when it is available.
+
+        Raises:
+            ValueError:
+                If the method is unknown, or "fork" is not available.
+        """
+        if method not in BRANCH_METHODS:
+            raise ValueError(
+                f"Unknown branch method {method}, not in {BRANCH_METHODS}."
+            )
+        can_fork = hasattr(os, "fork") and sys.platform.startswith("linux")
+        if method == "auto":
+            method = "fork" if can_fork else "checkpoint"
+        if method == "fork" and not can_fork:
+            raise ValueError("Forking branches is only available on Linux.")
+        if parallels is None:
+            parallels = os.cpu_count() or 1
+
+        cfg = deepcopy(self._cfg)
+        scenarios = [overrides_ for _, overrides_ in self._overriding(cfg, overrides)]
+        self.logger.info(
+            f"Branching {len(scenarios)} scenarios after {spin_up} steps, "
+            f"with {repeats} repeats by {method}."
+        )
+        for run_id in tqdm(
+            range(1, repeats + 1),
+            disable=not display_progress,
+            desc=f"{repeats} spin-ups, {len(scenarios)} branches each.",
+        ):
+            model = self.model_cls(
+                parameters=deepcopy(cfg),
+                run_id=run_id,
+                seed=self._get_seed(run_id),
+                outpath=self.outpath,
+                **self._extra_kwargs,
+            )
+            model.do_each("setup", order=DEFAULT_RUN_ORDER)
+            model._run_steps(spin_up, order=DEFAULT_RUN_ORDER)
+            branches = [
+                ((self._job_id + i, run_id), overrides_)
+                for i, overrides_ in enumerate(scenarios)
+            ]
+            if method == "fork":
+                results = self._fork_branches(model, branches, parallels)
+            else:
+                results = self._checkpoint_branches(model, branches)
+            for (key, seed, dataset), (_, overrides_) in zip(results, branches):
+                self._manager.update_result(
+                    key=key, datasets=dataset, seed=seed, overrides=overrides_
+                )
+        self._job_id += len(scenarios)
+
+    def _fork_branches(
+        self,
+        model: MainModelProtocol,
+        branches: List[Tuple[Tuple[int, int], Dict[str, Any]]],
+        parallels: int,
+    ) -> List[BranchResult]:
+        """Run the branches in forked processes, `parallels` at a time.
+
+        Every child of a batch is joined, even when some of them failed (or
+        forking failed), before the failures are raised together.
+
+        Raises:
+            RuntimeError:
+                If some branches failed.
+        """
+        results: List[BranchResult] = []
+        for start in range(0, len(branches), parallels):
+            running = []
+            errors: List[RuntimeError] = []
+            try:
+                for key, overrides_ in branches[start : start + parallels]:
+                    seed = branch_seed(model, job_id=key[0])
+                    pid, read_fd = _fork_branch(
+                        model, key, overrides_, seed, self._manager.hooks
+                    )
+                    running.append((key, pid, read_fd))
+            finally:
+                for key, pid, read_fd in running:
+                    try:
+                        results.append(_join_branch(pid, read_fd, key))
+                    except RuntimeError as error:
+                        errors.append(error)
+            if errors:
+                raise RuntimeError("\n".join(str(error) for error in errors))
+        return results
+
+    def _checkpoint_branches(
+        self,
+        model: MainModelProtocol,
+        branches: List[Tuple[Tuple[int, int], Dict[str, Any]]],
+    ) -> List[BranchResult]:
+        """Run the branches one by one, each from a checkpoint file."""
+        path = self.outpath / f".spin_up_{self.name}_{model.run_id}.pkl"
+        with open(path, "wb") as file:
+            checkpoint_pickler.dump(model, file)
+        try:
+            results = []
+            for key, overrides_ in branches:
+                seed = branch_seed(model, job_id=key[0])
+                with open(path, "rb") as file:
+                    branch = pickle.load(file)
+                results.append(
+                    run_branch(branch, key, overrides_, seed, self._manager.hooks)
+                )
+        finally:
+            path.unlink(missing_ok=True)
+        return results
+
     def add_hooks(
         self,
         hooks: List[HookFunc] | Dict[str, HookFunc] | HookFunc,
@@ -0,0 +1,361 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Estimates of where a model's memory goes.
+
+`model.memory_report()` estimates the bytes held by:
+
+- "layer": each patch module's cells, the attributes stored on its cells,
+  and its cache of neighborhoods;
+- "breed": the actors of each breed;
+- "link": the store of each link type, and the index of the linked nodes;
+- "collector": the records buffered by the data collector.
+
+Sizes are deep sizes (`sys.getsizeof` of an object and of what it holds),
+estimated from a sample: only `sample` items of a large container, or
+`sample` actors of a breed, are measured, then scaled up. Other model
+elements referred to (the model, actors, cells, modules) are not counted
+as part of an object.
+
+`model.watch_memory()` measures the total at each tick, keeps its
+high-water mark, and calls a hook when it exceeds a threshold.
+"""
+
+from __future__ import annotations
+
+import logging
+import random
+import sys
+import tracemalloc
+from collections import deque
+from itertools import islice
+from types import BuiltinFunctionType, FunctionType, MethodType, ModuleType
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Callable,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from abses.core.protocols import MainModelProtocol
+
+logger = logging.getLogger(__name__)
+
+MemoryMethod = Literal["sample", "tracemalloc"]
+ExceedAction = Union[Literal["warn", "stop", "raise"], Callable[[Any, int], Any]]
+Row = Tuple[str, str, str, int, int]
+
+_ATOMIC = (str, bytes, bytearray, int, float, complex, bool, range, type(None))
+_SKIPPED = (
+    type,
+    ModuleType,
+    FunctionType,
+    BuiltinFunctionType,
+    MethodType,
+    logging.Logger,
+)
+_MAX_DEPTH = 32
+
+
+def _shared_types() -> Tuple[type, ...]:
+    """Types of the objects shared by the model's elements, which are not
+    part of another object: model elements, random generators and CRS."""
+    from mesa import Agent, Model
+    from pyproj import CRS
+
+    from abses.core.base_module import BaseModelElement
+
+    return (Model, Agent, BaseModelElement, random.Random, np.random.Generator, CRS)
+
+
+def _sample(items: Iterable[Any], size: int, sample: int) -> Tuple[List[Any], float]:
+    """A sample of a container's items, and the scale to all the items."""
+    if size <= sample:
+        return list(items), 1.0
+    if isinstance(items, (list, tuple, np.ndarray)):
+        step = size // sample
+        return list(items[::step][:sample]), size / sample
+    return list(islice(items, sample)), size / sample
+
+
+def deep_sizeof(
+    obj: Any,
+    sample: int = 64,
+    shared: Tuple[type, ...] = (),
+) -> int:
+    """Estimated deep size of an object, in bytes.
+
+    Parameters:
+        obj:
+            The object.
+        sample:
+            Number of items measured in a large container, whose size is
+            scaled from them.
+        shared:
+            Types of the objects which are not counted when `obj` refers to
+            them, e.g. the model.
+
+    Returns:
+        The estimated number of bytes.
+    """
+    return _sizeof(obj, sample, shared, set(), 0)
+
+
+def _sizeof(
+    obj: Any, sample: int, shared: Tuple[type, ...], seen: Set[int], depth: int
+) -> int:
+    """Deep size of `obj`, skipping the objects already seen."""
+    if id(obj) in seen or isinstance(obj, _SKIPPED) or depth > _MAX_DEPTH:
+        return 0
+    if obj is None or isinstance(obj, bool) or (type(obj) is int and -5 <= obj <= 256):
+        return 0  # singletons and cached small ints
+    if depth and shared and isinstance(obj, shared):
+        return 0
+    seen.add(id(obj))
+    if isinstance(obj, _ATOMIC):
+        return sys.getsizeof(obj)
+    if isinstance(obj, np.ndarray):
+        size = sys.getsizeof(obj)
+        if obj.dtype == object:
+            size += _items(obj.flat, obj.size, sample, shared, seen, depth)
+        return size
+    if isinstance(obj, (pd.DataFrame, pd.Series, pd.Index)):
+        return int(np.sum(obj.memory_usage(deep=False)))
+    size = sys.getsizeof(obj, 0)
+    if isinstance(obj, dict):
+        return size + _items(obj.items(), len(obj), sample, shared, seen, depth)
+    if isinstance(obj, (list, tuple, set, frozenset, deque)):
+        return size + _items(obj, len(obj), sample, shared, seen, depth)
+    attrs = getattr(obj, "__dict__", None)
+    if isinstance(attrs, dict) and id(attrs) not in seen:
+        # Attributes' names are interned, shared by all the instances.
+        seen.add(id(attrs))
+        size += sys.getsizeof(attrs)
+        size += _items(attrs.values(), len(attrs), sample, shared, seen, depth)
+    for cls in type(obj).__mro__:
+        for slot in cls.__dict__.get("__slots__", ()):
+            if slot in ("__dict__", "__weakref__"):
+                continue
+            value = getattr(obj, slot, None)
+            size += _sizeof(value, sample, shared, seen, depth + 1)
+    return size
+
+
+def _items(
+    items: Iterable[Any],
+    size: int,
+    sample: int,
+    shared: Tuple[type, ...],
+    seen: Set[int],
+    depth: int,
+) -> int:
+    """Deep size of a container's items, scaled from a sample."""
+    picked, scale = _sample(items, size, sample)
+    total = sum(_sizeof(item, sample, shared, seen, depth + 1) for item in picked)
+    return int(total * scale)
+
+
+def _mean_size(objs: List[Any], sample: int, shared: Tuple[type, ...]) -> float:
+    """Mean deep size of a sample of objects."""
+    sizes = [deep_sizeof(obj, sample, shared) for obj in objs]
+    return sum(sizes) / len(sizes) if sizes else 0.0
+
+
+def _layer_rows(module: Any, sample: int, shared: Tuple[type, ...]) -> List[Row]:
+    """Cells, cells' attributes and neighborhoods of a patch module."""
+    n_cells = module.width * module.height
+    cells, _ = _sample(module.array_cells.ravel(), n_cells, sample)
+    cell_size = _mean_size(cells, sample, shared)
+    attrs_size = 0.0
+    if cells:
+        attrs = [
+            _sizeof(getattr(cell, attr), sample, shared, set(), 1)
+            for cell in cells
+            for attr in module._attributes
+            if hasattr(cell, attr)
+        ]
+        attrs_size = sum(attrs) / len(cells)
+    grid = sys.getsizeof(module.array_cells) if "array_cells" in vars(module) else 0
+    cells_bytes = int((cell_size - attrs_size) * n_cells) + grid
+    cache = getattr(module, "_neighborhood_cache", {})
+    name, n_attrs = module.name, len(module._attributes)
+    return [
+        ("layer", name, "cells", n_cells, cells_bytes),
+        ("layer", name, "attributes", n_attrs, int(attrs_size * n_cells)),
+        ("layer", name, "neighbors", len(cache), deep_sizeof(cache, sample, shared)),
+    ]
+
+
+def memory_report(model: MainModelProtocol, sample: int = 64) -> pd.DataFrame:
+    """Estimate the memory held by a model's layers, breeds, links and
+    collected records.
+
+    Parameters:
+        model:
+            The model.
+        sample:
+            Number of actors, cells or container items measured to estimate
+            the size of all of them.
+
+    Returns:
+        A table indexed by (kind, name, part), with the number of items and
+        the estimated bytes.
+    """
+    from abses.space.patch import PatchModule
+
+    shared = _shared_types()
+    rows: List[Row] = []
+    for module in model.nature.modules.values():
+        if isinstance(module, PatchModule):
+            rows.extend(_layer_rows(module, sample, shared))
+    for breed, agentset in model.agents_by_type.items():
+        n_actors = len(agentset)
+        actors = list(islice(agentset, sample))
+        mean = _mean_size(actors, sample, shared)
+        rows.append(("breed", breed.__name__, "actors", n_actors, int(mean * n_actors)))
+    human = model.human
+    for name, store in getattr(human, "_stores", {}).items():
+        size = deep_sizeof(store, sample, shared)
+        rows.append(("link", name, "store", len(store), size))
+    nodes = getattr(human, "_node_cache", None)
+    if nodes:
+        size = deep_sizeof((human._nodes, nodes), sample, shared)
+        rows.append(("link", "nodes", "index", len(nodes), size))
+    collector = model.datacollector
+    n_values = sum(len(values) for values in collector.model_vars.values())
+    size = deep_sizeof(collector.model_vars, sample, shared)
+    rows.append(("collector", "model", "records", n_values, size))
+    for breed_name, records in collector._agent_records.items():
+        size = deep_sizeof(records, sample, shared)
+        rows.append(("collector", breed_name, "records", len(records), size))
+    data = pd.DataFrame(rows, columns=["kind", "name", "part", "count", "bytes"])
+    return data.set_index(["kind", "name", "part"])
+
+
+class MemoryWatcher:
+    """Measures a model's memory at each tick, keeping its high-water mark.
+
+    Parameters:
+        model:
+            The watched model.
+        threshold:
+            Number of bytes above which `on_exceed` is called.
+        on_exceed:
+            What to do when the memory exceeds `threshold`: "warn" logs a
+            warning, "stop" stops the model after this tick, "raise" raises
+            a `MemoryError`. A callable is called with the model and the
+            number of bytes, e.g. to spill the collected records to disk.
+        every:
+            Number of ticks between two measures.
+        method:
+            "sample" sums the estimates of `memory_report`. "tracemalloc"
+            reads the memory allocated by Python since the watcher started
+            tracing, more exhaustive but slowing down allocations.
+        sample:
+            Size of the samples of `memory_report`.
+        stream:
+            Whether to log the measures as the `memory/bytes` metric to the
+            model's tracker.
+
+    Attributes:
+        peak:
+            The highest measure, in bytes.
+        peak_tick:
+            The tick of the highest measure.
+    """
+
+    def __init__(
+        self,
+        model: MainModelProtocol,
+        threshold: Optional[int] = None,
+        on_exceed: ExceedAction = "warn",
+        every: int = 1,
+        method: MemoryMethod = "sample",
+        sample: int = 64,
+        stream: bool = False,
+    ) -> None:
+        if method not in ("sample", "tracemalloc"):
+            raise ValueError(
+                f"Unknown method '{method}', choose 'sample' or 'tracemalloc'."
+            )
+        if not callable(on_exceed) and on_exceed not in ("warn", "stop", "raise"):
+            raise ValueError(
+                f"Unknown action '{on_exceed}' when exceeding the threshold."
+            )
+        if isinstance(every, bool) or not isinstance(every, int) or every < 1:
+            raise ValueError(f"Measures interval must be a positive int, got {every}.")
+        self.model = model
+        self.threshold = threshold
+        self.on_exceed = on_exceed
+        self.every = every
+        self.method = method
+        self.sample = sample
+        self.stream = stream
+        self.peak = 0
+        self.peak_tick: Optional[int] = None
+        self._history: List[Tuple[int, int]] = []
+        self._tracing = method == "tracemalloc" and not tracemalloc.is_tracing()
+        if self._tracing:
+            tracemalloc.start()
+
+    def __repr__(self) -> str:
+        return f"<MemoryWatcher: peak {self.peak} bytes at tick {self.peak_tick}>"
+
+    def measure(self) -> int:
+        """The memory used by the model now, in bytes."""
+        if self.method == "tracemalloc":
+            return tracemalloc.get_traced_memory()[0]
+        return int(memory_report(self.model, self.sample)["bytes"].sum())
+
+    def end_tick(self, tick: int) -> None:
+        """Measure the memory if due, and handle exceeding the threshold."""
+        if tick % self.every:
+            return
+        nbytes = self.measure()
+        self._history.append((tick, nbytes))
+        if nbytes > self.peak:
+            self.peak, self.peak_tick = nbytes, tick
+        tracker = getattr(self.model.datacollector, "tracker", None)
+        if self.stream and tracker is not None:
+            tracker.log_metrics({"memory/bytes": float(nbytes)}, step=tick)
+        if self.threshold is not None and nbytes > self.threshold:
+            self._exceed(tick, nbytes)
+
+    def _exceed(self, tick: int, nbytes: int) -> None:
+        """Act when the memory exceeds the threshold."""
+        msg = f"Memory {nbytes} bytes exceeds {self.threshold} bytes at tick {tick}."
+        if callable(self.on_exceed):
+            self.on_exceed(self.model, nbytes)
+        elif self.on_exceed == "raise":
+            raise MemoryError(msg)
+        elif self.on_exceed == "stop":
+            logger.warning(f"{msg} Stopping the model.")
+            self.model.running = False
+        else:
+            logger.warning(msg)
+
+    def to_frame(self) -> pd.DataFrame:
+        """The measures, indexed by tick."""
+        data = pd.DataFrame(self._history, columns=["tick", "bytes"])
+        return data.set_index("tick")
+
+    def close(self) -> None:
+        """Stop tracing the allocations, if this watcher started it."""
+        if self._tracing:
+            tracemalloc.stop()
+            self._tracing = False
@@ -12,25 +12,32 @@ The main modelling framework of ABSESpy.
 from __future__ import annotations
 
 import functools
+from contextlib import contextmanager
 from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterator,
     Optional,
     Set,
     Tuple,
     Type,
 )
 
+import numpy as np
 from mesa import Model
 from omegaconf import DictConfig
 
 from abses import __version__
 from abses.agents.container import _ModelAgentsContainer
 from abses.core.base import BaseStateManager
+from abses.core.buffers import WriteBuffer
+from abses.core.events import EventScheduler
+from abses.core.memory import MemoryWatcher, memory_report
 from abses.core.primitives import DEFAULT_INIT_ORDER, DEFAULT_RUN_ORDER, State
+from abses.core.profiler import StepProfiler
 from abses.core.protocols import (
     ActorsListProtocol,
     ExperimentProtocol,
@@ -41,7 +48,7 @@ from abses.core.time_driver import TimeDriver
 from abses.human.human import BaseHuman
 from abses.space.nature import BaseNature
 from abses.utils.args import merge_parameters
-from abses.utils.config import apply_validation, normalize_config
+from abses.utils.config import FrozenParams, apply_validation, normalize_config
 from abses.utils.datacollector import ABSESpyDataCollector
 from abses.utils.log_parser import (
     get_file_config,
@@ -56,14 +63,17 @@ from abses.utils.logging import (
     setup_logger_info,
     setup_model_logger,
 )
+from abses.utils.random import RandomStreams, sequence_seed
 from abses.utils.tracker.factory import (
     create_tracker,
     prepare_collector_config,
 )
 
 if TYPE_CHECKING:
+    import pandas as pd
     from mesa.model import RNGLike, SeedLike
 
+    from abses.core.memory import ExceedAction, MemoryMethod
     from abses.core.type_aliases import (
         HowCheckName,
         SubSystemName,
@@ -99,7 +109,7 @@ class MainModel(Model, BaseStateManager):
         human_class: Type[HumanSystemProtocol] = BaseHuman,
         nature_class: Type[NatureSystemProtocol] = BaseNature,
         run_id: Optional[int] = None,
-        seed: Optional[int] = None,
+        seed: Optional[int | np.random.SeedSequence] = None,
         rng: Optional[RNGLike | SeedLike] = None,
         experiment: Optional[ExperimentProtocol] = None,
         **kwargs: Optional[Any],
@@ -111,6 +121,8 @@ class MainModel(Model, BaseStateManager):
             human_class: Class to use for human subsystem (defaults to BaseHuman).
             nature_class: Class to use for nature subsystem (defaults to BaseNature).
             run_id: Identifier for this model run.
+            seed: Random seed, or a `numpy.random.SeedSequence` rooting the
+                model's random streams (see `random_streams`).
             outpath: Directory path for model outputs.
             experiment: Associated experiment instance.
             **kwargs: Additional model parameters.
@@ -119,6 +131,19 @@ class MainModel(Model, BaseStateManager):
             AssertionError: If human_class or nature_class are not valid subclasses.
         """
         self._names: Set[str] = set()
+        self._params_cache: Optional[Dict[Tuple[type, Optional[str]], FrozenParams]] = (
+            None
+        )
+        self.profiler: Optional[StepProfiler] = None
+        self.memory_watcher: Optional[MemoryWatcher] = None
+        self._write_buffer: Optional[WriteBuffer] = None
+        # Number of cell ids given to the layers (see `PatchCell.unique_id`).
+        self._cell_ids_taken: int = 0
+        # A seed sequence (e.g., from an experiment) roots `random_streams`,
+        # while `random` and `rng` are seeded by an integer drawn from it.
+        self._seed_sequence: Optional[np.random.SeedSequence] = None
+        if isinstance(seed, np.random.SeedSequence):
+            self._seed_sequence, seed = seed, sequence_seed(seed)
         Model.__init__(self, seed=seed, rng=rng)
         BaseStateManager.__init__(self)
         self._exp = experiment
@@ -166,6 +191,32 @@ class MainModel(Model, BaseStateManager):
         default_name = self.__class__.__name__
         return self.settings.get("name", default_name)
 
+    @functools.cached_property
+    def events(self) -> EventScheduler:
+        """Scheduled events of this model's elements (see `schedule`).
+
+        The due events are run at each tick of `run_model`, after stepping
+        the model and its subsystems.
+        """
+        return EventScheduler(self)
+
+    @functools.cached_property
+    def random_streams(self) -> RandomStreams:
+        """Independent random streams, e.g., one per module or breed.
+
+        Streams are spawned from the model's seed with `numpy.random.SeedSequence`,
+        so they are reproducible and do not depend on each other.
+
+        Returns:
+            The model's random streams.
+
+        Example:
+            ```python
+            rng = model.random_streams.generator("breed", "Farmer")
+            ```
+        """
+        return RandomStreams.from_model(self)
+
     @functools.cached_property
     def outpath(self) -> Path:
         """Get the model's output directory path.
@@ -211,6 +262,20 @@ class MainModel(Model, BaseStateManager):
             self.time.go(delta)
         self._steps = steps
 
+    def register_agent(self, agent: Any) -> None:
+        """Register an agent, and notify the materialized collections."""
+        super().register_agent(agent)
+        handler = self.__dict__.get("_agents_handler")
+        if handler is not None:
+            handler._on_register(agent)
+
+    def deregister_agent(self, agent: Any) -> None:
+        """Deregister an agent, and notify the materialized collections."""
+        super().deregister_agent(agent)
+        handler = self.__dict__.get("_agents_handler")
+        if handler is not None:
+            handler._on_deregister(agent)
+
     def __deepcopy__(self, memo: dict) -> "MainModel":
         """Prevent deep copying of model.
 
@@ -271,26 +336,59 @@ class MainModel(Model, BaseStateManager):
     ) -> Dict[SubSystemName, Any]:
         """执行每个子系统
 
+        执行 "step" 时，跳过未到期的子系统，并执行声明了频率且到期的模块
+        （见 `BaseModule.step_every`）。
+
         Args:
             func: 函数名或可调用对象
             order: 子系统顺序
             **kwargs: 其他参数
         """
         _obj = {"model": self, "nature": self.nature, "human": self.human}
+        profiler = vars(self).get("profiler")
         result = {}
         for name in order:
             if name not in _obj:
                 raise ValueError(f"{name} is not a valid component.")
-            if isinstance(func, str):
-                callable_func = getattr(_obj[name], func)
+            if profiler is None:
+                self._do_one(name, _obj[name], func, **kwargs)
             else:
-                callable_func = func
-            if not callable(callable_func):
-                raise ValueError(f"{name}.{func} is not callable.")
-            callable_func(**kwargs)
+                phase = f"{name}.{getattr(func, '__name__', func)}"
+                start = profiler.start()
+                try:
+                    self._do_one(name, _obj[name], func, **kwargs)
+                finally:
+                    profiler.stop("phase", phase, start)
             result[name] = _obj[name]
         return result
 
+    def _do_one(
+        self, name: SubSystemName, obj: Any, func: str | Callable, **kwargs: Any
+    ) -> None:
+        """Execute a function of one component, see `do_each`."""
+        if func == "step" and name != "model":
+            self._step_subsystem(obj, **kwargs)
+            return
+        if isinstance(func, str):
+            callable_func = getattr(obj, func)
+        else:
+            callable_func = func
+        if not callable(callable_func):
+            raise ValueError(f"{name}.{func} is not callable.")
+        callable_func(**kwargs)
+
+    def _step_subsystem(self, subsystem: Any, **kwargs: Any) -> None:
+        """Step a subsystem and its modules declaring a frequency, if due."""
+        if subsystem.is_due:
+            subsystem.step(**kwargs)
+            subsystem.executions += 1
+        for module in subsystem.modules.values():
+            if module.step_every is None or not module.opening:
+                continue
+            if module.is_due:
+                module.step(**kwargs)
+                module.executions += 1
+
     def _setup_logger(self, log_cfg: Dict[str, Any]) -> None:
         """Setup logging for the model.
 
@@ -490,13 +588,149 @@ class MainModel(Model, BaseStateManager):
         pass
 
     @property
-    def params(self) -> DictConfig:
-        """The global parameters of this model."""
-        return self.settings.get("model", DictConfig({}))
+    def params(self) -> DictConfig | FrozenParams:
+        """The global parameters of this model.
+
+        While the model steps, a read-only snapshot (see `refresh_params`).
+        """
+        cache = self._params_cache
+        if cache is None:
+            return self.settings.get("model", DictConfig({}))
+        key = (self.__class__, "model")
+        params = cache.get(key)
+        if params is None:
+            params = cache[key] = FrozenParams(self.settings.get("model", {}))
+        return params
 
     # alias for model's parameters
     p = params
 
+    def refresh_params(self) -> None:
+        """Resolve the components' parameters again from `settings`.
+
+        While the model steps, the parameters of the model and of its
+        components are read-only snapshots resolved once, at their first
+        access. Call this after changing the settings at runtime, e.g.
+        `OmegaConf.update(model.settings, "model.rate", 2)`.
+        """
+        if self._params_cache is not None:
+            self._params_cache.clear()
+
+    @contextmanager
+    def synchronous(self) -> Iterator[WriteBuffer]:
+        """A synchronous phase of the buffered fields of cells and actors.
+
+        During the phase, buffered fields (see `abses.core.buffers`) read
+        the values from before it, and the values written are swapped in at
+        its end. Each tick of `run_model` is a synchronous phase, and nested
+        phases join the outer one.
+
+        Yields:
+            The buffer of the written values.
+        """
+        buffer = self._write_buffer
+        if buffer is not None:
+            yield buffer
+            return
+        self._write_buffer = buffer = WriteBuffer()
+        try:
+            yield buffer
+        finally:
+            self._write_buffer = None
+        buffer.swap()
+
+    def enable_profiler(self, stream: bool = False) -> StepProfiler:
+        """Start recording where the time of each tick goes.
+
+        The profiler records the time spent in each component's phase, each
+        module's step, the actors' methods by breed, the data collection,
+        and the heavy methods of patch modules (see `abses.core.profiler`).
+
+        Args:
+            stream: Whether to log the time spent during each tick to the
+                model's tracker, as `profile/<kind>/<name>` metrics.
+
+        Returns:
+            The profiler, whose `to_frame()` gives the timings.
+        """
+        if self.profiler is None:
+            self.profiler = StepProfiler(self, stream=stream)
+        else:
+            self.profiler.stream = stream
+        return self.profiler
+
+    def disable_profiler(self) -> Optional[StepProfiler]:
+        """Stop profiling.
+
+        Returns:
+            The profiler with the timings recorded so far, if any.
+        """
+        profiler, self.profiler = self.profiler, None
+        return profiler
+
+    def memory_report(self, sample: int = 64) -> pd.DataFrame:
+        """Estimate the memory held by the layers, breeds, links and
+        collected records (see `abses.core.memory`).
+
+        Args:
+            sample: Number of actors, cells or container items measured to
+                estimate the size of all of them.
+
+        Returns:
+            A table indexed by (kind, name, part), with the number of items
+            and the estimated bytes.
+        """
+        return memory_report(self, sample=sample)
+
+    def watch_memory(
+        self,
+        threshold: Optional[int] = None,
+        on_exceed: ExceedAction = "warn",
+        every: int = 1,
+        method: MemoryMethod = "sample",
+        sample: int = 64,
+        stream: bool = False,
+    ) -> MemoryWatcher:
+        """Measure the memory at each tick while running, keeping its
+        high-water mark.
+
+        Args:
+            threshold: Number of bytes above which `on_exceed` is triggered.
+            on_exceed: "warn", "stop" the model, "raise" a `MemoryError`, or
+                a callable taking the model and the number of bytes, e.g. to
+                spill the collected records to disk.
+            every: Number of ticks between two measures.
+            method: "sample" the estimates of `memory_report`, or read the
+                memory traced by "tracemalloc".
+            sample: Size of the samples of `memory_report`.
+            stream: Whether to log the measures to the model's tracker.
+
+        Returns:
+            The watcher, whose `peak` is the high-water mark.
+        """
+        self.unwatch_memory()
+        self.memory_watcher = MemoryWatcher(
+            self,
+            threshold=threshold,
+            on_exceed=on_exceed,
+            every=every,
+            method=method,
+            sample=sample,
+            stream=stream,
+        )
+        return self.memory_watcher
+
+    def unwatch_memory(self) -> Optional[MemoryWatcher]:
+        """Stop measuring the memory.
+
+        Returns:
+            The watcher with the measures so far, if any.
+        """
+        watcher, self.memory_watcher = self.memory_watcher, None
+        if watcher is not None:
+            watcher.close()
+        return watcher
+
     @property
     def datasets(self) -> DictConfig:
         """Available datasets for the model.
@@ -518,21 +752,46 @@ class MainModel(Model, BaseStateManager):
 
         Runs through the following phases:
         1. Setup phase (model.setup())
-        2. Step phase (model.step()) - repeated
+        2. Step phase (model.step()) - repeated, followed by the due events
         3. End phase (model.end())
 
         Args:
             steps: Number of steps to run. If None, runs until self.running is False.
         """
-        run_times = 0
         self.do_each("setup", order=order)
-        while self.running is True:
-            self.do_each("step", order=order)
-            run_times += 1
-            if steps is not None and run_times >= steps:
-                break
+        self._run_steps(steps, order=order)
         self.do_each("end", order=order)
 
+    def _run_steps(
+        self,
+        steps: Optional[int] = None,
+        order: Tuple[SubSystemName, ...] = DEFAULT_RUN_ORDER,
+    ) -> None:
+        """Steps the model, without the setup and end phases.
+
+        Args:
+            steps: Number of steps to run. If None, runs until self.running is False.
+        """
+        run_times = 0
+        # Parameters are frozen snapshots while stepping, see `refresh_params`.
+        self._params_cache = {}
+        try:
+            while self.running is True:
+                # Buffered fields are swapped at the end of each tick.
+                with self.synchronous():
+                    self.do_each("step", order=order)
+                    if "events" in self.__dict__:
+                        self.events.run_due()
+                if self.profiler is not None:
+                    self.profiler.end_tick(self.time.tick)
+                if self.memory_watcher is not None:
+                    self.memory_watcher.end_tick(self.time.tick)
+                run_times += 1
+                if steps is not None and run_times >= steps:
+                    break
+        finally:
+            self._params_cache = None
+
     def setup(self) -> None:
         """Users can custom what to do when the model is setup and going to start running."""
 
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Opt-in profiling of where the time of a tick goes.
+
+Once enabled with `model.enable_profiler()`, the model accumulates the wall
+time (inclusive, in nanoseconds) and the number of calls of:
+
+- "phase": each component's phase in `do_each`, e.g. "model.step" or
+  "nature.setup";
+- "module": the steps of each module;
+- "breed": the actors' method calls in `shuffle_do` / `do` and
+  `do_by_breed`, by breed, e.g. "Sheep.step";
+- "method": the data collection and heavy methods of patch modules, e.g.
+  "PatchModule.get_raster".
+
+When the profiler is disabled (the default), the instrumented code only
+checks `model.profiler is None`.
+"""
+
+from __future__ import annotations
+
+from functools import wraps
+from time import perf_counter_ns
+from typing import TYPE_CHECKING, Any, Callable, Dict, List, Tuple, TypeVar
+
+import pandas as pd
+
+if TYPE_CHECKING:
+    from abses.core.protocols import MainModelProtocol
+
+F = TypeVar("F", bound=Callable[..., Any])
+Key = Tuple[str, str]
+
+
+class StepProfiler:
+    """Accumulated wall time and calls of a model's instrumented code.
+
+    Parameters:
+        model:
+            The profiled model.
+        stream:
+            Whether to log the time spent during each tick as metrics
+            (`profile/<kind>/<name>`, in seconds) to the model's tracker.
+
+    Example:
+        ```python
+        profiler = model.enable_profiler()
+        model.run_model()
+        profiler.to_frame().head()
+        ```
+    """
+
+    def __init__(self, model: MainModelProtocol, stream: bool = False) -> None:
+        self.model = model
+        self.stream = stream
+        # Mutable [nanoseconds, calls] accumulators, updated in place.
+        self._records: Dict[Key, List[int]] = {}
+        self._streamed: Dict[Key, int] = {}
+
+    def __repr__(self) -> str:
+        return f"<StepProfiler: {len(self._records)} records>"
+
+    def record_of(self, key: Key) -> List[int]:
+        """The [nanoseconds, calls] accumulator of a (kind, name) key.
+
+        Hot loops look the accumulator up once, then update it in place.
+        """
+        record = self._records.get(key)
+        if record is None:
+            record = self._records[key] = [0, 0]
+        return record
+
+    def add(self, kind: str, name: str, elapsed_ns: int) -> None:
+        """Record one call that took `elapsed_ns` nanoseconds."""
+        record = self.record_of((kind, name))
+        record[0] += elapsed_ns
+        record[1] += 1
+
+    def start(self) -> int:
+        """The current time (ns), to pass to `stop` at the end of a block."""
+        return perf_counter_ns()
+
+    def stop(self, kind: str, name: str, start: int) -> None:
+        """Record the time since `start` as one call.
+
+        A plain start/stop pair rather than a context manager, so that timing
+        a block allocates no generator:
+
+        ```python
+        start = profiler.start()
+        try:
+            ...
+        finally:
+            profiler.stop("module", "land", start)
+        ```
+        """
+        record = self.record_of((kind, name))
+        record[0] += perf_counter_ns() - start
+        record[1] += 1
+
+    def to_frame(self) -> pd.DataFrame:
+        """The recorded timings.
+
+        Returns:
+            A table indexed by (kind, name), with the number of calls, and
+            the total and mean time (in seconds), sorted by total time.
+        """
+        columns = ["calls", "total_time", "mean_time"]
+        if not self._records:
+            return pd.DataFrame(columns=columns)
+        data = pd.DataFrame.from_dict(
+            self._records, orient="index", columns=["total_time", "calls"]
+        )
+        data.index = pd.MultiIndex.from_tuples(data.index, names=["kind", "name"])
+        data["total_time"] = data["total_time"] / 1e9
+        data["mean_time"] = data["total_time"] / data["calls"]
+        return data[columns].sort_values("total_time", ascending=False)
+
+    def reset(self) -> None:
+        """Forget all recorded timings."""
+        self._records.clear()
+        self._streamed.clear()
+
+    def end_tick(self, tick: int) -> None:
+        """Log the time spent during this tick to the tracker, if streaming."""
+        tracker = getattr(self.model.datacollector, "tracker", None)
+        if not self.stream or tracker is None:
+            return
+        metrics: Dict[str, float] = {}
+        for key, (elapsed, _) in self._records.items():
+            delta = elapsed - self._streamed.get(key, 0)
+            if delta:
+                metrics[f"profile/{key[0]}/{key[1]}"] = delta / 1e9
+                self._streamed[key] = elapsed
+        if metrics:
+            tracker.log_metrics(metrics, step=tick)
+
+
+def profiled(func: F) -> F:
+    """Record the calls of a model element's method when profiling.
+
+    The time is recorded as ("method", "<Class>.<method>").
+    """
+    key = ("method", func.__qualname__)
+
+    @wraps(func)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        profiler = vars(self.model).get("profiler")
+        if profiler is None:
+            return func(self, *args, **kwargs)
+        record = profiler.record_of(key)
+        start = perf_counter_ns()
+        try:
+            return func(self, *args, **kwargs)
+        finally:
+            record[0] += perf_counter_ns() - start
+            record[1] += 1
+
+    return wrapper  # type: ignore[return-value]
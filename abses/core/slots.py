@@ -0,0 +1,73 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Helpers for slot-based model elements.
+
+Slot-based classes (e.g., `SlotActor`, `SlotPatchCell`) keep their core state
+in `__slots__` instead of a per-instance dictionary. Containers that most
+instances never touch (observers, dynamic variables, agents on a cell) are
+created lazily, on first access, via `LazySlot`.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Callable, Generic, Optional, Type, TypeVar
+
+T = TypeVar("T")
+
+
+class LazySlot(Generic[T]):
+    """A descriptor creating its value on first access.
+
+    The value is stored in another slot (`storage`), so the descriptor and the
+    slot can live in the same class body without name conflicts. Slot-based
+    classes skip the base classes' eager creation of these containers (see
+    `BaseModelElement._create_containers`).
+
+    Parameters:
+        storage:
+            Name of the slot where the value is stored.
+        factory:
+            Callable receiving the instance and returning the initial value.
+
+    Example:
+        ```python
+        class Node:
+            __slots__ = ("_lazy_tags",)
+            tags = LazySlot("_lazy_tags", lambda obj: set())
+        ```
+    """
+
+    __slots__ = ("storage", "factory")
+
+    def __init__(self, storage: str, factory: Callable[[Any], T]) -> None:
+        self.storage = storage
+        self.factory = factory
+
+    def __get__(self, obj: Any, owner: Optional[Type[Any]] = None) -> T:
+        if obj is None:
+            return self  # type: ignore[return-value]
+        try:
+            return getattr(obj, self.storage)
+        except AttributeError:
+            value = self.factory(obj)
+            setattr(obj, self.storage, value)
+            return value
+
+    def __set__(self, obj: Any, value: T) -> None:
+        setattr(obj, self.storage, value)
+
+    def __delete__(self, obj: Any) -> None:
+        try:
+            delattr(obj, self.storage)
+        except AttributeError:
+            pass
+
+    def is_created(self, obj: Any) -> bool:
+        """Whether the value has been created for this instance."""
+        return hasattr(obj, self.storage)
@@ -7,19 +7,21 @@
 
 from __future__ import annotations
 
+import math
 import threading
-from collections import deque
-from datetime import datetime
+from datetime import datetime, timedelta
 from functools import cached_property, total_ordering, wraps
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
-    Deque,
     Dict,
+    FrozenSet,
     Optional,
+    Tuple,
 )
 
+import numpy as np
 import pandas as pd
 import pendulum
 from pendulum import DateTime
@@ -39,6 +41,144 @@ from abses.utils.time import is_positive_int, parse_datetime, parse_duration
 if TYPE_CHECKING:
     from abses.core.types import DateOrTick, DateTimeOrStr
 
+ConditionKey = Optional[FrozenSet[Tuple[str, Any]]]
+
+CALENDAR_FIELDS = (
+    "year",
+    "month",
+    "day",
+    "hour",
+    "minute",
+    "second",
+    "day_of_week",
+    "day_of_year",
+    "week_of_year",
+    "quarter",
+)
+MAX_CALENDAR_TICKS = 1_000_000
+
+
+def _condition_key(condition: Dict[str, Any]) -> ConditionKey:
+    """A hashable key of a time condition, None if its values are not hashable."""
+    try:
+        return frozenset(condition.items())
+    except TypeError:
+        return None
+
+
+class Calendar:
+    """Precomputed datetimes of the simulation ticks, from a start to an end.
+
+    The calendar holds the datetime of each tick (`datetime64[ns]`) and,
+    computed on demand, arrays of their fields (year, month, day, weekday...).
+    A time condition becomes a boolean array over the ticks, so checking it
+    at a tick is a lookup.
+
+    Parameters:
+        datetimes:
+            The datetime of each tick, in ascending order.
+    """
+
+    def __init__(self, datetimes: np.ndarray) -> None:
+        datetimes = np.asarray(datetimes, dtype="datetime64[ns]")
+        datetimes.flags.writeable = False
+        self.datetimes = datetimes
+        self._fields: Dict[str, np.ndarray] = {}
+        self._masks: Dict[ConditionKey, Optional[np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.datetimes)
+
+    def __repr__(self) -> str:
+        return f"<Calendar: {len(self)} ticks>"
+
+    @classmethod
+    def build(
+        cls,
+        start: DateTime,
+        duration: pendulum.Duration,
+        end: DateTime,
+        max_ticks: int = MAX_CALENDAR_TICKS,
+    ) -> Optional[Calendar]:
+        """Calendar of the ticks from `start` until the first one reaching `end`.
+
+        Durations with years or months are added tick by tick as when
+        advancing the time driver, since their length varies. Other durations
+        have a fixed length, and the calendar is an arithmetic sequence.
+
+        Returns:
+            The calendar, or None if it would be longer than `max_ticks`.
+        """
+        if duration.years or duration.months:
+            datetimes = [start]
+            while datetimes[-1] < end:
+                if len(datetimes) > max_ticks:
+                    return None
+                datetimes.append(datetimes[-1] + duration)
+            return cls(np.array([np.datetime64(dt, "ns") for dt in datetimes]))
+        step = np.timedelta64(int(round(duration.total_seconds() * 1e9)), "ns")
+        if step <= np.timedelta64(0, "ns"):
+            return None
+        origin = np.datetime64(start, "ns")
+        n_ticks = max(-(-(np.datetime64(end, "ns") - origin) // step), 0)
+        if n_ticks > max_ticks:
+            return None
+        return cls(origin + np.arange(n_ticks + 1) * step)
+
+    def field(self, name: str) -> np.ndarray:
+        """An attribute of the datetime of each tick, named as in `pendulum`,
+        e.g. "year", "month" or "day_of_week" (Monday is 0)."""
+        values = self._fields.get(name)
+        if values is None:
+            if name not in CALENDAR_FIELDS:
+                raise KeyError(f"Unknown calendar field '{name}'.")
+            index = pd.DatetimeIndex(self.datetimes)
+            if name == "week_of_year":
+                values = index.isocalendar().week.to_numpy(dtype=np.int64)
+            else:
+                attr = name.replace("_of_", "of").replace("_", "")
+                values = np.asarray(getattr(index, attr), dtype=np.int64)
+            values.flags.writeable = False
+            self._fields[name] = values
+        return values
+
+    def mask(
+        self, condition: Dict[str, Any], key: ConditionKey = None
+    ) -> Optional[np.ndarray]:
+        """Whether each tick satisfies a time condition (all of its fields).
+
+        Parameters:
+            condition:
+                Values of the datetime's fields, e.g. `{"month": 1, "day": 1}`.
+            key:
+                The condition's key, if already computed.
+
+        Returns:
+            A boolean array over the ticks, or None if the condition uses
+            attributes which are not calendar fields.
+        """
+        if key is None:
+            key = _condition_key(condition)
+        if key is not None and key in self._masks:
+            return self._masks[key]
+        result: Optional[np.ndarray] = np.ones(len(self), dtype=bool)
+        for unit, value in condition.items():
+            if unit not in CALENDAR_FIELDS:
+                result = None
+                break
+            result &= self.field(unit) == value
+        if key is not None:
+            self._masks[key] = result
+        return result
+
+    def locate(self, dt: datetime) -> Optional[int]:
+        """The tick of a datetime in this calendar, or None."""
+        value = np.datetime64(dt.replace(tzinfo=None), "ns")
+        position = int(np.searchsorted(self.datetimes, value))
+        if position < len(self) and self.datetimes[position] == value:
+            return position
+        return None
+
 
 def time_condition(condition: dict, when_run: bool = True) -> Callable:
     """
@@ -74,24 +214,22 @@ def time_condition(condition: dict, when_run: bool = True) -> Callable:
         It should be called again in the next year beginning (i.e., `1998-01-01`) if we run this model longer... It means, the function will be called when the condition is fully satisfied.
     """
 
+    key = _condition_key(condition)
+
     def decorator(func):
         @wraps(func)
         def wrapper(self, *args, **kwargs):
-            if not hasattr(self, "time"):
+            time = getattr(self, "time", None)
+            if time is None:
                 raise AttributeError(
                     "The object doesn't have a TimeDriver object as `time` attribute."
                 )
-            time = self.time
             if not isinstance(time, TimeDriver):
                 raise TypeError(
                     "Decorated function is not belonged to an object with `TimeDriver`."
                 )
 
-            ok = all(
-                getattr(time.dt, unit, None) == value
-                for unit, value in condition.items()
-            )
-
+            ok = time.match(condition, key=key)
             if (ok and when_run) or (not ok and not when_run):
                 return func(self, *args, **kwargs)
 
@@ -121,9 +259,12 @@ class TimeDriver(BaseModelElement, TimeDriverProtocol):
         return driver
 
     def __init__(self, model: MainModelProtocol):
+        self._calendar: Optional[Calendar] = None
+        self._cursor: Optional[int] = None
         super().__init__(model=model, name="time")
-        self._history: Deque[DateTime] = deque()
-        self._history_ticks: Deque[int] = deque()
+        self._history = np.empty(64, dtype="datetime64[ns]")
+        self._history_ticks = np.empty(64, dtype=np.int64)
+        self._history_size = 0
         # End time can only be DateTime | int | None at runtime
         self._end_dt: DateTime | int | None = None
         self._parse_ticking_mode(set(self.params.keys()))
@@ -133,8 +274,16 @@ class TimeDriver(BaseModelElement, TimeDriverProtocol):
 
     def __getattr__(self, name: str):
         """Redirect all undefined attributes to the datetime object."""
+        if name.startswith("_"):
+            raise AttributeError(
+                f"'{self.__class__.__name__}' object has no attribute '{name}'"
+            )
         return getattr(self.dt, name)
 
+    def __getnewargs__(self) -> Tuple[MainModelProtocol]:
+        # Unpickled drivers are registered for their (unpickled) model.
+        return (self._model,)
+
     def __repr__(self) -> str:
         return f"<TimeDriver: {self.dt.format(self.fmt)}>"
 
@@ -208,6 +357,9 @@ class TimeDriver(BaseModelElement, TimeDriverProtocol):
         if isinstance(self.end_at, DateTime):
             if self.duration is None:
                 raise RuntimeError("No duration settings.")
+            calendar = self.calendar
+            if calendar is not None:
+                return len(calendar) - 1 - self._cursor  # type: ignore[operator]
             # 使用 pendulum 的 diff 方法计算差异
             diff_seconds = self.end_at.diff(self.dt).in_seconds()
             step_seconds = self.duration.in_seconds()
@@ -229,12 +381,91 @@ class TimeDriver(BaseModelElement, TimeDriverProtocol):
     @property
     def history(self) -> pd.Series:
         """Returns the history of the time driver.
-        The history is a pandas Series object with the datetime as the index.
+        The history is a pandas Series of the datetimes, indexed by ticks.
+        The datetimes are recorded as `datetime64[ns]` (as pandas stored the
+        `DateTime` objects it was built from), so its items are
+        `pd.Timestamp`, and the series is a view of the records, not a copy.
         """
+        size = self._history_size
         return pd.Series(
-            index=self._history_ticks,
-            data=self._history,
+            index=pd.Index(self._history_ticks[:size], copy=False),
+            data=self._history[:size],
             name="datetime",
+            copy=False,
+        )
+
+    @property
+    def calendar(self) -> Optional[Calendar]:
+        """The precomputed calendar from the current time to the end time.
+
+        It is built on first access, when the end time is a datetime and the
+        duration is set, and reused while the time advances tick by tick.
+        After jumping to another time (`to`), the current time is looked up in
+        the calendar, which is rebuilt from it if not found.
+
+        Returns:
+            The calendar, or None in tick mode, without an end datetime, or if
+            it would be longer than `MAX_CALENDAR_TICKS`.
+        """
+        if self._cursor is not None:
+            return self._calendar
+        if self.duration is None or not isinstance(self.end_at, DateTime):
+            return None
+        if self._calendar is not None:
+            self._cursor = self._calendar.locate(self.dt)
+            if self._cursor is not None:
+                return self._calendar
+        self._calendar = Calendar.build(self.dt, self.duration, self.end_at)
+        self._cursor = None if self._calendar is None else 0
+        return self._calendar
+
+    def ticks_after(self, delay: timedelta) -> int:
+        """Number of ticks until the time reaches the current time plus a delay.
+
+        Parameters:
+            delay:
+                The delay, e.g. `pendulum.duration(months=3)`.
+
+        Returns:
+            The number of ticks, looked up in the calendar when there is one,
+            otherwise estimated from the length of a tick.
+
+        Raises:
+            ValueError:
+                In tick mode, where ticks have no duration.
+        """
+        if self.duration is None:
+            raise ValueError("Ticks have no duration in tick mode, use ticks.")
+        target = np.datetime64(self.dt + delay, "ns")
+        calendar = self.calendar
+        if calendar is not None:
+            position = int(np.searchsorted(calendar.datetimes, target))
+            if position < len(calendar):
+                return position - self._cursor  # type: ignore[operator]
+        seconds = (target - np.datetime64(self.dt, "ns")) / np.timedelta64(1, "s")
+        return max(math.ceil(seconds / self.duration.total_seconds()), 0)
+
+    def match(self, condition: Dict[str, Any], key: ConditionKey = None) -> bool:
+        """Whether the current time satisfies a condition on its attributes.
+
+        Parameters:
+            condition:
+                Values of the datetime's attributes, e.g. `{"month": 1}`.
+            key:
+                The condition's key, if already computed.
+
+        Returns:
+            True if all the attributes equal the given values. Calendar fields
+            are looked up in the precomputed calendar when there is one.
+        """
+        calendar = self.calendar
+        if calendar is not None:
+            mask = calendar.mask(condition, key=key)
+            if mask is not None:
+                return bool(mask[self._cursor])
+        dt = self.dt
+        return all(
+            getattr(dt, unit, None) == value for unit, value in condition.items()
         )
 
     @property
@@ -257,8 +488,28 @@ class TimeDriver(BaseModelElement, TimeDriverProtocol):
         if self.duration is None:
             self.dt = pendulum.now(tz=None)
         else:
-            # 使用 += 操作符添加 duration
-            self.dt += self.duration
+            calendar = self.calendar
+            cursor = self._cursor
+            if calendar is not None and cursor + 1 < len(calendar):  # type: ignore[operator]
+                # 逐步推进时，下一个时间直接从日历中读取
+                nxt = calendar.datetimes[cursor + 1]  # type: ignore[operator]
+                # `item()` gives a datetime at microseconds, an int at ns.
+                nxt = nxt.astype("datetime64[us]").item()
+                self._set_dt(
+                    DateTime(
+                        nxt.year,
+                        nxt.month,
+                        nxt.day,
+                        nxt.hour,
+                        nxt.minute,
+                        nxt.second,
+                        nxt.microsecond,
+                    )
+                )
+                self._cursor = cursor + 1  # type: ignore[operator]
+            else:
+                # 使用 += 操作符添加 duration
+                self.dt += self.duration
         if self.should_end:
             self.model.running = False
 
@@ -384,6 +635,7 @@ class TimeDriver(BaseModelElement, TimeDriverProtocol):
             else:
                 raise TypeError(f"Wrong type for end time: {type(dt)}.")
         self._end_dt = normalized
+        self._calendar = self._cursor = None
 
     @property
     def dt(self) -> DateTime:
@@ -402,6 +654,16 @@ class TimeDriver(BaseModelElement, TimeDriverProtocol):
             value = pendulum.instance(value).replace(tzinfo=None)
         elif isinstance(value, DateTime):
             value = value.replace(tzinfo=None)
+        self._cursor = None
+        self._set_dt(value)
+
+    def _set_dt(self, value: DateTime) -> None:
+        """Set the current time (without timezone), and record it."""
         self._dt = value
-        self._history.append(value)
-        self._history_ticks.append(self.tick)
+        size = self._history_size
+        if size == len(self._history):
+            self._history = np.resize(self._history, 2 * size)
+            self._history_ticks = np.resize(self._history_ticks, 2 * size)
+        self._history[size] = np.datetime64(value, "ns")
+        self._history_ticks[size] = self.tick
+        self._history_size = size + 1
@@ -0,0 +1,811 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Storage backends for the links of one link type.
+
+Nodes are identified by dense integer indices (see `NodeIndex`), so that the
+links of a type can be stored as an adjacency structure over `0..n-1`:
+
+- `DictLinks` keeps a set of out- and in-neighbors per node. It is cheap for
+  small, frequently rewired networks.
+- `SparseLinks` keeps the links as a compressed sparse row (CSR) matrix plus
+  an append buffer of recent changes, which is merged into the matrix from
+  time to time ("compaction"). It scales to millions of links and answers
+  vectorized queries (degrees, edge lists, `scipy.sparse` export) directly
+  from the arrays.
+
+Links can carry attributes (e.g., a weight or a timestamp), stored in one
+NumPy column per attribute name and aligned to the edges. Links without a
+value for an attribute get a default: 1.0 for "weight", NaN for floats, 0 for
+integers, False for booleans and None otherwise.
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from typing import (
+    TYPE_CHECKING,
+    Any,
+    Dict,
+    Iterable,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from scipy import sparse
+
+    from abses.core.types import UniqueID
+
+LinkBackend = Literal["dict", "sparse"]
+EdgeDirection = Literal["in", "out"]
+
+WEIGHT = "weight"
+
+_SHIFT = np.int64(32)
+
+
+def _keys(rows: np.ndarray, cols: np.ndarray) -> np.ndarray:
+    """Encode (row, col) pairs as single sortable integers."""
+    return (rows.astype(np.int64) << _SHIFT) | cols.astype(np.int64)
+
+
+def _fill_value(attr: str, dtype: np.dtype) -> Any:
+    """Default value of an edge attribute."""
+    if attr == WEIGHT:
+        return 1.0
+    if dtype.kind == "f":
+        return np.nan
+    if dtype.kind in "iu":
+        return 0
+    if dtype.kind == "b":
+        return False
+    return None
+
+
+def _new_column(attr: str, sample: Any, size: int) -> np.ndarray:
+    """An edge attribute column filled with its default value."""
+    dtype = np.asarray(sample).dtype
+    if attr == WEIGHT:
+        dtype = np.dtype(float)
+    elif dtype.kind in "USO":
+        dtype = np.dtype(object)
+    column = np.empty(size, dtype=dtype)
+    column.fill(_fill_value(attr, dtype))
+    return column
+
+
+def _check_direction(direction: str) -> None:
+    if direction not in ("in", "out"):
+        raise ValueError(f"Invalid direction '{direction}'.")
+
+
+class NodeIndex:
+    """Maps the nodes' unique ids to dense indices `0..n-1`.
+
+    Indices are never reused, so they stay valid for the whole simulation.
+    """
+
+    def __init__(self) -> None:
+        self._index: Dict[UniqueID, int] = {}
+        self._uids: List[UniqueID] = []
+        self._uid_array: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self._uids)
+
+    def __contains__(self, uid: UniqueID) -> bool:
+        return uid in self._index
+
+    def index(self, uid: UniqueID) -> int:
+        """The index of a unique id, registering it if needed."""
+        idx = self._index.get(uid)
+        if idx is None:
+            idx = self._index[uid] = len(self._uids)
+            self._uids.append(uid)
+        return idx
+
+    def get(self, uid: UniqueID) -> Optional[int]:
+        """The index of a unique id, or None if it is not registered."""
+        return self._index.get(uid)
+
+    def indices(self, uids: Iterable[UniqueID]) -> np.ndarray:
+        """The indices of many unique ids, registering them if needed."""
+        index = self.index
+        return np.fromiter((index(uid) for uid in uids), dtype=np.int64)
+
+    def uid(self, idx: int) -> UniqueID:
+        """The unique id at an index."""
+        return self._uids[idx]
+
+    @property
+    def uids(self) -> np.ndarray:
+        """The unique ids of all the registered nodes, ordered by index."""
+        if self._uid_array is None or len(self._uid_array) != len(self._uids):
+            self._uid_array = np.asarray(self._uids)
+        return self._uid_array
+
+
+class LinkStore(ABC):
+    """The links of one link type, between node indices.
+
+    Each store counts the out- and in-links of every node, maintained on
+    each change, so whether a node takes part in this link type is O(1).
+
+    Attributes:
+        version:
+            Incremented on each change of the links or their attributes,
+            useful to invalidate caches derived from them.
+    """
+
+    backend: str = ""
+
+    def __init__(self) -> None:
+        self.version = 0
+        self._columns: Dict[str, np.ndarray] = {}
+        self._counts: Dict[str, np.ndarray] = {
+            "out": np.zeros(0, dtype=np.int64),
+            "in": np.zeros(0, dtype=np.int64),
+        }
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__}: {len(self)} links>"
+
+    @property
+    def attributes(self) -> Tuple[str, ...]:
+        """Names of the edge attributes."""
+        return tuple(self._columns)
+
+    def _check_attr(self, attr: str) -> None:
+        if attr not in self._columns and attr != WEIGHT:
+            raise KeyError(f"No edge attribute '{attr}'.")
+
+    def _missing(self, source: int, target: int) -> KeyError:
+        return KeyError(f"No link from {source} to {target}.")
+
+    @abstractmethod
+    def __len__(self) -> int:
+        """Number of links."""
+
+    @abstractmethod
+    def has(self, source: int, target: int) -> bool:
+        """Whether the link `source -> target` exists."""
+
+    @abstractmethod
+    def add(self, source: int, target: int) -> bool:
+        """Add the link `source -> target`, returns False if it exists."""
+
+    @abstractmethod
+    def remove(self, source: int, target: int) -> bool:
+        """Remove the link `source -> target`, returns False if missing."""
+
+    @abstractmethod
+    def neighbors(self, node: int, direction: EdgeDirection = "out") -> np.ndarray:
+        """Indices of the out- or in-neighbors of a node."""
+
+    @abstractmethod
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Sources and targets of all the links, sorted by (source, target)."""
+
+    @abstractmethod
+    def set_attrs(self, source: int, target: int, attrs: Dict[str, Any]) -> None:
+        """Set attributes of the link `source -> target`.
+
+        Raises:
+            KeyError:
+                If the link doesn't exist.
+        """
+
+    @abstractmethod
+    def get_attr(self, source: int, target: int, attr: str) -> Any:
+        """An attribute of the link `source -> target`.
+
+        Raises:
+            KeyError:
+                If the link or the attribute doesn't exist.
+        """
+
+    @abstractmethod
+    def edge_array(self, attr: str) -> np.ndarray:
+        """Values of an attribute for all the links, aligned with `edges()`."""
+
+    @abstractmethod
+    def set_edge_array(self, attr: str, values: np.ndarray) -> None:
+        """Set an attribute for all the links, aligned with `edges()`."""
+
+    def _count(self, source: int, target: int, delta: int) -> None:
+        """Update the link counters of both ends of a link."""
+        for direction, node in (("out", source), ("in", target)):
+            counts = self._counts[direction]
+            if node >= len(counts):
+                size = max(node + 1, 2 * len(counts))
+                counts = np.concatenate(
+                    [counts, np.zeros(size - len(counts), dtype=np.int64)]
+                )
+                self._counts[direction] = counts
+            counts[node] += delta
+
+    def _recount(self) -> None:
+        """Rebuild the link counters from all the links, after bulk changes."""
+        sources, targets = self.edges()
+        self._counts = {
+            "out": np.bincount(sources).astype(np.int64),
+            "in": np.bincount(targets).astype(np.int64),
+        }
+
+    def node_degree(self, node: int, direction: EdgeDirection = "out") -> int:
+        """Number of out- or in-links of a node, in O(1)."""
+        counts = self._counts[direction]
+        return int(counts[node]) if node < len(counts) else 0
+
+    def _check_length(self, values: np.ndarray) -> np.ndarray:
+        values = np.asarray(values)
+        if values.shape != (len(self),):
+            raise ValueError(f"Got {len(values)} values for {len(self)} links.")
+        return values
+
+    def neighbor_values(
+        self, node: int, attr: str, direction: EdgeDirection = "out"
+    ) -> np.ndarray:
+        """An attribute of the links of a node, aligned with `neighbors()`."""
+        others = self.neighbors(node, direction).tolist()
+        if direction == "out":
+            return np.array([self.get_attr(node, other, attr) for other in others])
+        return np.array([self.get_attr(other, node, attr) for other in others])
+
+    def participates(self, node: int, direction: EdgeDirection = "out") -> bool:
+        """Whether a node has any link in this direction."""
+        _check_direction(direction)
+        return self.node_degree(node, direction) > 0
+
+    def pop_node(self, node: int, direction: EdgeDirection = "out") -> np.ndarray:
+        """Remove all the links of a node in one direction.
+
+        Returns:
+            The indices of the former neighbors.
+        """
+        if not self.participates(node, direction):
+            return np.zeros(0, dtype=np.int64)
+        others = self.neighbors(node, direction)
+        for other in others.tolist():
+            if direction == "out":
+                self.remove(node, other)
+            else:
+                self.remove(other, node)
+        return others
+
+    def add_edges(
+        self,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        attrs: Optional[Dict[str, np.ndarray]] = None,
+    ) -> int:
+        """Add many links at once.
+
+        Parameters:
+            sources:
+                Indices of the source nodes.
+            targets:
+                Indices of the target nodes.
+            attrs:
+                Attributes of the links, aligned with `sources`. They
+                overwrite the values of already existing links.
+
+        Returns:
+            The number of new links.
+        """
+        attrs = attrs or {}
+        added = 0
+        for i, (source, target) in enumerate(zip(sources.tolist(), targets.tolist())):
+            added += self.add(source, target)
+            if attrs:
+                self.set_attrs(source, target, {k: v[i] for k, v in attrs.items()})
+        return added
+
+    def degree(self, n_nodes: int, direction: EdgeDirection = "out") -> np.ndarray:
+        """The out- or in-degree of each node in `0..n_nodes-1`."""
+        _check_direction(direction)
+        counts = self._counts[direction]
+        result = np.zeros(n_nodes, dtype=np.int64)
+        size = min(n_nodes, len(counts))
+        result[:size] = counts[:size]
+        return result
+
+    def to_scipy(self, n_nodes: int, attr: Optional[str] = None) -> sparse.csr_matrix:
+        """The adjacency matrix, with a 1 (or the link's `attr` value) for each
+        link `row -> column`."""
+        from scipy import sparse
+
+        sources, targets = self.edges()
+        if attr is None:
+            data = np.ones(len(sources), dtype=np.int8)
+        else:
+            data = self.edge_array(attr).astype(float)
+        return sparse.csr_matrix((data, (sources, targets)), shape=(n_nodes, n_nodes))
+
+
+class DictLinks(LinkStore):
+    """Links stored as sets of neighbors for each node.
+
+    Each link gets a row in the attribute columns, recycled once the link is
+    removed.
+    """
+
+    backend = "dict"
+
+    def __init__(self) -> None:
+        super().__init__()
+        self._out: Dict[int, Set[int]] = {}
+        self._in: Dict[int, Set[int]] = {}
+        self._rows: Dict[int, int] = {}
+        self._free: List[int] = []
+        self._n_edges = 0
+
+    def __len__(self) -> int:
+        return self._n_edges
+
+    def has(self, source: int, target: int) -> bool:
+        return target in self._out.get(source, ())
+
+    def add(self, source: int, target: int) -> bool:
+        targets = self._out.setdefault(source, set())
+        if target in targets:
+            return False
+        targets.add(target)
+        self._in.setdefault(target, set()).add(source)
+        row = self._free.pop() if self._free else len(self._rows)
+        self._rows[source << 32 | target] = row
+        for attr, column in self._columns.items():
+            if row >= len(column):
+                column = self._grow(attr, row + 1)
+            column[row] = _fill_value(attr, column.dtype)
+        self._count(source, target, 1)
+        self._n_edges += 1
+        self.version += 1
+        return True
+
+    def remove(self, source: int, target: int) -> bool:
+        targets = self._out.get(source)
+        if not targets or target not in targets:
+            return False
+        targets.discard(target)
+        if not targets:
+            del self._out[source]
+        sources = self._in[target]
+        sources.discard(source)
+        if not sources:
+            del self._in[target]
+        self._free.append(self._rows.pop(source << 32 | target))
+        self._count(source, target, -1)
+        self._n_edges -= 1
+        self.version += 1
+        return True
+
+    def neighbors(self, node: int, direction: EdgeDirection = "out") -> np.ndarray:
+        _check_direction(direction)
+        data = self._out if direction == "out" else self._in
+        return np.fromiter(data.get(node, ()), dtype=np.int64)
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        sources = np.fromiter(
+            (s for s, targets in self._out.items() for _ in targets),
+            dtype=np.int64,
+            count=self._n_edges,
+        )
+        targets = np.fromiter(
+            (t for targets in self._out.values() for t in targets),
+            dtype=np.int64,
+            count=self._n_edges,
+        )
+        order = np.lexsort((targets, sources))
+        return sources[order], targets[order]
+
+    def _grow(self, attr: str, size: int) -> np.ndarray:
+        """Enlarge a column to at least `size` rows."""
+        column = self._columns[attr]
+        new = _new_column(attr, column[:0], max(size, 2 * len(column)))
+        new[: len(column)] = column
+        self._columns[attr] = new
+        return new
+
+    def _column(self, attr: str, sample: Any) -> np.ndarray:
+        """The column of an attribute, created if needed."""
+        if attr not in self._columns:
+            size = max(len(self._rows) + len(self._free), 1)
+            self._columns[attr] = _new_column(attr, sample, size)
+        return self._columns[attr]
+
+    def set_attrs(self, source: int, target: int, attrs: Dict[str, Any]) -> None:
+        row = self._rows.get(source << 32 | target)
+        if row is None:
+            raise self._missing(source, target)
+        for attr, value in attrs.items():
+            self._column(attr, value)[row] = value
+        self.version += 1
+
+    def get_attr(self, source: int, target: int, attr: str) -> Any:
+        row = self._rows.get(source << 32 | target)
+        if row is None:
+            raise self._missing(source, target)
+        self._check_attr(attr)
+        if attr not in self._columns:
+            return _fill_value(attr, np.dtype(float))
+        return self._columns[attr][row]
+
+    def _edge_rows(self) -> np.ndarray:
+        rows = self._rows
+        keys = _keys(*self.edges()).tolist()
+        return np.fromiter((rows[key] for key in keys), dtype=np.int64, count=len(keys))
+
+    def edge_array(self, attr: str) -> np.ndarray:
+        self._check_attr(attr)
+        if attr not in self._columns:
+            return np.ones(self._n_edges)
+        return self._columns[attr][self._edge_rows()]
+
+    def set_edge_array(self, attr: str, values: np.ndarray) -> None:
+        values = self._check_length(values)
+        self._column(attr, values)[self._edge_rows()] = values
+        self.version += 1
+
+
+class SparseLinks(LinkStore):
+    """Links stored as a CSR matrix plus a buffer of recent changes.
+
+    New links are kept in a pending buffer (a set of targets per source, and
+    of sources per target), so single changes cost O(1). Removed links which
+    are already in the matrix are marked as deleted. When the buffer grows
+    beyond `compact_ratio` of the links (and at least `min_pending`), or before
+    any vectorized query, the buffer and deletions are merged into the matrix
+    with a single sort. Attribute columns are aligned to the matrix entries.
+
+    Parameters:
+        compact_ratio:
+            Relative size of the pending buffer triggering a compaction.
+        min_pending:
+            Minimum size of the pending buffer triggering a compaction.
+    """
+
+    backend = "sparse"
+
+    def __init__(self, compact_ratio: float = 0.25, min_pending: int = 4096) -> None:
+        super().__init__()
+        self.compact_ratio = compact_ratio
+        self.min_pending = min_pending
+        self.compactions = 0
+        self._indptr = np.zeros(1, dtype=np.int64)
+        self._indices = np.zeros(0, dtype=np.int64)
+        # Transposed matrix (in-neighbors), built lazily from the CSR arrays.
+        self._t_indptr: Optional[np.ndarray] = None
+        self._t_indices: Optional[np.ndarray] = None
+        self._pending_out: Dict[int, Set[int]] = {}
+        self._pending_in: Dict[int, Set[int]] = {}
+        self._pending_attrs: Dict[int, Dict[str, Any]] = {}
+        self._n_pending = 0
+        self._deleted: Set[int] = set()
+        self._n_edges = 0
+
+    def __len__(self) -> int:
+        return self._n_edges
+
+    @property
+    def n_pending(self) -> int:
+        """Number of changes not merged into the matrix yet."""
+        return self._n_pending + len(self._deleted)
+
+    def _row(self, node: int) -> np.ndarray:
+        """Targets of a node in the compacted matrix (deleted ones included)."""
+        if node + 1 >= len(self._indptr):
+            return self._indices[:0]
+        return self._indices[self._indptr[node] : self._indptr[node + 1]]
+
+    def _column(self, node: int) -> np.ndarray:
+        """Sources of a node in the compacted matrix (deleted ones included)."""
+        if self._t_indptr is None or self._t_indices is None:
+            n_rows = len(self._indptr) - 1
+            rows = np.repeat(np.arange(n_rows, dtype=np.int64), np.diff(self._indptr))
+            order = np.argsort(self._indices, kind="stable")
+            counts = np.bincount(self._indices, minlength=n_rows)
+            self._t_indptr = np.concatenate([[0], np.cumsum(counts)])
+            self._t_indices = rows[order]
+        if node + 1 >= len(self._t_indptr):
+            return self._t_indices[:0]
+        return self._t_indices[self._t_indptr[node] : self._t_indptr[node + 1]]
+
+    def _position(self, source: int, target: int) -> Optional[int]:
+        """Position of a link in the compacted matrix (deleted ones included)."""
+        row = self._row(source)
+        pos = int(np.searchsorted(row, target))
+        if pos < len(row) and row[pos] == target:
+            return int(self._indptr[source]) + pos
+        return None
+
+    def _is_pending(self, source: int, target: int) -> bool:
+        return target in self._pending_out.get(source, ())
+
+    def has(self, source: int, target: int) -> bool:
+        if self._is_pending(source, target):
+            return True
+        if (source << 32 | target) in self._deleted:
+            return False
+        return self._position(source, target) is not None
+
+    def add(self, source: int, target: int) -> bool:
+        if self.has(source, target):
+            return False
+        key = source << 32 | target
+        if key in self._deleted:
+            self._deleted.discard(key)
+            pos = self._position(source, target)
+            for attr, column in self._columns.items():
+                column[pos] = _fill_value(attr, column.dtype)
+        else:
+            self._pending_out.setdefault(source, set()).add(target)
+            self._pending_in.setdefault(target, set()).add(source)
+            self._n_pending += 1
+        self._count(source, target, 1)
+        self._n_edges += 1
+        self.version += 1
+        self._maybe_compact()
+        return True
+
+    def remove(self, source: int, target: int) -> bool:
+        if self._is_pending(source, target):
+            targets = self._pending_out[source]
+            targets.discard(target)
+            if not targets:
+                del self._pending_out[source]
+            sources = self._pending_in[target]
+            sources.discard(source)
+            if not sources:
+                del self._pending_in[target]
+            self._pending_attrs.pop(source << 32 | target, None)
+            self._n_pending -= 1
+        elif self.has(source, target):
+            self._deleted.add(source << 32 | target)
+        else:
+            return False
+        self._count(source, target, -1)
+        self._n_edges -= 1
+        self.version += 1
+        self._maybe_compact()
+        return True
+
+    def neighbors(self, node: int, direction: EdgeDirection = "out") -> np.ndarray:
+        _check_direction(direction)
+        if direction == "out":
+            stored = self._row(node)
+            pending = self._pending_out.get(node)
+            if self._deleted:
+                deleted = self._deleted
+                base = node << 32
+                stored = np.fromiter(
+                    (t for t in stored.tolist() if base | t not in deleted),
+                    dtype=np.int64,
+                )
+        else:
+            stored = self._column(node)
+            pending = self._pending_in.get(node)
+            if self._deleted:
+                deleted = self._deleted
+                stored = np.fromiter(
+                    (s for s in stored.tolist() if s << 32 | node not in deleted),
+                    dtype=np.int64,
+                )
+        if not pending:
+            return stored
+        return np.concatenate([stored, np.fromiter(pending, dtype=np.int64)])
+
+    def _maybe_compact(self) -> None:
+        threshold = max(self.min_pending, int(self.compact_ratio * self._n_edges))
+        if self.n_pending > threshold:
+            self.compact()
+
+    def _matrix_edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        n_rows = len(self._indptr) - 1
+        rows = np.repeat(np.arange(n_rows, dtype=np.int64), np.diff(self._indptr))
+        return rows, self._indices
+
+    def compact(self) -> None:
+        """Merge the pending changes into the matrix."""
+        if not self.n_pending:
+            return
+        rows, cols = self._matrix_edges()
+        columns = dict(self._columns)
+        if self._deleted:
+            deleted = np.fromiter(self._deleted, dtype=np.int64)
+            keep = ~np.isin(_keys(rows, cols), deleted)
+            rows, cols = rows[keep], cols[keep]
+            columns = {attr: column[keep] for attr, column in columns.items()}
+        if self._n_pending:
+            pending = [
+                (s, t) for s, targets in self._pending_out.items() for t in targets
+            ]
+            new_rows = np.fromiter((s for s, _ in pending), dtype=np.int64)
+            new_cols = np.fromiter((t for _, t in pending), dtype=np.int64)
+            rows = np.concatenate([rows, new_rows])
+            cols = np.concatenate([cols, new_cols])
+            values = self._pending_attrs
+            for attr, column in columns.items():
+                fill = _fill_value(attr, column.dtype)
+                new = np.array(
+                    [values.get(s << 32 | t, {}).get(attr, fill) for s, t in pending],
+                    dtype=column.dtype,
+                )
+                columns[attr] = np.concatenate([column, new])
+        self._set_matrix(rows, cols, columns)
+        self._pending_out.clear()
+        self._pending_in.clear()
+        self._pending_attrs.clear()
+        self._n_pending = 0
+        self._deleted.clear()
+        self.compactions += 1
+
+    def _set_matrix(
+        self,
+        rows: np.ndarray,
+        cols: np.ndarray,
+        columns: Dict[str, np.ndarray],
+        overwrite: Tuple[str, ...] = (),
+    ) -> None:
+        """Replace the matrix with sorted (rows, cols) pairs.
+
+        Duplicated pairs are merged, keeping the first values of each column,
+        except for the `overwrite` columns where the last value is kept.
+        """
+        order = np.lexsort((cols, rows))
+        keys = _keys(rows[order], cols[order])
+        first = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]][: len(keys)])
+        last = np.r_[first[1:] - 1, len(keys) - 1][: len(first)]
+        rows, cols = rows[order[first]], cols[order[first]]
+        n_rows = max(
+            len(self._indptr) - 1,
+            int(rows.max()) + 1 if len(rows) else 0,
+            int(cols.max()) + 1 if len(cols) else 0,
+        )
+        self._indptr = np.concatenate(
+            [[0], np.cumsum(np.bincount(rows, minlength=n_rows))]
+        ).astype(np.int64)
+        self._indices = np.ascontiguousarray(cols, dtype=np.int64)
+        self._columns = {
+            attr: column[order[last if attr in overwrite else first]]
+            for attr, column in columns.items()
+        }
+        self._t_indptr = self._t_indices = None
+
+    def edges(self) -> Tuple[np.ndarray, np.ndarray]:
+        self.compact()
+        return self._matrix_edges()
+
+    def add_edges(
+        self,
+        sources: np.ndarray,
+        targets: np.ndarray,
+        attrs: Optional[Dict[str, np.ndarray]] = None,
+    ) -> int:
+        sources = np.asarray(sources, dtype=np.int64)
+        targets = np.asarray(targets, dtype=np.int64)
+        if sources.shape != targets.shape:
+            raise ValueError("Sources and targets must have the same length.")
+        if not len(sources):
+            return 0
+        attrs = {attr: np.asarray(values) for attr, values in (attrs or {}).items()}
+        self.compact()
+        rows, cols = self._matrix_edges()
+        n_old, n_new = len(rows), len(sources)
+        columns = {}
+        for attr in set(self._columns) | set(attrs):
+            old = self._columns.get(attr)
+            if old is None:
+                old = _new_column(attr, attrs[attr], n_old)
+            new = attrs.get(attr)
+            if new is None:
+                new = _new_column(attr, old, n_new)
+            columns[attr] = np.concatenate([old, new.astype(old.dtype)])
+        n_before = self._n_edges
+        self._set_matrix(
+            np.concatenate([rows, sources]),
+            np.concatenate([cols, targets]),
+            columns,
+            overwrite=tuple(attrs),
+        )
+        self._n_edges = len(self._indices)
+        self._recount()
+        self.version += 1
+        return self._n_edges - n_before
+
+    def _attr_column(self, attr: str, sample: Any) -> np.ndarray:
+        """The column of an attribute, created if needed."""
+        if attr not in self._columns:
+            self._columns[attr] = _new_column(attr, sample, len(self._indices))
+        return self._columns[attr]
+
+    def set_attrs(self, source: int, target: int, attrs: Dict[str, Any]) -> None:
+        if self._is_pending(source, target):
+            for attr, value in attrs.items():
+                self._attr_column(attr, value)
+            self._pending_attrs.setdefault(source << 32 | target, {}).update(attrs)
+        elif self.has(source, target):
+            pos = self._position(source, target)
+            for attr, value in attrs.items():
+                self._attr_column(attr, value)[pos] = value
+        else:
+            raise self._missing(source, target)
+        self.version += 1
+
+    def get_attr(self, source: int, target: int, attr: str) -> Any:
+        if not self.has(source, target):
+            raise self._missing(source, target)
+        self._check_attr(attr)
+        column = self._columns.get(attr)
+        if column is None:
+            return _fill_value(attr, np.dtype(float))
+        if self._is_pending(source, target):
+            values = self._pending_attrs.get(source << 32 | target, {})
+            return values.get(attr, _fill_value(attr, column.dtype))
+        return column[self._position(source, target)]
+
+    def edge_array(self, attr: str) -> np.ndarray:
+        self._check_attr(attr)
+        self.compact()
+        if attr not in self._columns:
+            return np.ones(self._n_edges)
+        return self._columns[attr].copy()
+
+    def set_edge_array(self, attr: str, values: np.ndarray) -> None:
+        values = self._check_length(values)
+        self.compact()
+        self._attr_column(attr, values)[:] = values
+        self.version += 1
+
+    def to_scipy(self, n_nodes: int, attr: Optional[str] = None) -> sparse.csr_matrix:
+        from scipy import sparse
+
+        self.compact()
+        indptr = self._indptr
+        if len(indptr) - 1 < n_nodes:
+            extra = np.full(n_nodes - len(indptr) + 1, indptr[-1], dtype=np.int64)
+            indptr = np.concatenate([indptr, extra])
+        if attr is None:
+            data = np.ones(len(self._indices), dtype=np.int8)
+        else:
+            data = self.edge_array(attr).astype(float)
+        return sparse.csr_matrix(
+            (data, self._indices.copy(), indptr[: n_nodes + 1].copy()),
+            shape=(n_nodes, n_nodes),
+        )
+
+
+LINK_BACKENDS: Dict[str, Type[LinkStore]] = {
+    DictLinks.backend: DictLinks,
+    SparseLinks.backend: SparseLinks,
+}
+
+
+def create_link_store(backend: LinkBackend = "dict") -> LinkStore:
+    """Create an empty link store.
+
+    Parameters:
+        backend:
+            "dict" for sets of neighbors, "sparse" for a CSR matrix.
+
+    Raises:
+        ValueError:
+            If the backend is unknown.
+    """
+    if backend not in LINK_BACKENDS:
+        raise ValueError(
+            f"Unknown link backend '{backend}', choose from {tuple(LINK_BACKENDS)}."
+        )
+    return LINK_BACKENDS[backend]()
@@ -0,0 +1,177 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Diffusion of actors' attributes over a network.
+
+All the rules aggregate the neighbors' values with an influence matrix `W`,
+where `W[i, j]` is the weight of node `j`'s value on node `i`:
+
+- "mean": opinion dynamics, each node moves (by `rate`) toward the weighted
+  mean of its neighbors.
+- "threshold": adoption, a node adopts (becomes 1) once the weighted share
+  of its adopting neighbors reaches `threshold`. Adoption is irreversible.
+- "SI": contagion, a susceptible node (0) is infected (1) with probability
+  `1 - (1 - beta) ** pressure`, where `pressure` is the weighted number of
+  its infected neighbors.
+- "SIR": as "SI", and infected nodes recover (2) with probability `gamma`.
+
+In the synchronous mode, all the nodes are updated from the values at the
+beginning of the tick, with one sparse matrix-vector product. In the
+asynchronous mode, nodes are updated one by one in a random order, each of
+them seeing the values already updated in this tick.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Literal, Optional
+
+import numpy as np
+
+if TYPE_CHECKING:
+    from scipy import sparse
+
+DiffusionRule = Literal["mean", "threshold", "SI", "SIR"]
+
+SUSCEPTIBLE, INFECTED, RECOVERED = 0, 1, 2
+DIFFUSION_RULES = ("mean", "threshold", "SI", "SIR")
+
+
+def diffuse_values(
+    matrix: sparse.csr_matrix,
+    values: np.ndarray,
+    rule: DiffusionRule = "mean",
+    rng: Optional[np.random.Generator] = None,
+    synchronous: bool = True,
+    rate: float = 1.0,
+    threshold: float = 0.5,
+    beta: float = 0.1,
+    gamma: float = 0.1,
+) -> np.ndarray:
+    """Apply one tick of diffusion to an array of values.
+
+    Parameters:
+        matrix:
+            The influence matrix, `matrix[i, j]` being the weight of node `j`'s
+            value on node `i`.
+        values:
+            The current value of each node.
+        rule:
+            The diffusion rule, one of "mean", "threshold", "SI" or "SIR".
+        rng:
+            The random generator, for the stochastic rules and the order of
+            the asynchronous mode.
+        synchronous:
+            Whether to update all the nodes at once (True), or one by one in a
+            random order (False).
+        rate:
+            For "mean", the share of the gap to the neighbors' mean closed in
+            one tick.
+        threshold:
+            For "threshold", the share of adopting neighbors needed to adopt.
+        beta:
+            For "SI" and "SIR", the infection probability per infected neighbor.
+        gamma:
+            For "SIR", the recovery probability of an infected node.
+
+    Returns:
+        The new values, with the same dtype as `values`.
+
+    Raises:
+        ValueError:
+            If the rule is unknown, or if the sizes do not match.
+    """
+    if rule not in DIFFUSION_RULES:
+        raise ValueError(f"Unknown rule '{rule}', choose from {DIFFUSION_RULES}.")
+    values = np.asarray(values)
+    n_nodes = len(values)
+    if matrix.shape != (n_nodes, n_nodes):
+        raise ValueError(
+            f"Matrix of shape {matrix.shape} doesn't match {n_nodes} values."
+        )
+    if rng is None:
+        rng = np.random.default_rng()
+    draws = rng.random(n_nodes) if rule in ("SI", "SIR") else None
+    if synchronous:
+        new = _synchronous(matrix, values, rule, draws, rate, threshold, beta, gamma)
+    else:
+        order = rng.permutation(n_nodes)
+        new = _asynchronous(
+            matrix, values, rule, draws, order, rate, threshold, beta, gamma
+        )
+    return new.astype(values.dtype, copy=False)
+
+
+def _synchronous(
+    matrix: sparse.csr_matrix,
+    values: np.ndarray,
+    rule: str,
+    draws: Optional[np.ndarray],
+    rate: float,
+    threshold: float,
+    beta: float,
+    gamma: float,
+) -> np.ndarray:
+    """Update all the nodes from the same values."""
+    total = np.asarray(matrix.sum(axis=1)).ravel()
+    linked = total > 0
+    if rule == "mean":
+        current = values.astype(float)
+        mean = np.divide(matrix @ current, total, out=current.copy(), where=linked)
+        return current + rate * (mean - current)
+    if rule == "threshold":
+        adopted = values > 0
+        share = np.divide(
+            matrix @ adopted.astype(float),
+            total,
+            out=np.zeros(len(values)),
+            where=linked,
+        )
+        return adopted | (linked & (share >= threshold))
+    assert draws is not None
+    pressure = matrix @ (values == INFECTED).astype(float)
+    infection = 1.0 - (1.0 - beta) ** pressure
+    new = values.copy()
+    new[(values == SUSCEPTIBLE) & (draws < infection)] = INFECTED
+    if rule == "SIR":
+        new[(values == INFECTED) & (draws < gamma)] = RECOVERED
+    return new
+
+
+def _asynchronous(
+    matrix: sparse.csr_matrix,
+    values: np.ndarray,
+    rule: str,
+    draws: Optional[np.ndarray],
+    order: np.ndarray,
+    rate: float,
+    threshold: float,
+    beta: float,
+    gamma: float,
+) -> np.ndarray:
+    """Update the nodes one by one, in the given order."""
+    indptr, indices, weights = matrix.indptr, matrix.indices, matrix.data
+    new = values.astype(float) if rule == "mean" else values.copy()
+    for i in order.tolist():
+        start, end = indptr[i], indptr[i + 1]
+        neighbors, weight = indices[start:end], weights[start:end]
+        total = weight.sum()
+        if rule == "mean":
+            if total > 0:
+                mean = weight @ new[neighbors] / total
+                new[i] += rate * (mean - new[i])
+        elif rule == "threshold":
+            if not new[i] and total > 0:
+                share = weight @ (new[neighbors] > 0) / total
+                new[i] = share >= threshold
+        elif new[i] == SUSCEPTIBLE:
+            pressure = weight @ (new[neighbors] == INFECTED)
+            if draws[i] < 1.0 - (1.0 - beta) ** pressure:
+                new[i] = INFECTED
+        elif rule == "SIR" and new[i] == INFECTED and draws[i] < gamma:
+            new[i] = RECOVERED
+    return new
@@ -0,0 +1,221 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Random graph generators producing edge lists.
+
+Each generator returns two arrays `(sources, targets)` of node positions in
+`0..n-1`, ready to be inserted in bulk into a link store. They only draw
+from the given random generator, so they are reproducible from its seed.
+Undirected generators return each edge once, with `sources < targets`.
+"""
+
+from __future__ import annotations
+
+from typing import Callable, Optional, Tuple
+
+import numpy as np
+
+Edges = Tuple[np.ndarray, np.ndarray]
+
+
+def _empty() -> Edges:
+    return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+
+def _skip_positions(total: int, p: float, rng: np.random.Generator) -> np.ndarray:
+    """Positions in `0..total-1` selected with probability `p` each.
+
+    Instead of drawing one number per position, the gaps between selected
+    positions are drawn from a geometric distribution, so the cost is
+    proportional to the number of selected positions.
+    """
+    if p >= 1:
+        return np.arange(total, dtype=np.int64)
+    expected = total * p
+    chunk = int(expected + 5 * np.sqrt(expected) + 16)
+    positions = []
+    last = -1
+    while last < total:
+        gaps = rng.geometric(p, size=chunk)
+        selected = last + np.cumsum(gaps, dtype=np.int64)
+        positions.append(selected)
+        last = int(selected[-1])
+    result = np.concatenate(positions)
+    return result[result < total]
+
+
+def erdos_renyi(
+    n: int, p: float, rng: np.random.Generator, directed: bool = False
+) -> Edges:
+    """Erdős–Rényi G(n, p) graph, by geometric edge skipping.
+
+    Parameters:
+        n:
+            Number of nodes.
+        p:
+            Probability of each possible edge.
+        rng:
+            The random generator.
+        directed:
+            Whether `i -> j` and `j -> i` are distinct possible edges.
+
+    Returns:
+        Sources and targets of the edges.
+    """
+    if not 0 <= p <= 1:
+        raise ValueError(f"Probability must be in [0, 1], got {p}.")
+    if n < 2 or p == 0:
+        return _empty()
+    if directed:
+        k = _skip_positions(n * (n - 1), p, rng)
+        sources, targets = np.divmod(k, n - 1)
+        targets += targets >= sources
+        return sources, targets
+    k = _skip_positions(n * (n - 1) // 2, p, rng)
+    # Position k in the lower triangle: row i, column j, with j < i.
+    rows = ((1 + np.sqrt(1 + 8 * k.astype(float))) // 2).astype(np.int64)
+    rows -= rows * (rows - 1) // 2 > k
+    rows += (rows + 1) * rows // 2 <= k
+    cols = k - rows * (rows - 1) // 2
+    return cols, rows
+
+
+def watts_strogatz(
+    n: int, k: int, p: float, rng: np.random.Generator, max_rounds: int = 100
+) -> Edges:
+    """Watts–Strogatz small-world graph.
+
+    Each node is linked to its `k // 2` nearest neighbors on each side of a
+    ring, then each edge is rewired to a uniformly random target with
+    probability `p`, avoiding self-loops and duplicated edges.
+
+    Parameters:
+        n:
+            Number of nodes.
+        k:
+            Number of nearest neighbors in the ring lattice (even).
+        p:
+            Rewiring probability of each edge.
+        rng:
+            The random generator.
+        max_rounds:
+            Maximum number of redraws for rewired edges creating self-loops
+            or duplicates. Edges still conflicting after that are dropped.
+
+    Returns:
+        Sources and targets of the edges.
+    """
+    if not 0 <= p <= 1:
+        raise ValueError(f"Probability must be in [0, 1], got {p}.")
+    if k % 2 or not 0 <= k < n:
+        raise ValueError(f"k must be even and lower than n={n}, got {k}.")
+    half = k // 2
+    sources = np.repeat(np.arange(n, dtype=np.int64), half)
+    targets = (sources + np.tile(np.arange(1, half + 1), n)) % n
+    rewired = rng.random(len(sources)) < p
+    targets[rewired] = rng.integers(0, n, size=int(rewired.sum()))
+    for _ in range(max_rounds):
+        bad = rewired & _conflicts(sources, targets, n)
+        if not bad.any():
+            break
+        targets[bad] = rng.integers(0, n, size=int(bad.sum()))
+    keep = ~(rewired & _conflicts(sources, targets, n))
+    sources, targets = sources[keep], targets[keep]
+    return np.minimum(sources, targets), np.maximum(sources, targets)
+
+
+def _conflicts(sources: np.ndarray, targets: np.ndarray, n: int) -> np.ndarray:
+    """Self-loops and edges duplicated in an undirected edge list."""
+    keys = np.minimum(sources, targets) * n + np.maximum(sources, targets)
+    _, inverse, counts = np.unique(keys, return_inverse=True, return_counts=True)
+    return (sources == targets) | (counts[inverse] > 1)
+
+
+def barabasi_albert(n: int, m: int, rng: np.random.Generator) -> Edges:
+    """Barabási–Albert preferential attachment graph.
+
+    Starting from `m` unlinked nodes, each new node links to `m` distinct
+    existing nodes, chosen with a probability proportional to their degree.
+
+    Parameters:
+        n:
+            Number of nodes.
+        m:
+            Number of edges of each new node.
+        rng:
+            The random generator.
+
+    Returns:
+        Sources and targets of the edges.
+    """
+    if not 1 <= m < n:
+        raise ValueError(f"m must be in [1, n), got m={m} and n={n}.")
+    n_edges = m * (n - m)
+    sources = np.repeat(np.arange(m, n, dtype=np.int64), m)
+    targets = np.empty(n_edges, dtype=np.int64)
+    # Each node appears once per edge end, so uniform draws from this array
+    # are proportional to degrees.
+    repeated = np.empty(2 * n_edges, dtype=np.int64)
+    size = 0
+    chosen = np.arange(m, dtype=np.int64)
+    for i, source in enumerate(range(m, n)):
+        targets[i * m : (i + 1) * m] = chosen
+        repeated[size : size + m] = chosen
+        repeated[size + m : size + 2 * m] = source
+        size += 2 * m
+        picked: dict = {}
+        while len(picked) < m:
+            for node in repeated[rng.integers(0, size, size=m)].tolist():
+                picked.setdefault(node, None)
+        chosen = np.fromiter(picked, dtype=np.int64)[:m]
+    return np.minimum(sources, targets), np.maximum(sources, targets)
+
+
+def spatial_kernel(
+    positions: np.ndarray,
+    radius: float,
+    rng: np.random.Generator,
+    kernel: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+) -> Edges:
+    """Spatial graph linking nodes within a distance.
+
+    Candidate pairs are found with a KD-tree, then each pair is kept with the
+    probability given by the kernel of its distance.
+
+    Parameters:
+        positions:
+            Coordinates of the nodes, of shape (n, dims).
+        radius:
+            Maximum distance of linked nodes.
+        rng:
+            The random generator.
+        kernel:
+            Function from an array of distances to an array of link
+            probabilities, e.g. `lambda d: np.exp(-d / 10)`. By default, all
+            the pairs within the radius are linked.
+
+    Returns:
+        Sources and targets of the edges.
+    """
+    from scipy.spatial import cKDTree
+
+    positions = np.asarray(positions, dtype=float)
+    if positions.ndim != 2:
+        raise ValueError(
+            f"Positions must be of shape (n, dims), got {positions.shape}."
+        )
+    pairs = cKDTree(positions).query_pairs(radius, output_type="ndarray")
+    if not len(pairs):
+        return _empty()
+    pairs = pairs[np.lexsort((pairs[:, 1], pairs[:, 0]))].astype(np.int64)
+    sources, targets = pairs[:, 0], pairs[:, 1]
+    if kernel is not None:
+        distances = np.linalg.norm(positions[sources] - positions[targets], axis=1)
+        keep = rng.random(len(pairs)) < np.asarray(kernel(distances))
+        sources, targets = sources[keep], targets[keep]
+    return sources, targets
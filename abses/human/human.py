@@ -8,25 +8,47 @@
 from __future__ import annotations
 
 from typing import (
+    TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
+    Iterable,
     Optional,
     Set,
+    Tuple,
     Type,
 )
 
+import numpy as np
+import pandas as pd
+
+from abses.agents.sequences import ActorsList
 from abses.core.base import BaseModule, BaseSubSystem
 from abses.core.protocols import (
     ActorsListProtocol,
     HumanSystemProtocol,
     MainModelProtocol,
 )
+from abses.human import generators
+from abses.human.diffusion import DiffusionRule, diffuse_values
 from abses.human.links import _LinkContainer
+from abses.utils.errors import ABSESpyError
+
+if TYPE_CHECKING:
+    from abses.agents.collection import ActorCollection
+    from abses.core.types import Direction, LinkingNode
 
 
 class HumanModule(BaseModule):
     """The `Human` sub-module base class.
 
+    Collections defined only by `agent_type` are materialized (see
+    `abses.agents.collection`): their members are maintained when actors are
+    born or die, instead of scanning the whole population at each access.
+    Collections selecting by attributes are materialized on request only
+    (`materialize=True`), as attributes changed by plain assignment are not
+    observed. Collections selecting by a function are queried at each access.
+
     Note:
         Look at [this tutorial](../tutorial/beginner/organize_model_structure.ipynb) to understand the model structure.
 
@@ -46,15 +68,23 @@ class HumanModule(BaseModule):
     ):
         BaseModule.__init__(self, model, name=name)
         self._refers: Dict[str, Dict[str, Any]] = {}
+        self._materialized: Dict[str, ActorCollection] = {}
+        self._on_earth: Optional[ActorCollection] = None
         self.define(name, **kwargs)
 
     @property
     def agents(self) -> ActorsListProtocol:
         """The agents container of this ABSESpy model."""
-        if self.name not in self._refers:
-            raise KeyError(f"{self.name} is not defined.")
-        selection = self._refers[self.name]
-        return self.model.agents.select(**selection)
+        return self._select(self.name)
+
+    def _select(self, refer_name: str) -> ActorsListProtocol:
+        """Actors of a defined collection."""
+        if refer_name not in self._refers:
+            raise KeyError(f"{refer_name} is not defined.")
+        collection = self._materialized.get(refer_name)
+        if collection is None:
+            return self.model.agents.select(**self._refers[refer_name])
+        return ActorsList(self.model, collection.members())
 
     @property
     def collections(self) -> Set[str]:
@@ -64,11 +94,17 @@ class HumanModule(BaseModule):
     @property
     def actors(self) -> ActorsListProtocol:
         """Different selections of agents"""
-        return self.agents.select("on_earth")
+        collection = self._materialized.get(self.name)
+        if collection is None:
+            return self.agents.select("on_earth")
+        if self._on_earth is None:
+            self._on_earth = collection.on_earth()
+        return ActorsList(self.model, self._on_earth.members())
 
     def define(
         self,
         refer_name: Optional[str] = None,
+        materialize: bool = False,
         **kwargs,
     ) -> ActorsListProtocol:
         """Define a query of actors and save it into collections.
@@ -76,12 +112,22 @@ class HumanModule(BaseModule):
         Parameters:
             name:
                 defined name of this group of actors.
+            materialize:
+                Whether to maintain the members of an attribute selection
+                (a name or a dict of values) incrementally, instead of
+                querying them at each access. Only changes made through
+                `Actor.set` or `ActorsList.update` are then observed; call
+                `refresh` after plain assignments. Selections only by
+                `agent_type` are always materialized.
             selection:
                 Selection query of `Actor`.
 
         Raises:
             KeyError:
                 If the name is already defined.
+            ValueError:
+                If materializing a selection function, or a selection
+                limiting the number of actors.
 
         Returns:
             The list of actors who are satisfied the query condition.
@@ -105,17 +151,57 @@ class HumanModule(BaseModule):
             refer_name = self.name
         if refer_name in self._refers:
             raise KeyError(f"{refer_name} is already defined.")
+        # Selections limiting the number of actors can't be maintained, and
+        # the attributes read by a selection function can't be observed.
+        maintainable = set(kwargs) <= {"selection", "agent_type"}
+        selection = kwargs.get("selection")
+        if materialize and (not maintainable or callable(selection)):
+            raise ValueError(f"Cannot materialize the selection {kwargs}.")
         self._refers[refer_name] = kwargs.copy()
-        selected = self.agents.select(**kwargs)
-        return selected
+        if maintainable and (materialize or selection is None):
+            self._materialized[refer_name] = self.model.agents.collection(**kwargs)
+        return self._select(refer_name)
+
+    def refresh(self, refer_name: Optional[str] = None) -> None:
+        """Rescan the population for materialized collections.
+
+        Needed when attributes used by a selection were changed by plain
+        assignment, which is not observed.
+
+        Parameters:
+            refer_name:
+                The collection to refresh. All of them by default.
+        """
+        names = self._materialized if refer_name is None else [refer_name]
+        for name in names:
+            if name in self._materialized:
+                self._materialized[name].invalidate()
+
+    def collection_stats(self) -> pd.DataFrame:
+        """Materialization cost of the collections.
+
+        Returns:
+            A table indexed by collection name, with the number of members,
+            full scans, incremental updates and the time spent (seconds).
+        """
+        return pd.DataFrame.from_dict(
+            {name: c.stats() for name, c in self._materialized.items()},
+            orient="index",
+        )
 
 
 class BaseHuman(BaseSubSystem, _LinkContainer, HumanSystemProtocol):
-    """The Base Human Module."""
+    """The Base Human Module.
+
+    The storage of links defaults to sets of neighbors ("dict"). For large
+    networks, set `link_backend: sparse` in the `human` parameters to store
+    them as sparse matrices (see `define_link` for a per-link-type choice).
+    """
 
     def __init__(self, model: MainModelProtocol, name: str = "human"):
         BaseSubSystem.__init__(self, model, name=name)
-        _LinkContainer.__init__(self, model)
+        backend = self.params.get("link_backend", "dict")
+        _LinkContainer.__init__(self, model, backend=backend)
 
     def create_module(
         self,
@@ -132,3 +218,258 @@ class BaseHuman(BaseSubSystem, _LinkContainer, HumanSystemProtocol):
             **kwargs,
         )
         return module
+
+    def diffuse(
+        self,
+        link_name: str,
+        attr: str,
+        rule: DiffusionRule = "mean",
+        weight: Optional[str | np.ndarray] = None,
+        nodes: Optional[Iterable[LinkingNode]] = None,
+        direction: Direction = "out",
+        synchronous: bool = True,
+        seed: Optional[int | np.random.Generator] = None,
+        **kwargs: Any,
+    ) -> np.ndarray:
+        """Diffuse an attribute over a network for one tick.
+
+        The neighbors' values are aggregated for all the nodes at once with a
+        sparse matrix product, and the new values are written back to the
+        nodes' attribute. See `abses.human.diffusion` for the rules.
+
+        Parameters:
+            link_name:
+                The link type of the network.
+            attr:
+                The nodes' attribute to diffuse. For "SI" and "SIR", its
+                values are states: 0 (susceptible), 1 (infected) and 2
+                (recovered).
+            rule:
+                One of "mean", "threshold", "SI" or "SIR".
+            weight:
+                Influence weight of each neighbor: a links' attribute name
+                (e.g., "weight", see `link.to(..., weight=...)`), a nodes'
+                attribute name, or an array aligned with `nodes`. Links'
+                attributes take precedence. Equal weights by default.
+            nodes:
+                The nodes taking part in the diffusion. Defaults to all the
+                nodes having a link of this type.
+            direction:
+                Whose values a node sees: "out" for the nodes it links to,
+                "in" for the nodes linking to it, None for both.
+            synchronous:
+                If True, all the nodes are updated from the values at the
+                beginning of the tick. Otherwise, they are updated one after
+                another in a random order.
+            seed:
+                A seed or a random generator. By default, a random stream
+                derived from the model's seed (see `model.random_streams`),
+                so that runs with the same seed are reproducible.
+            **kwargs:
+                Parameters of the rule: `rate` ("mean"), `threshold`
+                ("threshold"), `beta` ("SI", "SIR") and `gamma` ("SIR").
+
+        Returns:
+            The new values, aligned with the nodes.
+
+        Example:
+            ```python
+            model.human.diffuse("friend", "opinion", rule="mean", rate=0.5)
+            model.human.diffuse("contact", "state", rule="SIR", beta=0.3, gamma=0.1)
+            ```
+        """
+        if nodes is None:
+            nodes = self.linked_nodes(link_name)
+        nodes = ActorsList(self.model, nodes)
+        rng = self._rng(seed, "diffusion", link_name, attr)
+        matrix = self.influence_matrix(link_name, nodes, direction, weight)
+        values = diffuse_values(
+            matrix,
+            nodes.array(attr),
+            rule=rule,
+            rng=rng,
+            synchronous=synchronous,
+            **kwargs,
+        )
+        nodes.update(attr, values.tolist())
+        return values
+
+    def _rng(
+        self, seed: Optional[int | np.random.Generator], *keys: str
+    ) -> np.random.Generator:
+        """A random generator from a seed, or the model's stream for `keys`."""
+        if isinstance(seed, np.random.Generator):
+            return seed
+        if seed is not None:
+            return np.random.default_rng(seed)
+        return self.model.random_streams.generator(*keys)
+
+    def _insert_generated(
+        self,
+        link_name: str,
+        nodes: Iterable[LinkingNode],
+        edges: Tuple[np.ndarray, np.ndarray],
+        mutual: bool,
+    ) -> int:
+        """Insert a generated edge list (positions in `nodes`) in bulk."""
+        index = self._index_node
+        indices = np.fromiter((index(node) for node in nodes), dtype=np.int64)
+        sources, targets = edges
+        return self._add_links_by_index(
+            link_name, indices[sources], indices[targets], mutual=mutual
+        )
+
+    def erdos_renyi(
+        self,
+        link_name: str,
+        nodes: Iterable[LinkingNode],
+        p: float,
+        directed: bool = False,
+        seed: Optional[int | np.random.Generator] = None,
+    ) -> int:
+        """Link each pair of nodes with probability `p` (Erdős–Rényi graph).
+
+        The cost is proportional to the number of links, not to the number
+        of pairs, thanks to geometric skipping between the linked pairs.
+
+        Parameters:
+            link_name:
+                The link type to create.
+            nodes:
+                The nodes to link.
+            p:
+                The probability of each link.
+            directed:
+                If False, each drawn pair is linked in both directions.
+                Otherwise, `i -> j` and `j -> i` are drawn independently.
+            seed:
+                A seed or a random generator. By default, the model's
+                ("graph", link_name) random stream.
+
+        Returns:
+            The number of new links.
+        """
+        nodes = list(nodes)
+        rng = self._rng(seed, "graph", link_name)
+        edges = generators.erdos_renyi(len(nodes), p, rng, directed=directed)
+        return self._insert_generated(link_name, nodes, edges, mutual=not directed)
+
+    def watts_strogatz(
+        self,
+        link_name: str,
+        nodes: Iterable[LinkingNode],
+        k: int,
+        p: float,
+        seed: Optional[int | np.random.Generator] = None,
+    ) -> int:
+        """Create a small-world network (Watts–Strogatz graph).
+
+        Nodes are placed on a ring, in the given order, and mutually linked to
+        their `k` nearest neighbors. Each link is then rewired to a random node
+        with probability `p`.
+
+        Parameters:
+            link_name:
+                The link type to create.
+            nodes:
+                The nodes to link.
+            k:
+                The number of nearest neighbors on the ring (even).
+            p:
+                The rewiring probability.
+            seed:
+                A seed or a random generator. By default, the model's
+                ("graph", link_name) random stream.
+
+        Returns:
+            The number of new links.
+        """
+        nodes = list(nodes)
+        rng = self._rng(seed, "graph", link_name)
+        edges = generators.watts_strogatz(len(nodes), k, p, rng)
+        return self._insert_generated(link_name, nodes, edges, mutual=True)
+
+    def barabasi_albert(
+        self,
+        link_name: str,
+        nodes: Iterable[LinkingNode],
+        m: int,
+        seed: Optional[int | np.random.Generator] = None,
+    ) -> int:
+        """Create a scale-free network (Barabási–Albert graph).
+
+        Nodes join the network in the given order, each one mutually linked to
+        `m` existing nodes chosen with a probability proportional to their
+        number of links.
+
+        Parameters:
+            link_name:
+                The link type to create.
+            nodes:
+                The nodes to link.
+            m:
+                The number of links of each joining node.
+            seed:
+                A seed or a random generator. By default, the model's
+                ("graph", link_name) random stream.
+
+        Returns:
+            The number of new links.
+        """
+        nodes = list(nodes)
+        rng = self._rng(seed, "graph", link_name)
+        edges = generators.barabasi_albert(len(nodes), m, rng)
+        return self._insert_generated(link_name, nodes, edges, mutual=True)
+
+    def spatial_graph(
+        self,
+        link_name: str,
+        nodes: Iterable[LinkingNode],
+        radius: float,
+        kernel: Optional[Callable[[np.ndarray], np.ndarray]] = None,
+        positions: Optional[np.ndarray] = None,
+        seed: Optional[int | np.random.Generator] = None,
+    ) -> int:
+        """Mutually link the nodes close to each other in space.
+
+        Pairs of nodes within `radius` are found with a KD-tree, and each of
+        them is linked with the probability given by `kernel(distance)`.
+
+        Parameters:
+            link_name:
+                The link type to create.
+            nodes:
+                The nodes to link.
+            radius:
+                The maximum distance between linked nodes, in the units of
+                the coordinates (CRS units by default).
+            kernel:
+                Function from an array of distances to an array of link
+                probabilities, e.g. `lambda d: np.exp(-d / 1000)`. By default,
+                all the pairs within the radius are linked.
+            positions:
+                Coordinates of the nodes, of shape (n, 2). By default, the
+                coordinates of the nodes' geometries.
+            seed:
+                A seed or a random generator. By default, the model's
+                ("graph", link_name) random stream.
+
+        Returns:
+            The number of new links.
+
+        Raises:
+            ABSESpyError:
+                If positions are not given and a node has no geometry.
+        """
+        nodes = list(nodes)
+        if positions is None:
+            positions = np.empty((len(nodes), 2))
+            for i, node in enumerate(nodes):
+                geometry = getattr(node, "geometry", None)
+                if geometry is None:
+                    raise ABSESpyError(f"{node} has no geometry to link in space.")
+                centroid = geometry.centroid
+                positions[i] = centroid.x, centroid.y
+        rng = self._rng(seed, "graph", link_name)
+        edges = generators.spatial_kernel(positions, radius, rng, kernel=kernel)
+        return self._insert_generated(link_name, nodes, edges, mutual=True)
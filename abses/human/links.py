@@ -11,13 +11,16 @@ from __future__ import annotations
 
 import contextlib
 import logging
-from abc import abstractmethod
+import weakref
 from functools import cached_property
+from pathlib import Path
 from typing import (
     TYPE_CHECKING,
     Any,
+    Callable,
     Dict,
     Iterable,
+    Iterator,
     List,
     Optional,
     Set,
@@ -33,10 +36,20 @@ with contextlib.suppress(ImportError):
     import networkx as nx
 
 from abses.agents.sequences import ActorsList
+from abses.human.adjacency import (
+    LINK_BACKENDS,
+    WEIGHT,
+    LinkBackend,
+    LinkStore,
+    NodeIndex,
+    create_link_store,
+)
 from abses.utils.errors import ABSESpyError
 from abses.utils.func import make_list
 
 if TYPE_CHECKING:
+    from scipy import sparse
+
     from abses import MainModel
     from abses.agents.actor import Actor
     from abses.core.protocols import LinkContainerProtocol
@@ -66,19 +79,33 @@ def get_node_unique_id(node: Any) -> UniqueID:
 class _LinkContainer:
     """容器类，用于管理节点之间的链接。
 
-    使用唯一 ID 作为键来存储链接，提高检索效率。
+    节点的唯一 ID 被映射为连续的整数索引，每种链接类型的链接存储在一个
+    以这些索引为行列的邻接结构中（见 `abses.human.adjacency`）：
+
+    - "dict": 每个节点的邻居集合，适合规模小、频繁变化的网络；
+    - "sparse": CSR 稀疏矩阵加追加缓冲区，适合百万级以上的链接和向量化查询。
 
     Attributes:
-        _back_links: 存储入向链接的字典。
-        _links: 存储出向链接的字典。
-        _cached_networks: 存储缓存的网络图的字典。
+        link_backend: 新链接类型默认使用的存储后端。
+        _stores: 每种链接类型的链接存储。
+        _nodes: 唯一 ID 到整数索引的映射。
+        _cached_networks: 缓存的 networkx 图及其对应的存储版本。
+        _cached_matrices: 缓存的邻接矩阵及其对应的存储版本和节点数。
         _node_cache: 存储节点对象的缓存，以便通过 ID 快速检索。
     """
 
-    def __init__(self, model=None) -> None:
-        self._back_links: Dict[str, Dict[UniqueID, Set[UniqueID]]] = {}
-        self._links: Dict[str, Dict[UniqueID, Set[UniqueID]]] = {}
-        self._cached_networks: Dict[str, object] = {}
+    def __init__(self, model=None, backend: LinkBackend = "dict") -> None:
+        if backend not in LINK_BACKENDS:
+            raise ValueError(
+                f"Unknown link backend '{backend}', choose from {tuple(LINK_BACKENDS)}."
+            )
+        self.link_backend: LinkBackend = backend
+        self._stores: Dict[str, LinkStore] = {}
+        self._nodes = NodeIndex()
+        self._cached_networks: Dict[Tuple[str, bool], Tuple[int, object]] = {}
+        self._cached_matrices: Dict[
+            Tuple[str, Optional[str]], Tuple[int, int, object]
+        ] = {}
         self._node_cache: Dict[UniqueID, LinkingNode] = {}
 
     def _cache_node(self, node: LinkingNode) -> UniqueID:
@@ -87,25 +114,93 @@ class _LinkContainer:
         self._node_cache[node_id] = node
         return node_id
 
+    def _index_node(self, node: LinkingNode) -> int:
+        """缓存节点并返回其整数索引。"""
+        return self._nodes.index(self._cache_node(node))
+
     def _get_node(self, node_id: UniqueID) -> LinkingNode:
         """从缓存中获取节点。"""
         return self._node_cache[node_id]
 
+    def _get_nodes(self, indices: Iterable[int]) -> List[LinkingNode]:
+        """将整数索引转换为节点对象。"""
+        uid, cache = self._nodes.uid, self._node_cache
+        return [cache[uid(idx)] for idx in indices]
+
     @property
     def links(self) -> Tuple[str, ...]:
         """获取特定类型的链接。"""
-        return tuple(self._links.keys())
+        return tuple(self._stores.keys())
 
-    def _add_a_link_name(self, link_name: str) -> None:
+    @property
+    def _links(self) -> Dict[str, Dict[UniqueID, Set[UniqueID]]]:
+        """出向链接：链接类型 -> 源节点 ID -> 目标节点 ID 集合（仅用于调试）。"""
+        return self._as_dict(direction="out")
+
+    @property
+    def _back_links(self) -> Dict[str, Dict[UniqueID, Set[UniqueID]]]:
+        """入向链接：链接类型 -> 目标节点 ID -> 源节点 ID 集合（仅用于调试）。"""
+        return self._as_dict(direction="in")
+
+    def _as_dict(
+        self, direction: Direction
+    ) -> Dict[str, Dict[UniqueID, Set[UniqueID]]]:
+        result: Dict[str, Dict[UniqueID, Set[UniqueID]]] = {}
+        uid = self._nodes.uid
+        for name, store in self._stores.items():
+            sources, targets = store.edges()
+            if direction == "in":
+                sources, targets = targets, sources
+            data = result[name] = {}
+            for source, target in zip(sources.tolist(), targets.tolist()):
+                data.setdefault(uid(source), set()).add(uid(target))
+        return result
+
+    def _add_a_link_name(
+        self, link_name: str, backend: Optional[LinkBackend] = None
+    ) -> LinkStore:
         """添加一个链接类型。"""
-        self._links[link_name] = {}
-        self._back_links[link_name] = {}
+        store = create_link_store(backend or self.link_backend)
+        self._stores[link_name] = store
+        return store
+
+    def define_link(
+        self, link_name: str, backend: Optional[LinkBackend] = None
+    ) -> None:
+        """定义一个链接类型，并选择其存储后端。
+
+        未定义的链接类型会在第一次建立链接时，以 `link_backend` 自动创建。
+
+        Parameters:
+            link_name:
+                链接类型的名称。
+            backend:
+                存储后端，"dict" 或 "sparse"。默认为 `link_backend`。
+
+        Raises:
+            ABSESpyError:
+                如果该链接类型已经存在。
+            ValueError:
+                如果后端未知。
+        """
+        if link_name in self._stores:
+            raise ABSESpyError(f"Link '{link_name}' already exists.")
+        self._add_a_link_name(link_name, backend)
+
+    def _store(self, link_name: str) -> LinkStore:
+        """获取链接类型的存储，不存在时引发 KeyError。"""
+        try:
+            return self._stores[link_name]
+        except KeyError as exc:
+            raise KeyError(f"No link named {link_name}.") from exc
 
     def owns_links(
         self, node: LinkingNode, direction: Direction = "out"
     ) -> Tuple[str, ...]:
         """获取特定节点参与的所有链接类型。
 
+        每种链接的存储都记录了各节点的链接数量，因此每种链接类型的检查为 O(1)。
+
         Args:
             node: 要检查链接的节点。
             direction: 要检查的链接方向:
@@ -119,19 +214,38 @@ class _LinkContainer:
         Raises:
             ValueError: 如果方向无效。
         """
-        node_id = node.unique_id
-        if direction == "out":
-            data = self._links
-        elif direction == "in":
-            data = self._back_links
-        elif direction is None:
+        if direction is None:
             links_in = self.owns_links(node, direction="in")
             links_out = self.owns_links(node, direction="out")
             return tuple(set(links_in) | set(links_out))
-        else:
+        if direction not in ("in", "out"):
             raise ValueError(f"Invalid direction '{direction}'.")
-        links = {link for link, agents in data.items() if node_id in agents}
-        return tuple(links)
+        idx = self._nodes.get(node.unique_id)
+        if idx is None:
+            return ()
+        return tuple(
+            name
+            for name, store in self._stores.items()
+            if store.participates(idx, direction)
+        )
+
+    def participates(self, node: LinkingNode, link_name: str) -> Tuple[bool, bool]:
+        """检查节点是否有某种类型的出向链接和入向链接，复杂度为 O(1)。
+
+        Parameters:
+            node:
+                要检查的节点。
+            link_name:
+                链接类型。不存在的链接类型视为没有链接。
+
+        Returns:
+            (has_outgoing, has_incoming) 布尔值的元组。
+        """
+        store = self._stores.get(link_name)
+        idx = self._nodes.get(node.unique_id)
+        if store is None or idx is None:
+            return False, False
+        return store.participates(idx, "out"), store.participates(idx, "in")
 
     @overload
     def get_graph(self, link_name: str, directions: bool = False) -> "nx.Graph": ...
@@ -144,6 +258,9 @@ class _LinkContainer:
     ) -> "nx.Graph | nx.DiGraph":
         """将指定类型的链接转换为 networkx 图。
 
+        图会被缓存，直到该类型的链接发生变化。返回的图是共享的，
+        如需修改请先调用 `graph.copy()`。
+
         Args:
             link_name: 要转换的链接类型。
             directions: 如果为 True，返回有向图。如果为 False，返回无向图。
@@ -156,33 +273,37 @@ class _LinkContainer:
         """
         if "nx" not in globals():
             raise ImportError("You need to install networkx to use this function.")
-        creating_using = nx.DiGraph if directions else nx.Graph
-
-        # 将 ID 映射回节点对象
-        links_dict = {}
-        for source_id, target_ids in self._links[link_name].items():
-            source_node = self._get_node(source_id)
-            links_dict[source_node] = {
-                self._get_node(target_id) for target_id in target_ids
-            }
-
-        graph = nx.from_dict_of_lists(links_dict, creating_using)
-        self._cached_networks[link_name] = graph
+        store = self._store(link_name)
+        cached = self._cached_networks.get((link_name, directions))
+        if cached is not None and cached[0] == store.version:
+            return cached[1]  # type: ignore[return-value]
+        graph = nx.DiGraph() if directions else nx.Graph()
+        sources, targets = store.edges()
+        nodes = np.unique(np.concatenate([sources, targets]))
+        objects = dict(zip(nodes.tolist(), self._get_nodes(nodes.tolist())))
+        graph.add_nodes_from(objects.values())
+        edges = zip(sources.tolist(), targets.tolist())
+        if not store.attributes:
+            graph.add_edges_from((objects[s], objects[t]) for s, t in edges)
+        else:
+            columns = {attr: store.edge_array(attr) for attr in store.attributes}
+            graph.add_edges_from(
+                (objects[s], objects[t], {k: v[i] for k, v in columns.items()})
+                for i, (s, t) in enumerate(edges)
+            )
+        self._cached_networks[(link_name, directions)] = (store.version, graph)
         return graph
 
     def _register_link(
         self, link_name: str, source: LinkingNode, target: LinkingNode
-    ) -> None:
-        """注册一个链接。"""
-        source_id = self._cache_node(source)
-        target_id = self._cache_node(target)
-
-        if link_name not in self._links:
-            self._add_a_link_name(link_name)
-        if source_id not in self._links[link_name]:
-            self._links[link_name][source_id] = set()
-        if target_id not in self._back_links[link_name]:
-            self._back_links[link_name][target_id] = set()
+    ) -> Tuple[LinkStore, int, int]:
+        """注册一个链接，返回其存储和两端节点的索引。"""
+        source_idx = self._index_node(source)
+        target_idx = self._index_node(target)
+        store = self._stores.get(link_name)
+        if store is None:
+            store = self._add_a_link_name(link_name)
+        return store, source_idx, target_idx
 
     def has_link(
         self, link_name: str, source: LinkingNode, target: LinkingNode
@@ -202,16 +323,12 @@ class _LinkContainer:
         Raises:
             KeyError: 如果 link_name 不存在。
         """
-        if link_name not in self.links:
-            raise KeyError(f"No link named {link_name}.")
-
-        source_id = source.unique_id
-        target_id = target.unique_id
-
-        data = self._links[link_name]
-        to = False if source_id not in data else target_id in data.get(source_id, [])
-        by = False if target_id not in data else source_id in data.get(target_id, [])
-        return to, by
+        store = self._store(link_name)
+        source_idx = self._nodes.get(source.unique_id)
+        target_idx = self._nodes.get(target.unique_id)
+        if source_idx is None or target_idx is None:
+            return False, False
+        return store.has(source_idx, target_idx), store.has(target_idx, source_idx)
 
     def add_a_link(
         self,
@@ -219,6 +336,7 @@ class _LinkContainer:
         source: LinkingNode,
         target: LinkingNode,
         mutual: bool = False,
+        **attrs: Any,
     ) -> None:
         """在节点之间创建新链接。
 
@@ -227,16 +345,163 @@ class _LinkContainer:
             source: 源节点。
             target: 目标节点。
             mutual: 如果为 True，则在两个方向上创建链接。
+            **attrs: 链接的属性，例如 `weight`。互相链接的两个方向属性相同。
         """
-        self._register_link(link_name, source, target)
+        store, source_idx, target_idx = self._register_link(link_name, source, target)
+        store.add(source_idx, target_idx)
+        if attrs:
+            store.set_attrs(source_idx, target_idx, attrs)
+        if mutual:
+            store.add(target_idx, source_idx)
+            if attrs:
+                store.set_attrs(target_idx, source_idx, attrs)
 
-        source_id = source.unique_id
-        target_id = target.unique_id
+    def add_links(
+        self,
+        link_name: str,
+        sources: Iterable[LinkingNode],
+        targets: Iterable[LinkingNode],
+        mutual: bool = False,
+        **attrs: Iterable[Any],
+    ) -> int:
+        """批量创建链接，`sources[i]` 链接到 `targets[i]`。
+
+        对于 "sparse" 后端，所有链接通过一次排序写入稀疏矩阵。
+
+        Parameters:
+            link_name:
+                要创建的链接类型。
+            sources:
+                源节点序列。
+            targets:
+                目标节点序列，与源节点一一对应。
+            mutual:
+                如果为 True，则在两个方向上创建链接。
+            **attrs:
+                链接的属性数组，与源节点一一对应，例如 `weight=[...]`。
+                会覆盖已存在链接的属性值。
+
+        Returns:
+            新创建的链接数量（已存在的链接不重复计数）。
 
-        self._links[link_name][source_id].add(target_id)
-        self._back_links[link_name][target_id].add(source_id)
+        Raises:
+            ValueError:
+                如果源节点、目标节点和属性的数量不一致。
+        """
+        index = self._index_node
+        source_idx = np.fromiter((index(node) for node in sources), dtype=np.int64)
+        target_idx = np.fromiter((index(node) for node in targets), dtype=np.int64)
+        return self._add_links_by_index(
+            link_name, source_idx, target_idx, mutual=mutual, **attrs
+        )
+
+    def _add_links_by_index(
+        self,
+        link_name: str,
+        source_idx: np.ndarray,
+        target_idx: np.ndarray,
+        mutual: bool = False,
+        **attrs: Iterable[Any],
+    ) -> int:
+        """按节点索引批量创建链接。"""
+        if source_idx.shape != target_idx.shape:
+            raise ValueError(
+                f"Got {len(source_idx)} sources but {len(target_idx)} targets."
+            )
+        columns = {attr: np.asarray(values) for attr, values in attrs.items()}
+        for attr, values in columns.items():
+            if values.shape != source_idx.shape:
+                raise ValueError(
+                    f"Got {len(values)} values of '{attr}' for {len(source_idx)} links."
+                )
+        store = self._stores.get(link_name)
+        if store is None:
+            store = self._add_a_link_name(link_name)
         if mutual:
-            self.add_a_link(link_name, target=source, source=target, mutual=False)
+            source_idx, target_idx = (
+                np.concatenate([source_idx, target_idx]),
+                np.concatenate([target_idx, source_idx]),
+            )
+            columns = {k: np.concatenate([v, v]) for k, v in columns.items()}
+        return store.add_edges(source_idx, target_idx, columns)
+
+    def _link_indices(
+        self, link_name: str, source: LinkingNode, target: LinkingNode
+    ) -> Tuple[LinkStore, int, int]:
+        """链接的存储和两端节点的索引，链接不存在时引发 KeyError。"""
+        store = self._store(link_name)
+        source_idx = self._nodes.get(source.unique_id)
+        target_idx = self._nodes.get(target.unique_id)
+        if source_idx is None or target_idx is None:
+            raise KeyError(f"No link '{link_name}' from {source} to {target}.")
+        return store, source_idx, target_idx
+
+    def edge_attr(
+        self, link_name: str, source: LinkingNode, target: LinkingNode, attr: str
+    ) -> Any:
+        """获取一条链接的属性。
+
+        Parameters:
+            link_name:
+                链接类型。
+            source:
+                源节点。
+            target:
+                目标节点。
+            attr:
+                属性名称。未设置过的 "weight" 默认为 1.0。
+
+        Raises:
+            KeyError:
+                如果链接或属性不存在。
+        """
+        store, source_idx, target_idx = self._link_indices(link_name, source, target)
+        return store.get_attr(source_idx, target_idx, attr)
+
+    def set_edge_attrs(
+        self, link_name: str, source: LinkingNode, target: LinkingNode, **attrs: Any
+    ) -> None:
+        """设置一条链接的属性。
+
+        Raises:
+            KeyError:
+                如果链接不存在。
+        """
+        store, source_idx, target_idx = self._link_indices(link_name, source, target)
+        store.set_attrs(source_idx, target_idx, attrs)
+
+    def edge_attributes(self, link_name: str) -> Tuple[str, ...]:
+        """某种链接已有的属性名称。"""
+        return self._store(link_name).attributes
+
+    def edge_array(self, link_name: str, attr: str) -> np.ndarray:
+        """某种链接所有链接的属性值。
+
+        数组按（源节点索引，目标节点索引）排序，与 `adjacency` 中
+        稀疏矩阵的非零元素顺序一致。
+
+        Parameters:
+            link_name:
+                链接类型。
+            attr:
+                属性名称。未设置过的 "weight" 全部为 1.0。
+
+        Raises:
+            KeyError:
+                如果链接类型或属性不存在。
+        """
+        return self._store(link_name).edge_array(attr)
+
+    def set_edge_array(
+        self, link_name: str, attr: str, values: Iterable[Any] | np.ndarray
+    ) -> None:
+        """批量设置某种链接所有链接的属性值，顺序与 `edge_array` 一致。
+
+        Raises:
+            ValueError:
+                如果值的数量与链接数量不一致。
+        """
+        self._store(link_name).set_edge_array(attr, np.asarray(values))
 
     def remove_a_link(
         self,
@@ -263,14 +528,228 @@ class _LinkContainer:
         """
         if not self.has_link(link_name, source, target)[0]:
             raise ABSESpyError(f"Link from {source} to {target} not found.")
+        store = self._stores[link_name]
+        source_idx = self._nodes.index(source.unique_id)
+        target_idx = self._nodes.index(target.unique_id)
+        store.remove(source_idx, target_idx)
+        if mutual:
+            store.remove(target_idx, source_idx)
 
-        source_id = source.unique_id
-        target_id = target.unique_id
+    def degree(
+        self,
+        link_name: str,
+        direction: Direction = "out",
+        nodes: Optional[Iterable[LinkingNode]] = None,
+    ) -> pd.Series:
+        """每个节点在某种链接中的度。
 
-        self._links[link_name].get(source_id, set()).remove(target_id)
-        self._back_links[link_name].get(target_id, set()).remove(source_id)
-        if mutual:
-            self.remove_a_link(link_name, target=source, source=target, mutual=False)
+        Parameters:
+            link_name:
+                链接类型。
+            direction:
+                "out" 为出度，"in" 为入度，None 为两者之和。
+            nodes:
+                要查询的节点。默认为所有曾经建立过链接的节点。
+
+        Returns:
+            以节点唯一 ID 为索引的度序列。
+        """
+        store = self._store(link_name)
+        n_nodes = len(self._nodes)
+        if direction is None:
+            degree = store.degree(n_nodes, "out") + store.degree(n_nodes, "in")
+        else:
+            degree = store.degree(n_nodes, direction)
+        if nodes is None:
+            return pd.Series(degree, index=self._nodes.uids, name=link_name)
+        uids = [node.unique_id for node in nodes]
+        indices = [self._nodes.get(uid) for uid in uids]
+        values = [0 if idx is None else degree[idx] for idx in indices]
+        return pd.Series(values, index=uids, name=link_name, dtype=np.int64)
+
+    def adjacency(
+        self, link_name: str, attr: Optional[str] = None
+    ) -> Tuple["sparse.csr_matrix", np.ndarray]:
+        """某种链接的邻接矩阵。
+
+        Parameters:
+            link_name:
+                链接类型。
+            attr:
+                用作矩阵元素的链接属性（例如 "weight"）。默认为 1。
+
+        Returns:
+            一个 `scipy.sparse.csr_matrix`，其第 i 行第 j 列非零表示存在
+            从节点 i 到节点 j 的链接；以及行（列）对应的节点唯一 ID 数组。
+            矩阵会被缓存直到链接变化，如需修改请先复制。
+        """
+        store = self._store(link_name)
+        n_nodes = len(self._nodes)
+        cached = self._cached_matrices.get((link_name, attr))
+        if cached is not None and cached[:2] == (store.version, n_nodes):
+            return cached[2], self._nodes.uids  # type: ignore[return-value]
+        matrix = store.to_scipy(n_nodes, attr=attr)
+        self._cached_matrices[(link_name, attr)] = (store.version, n_nodes, matrix)
+        return matrix, self._nodes.uids
+
+    def linked_nodes(self, link_name: str) -> List[LinkingNode]:
+        """所有拥有某种链接的节点（任一方向），按节点索引排序。"""
+        store = self._store(link_name)
+        n_nodes = len(self._nodes)
+        degree = store.degree(n_nodes, "out") + store.degree(n_nodes, "in")
+        return self._get_nodes(np.flatnonzero(degree).tolist())
+
+    def influence_matrix(
+        self,
+        link_name: str,
+        nodes: Iterable[LinkingNode],
+        direction: Direction = "out",
+        weight: Optional[str | np.ndarray] = None,
+    ) -> "sparse.csr_matrix":
+        """节点之间的影响矩阵，用于网络扩散。
+
+        Parameters:
+            link_name:
+                链接类型。
+            nodes:
+                参与扩散的节点，矩阵的行列按此顺序排列。
+            direction:
+                节点受哪些邻居影响："out" 为其链接到的节点，"in" 为链接到它
+                的节点，None 为两者。
+            weight:
+                邻居影响力的权重：链接属性名（如 "weight"，优先）、节点属性名，
+                或与 `nodes` 对齐的数组。默认所有邻居权重相同。
+
+        Returns:
+            一个 `scipy.sparse.csr_matrix`，第 i 行第 j 列为节点 j 对节点 i
+            的影响权重。
+
+        Raises:
+            ValueError:
+                如果方向无效，或权重数组的长度与节点数不一致。
+        """
+        nodes = list(nodes)
+        indices = self._nodes.indices(node.unique_id for node in nodes)
+        store = self._store(link_name)
+        edge_weight = isinstance(weight, str) and (
+            weight == WEIGHT or weight in store.attributes
+        )
+        attr = weight if edge_weight else None
+        matrix = self.adjacency(link_name, attr=attr)[0][indices][:, indices]
+        if direction == "in":
+            matrix = matrix.T
+        elif direction is None:
+            matrix = matrix.maximum(matrix.T)
+        elif direction != "out":
+            raise ValueError(f"Invalid direction {direction}")
+        matrix = matrix.tocsr().astype(float)
+        if weight is None or edge_weight:
+            return matrix
+        if isinstance(weight, str):
+            weight = np.array([node.get(weight) for node in nodes], dtype=float)
+        weight = np.asarray(weight, dtype=float)
+        if weight.shape != (len(nodes),):
+            raise ValueError(f"Got {len(weight)} weights for {len(nodes)} nodes.")
+        return matrix.multiply(weight[np.newaxis, :]).tocsr()
+
+    def _directed_adjacency(
+        self, link_name: str, direction: Direction = "out"
+    ) -> "sparse.csr_matrix":
+        """邻接矩阵，第 i 行为节点 i 在该方向上的邻居（None 为两个方向）。"""
+        matrix = self.adjacency(link_name)[0]
+        if direction == "in":
+            return matrix.T.tocsr()
+        if direction is None:
+            return matrix.maximum(matrix.T).tocsr()
+        if direction != "out":
+            raise ValueError(f"Invalid direction {direction}")
+        return matrix
+
+    def neighbor_aggregate(
+        self,
+        link_name: str,
+        attr: str,
+        nodes: Iterable[LinkingNode],
+        how: str = "mean",
+        direction: Direction = "out",
+    ) -> np.ndarray:
+        """聚合每个节点的邻居的属性值，所有节点只需一次稀疏矩阵乘法。
+
+        邻居的属性值只读取一次，即使它是多个节点的邻居。
+
+        Parameters:
+            link_name:
+                链接类型。
+            attr:
+                邻居的属性名称。
+            nodes:
+                要聚合的节点。
+            how:
+                "mean" 为邻居的平均值（没有邻居时为 NaN），"sum" 为总和
+                （没有邻居时为 0）。
+            direction:
+                "out" 为其链接到的节点，"in" 为链接到它的节点，None 为两者。
+
+        Returns:
+            与 `nodes` 对齐的聚合值数组。
+
+        Raises:
+            ValueError:
+                如果聚合方式或方向无效。
+        """
+        if how not in ("mean", "sum"):
+            raise ValueError(f"Unknown aggregation '{how}', choose mean or sum.")
+        # 从未链接过的节点没有索引，也没有邻居
+        indices = [self._nodes.get(node.unique_id) for node in nodes]
+        known = np.array([idx is not None for idx in indices], dtype=bool)
+        result = np.zeros(len(indices), dtype=float)
+        counts = np.zeros(len(indices), dtype=np.int64)
+        if known.any():
+            matrix = self._directed_adjacency(link_name, direction)
+            rows = matrix[[idx for idx in indices if idx is not None]]
+            columns = np.unique(rows.indices)
+            values = np.array(
+                [node.get(attr) for node in self._get_nodes(columns.tolist())],
+                dtype=float,
+            )
+            rows = (rows[:, columns] != 0).astype(float)
+            result[known] = rows @ values
+            counts[known] = rows.getnnz(axis=1)
+        if how == "sum":
+            return result
+        return np.divide(
+            result, counts, out=np.full(len(indices), np.nan), where=counts > 0
+        )
+
+    def n_components(
+        self,
+        link_name: str,
+        nodes: Optional[Iterable[LinkingNode]] = None,
+    ) -> int:
+        """某种链接构成的网络中（弱）连通分量的数量。
+
+        Parameters:
+            link_name:
+                链接类型。
+            nodes:
+                网络中的节点，其中没有链接的节点各自是一个分量。
+                默认为所有拥有该链接的节点。
+
+        Returns:
+            连通分量的数量。
+        """
+        from scipy.sparse.csgraph import connected_components
+
+        if nodes is None:
+            nodes = self.linked_nodes(link_name)
+        indices = [self._nodes.get(node.unique_id) for node in nodes]
+        linked = np.array([idx for idx in indices if idx is not None], dtype=np.int64)
+        isolated = len(indices) - len(linked)
+        if not len(linked):
+            return isolated
+        matrix = self.adjacency(link_name)[0][linked][:, linked]
+        n_components, _ = connected_components(matrix, connection="weak")
+        return int(n_components) + isolated
 
     def _clean_link_name(self, link_name: Optional[str | Iterable[str]]) -> List[str]:
         """清理链接名称。"""
@@ -301,26 +780,23 @@ class _LinkContainer:
         Raises:
             ValueError: 如果方向无效。
         """
-        node_id = node.unique_id
-
-        if direction == "in":
-            data = self._back_links
-            another_data = self._links
-        elif direction == "out":
-            data = self._links
-            another_data = self._back_links
-        elif direction is None:
+        if direction is None:
             self.clean_links_of(node, link_name, direction="in")
             self.clean_links_of(node, link_name, direction="out")
             return
-        else:
+        if direction not in ("in", "out"):
             raise ValueError(
                 f"Invalid direction {direction}, please choose from 'in' or 'out'."
             )
-        for name in self._clean_link_name(link_name):
-            to_clean = data[name].pop(node_id, set())
-            for another_node_id in to_clean:
-                another_data[name][another_node_id].remove(node_id)
+        idx = self._nodes.get(node.unique_id)
+        names = self._clean_link_name(link_name)
+        stores = [self._store(name) for name in names]
+        if idx is None:
+            return
+        # 只处理节点实际参与的链接类型
+        for store in stores:
+            if store.participates(idx, direction):
+                store.pop_node(idx, direction)
 
     def linked(
         self,
@@ -347,28 +823,25 @@ class _LinkContainer:
         Returns:
             与输入节点链接的 Actors 或 PatchCells。
         """
-        node_id = node.unique_id
         link_names = self._clean_link_name(link_name=link_name)
-
-        if direction == "in":
-            data = self._back_links
-        elif direction == "out":
-            data = self._links
-        elif direction is None:
-            in_links = self.linked(node, link_name, direction="in")
-            out_links = self.linked(node, link_name, direction="out")
+        if direction is None:
+            in_links = self.linked(node, link_name, direction="in", default=default)
+            out_links = self.linked(node, link_name, direction="out", default=default)
             return in_links | out_links
-        else:
+        if direction not in ("in", "out"):
             raise ValueError(f"Invalid direction {direction}")
 
-        linked_ids: Set[UniqueID] = set()
+        idx = self._nodes.get(node.unique_id)
+        linked_idx: Set[int] = set()
         for name in link_names:
-            if name not in data and default is not ...:
+            if name not in self._stores and default is not ...:
                 continue
-            linked_ids = linked_ids.union(data[name].get(node_id, set()))
+            store = self._store(name)
+            if idx is not None:
+                linked_idx.update(store.neighbors(idx, direction).tolist())
 
-        # 将 ID 转换回节点对象
-        return {self._get_node(node_id) for node_id in linked_ids}
+        # 将索引转换回节点对象
+        return set(self._get_nodes(linked_idx))
 
     def _check_is_node(
         self,
@@ -389,19 +862,254 @@ class _LinkContainer:
         mapping_dict: Optional[Dict[UniqueID, Actor]] = None,
         mutual: Optional[bool] = None,
     ) -> None:
-        """从图中添加链接。"""
+        """从图中添加链接。
+
+        每个图节点只检查一次，所有链接批量写入。
+        """
         if mutual is None:
             mutual = not isinstance(graph, nx.DiGraph)
         if mapping_dict is None:
             mapping_dict = {}
-        edges = 0
-        for source, targets in nx.to_dict_of_lists(graph).items():
-            source = self._check_is_node(source, mapping_dict)
-            for target in targets:
-                target = self._check_is_node(target, mapping_dict)
-                self.add_a_link(link_name, source, target, mutual=mutual)
-                edges += 1
-        logger.info(f"Imported links {edges} links from graph {graph}.")
+        positions = {node: i for i, node in enumerate(graph.nodes)}
+        indices = np.fromiter(
+            (
+                self._index_node(self._check_is_node(node, mapping_dict))
+                for node in graph.nodes
+            ),
+            dtype=np.int64,
+            count=len(positions),
+        )
+        edges = np.array(
+            [(positions[u], positions[v]) for u, v in graph.edges], dtype=np.int64
+        ).reshape(-1, 2)
+        self._add_links_by_index(
+            link_name, indices[edges[:, 0]], indices[edges[:, 1]], mutual=mutual
+        )
+        logger.info(f"Imported links {len(edges)} links from graph {graph}.")
+
+    def _layer_cells(self) -> Iterator[LinkingNode]:
+        """各斑块模块的所有斑块。"""
+        for module in getattr(self, "model").nature.modules.values():
+            cells = getattr(module, "array_cells", None)
+            if cells is not None:
+                yield from cells.ravel()
+
+    def _cells_of_ids(self, ids: np.ndarray) -> np.ndarray:
+        """按各图层的编号区间，把斑块的（负数）`unique_id` 直接换算为斑块。"""
+        cells = np.empty(len(ids), dtype=object)
+        found = np.zeros(len(ids), dtype=bool)
+        for module in getattr(self, "model").nature.modules.values():
+            first = getattr(module, "_first_cell_id", None)
+            if first is None:
+                continue
+            offsets = first - ids
+            inside = (offsets >= 0) & (offsets < module.width * module.height)
+            rows, cols = np.divmod(offsets[inside], module.width)
+            cells[inside] = module.array_cells[rows, cols]
+            found |= inside
+        if not found.all():
+            raise KeyError(
+                f"{(~found).sum()} ids not found, e.g., {list(ids[~found][:5])}."
+            )
+        return cells
+
+    def _index_by_keys(
+        self, ids: np.ndarray, keys: List[Any], nodes: List[LinkingNode]
+    ) -> np.ndarray:
+        """按与节点一一对应的键，把 ID 批量转换为节点索引。"""
+        lookup = pd.Index(keys)
+        if not lookup.is_unique:
+            raise ValueError("The ids mapping to nodes are not unique.")
+        positions = lookup.get_indexer(ids)
+        missing = positions < 0
+        if missing.any():
+            raise KeyError(
+                f"{missing.sum()} ids not found, e.g., {list(ids[missing][:5])}."
+            )
+        used, inverse = np.unique(positions, return_inverse=True)
+        index = self._index_node
+        indices = np.fromiter(
+            (index(nodes[pos]) for pos in used.tolist()),
+            dtype=np.int64,
+            count=len(used),
+        )
+        return indices[inverse]
+
+    def _resolve_unique_ids(self, ids: np.ndarray) -> np.ndarray:
+        """按 `unique_id` 转换：主体的 ID 在模型的主体中查找，斑块的（负数）
+        ID 只在出现时按图层的编号区间换算，无需遍历斑块。"""
+        if np.issubdtype(ids.dtype, np.integer):
+            negative = ids < 0
+        else:
+            negative = np.zeros(len(ids), dtype=bool)
+        indices = np.empty(len(ids), dtype=np.int64)
+        if not negative.all():
+            actors = list(getattr(self, "model").agents)
+            keys = [actor.unique_id for actor in actors]
+            indices[~negative] = self._index_by_keys(ids[~negative], keys, actors)
+        if negative.any():
+            used, inverse = np.unique(ids[negative], return_inverse=True)
+            index = self._index_node
+            cells = np.fromiter(
+                (index(cell) for cell in self._cells_of_ids(used)),
+                dtype=np.int64,
+                count=len(used),
+            )
+            indices[negative] = cells[inverse]
+        return indices
+
+    def _resolve_ids(
+        self,
+        ids: np.ndarray,
+        mapping: Optional[str | Dict[Any, LinkingNode]] = None,
+    ) -> np.ndarray:
+        """将节点 ID（或节点本身）批量转换为节点索引。"""
+        if len(ids) and isinstance(ids[0], _LinkNode):
+            index = self._index_node
+            return np.fromiter((index(node) for node in ids), dtype=np.int64)
+        if mapping is None or mapping == "unique_id":
+            return self._resolve_unique_ids(ids)
+        if not isinstance(mapping, str):
+            return self._index_by_keys(
+                ids, list(mapping.keys()), list(mapping.values())
+            )
+        # 先在主体中查找，只有找不到的 ID 才需要遍历斑块。
+        nodes, keys = [], []
+        for node in getattr(self, "model").agents:
+            key = getattr(node, mapping, None)
+            if key is not None:
+                nodes.append(node)
+                keys.append(key)
+        lookup = pd.Index(keys)
+        if lookup.is_unique and (lookup.get_indexer(ids) < 0).any():
+            for cell in self._layer_cells():
+                key = getattr(cell, mapping, None)
+                if key is not None:
+                    nodes.append(cell)
+                    keys.append(key)
+        return self._index_by_keys(ids, keys, nodes)
+
+    def add_links_from_edges(
+        self,
+        link_name: str,
+        sources: Iterable[Any] | pd.DataFrame | str | Path,
+        targets: Optional[Iterable[Any]] = None,
+        mutual: bool = False,
+        mapping: Optional[str | Dict[Any, LinkingNode]] = None,
+        columns: Tuple[str, str] = ("source", "target"),
+        attrs: Optional[Iterable[str] | Dict[str, Iterable[Any]]] = None,
+    ) -> int:
+        """从边列表批量创建链接。
+
+        Parameters:
+            link_name:
+                要创建的链接类型。
+            sources:
+                源节点 ID 的数组；或一个边表（`pandas`/`GeoPandas` 数据框，
+                或 Parquet/CSV 文件路径），此时 `targets` 留空。
+            targets:
+                目标节点 ID 的数组，与 `sources` 一一对应。
+            mutual:
+                如果为 True，则在两个方向上创建链接。
+            mapping:
+                如何把 ID 映射为节点：
+                - None: ID 是模型中主体或斑块的 `unique_id`；
+                - 字符串: ID 是模型中主体或斑块的该属性值，例如 "name"，
+                  没有该属性的节点被忽略；
+                - 字典: ID 到节点的映射。
+                如果 `sources` 和 `targets` 本身就是节点，则忽略。
+            columns:
+                边表中源和目标 ID 所在的列名。
+            attrs:
+                链接属性：边表中要导入的列名，或属性名到数组的字典。
+
+        Returns:
+            新创建的链接数量。
+
+        Raises:
+            KeyError:
+                如果某些 ID 找不到对应的节点。
+            ValueError:
+                如果文件格式不支持，或数组长度不一致。
+
+        Example:
+            ```python
+            # 从通勤数据中导入带流量的链接
+            model.human.add_links_from_edges(
+                "commute", "commuting.parquet",
+                columns=("origin", "destination"),
+                mapping="person_id",
+                attrs=["flow"],
+            )
+            ```
+        """
+        if isinstance(sources, (str, Path)):
+            sources = _read_edges(sources)
+        if isinstance(sources, pd.DataFrame):
+            frame = sources
+            source_col, target_col = columns
+            sources, targets = (
+                frame[source_col].to_numpy(),
+                frame[target_col].to_numpy(),
+            )
+            if attrs is not None and not isinstance(attrs, dict):
+                attrs = {attr: frame[attr].to_numpy() for attr in attrs}
+        elif targets is None:
+            raise ValueError("Targets are required with arrays of sources.")
+        if attrs is not None and not isinstance(attrs, dict):
+            raise TypeError("Attributes must be a dict of arrays, or columns' names.")
+        sources, targets = np.asarray(sources), np.asarray(targets)
+        if sources.shape != targets.shape:
+            raise ValueError(f"Got {len(sources)} sources but {len(targets)} targets.")
+        indices = self._resolve_ids(np.concatenate([sources, targets]), mapping)
+        added = self._add_links_by_index(
+            link_name,
+            indices[: len(sources)],
+            indices[len(sources) :],
+            mutual=mutual,
+            **(attrs or {}),
+        )
+        logger.info(f"Imported {added} new '{link_name}' links from edges.")
+        return added
+
+    def edges(
+        self, link_name: str, as_frame: bool = False
+    ) -> Tuple[np.ndarray, np.ndarray] | pd.DataFrame:
+        """导出某种链接的边列表。
+
+        Parameters:
+            link_name:
+                链接类型。
+            as_frame:
+                如果为 True，返回包含 "source"、"target" 以及所有链接属性列的
+                数据框，可以直接传给 `add_links_from_edges`。
+
+        Returns:
+            源节点和目标节点 `unique_id` 的两个数组，按节点索引排序，
+            与 `edge_array` 的顺序一致；或一个数据框。
+        """
+        store = self._store(link_name)
+        sources, targets = store.edges()
+        uids = self._nodes.uids
+        if len(uids) == 0:
+            uids = np.zeros(0, dtype=np.int64)
+        source_ids, target_ids = uids[sources], uids[targets]
+        if not as_frame:
+            return source_ids, target_ids
+        data = {"source": source_ids, "target": target_ids}
+        data.update({attr: store.edge_array(attr) for attr in store.attributes})
+        return pd.DataFrame(data)
+
+
+def _read_edges(path: str | Path) -> pd.DataFrame:
+    """Read an edge list from a Parquet or CSV file."""
+    path = Path(path)
+    suffix = path.suffix.lower()
+    if suffix in (".parquet", ".pq"):
+        return pd.read_parquet(path)
+    if suffix == ".csv":
+        return pd.read_csv(path)
+    raise ValueError(f"Unsupported edge list format '{suffix}', use Parquet or CSV.")
 
 
 class _LinkProxy:
@@ -499,14 +1207,7 @@ class _LinkProxy:
                 如果从其他到我存在链接，则第二个元素为 True。
         """
         if node is None:
-            try:
-                has_in = link_name in self.owning("in")
-                has_out = link_name in self.owning("out")
-            except TypeError:
-                # 如果owning返回的不是可迭代对象，则假设没有链接
-                has_in = False
-                has_out = False
-            return has_out, has_in
+            return self.human.participates(self.node, link_name)
 
         # 直接调用human.has_link并确保返回元组
         result = self.human.has_link(link_name, self.node, node)
@@ -515,19 +1216,24 @@ class _LinkProxy:
             return (False, False)
         return result
 
-    def to(self, node: LinkingNode, link_name: str, mutual: bool = False) -> None:
+    def to(
+        self, node: LinkingNode, link_name: str, mutual: bool = False, **attrs: Any
+    ) -> None:
         """创建到另一个节点的出向链接。
 
         Args:
             node: 要链接到的目标节点。
             link_name: 要创建的链接类型。
             mutual: 如果为 True，则在两个方向上创建链接。
+            **attrs: 链接的属性，例如 `weight=0.5`。
         """
         self.human.add_a_link(
-            link_name=link_name, source=self.node, target=node, mutual=mutual
+            link_name=link_name, source=self.node, target=node, mutual=mutual, **attrs
         )
 
-    def by(self, node: LinkingNode, link_name: str, mutual: bool = False) -> None:
+    def by(
+        self, node: LinkingNode, link_name: str, mutual: bool = False, **attrs: Any
+    ) -> None:
         """使此节点被另一个节点链接。
 
         Parameters:
@@ -537,11 +1243,47 @@ class _LinkProxy:
                 链接的名称。
             mutual:
                 链接是否是互相的。默认为 False。
+            **attrs:
+                链接的属性，例如 `weight=0.5`。
         """
         self.human.add_a_link(
-            link_name=link_name, source=node, target=self.node, mutual=mutual
+            link_name=link_name, source=node, target=self.node, mutual=mutual, **attrs
         )
 
+    def neighbors(self, link_name: str, direction: Direction = "out") -> ActorsList:
+        """某种链接的邻居，顺序与 `edge_values` 一致。
+
+        Parameters:
+            link_name:
+                链接的名称。
+            direction:
+                "out" 为此节点链接到的节点，"in" 为链接到此节点的节点。
+        """
+        human = self.human
+        idx = human._nodes.get(self.node.unique_id)
+        if idx is None:
+            return ActorsList(self.model, [])
+        others = human._store(link_name).neighbors(idx, direction)
+        return ActorsList(self.model, human._get_nodes(others.tolist()))
+
+    def edge_values(
+        self, link_name: str, attr: str = WEIGHT, direction: Direction = "out"
+    ) -> np.ndarray:
+        """此节点各条链接的属性值，顺序与 `neighbors` 一致。
+
+        Example:
+            ```python
+            # 按链接权重随机选择一个朋友
+            friends = actor.link.neighbors("friend")
+            friend = friends.random.choice(prob=actor.link.edge_values("friend"))
+            ```
+        """
+        human = self.human
+        idx = human._nodes.get(self.node.unique_id)
+        if idx is None:
+            return np.array([])
+        return human._store(link_name).neighbor_values(idx, attr, direction)
+
     def unlink(self, node: LinkingNode, link_name: str, mutual: bool = False):
         """移除我和另一个节点之间的链接。
 
@@ -588,6 +1330,127 @@ class _LinkProxy:
         self.human.clean_links_of(self.node, link_name=link_name, direction=direction)
 
 
+Getter = Callable[["_LinkNode", Any], Any]
+Setter = Callable[["_LinkNode", Any, bool], None]
+_MISSING = object()
+
+
+def _is_builtin(cls: type, name: str) -> bool:
+    """类的 `get` 或 `_redirect` 方法是否是内置的实现（比较函数对象）。"""
+    from abses.space.cells import PatchCell
+
+    builtins = {
+        "get": (_LinkNode.get, PatchCell.get),
+        "_redirect": (_LinkNodeActor._redirect, _LinkNodeCell._redirect),
+    }
+    method = getattr(cls, name, None)
+    return any(method is func for func in builtins[name])
+
+
+def _redirected_getter(attr: str) -> Getter:
+    """从重定向的对象获取其自身属性的函数，按对象的类缓存访问路径。"""
+    resolved: weakref.WeakKeyDictionary[type, Getter] = weakref.WeakKeyDictionary()
+
+    def get_from(obj: Any, default: Any) -> Any:
+        cls = type(obj)
+        getter = resolved.get(cls)
+        if getter is None:
+            if _is_builtin(cls, "get"):
+                getter = cls._getter(attr, "self")
+            else:
+                # 改写了 `get` 的类（或非节点对象）仍调用其 `get`
+                def getter(obj: Any, default: Any) -> Any:
+                    return obj.get(attr, target="self", default=default)
+
+            resolved[cls] = getter
+        return getter(obj, default)
+
+    return get_from
+
+
+def _compile_getter(cls: type, attr: str, target: Optional[TargetName]) -> Getter:
+    """解析 (attr, target) 在某个节点类上的访问路径，返回对应的访问函数。"""
+    if target in cls._self_targets:
+
+        def get_self(node: _LinkNode, default: Any) -> Any:
+            if default is ...:
+                return getattr(node, attr)
+            return getattr(node, attr, default)
+
+        return get_self
+    redirect_attr = cls._default_redirect_attr
+    if redirect_attr and _is_builtin(cls, "_redirect"):
+        # 默认目标（主体所在的斑块、斑块上的主体）直接取属性，无需重定向
+        def redirect(node: _LinkNode) -> Any:
+            return getattr(node, redirect_attr)
+    else:
+
+        def redirect(node: _LinkNode) -> Any:
+            return node._redirect(target=None)
+
+    if target is not None and target != cls._default_redirect_target:
+
+        def get_linked(node: _LinkNode, default: Any) -> Any:
+            return node._redirect(target=target).get(
+                attr, target="self", default=default
+            )
+
+        return get_linked
+    get_from = _redirected_getter(attr)
+    if target is not None:
+
+        def get_default(node: _LinkNode, default: Any) -> Any:
+            return get_from(redirect(node), default)
+
+        return get_default
+    protected = attr.startswith("_")
+
+    def get_auto(node: _LinkNode, default: Any) -> Any:
+        if not protected:
+            value = getattr(node, attr, _MISSING)
+            if value is not _MISSING:
+                return value
+        if default is not ...:
+            return default
+        target_obj = redirect(node)
+        try:
+            return get_from(target_obj, default)
+        except AttributeError as exc:
+            raise AttributeError(
+                f"Neither {node} nor {target_obj} has attribute {attr}."
+            ) from exc
+
+    return get_auto
+
+
+def _compile_setter(cls: type, attr: str, target: Optional[TargetName]) -> Setter:
+    """解析 (attr, target) 在某个节点类上的赋值路径，返回对应的赋值函数。"""
+    if target in cls._self_targets:
+
+        def set_self(node: _LinkNode, value: Any, new: bool) -> None:
+            node._setattr(attr, value, target="self", new=new)
+
+        return set_self
+    if target is not None:
+
+        def set_linked(node: _LinkNode, value: Any, new: bool) -> None:
+            node._redirect(target=target).set(attr, value, target="self", new=new)
+
+        return set_linked
+
+    def set_auto(node: _LinkNode, value: Any, new: bool) -> None:
+        if new or node.has(attr):
+            node._setattr(attr, value, target="self", new=new)
+            return
+        target_obj = node._redirect(target="self")
+        if hasattr(target_obj, attr):
+            target_obj.set(attr, value, target="self", new=new)
+            return
+        raise AttributeError(f"Neither {node} nor {target_obj} has attribute '{attr}'.")
+
+    return set_auto
+
+
 class _BreedDescriptor:
     """A descriptor to get the breed of a node."""
 
@@ -602,6 +1465,10 @@ class _LinkNode:
 
     使用唯一 ID 来优化链接的检索和管理。
 
+    `get` 和 `set` 的访问路径（自身属性、默认目标的属性、链接节点的属性）
+    按 (attr, target) 为每个类解析一次并缓存在类上（随类一起回收）。路径本身
+    与链接结构无关，链接目标是否存在在每次访问时以 O(1) 检查，因此缓存无需失效。
+
     Attributes:
         unique_id: 节点的唯一标识符。
         breed: 节点的品种/类型。
@@ -610,10 +1477,41 @@ class _LinkNode:
 
     unique_id: UniqueID = -1
     breed = _BreedDescriptor()
+    _self_targets: Tuple[str, ...] = ("self",)
+    _default_redirect_target: Optional[str] = None
+    _default_redirect_attr: Optional[str] = None
 
-    @abstractmethod
     def _target_is_me(self, target: Optional[TargetName]) -> bool:
         """检查目标是否是我自己。"""
+        return target in self._self_targets
+
+    @classmethod
+    def _getter(cls, attr: str, target: Optional[TargetName]) -> Getter:
+        """获取 (attr, target) 的访问函数，每个类只解析一次。"""
+        getters = cls.__dict__.get("_link_getters")
+        if getters is None:
+            getters = {}
+            setattr(cls, "_link_getters", getters)
+        getter = getters.get((attr, target))
+        if getter is None:
+            if not isinstance(attr, str):
+                raise TypeError(f"The attribute to get {attr} is not string.")
+            getter = getters[(attr, target)] = _compile_getter(cls, attr, target)
+        return getter
+
+    @classmethod
+    def _setter(cls, attr: str, target: Optional[TargetName]) -> Setter:
+        """获取 (attr, target) 的赋值函数，每个类只解析一次。"""
+        setters = cls.__dict__.get("_link_setters")
+        if setters is None:
+            setters = {}
+            setattr(cls, "_link_setters", setters)
+        setter = setters.get((attr, target))
+        if setter is None:
+            if not isinstance(attr, str):
+                raise TypeError(f"The attribute to set {attr} is not string.")
+            setter = setters[(attr, target)] = _compile_setter(cls, attr, target)
+        return setter
 
     @classmethod
     def viz_attrs(cls, **kwargs) -> Dict[str, Any]:
@@ -720,24 +1618,11 @@ class _LinkNode:
         Raises:
             AttributeError: 如果未找到属性且未提供默认值。
         """
-        if self._target_is_me(target):
-            if default is ...:
-                return getattr(self, attr)
-            return getattr(self, attr, default)
-        if target is not None:
-            target_obj = self._redirect(target=target)
-            return target_obj.get(attr, target="self", default=default)
-        if self.has(attr, raise_error=False):
-            return getattr(self, attr)
-        if default is not ...:
-            return default
-        target_obj = self._redirect(target=target)
-        try:
-            return target_obj.get(attr=attr, target="self", default=default)
-        except AttributeError as exc:
-            raise AttributeError(
-                f"Neither {self} nor {target_obj} has attribute {attr}."
-            ) from exc
+        getters = type(self).__dict__.get("_link_getters")
+        getter = None if getters is None else getters.get((attr, target))
+        if getter is None:
+            getter = self._getter(attr, target)
+        return getter(self, default)
 
     def set(
         self,
@@ -762,23 +1647,11 @@ class _LinkNode:
             TypeError: 如果 attr 不是字符串。
             ABSESpyError: 如果目标无效或属性受保护。
         """
-        if self._target_is_me(target):
-            self._setattr(attr, value, target="self", new=new)
-            return
-        if target is None and new:
-            self._setattr(attr, value, target="self", new=new)
-            return
-        if target is not None:
-            self._redirect(target=target).set(attr, value, target="self", new=new)
-            return
-        if self.has(attr):
-            self._setattr(attr, value, target="self")
-            return
-        target_obj = self._redirect(target="self")
-        if hasattr(target_obj, attr):
-            target_obj.set(attr, value, target="self", new=new)
-            return
-        raise AttributeError(f"Neither {self} nor {target_obj} has attribute '{attr}'.")
+        setters = type(self).__dict__.get("_link_setters")
+        setter = None if setters is None else setters.get((attr, target))
+        if setter is None:
+            setter = self._setter(attr, target)
+        setter(self, value, new)
 
     def summary(
         self, coords: bool = False, attrs: Optional[Iterable[str] | str] = None
@@ -802,11 +1675,9 @@ class _LinkNode:
 class _LinkNodeCell(_LinkNode):
     """PatchCell"""
 
+    _self_targets = ("self", "cell")
     _default_redirect_target = "actor"
-
-    def _target_is_me(self, target: Optional[TargetName]) -> bool:
-        """Check if the target is me."""
-        return target in ("self", "cell")
+    _default_redirect_attr = "agents"
 
     def _redirect(self, target: Optional[TargetName]) -> _LinkNode:
         """By default, redirect to the agents list of this cell."""
@@ -816,11 +1687,9 @@ class _LinkNodeCell(_LinkNode):
 
 
 class _LinkNodeActor(_LinkNode):
+    _self_targets = ("self", "actor")
     _default_redirect_target = "cell"
-
-    def _target_is_me(self, target: Optional[TargetName]) -> bool:
-        """Check if the target is me."""
-        return target in ("self", "actor")
+    _default_redirect_attr = "at"
 
     def _redirect(self, target: Optional[TargetName]) -> _LinkNode:
         """Redirect the target.
@@ -12,13 +12,16 @@ This module contains classes for managing spatial elements
 in agent-based models, including cells, patches, and nature modules.
 """
 
-from .cells import PatchCell, raster_attribute
+from .cells import PatchCell, SlotPatchCell, raster_attribute
 from .nature import BaseNature
+from .ownership import OwnershipIndex
 from .patch import PatchModule
 
 __all__ = [
     "PatchCell",
+    "SlotPatchCell",
     "raster_attribute",
     "BaseNature",
     "PatchModule",
+    "OwnershipIndex",
 ]
@@ -18,11 +18,14 @@ from pyproj import CRS
 
 from abses.agents.container import _CellAgentsContainer
 from abses.core.base import BaseModelElement
+from abses.core.buffers import BufferedField
 from abses.core.protocols import ActorProtocol
+from abses.core.slots import LazySlot
 from abses.human.links import _LinkNodeCell
 from abses.utils.errors import ABSESpyError
 
 if TYPE_CHECKING:
+    from abses.core.model import MainModel
     from abses.core.types import ActorsList, Pos, TargetName
     from abses.space.patch import PatchModule
 
@@ -90,6 +93,8 @@ class PatchCell(_LinkNodeCell, BaseModelElement, ActorProtocol):
     the `agents` property will be limited to the number of agents.
 
     Attributes:
+        unique_id:
+            The id of this cell among the model's linking nodes.
         agents:
             The agents located at here.
         layer:
@@ -106,9 +111,9 @@ class PatchCell(_LinkNodeCell, BaseModelElement, ActorProtocol):
     ):
         BaseModelElement.__init__(self, model=layer.model)
         _LinkNodeCell.__init__(self)
+        self._set_layer(layer=layer)
         self.indices = indices
         self.pos = pos
-        self._set_layer(layer=layer)
 
     def __repr__(self) -> str:
         return f"<Cell at {self.layer}[{self.indices}]>"
@@ -118,11 +123,13 @@ class PatchCell(_LinkNodeCell, BaseModelElement, ActorProtocol):
         """Properties that should be found in the `RasterLayer`.
 
         Users should decorate a property attribute when subclassing `PatchCell` to make it accessible in the `RasterLayer`.
+        Double-buffered fields (see `abses.core.buffers.buffered`) are accessible too.
         """
         return {
             name
             for name, method in cls.__dict__.items()
-            if isinstance(method, property)
+            if isinstance(method, BufferedField)
+            or isinstance(method, property)
             and getattr(method.fget, "is_decorated", False)
         }
 
@@ -137,6 +144,17 @@ class PatchCell(_LinkNodeCell, BaseModelElement, ActorProtocol):
             )
         return self._layer
 
+    @property
+    def unique_id(self) -> int:
+        """The id of this cell among the model's linking nodes.
+
+        Negative, so that it never collides with the ids of actors, and
+        given by the order in which the layers were created, so that the same
+        model structure gives the same ids.
+        """
+        row, col = self.indices
+        return self.layer._first_cell_id - row * self.layer.width - col
+
     @property
     def agents(self) -> _CellAgentsContainer:
         """The agents located at here."""
@@ -223,3 +241,94 @@ class PatchCell(_LinkNodeCell, BaseModelElement, ActorProtocol):
             include_center=include_center,
             annular=annular,
         )
+
+
+class SlotPatchCell(PatchCell):
+    """A memory-lean `PatchCell` storing its core state in `__slots__`.
+
+    Use it as `cell_cls` for large rasters. Compared with `PatchCell`:
+
+    - `pos` is derived from `indices` and the layer's height (a given
+      `pos` is only checked against them);
+    - runs the same `__init__` chain as `PatchCell`, but creates the agents
+      container, observers, dynamic variables and updated ticks only when
+      they are first used.
+
+    Subclasses can declare their own fields in `__slots__`.
+
+    Example:
+        ```python
+        class Grassland(SlotPatchCell):
+            __slots__ = ("grass",)
+
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                self.grass = 0.0
+
+        module = model.nature.create_module(shape=(100, 100), cell_cls=Grassland)
+        ```
+    """
+
+    __slots__ = (
+        "_model",
+        "_name",
+        "_layer",
+        "indices",
+        "_lazy_agents",
+        "_lazy_observers",
+        "_lazy_dynamic_variables",
+        "_lazy_updated_ticks",
+    )
+
+    _observers = LazySlot("_lazy_observers", lambda _: set())
+    _dynamic_variables = LazySlot("_lazy_dynamic_variables", lambda _: {})
+    _updated_ticks = LazySlot("_lazy_updated_ticks", lambda _: [])
+    _agents = LazySlot(
+        "_lazy_agents",
+        lambda cell: _CellAgentsContainer(
+            cell.model,
+            cell=cell,
+            max_len=getattr(cell, "max_agents", float("inf")),
+        ),
+    )
+
+    def _create_containers(self) -> None:
+        """Skipped: the containers are lazy slots."""
+
+    def _set_layer(self, layer: PatchModule) -> None:
+        if not isinstance(layer, RasterBase):
+            raise TypeError(f"{type(layer)} is not valid layer.")
+        # The agents container is a lazy slot.
+        self._layer = layer
+
+    @property
+    def model(self) -> MainModel:
+        """The model which the layer belongs to."""
+        return self._model
+
+    @model.setter
+    def model(self, model: MainModel) -> None:
+        if model is not self._layer.model:
+            raise ABSESpyError(
+                f"{self} belongs to the model of its layer, not to {model}."
+            )
+
+    @property
+    def pos(self) -> Pos:
+        """Position `(x, y)` of this cell, derived from its indices."""
+        row, col = self.indices
+        return col, self._layer.height - row - 1
+
+    @pos.setter
+    def pos(self, value: Optional[Pos]) -> None:
+        if value is not None and tuple(value) != self.pos:
+            raise ABSESpyError(
+                f"Position {value} does not match indices {self.indices} of {self}."
+            )
+
+    @property
+    def is_empty(self) -> bool:
+        """Check if the cell is empty, without creating the agents container."""
+        if not SlotPatchCell._agents.is_created(self):
+            return True
+        return len(self._agents) == 0
@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""
+Ownership of cells by actors, e.g. land tenure.
+
+The ownership of a layer is a flat array with the owner slot of each cell
+(-1 for no owner), in row-major order of the cells' indices. Each owner
+actor gets a slot, recycled once it owns nothing or dies. The cells of each
+owner are kept in a sorted array, built at the first query by sorting the
+cells by owner, then patched in place by each transfer: a transfer costs
+O(moved cells + cells of the owners involved), never a pass over the layer.
+
+Owners are kept as `ActorRef`, so the cells of a dead actor are released when
+it is queried or when the whole layer is exported, even when the actor's
+object is reused from a pool.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Dict, List, Literal, Optional, Tuple
+
+import numpy as np
+import pandas as pd
+
+if TYPE_CHECKING:
+    from abses.agents.actor import Actor
+    from abses.agents.pool import ActorRef
+
+OWNER_ID = "owner_id"
+NO_OWNER = -1
+ZonalStat = Literal["sum", "mean", "count"]
+
+
+class OwnershipIndex:
+    """Bipartite index between actors and the cells they own.
+
+    Parameters:
+        shape:
+            Shape of the layer, (height, width).
+
+    Attributes:
+        version:
+            Incremented on each change of ownership.
+    """
+
+    def __init__(self, shape: Tuple[int, int]) -> None:
+        self.shape = shape
+        self._owner = np.full(shape[0] * shape[1], NO_OWNER, dtype=np.int64)
+        self._refs: List[Optional[ActorRef]] = []
+        self._counts = np.zeros(0, dtype=np.int64)
+        self._slots: Dict[Actor, int] = {}
+        self._free: List[int] = []
+        # Sorted cells of each slot, None until the first query.
+        self._members: Optional[List[np.ndarray]] = None
+        self.version = 0
+
+    def __repr__(self) -> str:
+        return f"<OwnershipIndex: {len(self._slots)} owners>"
+
+    @property
+    def owner_slots(self) -> np.ndarray:
+        """The owner slot of each cell, -1 for no owner (read-only view)."""
+        self._prune()
+        view = self._owner.view()
+        view.flags.writeable = False
+        return view
+
+    def _slot(self, actor: Actor) -> int:
+        """The slot of an owner, allocated if needed."""
+        slot = self._slots.get(actor)
+        ref = None if slot is None else self._refs[slot]
+        if ref:
+            return slot  # type: ignore[return-value]
+        if slot is not None:
+            self._drop_slots([slot])
+        slot = self._free.pop() if self._free else len(self._refs)
+        if slot == len(self._refs):
+            self._refs.append(None)
+            self._counts = np.append(self._counts, 0)
+            if self._members is not None:
+                self._members.append(np.zeros(0, dtype=np.int64))
+        self._refs[slot] = actor.ref()
+        self._slots[actor] = slot
+        return slot
+
+    def _drop_slots(self, slots: List[int]) -> None:
+        """Release the cells of some owners and recycle their slots."""
+        members = self._members
+        if members is not None:
+            for slot in slots:
+                self._owner[members[slot]] = NO_OWNER
+        elif self._counts[slots].any():
+            self._owner[np.isin(self._owner, slots)] = NO_OWNER
+        self._counts[slots] = 0
+        for slot in slots:
+            ref = self._refs[slot]
+            if ref is not None:
+                self._slots.pop(ref._actor, None)
+            self._refs[slot] = None
+            self._free.append(slot)
+            if members is not None:
+                members[slot] = np.zeros(0, dtype=np.int64)
+        self.version += 1
+
+    def _prune(self) -> None:
+        """Release the cells of all the dead owners."""
+        stale = [s for s, ref in enumerate(self._refs) if ref is not None and not ref]
+        if stale:
+            self._drop_slots(stale)
+
+    def _inverse(self) -> List[np.ndarray]:
+        """The sorted cells of each slot, built once by sorting the layer."""
+        if self._members is None:
+            order = np.argsort(self._owner, kind="stable")
+            unowned = len(order) - int(self._counts.sum())
+            offsets = unowned + np.concatenate([[0], np.cumsum(self._counts)])
+            self._members = [order[a:b] for a, b in zip(offsets[:-1], offsets[1:])]
+        return self._members
+
+    def _move(self, cells: np.ndarray, previous: np.ndarray, slot: int) -> None:
+        """Patch the sorted cells of the slots involved in a transfer."""
+        members = self._members
+        if members is None:
+            return
+        owned = previous != NO_OWNER
+        for old in np.unique(previous[owned]):
+            moved = cells[previous == old]
+            kept = ~np.isin(members[old], moved, assume_unique=True)
+            members[old] = members[old][kept]
+        if slot != NO_OWNER:
+            members[slot] = np.union1d(members[slot], cells)
+
+    def assign(self, cells: np.ndarray, owner: Optional[Actor]) -> None:
+        """Give some cells to an owner, or release them if owner is None.
+
+        Parameters:
+            cells:
+                Flat indices of the cells.
+            owner:
+                The new owner. None to release the cells.
+        """
+        cells = np.unique(np.asarray(cells, dtype=np.int64))
+        slot = NO_OWNER if owner is None else self._slot(owner)
+        previous = self._owner[cells]
+        np.subtract.at(self._counts, previous[previous != NO_OWNER], 1)
+        if slot != NO_OWNER:
+            self._counts[slot] += len(cells)
+        self._owner[cells] = slot
+        self._move(cells, previous, slot)
+        self.version += 1
+        # Recycle the slots of owners who own nothing anymore.
+        released = np.unique(previous[previous != NO_OWNER])
+        empty = [int(s) for s in released if not self._counts[s]]
+        if empty:
+            self._drop_slots(empty)
+
+    def owner_of(self, cell: int) -> Optional[Actor]:
+        """The owner of a cell, by flat index, or None."""
+        slot = int(self._owner[cell])
+        if slot == NO_OWNER:
+            return None
+        ref = self._refs[slot]
+        return None if ref is None else ref.get()
+
+    def cells_of(self, owner: Actor) -> np.ndarray:
+        """Flat indices of the cells owned by an actor, in ascending order."""
+        slot = self._slots.get(owner)
+        if slot is not None and not self._refs[slot]:
+            # Only the queried owner is checked: its cells are released if it died.
+            self._drop_slots([slot])
+            slot = None
+        if slot is None:
+            return np.zeros(0, dtype=np.int64)
+        return self._inverse()[slot]
+
+    def _owner_uids(self) -> np.ndarray:
+        """The unique id of each slot's owner, -1 for free slots."""
+        return np.array(
+            [NO_OWNER if not ref else ref.get().unique_id for ref in self._refs],
+            dtype=np.int64,
+        )
+
+    def owner_ids(self) -> np.ndarray:
+        """The unique id of each cell's owner, -1 for no owner."""
+        uids = np.append(self._owner_uids(), NO_OWNER)
+        return uids[self._owner]
+
+    def aggregate(self, values: np.ndarray, how: ZonalStat = "sum") -> pd.Series:
+        """Aggregate values of the cells for each owner.
+
+        Parameters:
+            values:
+                One value per cell, in the order of the flat indices.
+                NaN values are ignored.
+            how:
+                "sum", "mean" or "count" (of the non-NaN values).
+
+        Returns:
+            The aggregated values indexed by the owners' unique ids.
+        """
+        if how not in ("sum", "mean", "count"):
+            raise ValueError(f"Unknown statistic '{how}', choose sum, mean or count.")
+        values = np.asarray(values, dtype=float).ravel()
+        if values.shape != self._owner.shape:
+            raise ValueError(f"Got {len(values)} values for {len(self._owner)} cells.")
+        valid = (self._owner != NO_OWNER) & ~np.isnan(values)
+        owner, values = self._owner[valid], values[valid]
+        n_slots = len(self._refs)
+        counts = np.bincount(owner, minlength=n_slots)
+        if how == "count":
+            result = counts.astype(float)
+        else:
+            result = np.bincount(owner, weights=values, minlength=n_slots)
+            if how == "mean":
+                result = np.divide(
+                    result, counts, out=np.full(n_slots, np.nan), where=counts > 0
+                )
+        uids = self._owner_uids()
+        alive = uids != NO_OWNER
+        return pd.Series(result[alive], index=pd.Index(uids[alive], name=OWNER_ID))
@@ -11,11 +11,14 @@ from __future__ import annotations
 
 import functools
 import logging
+import sys
+from types import ModuleType
 from typing import (
     TYPE_CHECKING,
     Any,
     Callable,
     Dict,
+    Iterable,
     Iterator,
     List,
     Literal,
@@ -27,10 +30,8 @@ from typing import (
 
 import geopandas as gpd
 import numpy as np
+import pandas as pd
 import pyproj
-import rioxarray
-import xarray as xr
-from geocube.api.core import make_geocube
 from mesa.space import Coordinate
 from mesa_geo.raster_layers import RasterLayer
 from numpy.typing import NDArray
@@ -41,16 +42,20 @@ from abses.agents.actor import Actor
 from abses.agents.sequences import ActorsList
 from abses.core.base import BaseModule
 from abses.core.primitives import DEFAULT_CRS
+from abses.core.profiler import profiled
 from abses.space.cells import PatchCell
 from abses.space.mesa_raster_compat import (
     maybe_sync_cell_xy,
     raster_base_update_transform,
 )
+from abses.space.ownership import OWNER_ID, OwnershipIndex, ZonalStat
 from abses.utils.errors import ABSESpyError
 from abses.utils.func import get_buffer, set_null_values
 from abses.utils.random import ListRandom
 
 if TYPE_CHECKING:
+    import xarray as xr
+
     from abses.core.protocols import ActorProtocol
     from abses.core.types import (
         CellFilter,
@@ -62,6 +67,22 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
+def _xarray() -> ModuleType:
+    """Import xarray on first use, with rioxarray's `.rio` accessor."""
+    import rioxarray  # noqa: F401  # Registers the `.rio` accessor.
+    import xarray
+
+    return xarray
+
+
+def _is_xarray(obj: Any, *types: str) -> bool:
+    """Whether an object is one of xarray's types, without importing xarray."""
+    if "xarray" not in sys.modules:
+        return False
+    xarray = _xarray()
+    return isinstance(obj, tuple(getattr(xarray, name) for name in types))
+
+
 class PatchModule(BaseModule, RasterLayer):
     """Base class for managing raster-based spatial modules in ABSESpy.
 
@@ -82,6 +103,7 @@ class PatchModule(BaseModule, RasterLayer):
         random: Random selection proxy for cells.
         mask: Boolean array indicating accessible cells.
         cells_lst: ActorsList containing all cells.
+        ownership: Index of the cells owned by actors (see `set_owner`).
         plot: Visualization interface for the module.
     """
 
@@ -165,6 +187,8 @@ class PatchModule(BaseModule, RasterLayer):
         # Determine creation method based on provided parameters
         if raster_file is not None:
             # Create from raster file
+            import rioxarray
+
             xda = rioxarray.open_rasterio(raster_file, masked=masked, **kwargs)
             xda = xda.sel(band=band)
 
@@ -203,6 +227,8 @@ class PatchModule(BaseModule, RasterLayer):
                 resolution = (resolution, resolution)
 
             # Create xarray from vector
+            from geocube.api.core import make_geocube
+
             xda = make_geocube(gdf, measurements=[attr_name], resolution=resolution)[
                 attr_name
             ]
@@ -219,6 +245,7 @@ class PatchModule(BaseModule, RasterLayer):
 
         elif xda is not None:
             # Create from xarray DataArray
+            _xarray()
             # Flip data if y-axis is ascending
             if xda.y[0].item() < xda.y[-1].item():
                 xda.data = np.flipud(xda.data)
@@ -323,6 +350,11 @@ class PatchModule(BaseModule, RasterLayer):
                     )
                 )
             self._cells.append(col)
+        # Actors have positive ids and -1 means "no id", so the cells take the
+        # negative ids from -2: each layer a block of its size, in the order
+        # of creation, the cell at (0, 0) first (see `PatchCell.unique_id`).
+        self._first_cell_id = -2 - model._cell_ids_taken
+        model._cell_ids_taken += self.width * self.height
 
     @functools.cached_property
     def cells_lst(self) -> ActorsList[PatchCell]:
@@ -357,6 +389,7 @@ class PatchModule(BaseModule, RasterLayer):
     @property
     def xda(self) -> xr.DataArray:
         """Get the xarray raster layer with spatial coordinates."""
+        xr = _xarray()
         xda = xr.DataArray(data=self.mask, coords=self.coords)
         xda = xda.rio.write_crs(self.crs)
         xda = xda.rio.set_spatial_dims("x", "y")
@@ -444,7 +477,7 @@ class PatchModule(BaseModule, RasterLayer):
         """Determine the incoming data type and turn it into a reasonable array."""
         if data is None:
             return np.ones(self.shape2d)
-        if isinstance(data, xr.DataArray):
+        if _is_xarray(data, "DataArray"):
             data = data.to_numpy()
         if isinstance(data, np.ndarray):
             if data.shape == self.shape2d:
@@ -472,7 +505,9 @@ class PatchModule(BaseModule, RasterLayer):
         """
         # 获取动态变量，及其附加属性
         array = super().dynamic_var(attr_name)
-        assert isinstance(array, (np.ndarray, xr.DataArray, xr.Dataset))
+        assert isinstance(array, np.ndarray) or _is_xarray(
+            array, "DataArray", "Dataset"
+        )
         kwargs = super().dynamic_variables[attr_name].attrs
         # 将矩阵转换为三维，并更新空间数据
         self.apply_raster(array, attr_name=attr_name, **kwargs)
@@ -505,16 +540,17 @@ class PatchModule(BaseModule, RasterLayer):
             coords = {"variable": list(self.attributes)}
             coords |= self.coords
             name = self.name
+        xr = _xarray()
         return xr.DataArray(
             data=data,
             name=name,
             coords=coords,
         ).rio.write_crs(self.crs)
 
-    @property
+    @functools.cached_property
     def random(self) -> ListRandom:
-        """Randomly"""
-        return self.cells_lst.random
+        """Random operations on the cells, using this module's random stream."""
+        return ListRandom(self.model, self.cells_lst, stream=("module", self.name))
 
     def __getitem__(self, key: tuple) -> ActorsList[PatchCell]:
         """Access cells using array indexing, returns ActorsList.
@@ -652,7 +688,11 @@ class PatchModule(BaseModule, RasterLayer):
         # Handle other filter types
         if isinstance(where, Geometry):
             mask_ = self._select_by_geometry(geometry=where)
-        elif isinstance(where, (np.ndarray, str, xr.DataArray)) or where is None:
+        elif (
+            where is None
+            or isinstance(where, (np.ndarray, str))
+            or _is_xarray(where, "DataArray")
+        ):
             mask_ = self._attr_or_array(where).reshape(self.shape2d)
         else:
             raise TypeError(f"{type(where)} is not supported for selecting cells.")
@@ -718,6 +758,7 @@ class PatchModule(BaseModule, RasterLayer):
         resampling_method: str = "nearest",
         flipud: bool = False,
     ) -> None:
+        _xarray()
         if cover_crs:
             data.rio.write_crs(self.crs, inplace=True)
         resampling = getattr(Resampling, resampling_method)
@@ -727,6 +768,7 @@ class PatchModule(BaseModule, RasterLayer):
         ).to_numpy()
         self._add_attribute(data, attr_name, flipud=flipud)
 
+    @profiled
     def apply_raster(
         self, data: Raster, attr_name: Optional[str] = None, **kwargs: Any
     ) -> None:
@@ -755,14 +797,15 @@ class PatchModule(BaseModule, RasterLayer):
         """
         if isinstance(data, np.ndarray):
             self._add_attribute(data, attr_name, **kwargs)
-        elif isinstance(data, xr.DataArray):
+        elif _is_xarray(data, "DataArray"):
             self._add_dataarray(data, attr_name, **kwargs)
-        elif isinstance(data, xr.Dataset):
+        elif _is_xarray(data, "Dataset"):
             if attr_name is None:
                 raise ValueError("Attribute name is required for xr.Dataset.")
             dataarray = data[attr_name]
             self._add_dataarray(dataarray, attr_name, **kwargs)
 
+    @profiled
     def get_raster(
         self,
         attr_name: Optional[str] = None,
@@ -780,6 +823,8 @@ class PatchModule(BaseModule, RasterLayer):
         """
         if attr_name in self.dynamic_variables and update:
             return self.dynamic_var(attr_name=attr_name).reshape(self.shape3d)
+        if attr_name == OWNER_ID and OWNER_ID not in self.attributes:
+            return self.ownership.owner_ids().reshape(self.shape3d)
         if attr_name is not None and attr_name not in self.attributes:
             raise ValueError(
                 f"Attribute {attr_name} does not exist. "
@@ -796,6 +841,78 @@ class PatchModule(BaseModule, RasterLayer):
             data.append(array)
         return np.stack(data)
 
+    @functools.cached_property
+    def ownership(self) -> OwnershipIndex:
+        """Index of the cells owned by actors, e.g. land tenure."""
+        return OwnershipIndex(self.shape2d)
+
+    def _flat_indices(
+        self, cells: PatchCell | Iterable[PatchCell] | np.ndarray
+    ) -> np.ndarray:
+        """Row-major flat indices of cells, or of a boolean mask."""
+        if isinstance(cells, PatchCell):
+            cells = [cells]
+        if isinstance(cells, np.ndarray) and cells.dtype == bool:
+            if cells.shape != self.shape2d:
+                raise ABSESpyError(
+                    f"Mask of shape {cells.shape} doesn't match {self.shape2d}."
+                )
+            return np.flatnonzero(cells)
+        indices = np.array([cell.indices for cell in cells], dtype=np.int64)
+        if not len(indices):
+            return np.zeros(0, dtype=np.int64)
+        return indices[:, 0] * self.width + indices[:, 1]
+
+    def set_owner(
+        self,
+        cells: PatchCell | Iterable[PatchCell] | np.ndarray,
+        owner: Optional[Actor],
+    ) -> None:
+        """Transfer the ownership of cells to an actor.
+
+        Each cell has at most one owner: the previous owners lose them.
+
+        Parameters:
+            cells:
+                A cell, some cells, or a boolean mask of this layer's shape.
+            owner:
+                The new owner. None to release the cells.
+
+        Example:
+            ```python
+            farmer = model.agents.new(Farmer, singleton=True)
+            module.set_owner(module.get_raster("elevation")[0] < 100, farmer)
+            module.owned_cells(farmer)
+            module.get_raster("owner_id")
+            ```
+        """
+        self.ownership.assign(self._flat_indices(cells), owner)
+
+    def owner_of(self, cell: PatchCell) -> Optional[Actor]:
+        """The owner of a cell, or None."""
+        return self.ownership.owner_of(int(self._flat_indices(cell)[0]))
+
+    def owned_cells(self, owner: Actor) -> ActorsList[PatchCell]:
+        """The cells owned by an actor, in row-major order."""
+        flat = self.ownership.cells_of(owner)
+        return ActorsList(self.model, self.array_cells.ravel()[flat])
+
+    def zonal_stats(
+        self, data: str | np.ndarray | xr.DataArray, how: ZonalStat = "sum"
+    ) -> pd.Series:
+        """Aggregate a cells' attribute for each owner.
+
+        Parameters:
+            data:
+                A cells' attribute name, or an array of this layer's shape.
+            how:
+                "sum", "mean" or "count" of the non-NaN values.
+
+        Returns:
+            The aggregated values indexed by the owners' unique ids.
+        """
+        return self.ownership.aggregate(self._attr_or_array(data), how=how)
+
     def reproject(
         self,
         xda: xr.DataArray,
@@ -803,6 +920,7 @@ class PatchModule(BaseModule, RasterLayer):
         **kwargs,
     ) -> xr.DataArray:
         """Reproject the xarray data to the same CRS as this layer."""
+        _xarray()
         if isinstance(resampling, str):
             resampling = getattr(Resampling, resampling)
         return xda.rio.reproject_match(self.xda, resampling=resampling, **kwargs)
@@ -833,6 +951,7 @@ class PatchModule(BaseModule, RasterLayer):
         cells = super().get_neighboring_cells(pos, moore, include_center, radius)
         return ActorsList(self.model, cells)
 
+    @profiled
     @functools.lru_cache(maxsize=1000)
     def get_neighboring_by_indices(
         self,
@@ -916,6 +1035,7 @@ class PatchModule(BaseModule, RasterLayer):
 
         if dtype == "xarray":
             # Convert to xarray with spatial coordinates
+            xr = _xarray()
             xda = xr.DataArray(
                 data=data,
                 coords=self.coords,
@@ -1028,6 +1148,7 @@ class PatchModule(BaseModule, RasterLayer):
         data = self.apply(_cell_compute).astype(float)
 
         if dtype == "xarray":
+            xr = _xarray()
             xda = xr.DataArray(
                 data=data, coords=self.coords, name=name or "applied_agents"
             )
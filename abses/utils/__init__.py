@@ -3,16 +3,20 @@
 """Utils module for ABSESpy."""
 
 from .analysis import ExpAnalyzer, ResultAnalyzer
+from .config import FrozenParams
 from .data import load_data
 from .errors import ABSESpyError
 from .func import with_axes
-from .random import ListRandom
+from .random import AliasTable, ListRandom, RandomStreams
 
 __all__ = [
     "load_data",
     "ABSESpyError",
     "with_axes",
     "ListRandom",
+    "RandomStreams",
+    "AliasTable",
     "ResultAnalyzer",
     "ExpAnalyzer",
+    "FrozenParams",
 ]
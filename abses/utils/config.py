@@ -4,7 +4,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Any, Dict, List
+from typing import Any, Dict, Iterator, List, Mapping
 
 from omegaconf import DictConfig, OmegaConf
 
@@ -277,3 +277,91 @@ def apply_validation(config: DictConfig) -> None:
     if strict_validation:
         raise ConfigurationError(error_msg)
     logger.warning("Configuration validation warnings:\n%s", error_msg)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested mappings and lists into immutable containers."""
+    if isinstance(value, Mapping):
+        return FrozenParams(value)
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+class FrozenParams(Mapping):
+    """Immutable snapshot of a component's parameters.
+
+    Reading a plain dict is much faster than reading an OmegaConf
+    `DictConfig`. While a model is running, components' `params` are such
+    snapshots: nested mappings are snapshots too, lists become tuples, and
+    interpolations are resolved. Parameters are read like a `DictConfig`
+    (`params.rate`, `params["rate"]`, `params.get("rate", 1)`), but cannot be
+    changed. After changing `model.settings` at runtime, call
+    `model.refresh_params()`.
+
+    Parameters:
+        data:
+            The parameters, e.g. a `DictConfig` or a dict.
+    """
+
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Mapping[str, Any] | None = None) -> None:
+        if isinstance(data, DictConfig):
+            data = OmegaConf.to_container(data, resolve=True)
+        items = {} if data is None else data
+        object.__setattr__(
+            self, "_data", {key: _freeze(value) for key, value in items.items()}
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return self._data[name]
+        except KeyError:
+            raise AttributeError(f"Missing parameter '{name}'.") from None
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(
+            f"Cannot set parameter '{name}': parameters are frozen while running."
+        )
+
+    def __getitem__(self, key: str) -> Any:
+        return self._data[key]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"FrozenParams({self._data})"
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, DictConfig):
+            other = OmegaConf.to_container(other, resolve=True)
+        if isinstance(other, Mapping):
+            return self.to_dict() == {key: _thaw(other[key]) for key in other}
+        return NotImplemented
+
+    def __reduce__(self) -> tuple:
+        return (FrozenParams, (self.to_dict(),))
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """The parameter, or `default` if it is missing."""
+        return self._data.get(key, default)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """The parameters as (nested) plain dicts and lists."""
+        return {key: _thaw(value) for key, value in self._data.items()}
+
+
+def _thaw(value: Any) -> Any:
+    """Convert frozen parameters back into dicts and lists."""
+    if isinstance(value, FrozenParams):
+        return value.to_dict()
+    if isinstance(value, Mapping):
+        return {key: _thaw(value[key]) for key in value}
+    if isinstance(value, (list, tuple)):
+        return [_thaw(item) for item in value]
+    return value
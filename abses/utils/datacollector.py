@@ -17,6 +17,7 @@ from typing import (
     Dict,
     List,
     Literal,
+    Mapping,
     Optional,
     Sequence,
     cast,
@@ -30,6 +31,7 @@ if TYPE_CHECKING:
     from abses.agents.sequences import ActorsList
     from abses.core.model import MainModel
     from abses.core.time_driver import TimeDriver
+    from abses.core.types import Direction
 
 from abses.utils.tracker import TrackerProtocol
 
@@ -44,6 +46,9 @@ ReportType: TypeAlias = Literal["model", "agents", "final"] | str
 
 logger = logging.getLogger(__name__)
 
+MODEL_LINK_STATS = ("degree_hist", "components", "neighbor_mean", "neighbor_sum")
+AGENT_LINK_STATS = ("degree", "neighbor_mean", "neighbor_sum")
+
 
 def _getattr_to_reporter(
     attribute_name: str,
@@ -75,6 +80,123 @@ def _func_reporter(reporter: Sequence) -> Callable[..., Any]:
     return func_reporter
 
 
+class LinkReporter:
+    """网络统计的报告器，直接从链接存储计算。
+
+    在配置中声明为带有 `link` 键的字典，例如：
+
+    ```yaml
+    tracker:
+      model:
+        friend_degrees: {link: friend, stat: degree_hist}
+        n_groups: {link: friend, stat: components}
+      agents:
+        Farmer:
+          friend_wealth: {link: friend, stat: neighbor_mean, attr: wealth}
+    ```
+
+    模型报告器的统计量:
+        - "degree_hist": 度的直方图，第 k 个数为度为 k 的节点数；
+        - "components": 连通分量的数量（忽略链接方向）；
+        - "neighbor_mean" / "neighbor_sum": 节点的邻居属性均值（忽略没有
+          邻居的节点）的平均值 / 邻居属性和的总和。
+
+    主体报告器的统计量为 "degree"、"neighbor_mean" 和 "neighbor_sum"，
+    每次收集时对一组主体只计算一次（一次稀疏矩阵乘法），而不是逐个主体计算。
+
+    Parameters:
+        link:
+            链接类型。
+        stat:
+            统计量的名称。
+        attr:
+            邻居的属性名称，仅用于 "neighbor_mean" 和 "neighbor_sum"。
+        direction:
+            "out"、"in" 或 None（两个方向）。
+        breed:
+            模型报告器统计的节点为该种类的主体（包括没有链接的主体）。
+            默认为所有拥有该链接的节点。
+
+    Raises:
+        ValueError:
+            如果统计量未知，或邻居统计量没有指定属性。
+    """
+
+    def __init__(
+        self,
+        link: str,
+        stat: str,
+        attr: Optional[str] = None,
+        direction: Direction = "out",
+        breed: Optional[str] = None,
+    ) -> None:
+        if stat not in MODEL_LINK_STATS + AGENT_LINK_STATS:
+            raise ValueError(
+                f"Unknown link statistic '{stat}', choose from "
+                f"{sorted(set(MODEL_LINK_STATS + AGENT_LINK_STATS))}."
+            )
+        if stat.startswith("neighbor_") and attr is None:
+            raise ValueError(f"Link statistic '{stat}' requires an attribute.")
+        if direction not in ("in", "out", None):
+            raise ValueError(f"Invalid direction {direction}")
+        self.link = link
+        self.stat = stat
+        self.attr = attr
+        self.direction = direction
+        self.breed = breed
+
+    def __repr__(self) -> str:
+        return f"<LinkReporter: {self.stat} of '{self.link}'>"
+
+    def _nodes(self, model: MainModel) -> List[Any]:
+        if self.breed is not None:
+            return list(model.agents[self.breed])
+        return model.human.linked_nodes(self.link)
+
+    def _per_node(self, model: MainModel, nodes: List[Any]) -> np.ndarray:
+        human = model.human
+        if self.link not in human.links:
+            default = np.nan if self.stat == "neighbor_mean" else 0
+            return np.full(len(nodes), default)
+        if self.stat in ("degree", "degree_hist"):
+            return human.degree(self.link, self.direction, nodes=nodes).to_numpy()
+        how = self.stat.removeprefix("neighbor_")
+        return human.neighbor_aggregate(
+            self.link, cast(str, self.attr), nodes, how=how, direction=self.direction
+        )
+
+    def report_model(self, model: MainModel) -> Any:
+        """计算模型层面的统计量。"""
+        if self.stat not in MODEL_LINK_STATS:
+            raise ValueError(f"'{self.stat}' is not a model-level link statistic.")
+        nodes = self._nodes(model)
+        if self.stat == "components":
+            if self.link not in model.human.links:
+                return len(nodes)
+            return model.human.n_components(self.link, nodes)
+        values = self._per_node(model, nodes)
+        if self.stat == "degree_hist":
+            return np.bincount(values.astype(np.int64)).tolist()
+        if self.stat == "neighbor_sum":
+            return float(values.sum())
+        if np.isnan(values).all():
+            return np.nan
+        return float(np.nanmean(values))
+
+    def report_agents(self, agents: ActorsList[Actor]) -> np.ndarray:
+        """计算每个主体的统计量，与 `agents` 对齐。"""
+        if self.stat not in AGENT_LINK_STATS:
+            raise ValueError(f"'{self.stat}' is not an agent-level link statistic.")
+        return self._per_node(agents._model, list(agents))
+
+    def __call__(self, obj: MainModel | Actor) -> Any:
+        from mesa import Model
+
+        if isinstance(obj, Model):
+            return self.report_model(cast("MainModel", obj))
+        return self._per_node(obj.model, [obj])[0]
+
+
 def clean_to_reporter(
     reporter: Reporter,
     *args,
@@ -87,11 +209,14 @@ def clean_to_reporter(
             - str: attribute name to get from object
             - list/tuple: [func, args] or [func, args, kwargs]
             - callable: function to call (args/kwargs bound if provided)
+            - dict with a `link` key: a `LinkReporter` of network statistics
 
     Returns:
         A callable reporter function
     """
-    if isinstance(reporter, str):
+    if isinstance(reporter, Mapping) and "link" in reporter:
+        reporter = LinkReporter(**reporter)
+    elif isinstance(reporter, str):
         reporter = _getattr_to_reporter(attribute_name=reporter)
     elif isinstance(reporter, (list, tuple)):
         # Expect [func], [func, args], or [func, args, kwargs]
@@ -182,7 +307,10 @@ class ABSESpyDataCollector:
                 Attribute string,
                 or function object that returns the variable.
         """
-        self.model_reporters[name] = clean_to_reporter(reporter)
+        reporter = clean_to_reporter(reporter)
+        if isinstance(reporter, LinkReporter) and reporter.stat not in MODEL_LINK_STATS:
+            raise ValueError(f"'{reporter.stat}' is not a model-level link statistic.")
+        self.model_reporters[name] = reporter
         self.model_vars[name] = []
 
     def _record_a_breed_of_agents(
@@ -195,7 +323,10 @@ class ABSESpyDataCollector:
             "Time": np.repeat(str(time.dt), len(agents)),
         }
         for name, reporter in self.agent_reporters[breed].items():
-            result[name] = agents.apply(reporter)
+            if isinstance(reporter, LinkReporter):
+                result[name] = reporter.report_agents(agents)
+            else:
+                result[name] = agents.apply(reporter)
         self._agent_records[breed].append(result)
 
     def _record_agents(self, model: MainModel) -> None:
@@ -213,7 +344,10 @@ class ABSESpyDataCollector:
         """添加新的 Agent Reporter"""
         if breed not in self.agent_reporters:
             self.agent_reporters[breed] = {}
-        self.agent_reporters[breed][name] = clean_to_reporter(reporter=reporter)
+        reporter = clean_to_reporter(reporter=reporter)
+        if isinstance(reporter, LinkReporter) and reporter.stat not in AGENT_LINK_STATS:
+            raise ValueError(f"'{reporter.stat}' is not an agent-level link statistic.")
+        self.agent_reporters[breed][name] = reporter
 
     def get_model_vars_dataframe(self):
         """Create a pandas DataFrame from the model variables.
@@ -264,7 +398,18 @@ class ABSESpyDataCollector:
 
     def collect(self, model: MainModel):
         """Collect all the data for the given model object."""
-
+        profiler = vars(model).get("profiler")
+        if profiler is None:
+            self._collect(model)
+            return
+        start = profiler.start()
+        try:
+            self._collect(model)
+        finally:
+            profiler.stop("method", "datacollector.collect", start)
+
+    def _collect(self, model: MainModel) -> None:
+        """Collect the model's and the actors' variables."""
         if self.model_reporters:
             model_snapshot = {}
             for var, func in self.model_reporters.items():
@@ -25,7 +25,6 @@ from typing import (
 )
 
 import numpy as np
-from matplotlib import pyplot as plt
 from scipy import ndimage
 
 from abses.utils.regex import CAMEL_NAME
@@ -163,6 +162,8 @@ def with_axes(
         def wrapper(*args, **kwargs):
             ax = kwargs.get("ax", None)
             if ax is None:
+                from matplotlib import pyplot as plt
+
                 _, ax = plt.subplots(figsize=figsize)
                 kwargs["ax"] = ax
                 result = func(*args, **kwargs)
@@ -9,15 +9,18 @@
 
 from __future__ import annotations
 
-from itertools import combinations
+import zlib
 from random import Random
 from typing import (
     TYPE_CHECKING,
     Any,
     Dict,
+    Hashable,
     Iterable,
     List,
     Optional,
+    Sequence,
+    Sized,
     Tuple,
     Type,
     Union,
@@ -36,32 +39,278 @@ if TYPE_CHECKING:
     from abses.core.types import WHEN_EMPTY
 
 
+def _key_to_int(key: Hashable) -> int:
+    """A stable (across processes) 32-bit integer for a stream key."""
+    if isinstance(key, (int, np.integer)) and 0 <= key < 2**32:
+        return int(key)
+    return zlib.crc32(str(key).encode("utf-8"))
+
+
+def sequence_seed(sequence: np.random.SeedSequence) -> int:
+    """A 32-bit integer seed drawn from a seed sequence, e.g. for `random.Random`."""
+    return int(sequence.generate_state(1)[0])
+
+
+class RandomStreams:
+    """Independent random number streams spawned from one seed.
+
+    Each stream is a `numpy.random.Generator` identified by a tuple of keys,
+    e.g., `("module", "land")` or `("breed", "Farmer")`. Its `SeedSequence` is
+    derived from the root seed and the keys only, so a stream does not depend
+    on which other streams exist nor on the order they are created in.
+
+    Streams form a tree: an experiment's streams spawn one seed sequence
+    per (job, run), which is the root of the run's model, whose streams are
+    in turn spawned per subsystem, module or breed (see `Experiment`).
+
+    Parameters:
+        seed:
+            Root seed, or an existing `numpy.random.SeedSequence`.
+            None draws fresh entropy from the OS.
+
+    Example:
+        ```python
+        streams = RandomStreams(42)
+        rng = streams.generator("breed", "Farmer")
+        assert rng is streams.generator("breed", "Farmer")
+        ```
+    """
+
+    def __init__(self, seed: Optional[int | np.random.SeedSequence] = None) -> None:
+        if isinstance(seed, np.random.SeedSequence):
+            self.root = seed
+        else:
+            self.root = np.random.SeedSequence(seed)
+        self._generators: Dict[Tuple[Hashable, ...], np.random.Generator] = {}
+
+    def __repr__(self) -> str:
+        return f"<RandomStreams [{len(self._generators)}]>"
+
+    @classmethod
+    def from_model(cls, model: MainModelProtocol) -> RandomStreams:
+        """Streams rooted at the model's seed.
+
+        Uses the model's seed sequence if it was created with one (e.g. by an
+        experiment), its integer `seed` if any, otherwise the initial state
+        of `model.rng`, so that models created with the same `seed` or `rng`
+        get the same streams.
+        """
+        sequence = getattr(model, "_seed_sequence", None)
+        if isinstance(sequence, np.random.SeedSequence):
+            return cls(sequence)
+        seed = getattr(model, "_seed", None)
+        if isinstance(seed, (int, np.integer)):
+            return cls(int(seed))
+        state = getattr(model, "_rng", None)
+        try:
+            return cls(int(state["state"]["state"]))  # type: ignore[index]
+        except (TypeError, KeyError, ValueError):
+            return cls(None)
+
+    def spawn(self, *keys: Hashable) -> np.random.SeedSequence:
+        """The seed sequence of the stream identified by `keys`."""
+        spawn_key = self.root.spawn_key + tuple(_key_to_int(key) for key in keys)
+        return np.random.SeedSequence(
+            self.root.entropy, spawn_key=spawn_key, pool_size=self.root.pool_size
+        )
+
+    def reseed(self, seed: Optional[int | np.random.SeedSequence]) -> None:
+        """Re-root the streams at a new seed.
+
+        The cached generators are kept, only their states change, so the
+        objects holding them (e.g., the random facades of actors' lists and
+        modules) draw from the re-seeded streams.
+        """
+        if isinstance(seed, np.random.SeedSequence):
+            self.root = seed
+        else:
+            self.root = np.random.SeedSequence(seed)
+        for keys, rng in self._generators.items():
+            fresh = np.random.default_rng(self.spawn(*keys))
+            rng.bit_generator.state = fresh.bit_generator.state
+
+    def generator(self, *keys: Hashable) -> np.random.Generator:
+        """The (cached) generator of the stream identified by `keys`."""
+        try:
+            return self._generators[keys]
+        except KeyError:
+            rng = np.random.default_rng(self.spawn(*keys))
+            self._generators[keys] = rng
+            return rng
+
+
+class AliasTable:
+    """Walker's alias table for repeated weighted draws in O(1) each.
+
+    Built once in O(n) from weights, it draws indices with probabilities
+    proportional to the weights. Invalid weights (negative, NaN) count as zero;
+    if no weight is valid, indices are drawn uniformly.
+
+    Parameters:
+        weights:
+            Non-negative weights of the indices.
+
+    Attributes:
+        members:
+            The membership of the actors the weights belong to, when built by
+            `ListRandom.alias`; None otherwise.
+    """
+
+    __slots__ = ("prob", "alias", "members")
+
+    def __init__(self, weights: Iterable[float] | np.ndarray) -> None:
+        weights = np.nan_to_num(np.asarray(weights, dtype=float))
+        weights[weights < 0] = 0.0
+        n = len(weights)
+        total = weights.sum()
+        scaled = weights * n / total if total else np.ones(n)
+        prob = np.ones(n)
+        alias = np.arange(n)
+        small = [i for i in range(n) if scaled[i] < 1.0]
+        large = [i for i in range(n) if scaled[i] >= 1.0]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            prob[less], alias[less] = scaled[less], more
+            scaled[more] -= 1.0 - scaled[less]
+            (small if scaled[more] < 1.0 else large).append(more)
+        self.prob = prob
+        self.alias = alias
+        self.members: Optional[Hashable] = None
+
+    def __len__(self) -> int:
+        return len(self.prob)
+
+    def draw(self, rng: np.random.Generator, size: int = 1) -> np.ndarray:
+        """Draw `size` indices (with replacement)."""
+        idx = rng.integers(0, len(self.prob), size=size)
+        keep = rng.random(size) < self.prob[idx]
+        return np.where(keep, idx, self.alias[idx])
+
+
 class ListRandom(Random):
     """Create a random generator from an `ActorsList`.
 
     Inherits from Python's Random class to provide Mesa-compatible shuffle() method.
     Extends Random with ABSESpy-specific methods for working with actors.
+
+    All draws, including the inherited `random.Random` methods, come from a
+    numpy generator: a stream of `model.random_streams` when available, so
+    that repeated calls continue the same stream instead of being reseeded.
+
+    Parameters:
+        model:
+            The model where the actors belong.
+        actors:
+            The actors to operate on. An `ActorsList` is used as is (no copy),
+            so the random facade follows its later changes.
+        stream:
+            Keys of the random stream to use. Defaults to the breed's stream
+            when the actors were selected by breed (see `ActorsList`),
+            `("actors",)` otherwise.
     """
 
-    def __init__(self, model: MainModelProtocol, actors: Iterable[Any]) -> None:
-        # Get seed from model and ensure it's a valid type
-        if hasattr(model, "_seed"):
-            seed = model._seed
-            # Ensure seed is a valid type for Random
-            if seed is not None and not isinstance(
-                seed, (int, float, str, bytes, bytearray)
-            ):
-                seed = None
+    def __init__(
+        self,
+        model: MainModelProtocol,
+        actors: Iterable[Any],
+        stream: Optional[Tuple[Hashable, ...]] = None,
+    ) -> None:
+        super().__init__()
+        self.model = model
+        self._source = actors
+        self._alias_tables: Dict[str, AliasTable] = {}
+        streams = getattr(model, "random_streams", None)
+        if streams is None:
+            self.rng = model.rng if model.rng else np.random.default_rng()
         else:
-            seed = None
+            self.rng = streams.generator(*(stream or self._default_stream()))
+
+    def _default_stream(self) -> Tuple[Hashable, ...]:
+        """Stream keys of the actors' breed if known, generic otherwise."""
+        breed = getattr(self._source, "_breed", None)
+        if breed is None:
+            return ("actors",)
+        return ("breed", breed.__name__)
+
+    @property
+    def actors(self) -> ActorsList:
+        """The actors to operate on."""
+        from abses.agents.sequences import ActorsList
 
-        # Initialize parent Random with seed
-        super().__init__(seed)
+        if isinstance(self._source, ActorsList):
+            return self._source
+        return self._to_actors_list(self._source)
 
-        self.model = model
-        self.actors = self._to_actors_list(actors)
-        self.rng = model.rng if model.rng else np.random.default_rng()
-        self.seed = seed
+    def _membership(self) -> Hashable:
+        """A token changing with the actors or their order.
+
+        An `ActorsList` counts its in-place changes, so the token is O(1);
+        other sources are identified by their members.
+        """
+        source = self._source
+        version = getattr(source, "_version", None)
+        if version is not None:
+            return version, len(source)
+        return tuple(map(id, self._population()))
+
+    def _population(self) -> Sized:
+        """The actors to draw from, without copying a sized source."""
+        source = self._source
+        return source if isinstance(source, Sized) else self.actors
+
+    @staticmethod
+    def _pick(actors: Iterable[Any], indices: np.ndarray) -> List[Any]:
+        """The actors at some positions, in the order of the indices.
+
+        Lists are indexed directly. Other sources (e.g., an `ActorsList`,
+        whose positional access copies its keys) are iterated once, up to
+        the last position drawn, instead of being copied.
+        """
+        if isinstance(actors, (list, tuple)):
+            return [actors[i] for i in indices]
+        positions, inverse = np.unique(indices, return_inverse=True)
+        found: List[Any] = []
+        wanted = iter(positions.tolist())
+        target = next(wanted, None)
+        for i, actor in enumerate(actors):
+            if i == target:
+                found.append(actor)
+                target = next(wanted, None)
+                if target is None:
+                    break
+        return [found[j] for j in inverse.ravel()]
+
+    # Draws of the inherited `random.Random` methods use the numpy stream.
+    def seed(self, a: Any = None, version: int = 2) -> None:
+        """Does nothing: draws come from the numpy stream, seeded once."""
+        self.gauss_next = None
+
+    def random(self) -> float:
+        """A float in [0.0, 1.0) from the numpy stream."""
+        return float(self.rng.random())
+
+    def getrandbits(self, k: int) -> int:
+        """An integer with `k` random bits from the numpy stream."""
+        if k < 0:
+            raise ValueError("number of bits must be non-negative")
+        n_bytes = (k + 7) // 8
+        return int.from_bytes(self.rng.bytes(n_bytes), "little") >> (n_bytes * 8 - k)
+
+    def shuffle(self, x: List[Any]) -> None:  # type: ignore[override]
+        """Shuffle a mutable sequence in place, with one numpy permutation."""
+        x[:] = [x[i] for i in self.rng.permutation(len(x))]
+
+    def sample(  # type: ignore[override]
+        self, population: Sequence[Any], k: int, *, counts: Any = None
+    ) -> List[Any]:
+        """Choose `k` unique elements, by drawing their indices."""
+        if counts is not None:
+            return super().sample(population, k, counts=counts)
+        if not 0 <= k <= len(population):
+            raise ValueError("Sample larger than population or is negative")
+        if not isinstance(population, Sized):
+            population = list(population)
+        return self._pick(population, self.rng.choice(len(population), k, False))
 
     def _to_actors_list(self, objs: Iterable) -> ActorsList:
         from abses.agents.sequences import ActorsList
@@ -111,6 +360,60 @@ class ListRandom(Random):
         prob = prob / total if total else np.repeat(1 / length, length)
         return prob
 
+    def alias(self, prob: Union[np.ndarray, str], refresh: bool = False) -> AliasTable:
+        """An alias table for repeated weighted draws.
+
+        Pass the returned table as `prob` of `choice` to draw with replacement
+        in O(1) per draw. Tables built from an attribute name are cached on
+        this facade, and rebuilt when the actors change; use `refresh=True`
+        after the attribute values changed. Drawing with a table built before
+        the actors changed raises an error.
+
+        Parameters:
+            prob:
+                Weights of the actors, or the name of the attribute storing them.
+            refresh:
+                Rebuild a cached table.
+
+        Returns:
+            The alias table.
+
+        Example:
+            ```python
+            table = farmers.random.alias("wealth")
+            for _ in range(100):
+                lucky = farmers.random.choice(size=10, prob=table, replace=True)
+            ```
+        """
+        members = self._membership()
+        table = self._alias_tables.get(prob) if isinstance(prob, str) else None
+        if refresh or table is None or table.members != members:
+            table = AliasTable(self.clean_p(prob))
+            table.members = members
+            if isinstance(prob, str):
+                self._alias_tables[prob] = table
+        return table
+
+    def _draw_indices(
+        self,
+        size: int,
+        prob: Optional[np.ndarray | AliasTable],
+        replace: bool,
+        n: int,
+    ) -> np.ndarray:
+        """Draw indices of the actors."""
+        if isinstance(prob, AliasTable):
+            if len(prob) != n or (
+                prob.members is not None and prob.members != self._membership()
+            ):
+                raise ABSESpyError(
+                    f"Alias table of {len(prob)} weights for {n} actors is stale."
+                )
+            if not replace and size > 1:
+                raise ValueError("Alias tables only draw with replacement.")
+            return prob.draw(self.rng, size=size)
+        return self.rng.choice(n, size=size, replace=replace, p=prob)
+
     @overload
     def choice(
         self,
@@ -134,14 +437,19 @@ class ListRandom(Random):
     def choice(
         self,
         size: int = 1,
-        prob: np.ndarray | None | str = None,
+        prob: np.ndarray | None | str | AliasTable = None,
         replace: bool = False,
         as_list: bool = False,
         when_empty: WHEN_EMPTY = "raise exception",
         double_check: bool = False,
     ) -> Optional[ActorProtocol | ActorsList[ActorProtocol] | list]:
-        """Randomly choose one or more actors from the current self object."""
-        instances_num = len(self.actors)
+        """Randomly choose one or more actors from the current self object.
+
+        Indices are drawn first, then only the chosen actors are picked.
+        `prob` can be an `AliasTable` (see `alias`) for fast repeated draws.
+        """
+        actors = self._population()
+        instances_num = len(actors)
         if instances_num == 0:
             self._when_empty(when_empty=when_empty)
             return None
@@ -150,31 +458,31 @@ class ListRandom(Random):
         if instances_num < size and not replace:
             raise ABSESpyError(f"Trying to choose {size} actors from {self.actors}.")
         # 有概率的时候，先清理概率
-        if prob is not None:
+        if prob is not None and not isinstance(prob, AliasTable):
             prob = self.clean_p(prob=prob)
             valid_prob = prob.astype(bool)
             # 特别处理有概率的主体数量不足预期的情况
             if valid_prob.sum() < size and not replace:
-                return self._when_p_not_enough(double_check, prob, size, as_list)
+                return self._when_p_not_enough(
+                    actors, double_check, prob, size, as_list
+                )
             # 如果只有一个有效概率且需要重复选择，直接返回对应的 actor
             if valid_prob.sum() == 1 and replace and size > 1:
-                idx = np.where(valid_prob)[0][0]
-                chosen = [self.actors[idx]] * size
+                chosen = self._pick(actors, np.flatnonzero(valid_prob)) * size
                 return chosen if as_list else self._to_actors_list(chosen)
         # 其他情况就正常随机选择
-        indices = np.arange(len(self.actors))
-        chosen_indices = self.rng.choice(indices, size=size, replace=replace, p=prob)
+        chosen_indices = self._draw_indices(size, prob, replace, instances_num)
         # 如果不允许重复，按索引排序
         if not replace:
             chosen_indices.sort()
-        chosen = [self.actors[i] for i in chosen_indices]
+        chosen = self._pick(actors, chosen_indices)
         return (
             chosen[0]
             if size == 1 and not as_list
             else (chosen if as_list else self._to_actors_list(chosen))
         )
 
-    def _when_p_not_enough(self, double_check, prob, size, as_list):
+    def _when_p_not_enough(self, actors, double_check, prob, size, as_list):
         """处理概率不足的情况"""
         if not double_check:
             raise ABSESpyError(
@@ -189,19 +497,15 @@ class ListRandom(Random):
         # 获取有效和无效的概率索引
         valid_indices = np.where(prob > 0)[0]
         invalid_indices = np.where(prob <= 0)[0]
-
-        # 选择所有有效概率的实体
-        first_chosen = [self.actors[i] for i in valid_indices]
-        remain_size = size - len(first_chosen)
+        remain_size = size - len(valid_indices)
 
         # 从无效概率的实体中随机选择剩余数量
         if remain_size > 0:
-            others = [self.actors[i] for i in invalid_indices]
-            second_chosen = list(self.rng.choice(others, remain_size, replace=False))
-            first_chosen.extend(second_chosen)
+            others = self.rng.choice(invalid_indices, remain_size, replace=False)
+            valid_indices = np.concatenate([valid_indices, others])
 
         # 按原始列表中的顺序排序
-        result = sorted(first_chosen, key=lambda x: self.actors.index(x))
+        result = self._pick(actors, np.sort(valid_indices))
         return result if as_list else self._to_actors_list(result)
 
     def new(
@@ -231,6 +535,13 @@ class ListRandom(Random):
                 Name of the link.
             p:
                 Probability to generate a link.
+            mutual:
+                Whether the links are created in both directions.
+
+        Note:
+            Pairs are drawn by geometric skipping (see `human.erdos_renyi`)
+            and inserted in bulk, so the cost depends on the number of links,
+            not on the number of pairs.
 
         Returns:
             A list of tuple, in each tuple, there are two actors who got linked.
@@ -247,11 +558,19 @@ class ListRandom(Random):
             >>> assert a3.link.get('test) == [a1, a2]
             ```
         """
-        linked_combs = []
-        for source, target in list(combinations(self.actors, 2)):
-            if self.rng.random() < p:
-                source.link.to(target, link_name=link, mutual=mutual)
-                linked_combs.append((source, target))
+        from abses.human.generators import erdos_renyi
+
+        actors = list(self.actors)
+        sources, targets = erdos_renyi(len(actors), p, self.rng)
+        order = np.lexsort((targets, sources))
+        sources, targets = sources[order], targets[order]
+        linked_combs = [(actors[s], actors[t]) for s, t in zip(sources, targets)]
+        self.model.human.add_links(
+            link,
+            (actors[s] for s in sources.tolist()),
+            (actors[t] for t in targets.tolist()),
+            mutual=mutual,
+        )
         return linked_combs
 
     def assign(
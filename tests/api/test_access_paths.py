@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试节点属性的访问路径。
+1. 每个类按 (attr, target) 只解析一次访问路径
+2. 自身、默认目标（斑块/主体）和链接节点的属性
+3. `ActorsList.get/set` 指定目标时与逐个访问一致
+"""
+
+from __future__ import annotations
+
+import gc
+import weakref
+from functools import wraps
+
+import numpy as np
+import pytest
+
+from abses import Actor, MainModel
+from abses.utils.errors import ABSESpyError
+
+
+@pytest.fixture(name="actors")
+def setup_actors(model: MainModel):
+    """三个位于不同斑块上的主体，斑块上有 soil 属性"""
+    module = model.nature.create_module(shape=(3, 3))
+    module.apply_raster(np.arange(9, dtype=float).reshape(1, 3, 3), "soil")
+    actors = model.agents.new(Actor, 3)
+    for i, actor in enumerate(actors):
+        actor.move.to((i, i), layer=module)
+    return actors
+
+
+class Tenant(Actor):
+    """默认从家（而不是所在的斑块）获取属性的租客"""
+
+    @wraps(Actor._redirect)
+    def _redirect(self, target):
+        if target is None:
+            return self.home
+        return super()._redirect(target)
+
+
+class TestCompiledPaths:
+    """测试缓存的访问路径"""
+
+    def test_cached_per_class(self, actors):
+        """相同的 (attr, target) 复用同一个访问函数"""
+        getter = Actor._getter("soil", "cell")
+        assert Actor._getter("soil", "cell") is getter
+        assert Actor._getter("soil", None) is not getter
+        assert Actor.__dict__["_link_getters"][("soil", "cell")] is getter
+        with pytest.raises(TypeError, match="not string"):
+            Actor._getter(1, None)
+
+    def test_wrapped_override(self, model: MainModel, actors):
+        """保留了限定名的改写也被识别为改写"""
+        tenant = model.agents.new(Tenant, singleton=True)
+        tenant.move.to((0, 0), layer=actors[0].layer)
+        tenant.home = actors[2].at
+        assert Tenant._redirect.__qualname__ == Actor._redirect.__qualname__
+        assert tenant.get("soil") == tenant.home.soil != tenant.at.soil
+
+    def test_cache_collected(self):
+        """动态创建的类被回收时，缓存随之回收"""
+        breed = type("Temporary", (Actor,), {})
+        breed._getter("soil", None)
+        breed._setter("soil", None)
+        ref = weakref.ref(breed)
+        del breed
+        gc.collect()
+        assert ref() is None
+
+    def test_get_cell_and_auto(self, actors):
+        """主体从所在斑块获取属性，自身属性优先"""
+        actor = actors[1]
+        assert actor.get("soil", target="cell") == 4.0
+        assert actor.get("soil") == 4.0
+        actor.soil = -1
+        assert actor.get("soil") == -1
+        assert actor.get("soil", target="cell") == 4.0
+        assert actor.get("missing", default=0) == 0
+        with pytest.raises(AttributeError, match="Neither"):
+            actor.get("missing")
+
+    def test_get_from_cell(self, actors):
+        """斑块获取自身属性，并且能设置在主体上"""
+        cell = actors[2].at
+        assert cell.get("soil") == cell.soil
+        cell.set("wealth", 3, target="actor", new=True)
+        assert actors[2].wealth == 3
+
+    def test_linked_target(self, model: MainModel, actors):
+        """从链接的节点获取属性，位置不影响缓存"""
+        a, b, _ = actors
+        b.wealth = 10
+        a.link.to(b, "friend")
+        assert a.get("wealth", target="friend") == [10]
+        a.set("wealth", 5, target="friend")
+        assert b.wealth == 5
+        a.link.unlink(b, "friend")
+        with pytest.raises(ABSESpyError):
+            a.get("wealth", target="friend")
+
+
+class TestActorsListTarget:
+    """测试列表批量访问"""
+
+    def test_get_target(self, actors):
+        """批量获取与逐个获取一致"""
+        expected = [a.get("soil", target="cell") for a in actors]
+        assert actors.get("soil", target="cell") == expected
+        assert expected == [a.at.soil for a in actors]
+        assert actors.get("missing", default=1) == [1, 1, 1]
+        with pytest.raises(TypeError):
+            actors.get(["soil", "x"], target="cell")
+
+    def test_mesa_compatible(self, actors):
+        """不指定目标时保持 mesa 的行为"""
+        actors.set("wealth", 2)
+        assert actors.get("wealth") == [2, 2, 2]
+        assert actors.get(["wealth", "unique_id"])[0][0] == 2
+
+    def test_set_target(self, actors):
+        """批量设置斑块的属性"""
+        actors.set("soil", 0.5, target="cell")
+        assert actors.get("soil", target="cell") == [0.5] * 3
+        actors.set("flag", True, target="self", new=True)
+        assert all(actors.get("flag"))
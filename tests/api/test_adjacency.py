@@ -0,0 +1,273 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试链接的存储后端。
+1. `DictLinks` 与 `SparseLinks` 行为一致（包括压缩前后）
+2. 链接容器的向量化查询：度、邻接矩阵、批量创建
+3. networkx 图缓存在链接变化后失效；节点参与的链接类型可 O(1) 查询
+4. 千万级链接（heavy，默认跳过）
+5. 链接属性的列式存储，及其在随机选择和扩散中的使用
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from abses import Actor, MainModel
+from abses.human.adjacency import DictLinks, SparseLinks, create_link_store
+from abses.utils.errors import ABSESpyError
+
+
+def _edge_set(store) -> set:
+    sources, targets = store.edges()
+    return set(zip(sources.tolist(), targets.tolist()))
+
+
+class TestLinkStores:
+    """测试两种存储后端"""
+
+    @pytest.mark.parametrize("backend", ["dict", "sparse"])
+    def test_basic_operations(self, backend):
+        """增删查以及邻居查询"""
+        store = create_link_store(backend)
+        assert store.add(0, 1) and store.add(0, 2) and store.add(2, 0)
+        assert not store.add(0, 1)
+        assert len(store) == 3
+        assert store.has(0, 1) and not store.has(1, 0)
+        assert sorted(store.neighbors(0, "out").tolist()) == [1, 2]
+        assert store.neighbors(0, "in").tolist() == [2]
+        assert store.remove(0, 1) and not store.remove(0, 1)
+        assert not store.participates(1, "in")
+        assert sorted(store.pop_node(0, "out").tolist()) == [2]
+        assert _edge_set(store) == {(2, 0)}
+        np.testing.assert_array_equal(store.degree(4, "in"), [1, 0, 0, 0])
+
+    def test_unknown_backend(self):
+        """未知后端报错"""
+        with pytest.raises(ValueError, match="Unknown link backend"):
+            create_link_store("matrix")
+
+    def test_sparse_matches_dict(self):
+        """随机增删后，稀疏后端与字典后端一致"""
+        rng = np.random.default_rng(42)
+        reference = DictLinks()
+        sparse = SparseLinks(min_pending=16)
+        for _ in range(2000):
+            source, target = rng.integers(0, 30, size=2).tolist()
+            if rng.random() < 0.7:
+                assert sparse.add(source, target) == reference.add(source, target)
+            else:
+                assert sparse.remove(source, target) == reference.remove(source, target)
+            node = int(rng.integers(0, 30))
+            for direction in ("out", "in"):
+                assert set(sparse.neighbors(node, direction).tolist()) == set(
+                    reference.neighbors(node, direction).tolist()
+                )
+                assert sparse.node_degree(node, direction) == len(
+                    reference.neighbors(node, direction)
+                )
+        assert sparse.compactions > 0
+        assert len(sparse) == len(reference)
+        assert _edge_set(sparse) == _edge_set(reference)
+        for direction in ("out", "in"):
+            np.testing.assert_array_equal(
+                sparse.degree(30, direction), reference.degree(30, direction)
+            )
+        assert (sparse.to_scipy(30) != reference.to_scipy(30)).nnz == 0
+
+    def test_bulk_add(self):
+        """批量添加去重，并返回新增数量"""
+        store = SparseLinks()
+        store.add(0, 1)
+        added = store.add_edges(np.array([0, 1, 1, 2]), np.array([1, 2, 2, 0]))
+        assert added == 2
+        assert len(store) == 3
+        assert store.neighbors(0, "in").tolist() == [2]
+
+
+class TestContainerQueries:
+    """测试链接容器的查询接口"""
+
+    @pytest.fixture(params=["dict", "sparse"])
+    def model(self, request):
+        """不同链接后端的模型"""
+        return MainModel(parameters={"human": {"link_backend": request.param}})
+
+    def test_backend_from_params(self, model: MainModel):
+        """后端来自参数，也可以为每种链接单独指定"""
+        backend = model.human.link_backend
+        assert backend == model.settings.human.link_backend
+        model.human.define_link("trade", backend="sparse")
+        actor1, actor2 = model.agents.new(Actor, 2)
+        actor1.link.to(actor2, "friend")
+        actor1.link.to(actor2, "trade")
+        assert model.human._stores["friend"].backend == backend
+        assert model.human._stores["trade"].backend == "sparse"
+        with pytest.raises(ABSESpyError, match="already exists"):
+            model.human.define_link("trade")
+
+    def test_degree_and_adjacency(self, model: MainModel):
+        """度与邻接矩阵"""
+        actors = model.agents.new(Actor, 4)
+        model.human.add_links("friend", [actors[0]] * 3, actors[1:])
+        out_degree = model.human.degree("friend")
+        assert out_degree[actors[0].unique_id] == 3
+        assert model.human.degree("friend", "in").sum() == 3
+        assert model.human.degree("friend", None, nodes=actors).tolist() == [
+            3,
+            1,
+            1,
+            1,
+        ]
+        matrix, uids = model.human.adjacency("friend")
+        row = list(uids).index(actors[0].unique_id)
+        assert matrix[row].sum() == 3
+        assert matrix.shape == (len(uids), len(uids))
+
+    def test_neighbor_aggregate_and_components(self, model: MainModel):
+        """邻居属性的聚合与连通分量"""
+        actors = model.agents.new(Actor, 5)
+        for i, actor in enumerate(actors):
+            actor.wealth = float(i)
+        model.human.add_links("friend", actors[:2], actors[1:3])
+        mean = model.human.neighbor_aggregate("friend", "wealth", actors)
+        np.testing.assert_array_equal(mean, [1.0, 2.0, np.nan, np.nan, np.nan])
+        total = model.human.neighbor_aggregate(
+            "friend", "wealth", actors, how="sum", direction=None
+        )
+        np.testing.assert_array_equal(total, [1.0, 2.0, 1.0, 0.0, 0.0])
+        with pytest.raises(ValueError, match="Unknown aggregation"):
+            model.human.neighbor_aggregate("friend", "wealth", actors, how="max")
+        assert model.human.n_components("friend") == 1
+        assert model.human.n_components("friend", actors) == 3
+
+    def test_owning_after_unlink(self, model: MainModel):
+        """解除所有链接后，节点不再拥有该类型的链接"""
+        actor1, actor2 = model.agents.new(Actor, 2)
+        actor1.link.to(actor2, "friend", mutual=True)
+        assert actor1.link.owning() == ("friend",)
+        actor1.link.unlink(actor2, "friend", mutual=True)
+        assert actor1.link.owning() == ()
+        assert not any(actor2.link.has("friend"))
+
+    def test_participation_counters(self, model: MainModel):
+        """批量链接后立即可查，清理时只处理参与的链接类型"""
+        actors = model.agents.new(Actor, 3)
+        model.human.add_links("friend", actors[:1], actors[1:2])
+        actors[1].link.to(actors[2], "trade")
+        assert model.human.participates(actors[0], "friend") == (True, False)
+        assert actors[1].link.has("friend") == (False, True)
+        assert model.human.participates(actors[0], "unknown") == (False, False)
+        trade = model.human._stores["trade"]
+        version = trade.version
+        actors[0].link.clean()
+        assert trade.version == version
+        assert actors[1].link.owning() == ("trade",)
+
+    def test_graph_cache(self, model: MainModel):
+        """网络图在链接变化之前被缓存，变化之后重新生成"""
+        actor1, actor2, actor3 = model.agents.new(Actor, 3)
+        actor1.link.to(actor2, "friend")
+        graph = model.human.get_graph("friend")
+        assert model.human.get_graph("friend") is graph
+        assert model.human.get_graph("friend", directions=True) is not graph
+        actor2.link.to(actor3, "friend")
+        updated = model.human.get_graph("friend")
+        assert updated is not graph
+        assert updated.number_of_edges() == 2
+        actor2.die()
+        assert model.human.get_graph("friend").number_of_edges() == 0
+
+
+def test_ten_million_links_heavy():
+    """千万级链接的批量写入和向量化查询"""
+    n_nodes, n_edges = 1_000_000, 10_000_000
+    rng = np.random.default_rng(0)
+    store = SparseLinks()
+    sources = rng.integers(0, n_nodes, n_edges)
+    targets = rng.integers(0, n_nodes, n_edges)
+
+    start = perf_counter()
+    added = store.add_edges(sources, targets)
+    degree = store.degree(n_nodes, "in")
+    matrix = store.to_scipy(n_nodes)
+    elapsed = perf_counter() - start
+    print(f"\n{added} links: bulk insert and queries in {elapsed:.2f}s")
+
+    assert added == len(store) == matrix.nnz
+    assert degree.sum() == added
+    node = int(sources[0])
+    start = perf_counter()
+    for target in range(1000):
+        store.add(node, target)
+    assert store.has(node, 999)
+    assert len(store.neighbors(node, "out")) >= 1000
+    assert perf_counter() - start < 1.0
+
+
+class TestEdgeAttributes:
+    """测试链接属性"""
+
+    @pytest.mark.parametrize("backend", ["dict", "sparse"])
+    def test_store_columns(self, backend):
+        """属性按列存储，与 edges() 对齐；删除后重建的链接恢复默认值"""
+        store = create_link_store(backend)
+        store.add(1, 0)
+        store.add(0, 1)
+        store.set_attrs(0, 1, {"weight": 0.5, "since": 3})
+        np.testing.assert_array_equal(store.edge_array("weight"), [0.5, 1.0])
+        np.testing.assert_array_equal(store.edge_array("since"), [3, 0])
+        assert store.get_attr(1, 0, "weight") == 1.0
+        store.set_edge_array("weight", np.array([2.0, 3.0]))
+        assert store.get_attr(1, 0, "weight") == 3.0
+        store.remove(0, 1)
+        store.add(0, 1)
+        assert store.get_attr(0, 1, "weight") == 1.0
+        with pytest.raises(KeyError, match="No edge attribute"):
+            store.edge_array("trust")
+        with pytest.raises(KeyError, match="No link"):
+            store.set_attrs(2, 3, {"weight": 1.0})
+
+    def test_sparse_compaction_keeps_values(self):
+        """压缩、批量添加后属性值不丢失"""
+        store = SparseLinks(min_pending=2)
+        for target in range(5):
+            store.add(0, target)
+            store.set_attrs(0, target, {"weight": float(target)})
+        store.remove(0, 2)
+        assert store.compactions > 0
+        added = store.add_edges(
+            np.array([0, 1]), np.array([4, 0]), {"weight": np.array([9.0, 7.0])}
+        )
+        assert added == 1
+        assert store.get_attr(0, 3, "weight") == 3.0
+        np.testing.assert_array_equal(store.edge_array("weight"), [0, 1, 3, 9, 7])
+
+    @pytest.mark.parametrize("backend", ["dict", "sparse"])
+    def test_weighted_links(self, backend):
+        """通过代理创建带权重的链接，并用于随机选择和扩散"""
+        model = MainModel(parameters={"human": {"link_backend": backend}})
+        ego, *friends = model.agents.new(Actor, 3)
+        ego.link.to(friends[0], "friend", weight=0.0, since=1)
+        ego.link.to(friends[1], "friend", weight=2.0, since=2)
+        assert model.human.edge_attr("friend", ego, friends[1], "since") == 2
+        assert set(model.human.edge_attributes("friend")) == {"weight", "since"}
+
+        neighbors = ego.link.neighbors("friend")
+        weights = ego.link.edge_values("friend")
+        assert neighbors.random.choice(prob=weights) is friends[1]
+
+        model.human.set_edge_attrs("friend", ego, friends[0], weight=1.0)
+        ego.opinion, friends[0].opinion, friends[1].opinion = 0.0, 1.0, 4.0
+        model.human.diffuse("friend", "opinion", nodes=[ego, *friends], weight="weight")
+        assert ego.opinion == pytest.approx((1.0 * 1 + 4.0 * 2) / 3)
+
+        graph = model.human.get_graph("friend", directions=True)
+        assert graph.edges[ego, friends[1]]["weight"] == 2.0
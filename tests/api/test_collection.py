@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试物化的主体集合。
+1. 出生、死亡、对象池复用时增量维护成员
+2. 通过 `set` 或 `update` 修改属性后重新判断成员
+3. 未观察到的修改可以手动刷新；记录物化成本
+4. 默认只物化按类型的选择；在地上的主体随移动维护
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from abses import Actor, MainModel
+
+
+class Farmer(Actor):
+    """测试用的农户"""
+
+    def setup(self):
+        self.rich = False
+
+
+class Herder(Actor):
+    """测试用的牧民"""
+
+    def setup(self):
+        self.rich = True
+
+
+def test_breed_collection(model: MainModel):
+    """按类型定义的集合随出生和死亡增量维护"""
+    farmers = model.agents.new(Farmer, 3)
+    module = model.human.create_module("farmers", agent_type=Farmer)
+    assert module.agents == farmers
+    model.agents.new(Herder, 2)
+    newborn = model.agents.new(Farmer, singleton=True)
+    farmers[0].die()
+    assert set(module.agents) == {farmers[1], farmers[2], newborn}
+    stats = module.collection_stats().loc["farmers"]
+    assert stats["size"] == 3
+    assert stats["materializations"] == 1
+    assert stats["updates"] == 3
+
+
+def test_pool_reuse(model: MainModel):
+    """从对象池复用的主体重新加入集合"""
+    model.agents.enable_pool(Farmer)
+    farmers = model.agents.new(Farmer, 2)
+    module = model.human.create_module("farmers", agent_type=Farmer)
+    farmers[0].die()
+    assert len(module.agents) == 1
+    reused = model.agents.new(Farmer, singleton=True)
+    assert reused is farmers[0]
+    assert reused in module.agents
+
+
+def test_attribute_collection(model: MainModel):
+    """按属性定义的集合在属性修改后更新"""
+    farmers = model.agents.new(Farmer, 3)
+    herders = model.agents.new(Herder, 2)
+    module = model.human.create_module("rich", selection="rich", materialize=True)
+    assert set(module.agents) == set(herders)
+    farmers[0].set("rich", True)
+    herders.update("rich", [False, False])
+    assert module.agents.array("unique_id").tolist() == [farmers[0].unique_id]
+    # 直接赋值不会被观察到，需要手动刷新
+    farmers[1].rich = True
+    assert farmers[1] not in module.agents
+    module.refresh()
+    assert set(module.agents) == {farmers[0], farmers[1]}
+    assert model.agents.select("rich") == module.agents
+
+
+def test_plain_assignment(model: MainModel):
+    """默认不物化按属性或函数的选择，直接赋值后的结果不会过时"""
+    farmers = model.agents.new(Farmer, 3)
+    by_attr = model.human.create_module("rich", selection="rich")
+    by_func = model.human.create_module("poor", selection=lambda a: not a.rich)
+    farmers[0].rich = True
+    assert list(by_attr.agents) == [farmers[0]]
+    assert set(by_func.agents) == {farmers[1], farmers[2]}
+    assert by_attr.collection_stats().empty
+    with pytest.raises(ValueError):
+        model.human.create_module("func", selection=callable, materialize=True)
+
+
+def test_actors_on_earth(model: MainModel):
+    """在地上的主体随移动增量维护，不再扫描"""
+    land = model.nature.create_module(shape=(3, 3))
+    farmers = model.agents.new(Farmer, 3)
+    module = model.human.create_module("farmers", agent_type=Farmer)
+    assert not module.actors
+    farmers[0].move.to(land.array_cells[0, 0])
+    farmers[1].move.to(land.array_cells[1, 1])
+    assert set(module.actors) == {farmers[0], farmers[1]}
+    farmers[0].move.off()
+    farmers[2].move.to(land.array_cells[2, 2])
+    assert set(module.actors) == {farmers[1], farmers[2]}
+    assert module._on_earth.materializations == 1
+
+
+def test_limited_selection(model: MainModel):
+    """限制数量的选择不被物化，每次重新查询"""
+    model.agents.new(Farmer, 4)
+    module = model.human.create_module("few", agent_type=Farmer, at_most=2)
+    assert len(module.agents) == 2
+    assert module.collection_stats().empty
+
+
+def test_stale_collection(model: MainModel):
+    """集合错过的变化会触发完整扫描"""
+    collection = model.agents.collection(agent_type=Farmer)
+    assert collection.is_stale
+    model.agents.new(Farmer, 2)
+    assert len(collection) == 2
+    assert not collection.is_stale
+    collection.invalidate()
+    assert collection.is_stale and len(collection) == 2
+    assert collection.materializations == 2
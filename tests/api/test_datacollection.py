@@ -13,6 +13,7 @@ import pytest
 
 from abses import MainModel
 from abses.agents.actor import Actor
+from abses.utils.datacollector import ABSESpyDataCollector, LinkReporter
 
 
 class TestDataCollector:
@@ -125,3 +126,64 @@ class TestDataCollector:
         final_report = datacollector.get_final_vars_report(model)
         assert "run_id" in final_report
         assert final_report["run_id"] == run_id
+
+
+class TestLinkReporters:
+    """测试网络统计的报告器"""
+
+    @pytest.fixture(name="network_model")
+    def network_model_fixture(self) -> MainModel:
+        """链状网络 0 -> 1 -> 2，以及一个孤立的主体"""
+        reports = {
+            "model": {
+                "degrees": {"link": "friend", "stat": "degree_hist", "breed": "Actor"},
+                "groups": {"link": "friend", "stat": "components", "breed": "Actor"},
+                "mean_wealth": {
+                    "link": "friend",
+                    "stat": "neighbor_mean",
+                    "attr": "wealth",
+                },
+            },
+            "agents": {
+                "Actor": {
+                    "friend_wealth": {
+                        "link": "friend",
+                        "stat": "neighbor_sum",
+                        "attr": "wealth",
+                        "direction": None,
+                    },
+                    "degree": {"link": "friend", "stat": "degree"},
+                }
+            },
+        }
+        model = MainModel(parameters={"tracker": reports, "time": {"end": 1}})
+        actors = model.agents.new(Actor, 4)
+        for i, actor in enumerate(actors):
+            actor.wealth = float(i)
+        actors[0].link.to(actors[1], "friend")
+        actors[1].link.to(actors[2], "friend")
+        return model
+
+    def test_model_level(self, network_model: MainModel):
+        """模型层面的度直方图、连通分量和邻居均值"""
+        network_model.datacollector.collect(network_model)
+        data = network_model.datacollector.get_model_vars_dataframe()
+        assert data["degrees"].iloc[0] == [2, 2]
+        assert data["groups"].iloc[0] == 2
+        assert data["mean_wealth"].iloc[0] == pytest.approx(1.5)
+
+    def test_agent_level(self, network_model: MainModel):
+        """每组主体只计算一次，结果与主体对齐"""
+        network_model.datacollector.collect(network_model)
+        data = network_model.datacollector.get_agent_vars_dataframe("Actor")
+        assert data["friend_wealth"].tolist() == [1.0, 2.0, 1.0, 0.0]
+        assert data["degree"].tolist() == [1, 1, 0, 0]
+
+    def test_invalid_reporters(self):
+        """未知或不适用的统计量"""
+        with pytest.raises(ValueError, match="Unknown link statistic"):
+            LinkReporter(link="friend", stat="clustering")
+        with pytest.raises(ValueError, match="requires an attribute"):
+            LinkReporter(link="friend", stat="neighbor_mean")
+        with pytest.raises(ValueError, match="model-level"):
+            ABSESpyDataCollector({"model": {"x": {"link": "f", "stat": "degree"}}})
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试网络扩散。
+1. 平均值规则（同步、异步）与逐个主体计算的结果一致
+2. 阈值规则和 SI/SIR 传播
+3. 相同种子的结果可复现
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+from scipy import sparse
+
+from abses import Actor, MainModel
+from abses.human.diffusion import INFECTED, RECOVERED, diffuse_values
+
+
+class Person(Actor):
+    """带有观点和状态的个体"""
+
+    def setup(self):
+        self.opinion = 0.0
+        self.state = 0
+        self.influence = 1.0
+
+
+def _line(model: MainModel, n: int = 4):
+    """创建一条双向链接的链：0 - 1 - 2 - 3"""
+    people = model.agents.new(Person, n)
+    for left, right in zip(people[:-1], people[1:]):
+        left.link.to(right, "friend", mutual=True)
+    return people
+
+
+class TestDiffusionRules:
+    """测试扩散规则"""
+
+    def test_mean_synchronous(self, model: MainModel):
+        """同步模式：所有节点基于同一时刻的值更新"""
+        people = _line(model)
+        people.update("opinion", [1.0, 0.0, 0.0, 0.0])
+        expected = [
+            np.mean([p.opinion for p in person.link.get("friend")]) for person in people
+        ]
+        values = model.human.diffuse("friend", "opinion", nodes=people)
+        np.testing.assert_allclose(values, expected)
+        np.testing.assert_allclose(people.array("opinion"), expected)
+
+    def test_mean_rate_and_weight(self, model: MainModel):
+        """部分趋近邻居均值，邻居影响力加权"""
+        people = _line(model, 3)
+        people.update("opinion", [0.0, 1.0, 0.0])
+        people.update("influence", [3.0, 1.0, 1.0])
+        model.human.diffuse(
+            "friend", "opinion", nodes=people, weight="influence", rate=0.5
+        )
+        np.testing.assert_allclose(people.array("opinion"), [0.5, 0.5, 0.5])
+
+    def test_mean_asynchronous(self):
+        """异步模式：后更新的节点看到先更新节点的新值"""
+        matrix = sparse.csr_matrix(np.array([[0, 1], [1, 0]], dtype=float))
+        order_rng = np.random.default_rng(0)
+        first = order_rng.permutation(2)[0]
+        values = diffuse_values(
+            matrix,
+            np.array([0.0, 1.0]),
+            synchronous=False,
+            rng=np.random.default_rng(0),
+        )
+        # 第一个更新的节点取另一个节点的旧值，第二个节点取其新值
+        assert values[0] == values[1] == (1.0 if first == 0 else 0.0)
+
+    def test_threshold(self, model: MainModel):
+        """阈值规则：邻居中采纳比例达到阈值才采纳"""
+        people = _line(model)
+        people.update("state", [1, 0, 0, 0])
+        model.human.diffuse("friend", "state", rule="threshold", threshold=0.5)
+        assert people.array("state").tolist() == [1, 1, 0, 0]
+        model.human.diffuse("friend", "state", rule="threshold", threshold=0.6)
+        assert people.array("state").tolist() == [1, 1, 0, 0]
+
+    @pytest.mark.parametrize("synchronous", [True, False])
+    def test_sir(self, model: MainModel, synchronous: bool):
+        """必然感染、必然康复（异步时，先康复的节点不再传染）"""
+        people = _line(model, 3)
+        people.update("state", [INFECTED, 0, 0])
+        model.human.diffuse(
+            "friend",
+            "state",
+            rule="SIR",
+            beta=1.0,
+            gamma=1.0,
+            synchronous=synchronous,
+        )
+        states = people.array("state").tolist()
+        assert states[0] == RECOVERED
+        if synchronous:
+            assert states == [RECOVERED, INFECTED, 0]
+
+    def test_unknown_rule(self, model: MainModel):
+        """未知规则报错"""
+        _line(model)
+        with pytest.raises(ValueError, match="Unknown rule"):
+            model.human.diffuse("friend", "state", rule="voter")
+
+
+@pytest.mark.parametrize("synchronous", [True, False])
+def test_reproducible(synchronous: bool):
+    """相同的模型种子得到相同的传播过程"""
+
+    def run(seed: int) -> list:
+        model = MainModel(seed=seed)
+        people = model.agents.new(Person, 30)
+        rng = np.random.default_rng(1)
+        for source, target in rng.integers(0, 30, size=(60, 2)).tolist():
+            if source != target:
+                people[source].link.to(people[target], "contact", mutual=True)
+        people[0].state = INFECTED
+        for _ in range(5):
+            model.human.diffuse(
+                "contact",
+                "state",
+                rule="SIR",
+                beta=0.4,
+                gamma=0.2,
+                nodes=people,
+                synchronous=synchronous,
+            )
+        return people.array("state").tolist()
+
+    assert run(42) == run(42)
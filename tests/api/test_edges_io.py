@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试边列表的批量导入与导出。
+1. 从数组、数据框、CSV/Parquet 文件导入链接
+2. 按属性或字典把 ID 映射为节点
+3. 导出后再导入得到相同的网络
+4. 五百万条边的导入（heavy，默认跳过）
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import networkx as nx
+import numpy as np
+import pandas as pd
+import pytest
+
+from abses import Actor, MainModel, PatchCell
+
+
+class Farmer(Actor):
+    """带有编号的农户"""
+
+    def setup(self):
+        self.farm_id = f"F{self.unique_id}"
+
+
+class Plot(PatchCell):
+    """带有编号的地块"""
+
+    @property
+    def farm_id(self) -> str:
+        """地块编号"""
+        return "P{}{}".format(*self.indices)
+
+
+class TestImportEdges:
+    """测试导入边列表"""
+
+    def test_from_arrays(self, model: MainModel):
+        """按 unique_id 导入，可以双向链接"""
+        actors = model.agents.new(Actor, 4)
+        ids = actors.array("unique_id")
+        added = model.human.add_links_from_edges(
+            "friend", ids[[0, 1]], ids[[1, 2]], mutual=True
+        )
+        assert added == 4
+        assert actors[1].link.has("friend", actors[0]) == (True, True)
+        assert actors[1].link.has("friend", actors[2]) == (True, True)
+        assert not actors[3].link.get("friend")
+
+    def test_from_nodes(self, model: MainModel):
+        """源和目标本身就是节点"""
+        actors = model.agents.new(Actor, 3)
+        model.human.add_links_from_edges("friend", actors[:2], actors[1:])
+        assert actors[0].link.has("friend", actors[1]) == (True, False)
+
+    def test_from_frame_with_attrs(self, model: MainModel):
+        """从数据框导入，按属性映射 ID，并带上链接属性"""
+        farmers = model.agents.new(Farmer, 3)
+        frame = pd.DataFrame(
+            {
+                "origin": [farmers[0].farm_id, farmers[1].farm_id],
+                "destination": [farmers[1].farm_id, farmers[2].farm_id],
+                "flow": [2.0, 3.0],
+            }
+        )
+        model.human.add_links_from_edges(
+            "trade",
+            frame,
+            mapping="farm_id",
+            columns=("origin", "destination"),
+            attrs=["flow"],
+        )
+        assert model.human.edge_attr("trade", farmers[1], farmers[2], "flow") == 3.0
+
+    def test_cells_and_actors(self, model: MainModel):
+        """斑块也可以按 unique_id 或属性导入，不同斑块的链接互不混淆"""
+        module = model.nature.create_module(shape=(2, 2), cell_cls=Plot)
+        farmers = model.agents.new(Farmer, 2)
+        cells = module.array_cells[0]
+        model.human.add_links_from_edges(
+            "own",
+            farmers.array("unique_id"),
+            [cell.unique_id for cell in cells],
+        )
+        assert list(farmers[0].link.get("own")) == [cells[0]]
+        assert list(cells[1].link.get("own", direction="in")) == [farmers[1]]
+        assert not module.array_cells[1, 0].link.get("own", direction="in")
+        with pytest.raises(KeyError, match="not found"):
+            model.human.add_links_from_edges("own", [farmers[0].unique_id], [-99])
+        model.human.add_links_from_edges(
+            "rent",
+            [cells[0].farm_id, cells[1].farm_id],
+            [farmers[1].farm_id, farmers[0].farm_id],
+            mapping="farm_id",
+        )
+        assert list(cells[0].link.get("rent")) == [farmers[1]]
+        assert list(farmers[0].link.get("rent", direction="in")) == [cells[1]]
+
+    def test_mapping_dict(self, model: MainModel):
+        """字典映射"""
+        actors = model.agents.new(Actor, 2)
+        mapping = {"a": actors[0], "b": actors[1]}
+        model.human.add_links_from_edges(
+            "friend", ["a"], ["b"], mapping=mapping, attrs={"weight": [0.5]}
+        )
+        assert model.human.edge_attr("friend", actors[0], actors[1], "weight") == 0.5
+
+    def test_errors(self, model: MainModel, tmp_path):
+        """ID 不存在、长度不一致、文件格式不支持"""
+        actors = model.agents.new(Actor, 2)
+        ids = actors.array("unique_id")
+        with pytest.raises(KeyError, match="not found"):
+            model.human.add_links_from_edges("friend", ids, [ids[0], -1])
+        with pytest.raises(ValueError, match="targets"):
+            model.human.add_links_from_edges("friend", ids, ids[:1])
+        with pytest.raises(ValueError, match="format"):
+            model.human.add_links_from_edges("friend", tmp_path / "edges.txt")
+
+    @pytest.mark.parametrize("suffix", [".csv", ".parquet"])
+    def test_files_round_trip(self, model: MainModel, tmp_path, suffix: str):
+        """导出为文件后，可以在新的模型中重新导入"""
+        if suffix == ".parquet":
+            pytest.importorskip("pyarrow")
+        actors = model.agents.new(Actor, 5)
+        model.human.watts_strogatz("friend", actors, k=2, p=0.0)
+        frame = model.human.edges("friend", as_frame=True)
+        path = tmp_path / f"edges{suffix}"
+        if suffix == ".csv":
+            frame.to_csv(path, index=False)
+        else:
+            frame.to_parquet(path)
+        model.human.add_links_from_edges("copy", path)
+        sources, targets = model.human.edges("copy")
+        np.testing.assert_array_equal(sources, frame["source"])
+        np.testing.assert_array_equal(targets, frame["target"])
+
+
+def test_export_and_graph(model: MainModel):
+    """导出的数组与链接一致，从图导入也是批量的"""
+    actors = model.agents.new(Actor, 3)
+    graph = nx.Graph([(actors[0], actors[1]), (actors[1], actors[2])])
+    model.human.add_links_from_graph(graph, "friend")
+    sources, targets = model.human.edges("friend")
+    assert len(sources) == 4
+    uid = actors[1].unique_id
+    assert (sources == uid).sum() == (targets == uid).sum() == 2
+    frame = model.human.edges("friend", as_frame=True)
+    assert list(frame.columns) == ["source", "target"]
+
+
+def test_cells_round_trip():
+    """斑块的 ID 只由图层的创建顺序决定，导出的边在新模型中连接相同的斑块"""
+
+    def build(first: str):
+        model = MainModel(seed=0)
+        for name in ("a", "b"):
+            model.nature.create_module(name=name, shape=(2, 3), cell_cls=Plot)
+        model.agents.new(Farmer, 2)
+        # 先访问哪个图层的斑块不影响它们的 ID
+        assert model.nature.modules[first].array_cells[0, 0].unique_id < 0
+        return model
+
+    model = build(first="b")
+    farmers = model.agents.select(agent_type=Farmer)
+    farmers[0].link.to(model.nature.a.array_cells[1, 2], link_name="own")
+    farmers[1].link.to(model.nature.b.array_cells[0, 1], link_name="own")
+    frame = model.human.edges("own", as_frame=True)
+    fresh = build(first="a")
+    fresh.human.add_links_from_edges("own", frame)
+    owned = [
+        (cell.layer.name, cell.indices)
+        for farmer in fresh.agents.select(agent_type=Farmer)
+        for cell in farmer.link.get("own")
+    ]
+    assert owned == [("a", (1, 2)), ("b", (0, 1))]
+
+
+def test_five_million_edges_heavy():
+    """五百万条边在几秒内导入"""
+    model = MainModel(seed=0, parameters={"human": {"link_backend": "sparse"}})
+    actors = model.agents.new(Actor, 100_000)
+    ids = actors.array("unique_id")
+    rng = np.random.default_rng(0)
+    sources = ids[rng.integers(0, len(ids), 5_000_000)]
+    targets = ids[rng.integers(0, len(ids), 5_000_000)]
+    start = perf_counter()
+    added = model.human.add_links_from_edges("contact", sources, targets)
+    elapsed = perf_counter() - start
+    print(f"\nImported {added} links in {elapsed:.2f}s")
+    assert added > 4_900_000
+    assert elapsed < 30
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试随机网络生成器。
+1. 边列表的结构性质（无自环、无重复、边数）
+2. 在 `BaseHuman` 上批量生成链接，且相同种子可复现
+3. 十万主体的随机网络（heavy，默认跳过）
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import numpy as np
+import pytest
+
+from abses import Actor, MainModel
+from abses.human import generators
+from abses.utils.errors import ABSESpyError
+
+
+def _check_simple(sources: np.ndarray, targets: np.ndarray, n: int) -> None:
+    """无自环、无重复的无向边列表"""
+    assert (sources < targets).all()
+    assert targets.max() < n
+    assert len(np.unique(sources * n + targets)) == len(sources)
+
+
+class TestEdgeGenerators:
+    """测试边列表生成函数"""
+
+    @pytest.mark.parametrize("n", [2, 3, 50, 301])
+    def test_erdos_renyi_complete(self, n):
+        """p=1 时得到完全图"""
+        rng = np.random.default_rng(0)
+        sources, targets = generators.erdos_renyi(n, 1.0, rng)
+        _check_simple(sources, targets, n)
+        assert len(sources) == n * (n - 1) // 2
+        sources, targets = generators.erdos_renyi(n, 1.0, rng, directed=True)
+        assert len(sources) == n * (n - 1)
+        assert (sources != targets).all()
+
+    def test_erdos_renyi_density(self):
+        """边数接近期望值"""
+        rng = np.random.default_rng(0)
+        n, p = 2000, 0.01
+        sources, targets = generators.erdos_renyi(n, p, rng)
+        _check_simple(sources, targets, n)
+        expected = p * n * (n - 1) / 2
+        assert abs(len(sources) - expected) < 5 * np.sqrt(expected)
+
+    def test_watts_strogatz(self):
+        """重连后边数不变，且没有自环和重复边"""
+        rng = np.random.default_rng(0)
+        sources, targets = generators.watts_strogatz(100, 4, 0.3, rng)
+        _check_simple(sources, targets, 100)
+        assert len(sources) == 200
+        with pytest.raises(ValueError, match="even"):
+            generators.watts_strogatz(10, 3, 0.1, rng)
+
+    def test_barabasi_albert(self):
+        """每个新节点带来 m 条边，度分布有明显的枢纽"""
+        rng = np.random.default_rng(0)
+        n, m = 1000, 2
+        sources, targets = generators.barabasi_albert(n, m, rng)
+        _check_simple(sources, targets, n)
+        assert len(sources) == m * (n - m)
+        degree = np.bincount(np.concatenate([sources, targets]), minlength=n)
+        assert degree.min() >= m
+        assert degree.max() > 10 * m
+
+    def test_spatial_kernel(self):
+        """只链接半径内的点对，核函数为 0 时不链接"""
+        positions = np.array([[0, 0], [0, 1], [0, 3], [5, 5]])
+        rng = np.random.default_rng(0)
+        sources, targets = generators.spatial_kernel(positions, 2.1, rng)
+        assert list(zip(sources, targets)) == [(0, 1), (1, 2)]
+        sources, _ = generators.spatial_kernel(
+            positions, 2.1, rng, kernel=np.zeros_like
+        )
+        assert len(sources) == 0
+
+
+class TestHumanGenerators:
+    """测试 BaseHuman 上的生成接口"""
+
+    def test_erdos_renyi_reproducible(self):
+        """相同种子得到相同网络"""
+
+        def edges(seed: int) -> set:
+            model = MainModel(seed=seed)
+            actors = model.agents.new(Actor, 50)
+            model.human.erdos_renyi("friend", actors, p=0.1)
+            sources, targets = model.human._stores["friend"].edges()
+            return set(zip(sources.tolist(), targets.tolist()))
+
+        assert edges(1) == edges(1)
+        assert edges(1) != edges(2)
+
+    def test_mutual_links(self, model: MainModel):
+        """无向网络在两个方向上链接"""
+        actors = model.agents.new(Actor, 20)
+        added = model.human.watts_strogatz("friend", actors, k=4, p=0.0)
+        assert added == 80
+        assert actors[0].link.has("friend", actors[1]) == (True, True)
+        assert model.human.barabasi_albert("trade", actors, m=2) == 72
+
+    def test_spatial_graph(self, model: MainModel):
+        """按照主体的位置在空间中链接"""
+        module = model.nature.create_module(shape=(5, 5), resolution=1)
+        actors = model.agents.new(Actor, 3)
+        for actor, pos in zip(actors, [(0, 0), (0, 1), (4, 4)]):
+            actor.move.to(pos, layer=module)
+        model.human.spatial_graph("near", actors, radius=1.5)
+        assert actors[1] in actors[0].link.get("near")
+        assert not actors[2].link.get("near")
+        floating = model.agents.new(Actor, singleton=True)
+        with pytest.raises(ABSESpyError, match="no geometry"):
+            model.human.spatial_graph("near", [floating], radius=1.0)
+
+    def test_list_random_link(self, model: MainModel):
+        """ListRandom.link 不再遍历所有点对"""
+        actors = model.agents.new(Actor, 10)
+        pairs = actors.random.link("test", p=1.0, mutual=False)
+        assert len(pairs) == 45
+        assert all(actors.index(a) < actors.index(b) for a, b in pairs)
+        assert actors[9].link.has("test", actors[0]) == (False, True)
+
+
+def test_large_random_graph_heavy():
+    """十万主体的稀疏随机网络"""
+    model = MainModel(seed=0, parameters={"human": {"link_backend": "sparse"}})
+    actors = model.agents.new(Actor, 100_000)
+    start = perf_counter()
+    added = model.human.erdos_renyi("friend", actors, p=1e-4)
+    elapsed = perf_counter() - start
+    print(f"\n{added} links among 100k actors in {elapsed:.2f}s")
+    assert added == pytest.approx(1e-4 * 100_000 * 99_999, rel=0.02)
+    assert elapsed < 30
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试主体与斑块之间的所有权索引。
+1. 转让所有权、查询拥有的斑块和斑块的所有者
+2. 导出所有者 ID 栅格，按所有者做分区统计
+3. 所有者死亡（包括被对象池复用）后释放其斑块
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from abses import Actor, MainModel
+
+
+@pytest.fixture(name="module")
+def fixture_module(model: MainModel):
+    """3x4 的斑块模块，带有产量属性"""
+    module = model.nature.create_module(shape=(3, 4), resolution=1)
+    module.apply_raster(np.arange(12, dtype=float).reshape(1, 3, 4), "yield")
+    return module
+
+
+class TestOwnership:
+    """测试所有权的转让与查询"""
+
+    def test_transfer(self, model: MainModel, module):
+        """每个斑块只有一个所有者，转让后原所有者失去斑块"""
+        alice, bob = model.agents.new(Actor, 2)
+        module.set_owner(module.array_cells[0, :], alice)
+        module.set_owner(module.array_cells[0, 1], bob)
+        assert module.owner_of(module.array_cells[0, 1]) is bob
+        assert [c.indices for c in module.owned_cells(alice)] == [
+            (0, 0),
+            (0, 2),
+            (0, 3),
+        ]
+        module.set_owner(module.owned_cells(bob), None)
+        assert module.owner_of(module.array_cells[0, 1]) is None
+        assert len(module.owned_cells(bob)) == 0
+
+    def test_mask_and_raster(self, model: MainModel, module):
+        """用布尔掩膜分配，并导出所有者 ID 栅格"""
+        alice, bob = model.agents.new(Actor, 2)
+        grid = module.get_raster("yield")[0]
+        module.set_owner(grid < 4, alice)
+        module.set_owner(grid >= 8, bob)
+        owners = module.get_raster("owner_id")
+        assert owners.shape == (1, 3, 4)
+        assert owners[0, 0].tolist() == [alice.unique_id] * 4
+        assert owners[0, 1].tolist() == [-1] * 4
+        assert owners[0, 2].tolist() == [bob.unique_id] * 4
+
+    def test_zonal_stats(self, model: MainModel, module):
+        """按所有者统计斑块属性"""
+        alice, bob = model.agents.new(Actor, 2)
+        grid = module.get_raster("yield")[0]
+        module.set_owner(grid < 4, alice)
+        module.set_owner(grid >= 8, bob)
+        total = module.zonal_stats("yield")
+        assert total[alice.unique_id] == 0 + 1 + 2 + 3
+        assert total[bob.unique_id] == 8 + 9 + 10 + 11
+        mean = module.zonal_stats("yield", how="mean")
+        assert mean[bob.unique_id] == 9.5
+        assert module.zonal_stats(grid, how="count")[alice.unique_id] == 4
+        with pytest.raises(ValueError, match="Unknown statistic"):
+            module.zonal_stats("yield", how="max")
+
+    def test_dead_owner(self, model: MainModel, module):
+        """所有者死亡后其斑块被释放，即使对象被复用"""
+        model.agents.enable_pool(Actor)
+        alice = model.agents.new(Actor, singleton=True)
+        module.set_owner(module.array_cells[1, :], alice)
+        alice.die()
+        reborn = model.agents.new(Actor, singleton=True)
+        assert reborn is alice
+        assert len(module.owned_cells(reborn)) == 0
+        assert (module.get_raster("owner_id") == -1).all()
+        module.set_owner(module.array_cells[2, 0], reborn)
+        assert module.zonal_stats("yield").to_dict() == {reborn.unique_id: 8.0}
+
+    def test_incremental_index(self, model: MainModel, module, monkeypatch):
+        """转让后逐段更新反向索引，不再对整个图层排序"""
+        owners = model.agents.new(Actor, 3)
+        index = module.ownership
+        rng = np.random.default_rng(0)
+        index.assign(np.arange(12), owners[0])
+        assert index.cells_of(owners[0]).tolist() == list(range(12))
+        sorts = []
+        argsort = np.argsort
+        monkeypatch.setattr(
+            np, "argsort", lambda *a, **kw: sorts.append(1) or argsort(*a, **kw)
+        )
+        for _ in range(30):
+            cells = rng.choice(12, size=rng.integers(1, 4), replace=False)
+            owner = owners[int(rng.integers(3))] if rng.random() > 0.2 else None
+            index.assign(cells, owner)
+            for actor in owners:
+                slot = index._slots.get(actor)
+                expected = [] if slot is None else np.flatnonzero(index._owner == slot)
+                assert index.cells_of(actor).tolist() == list(expected)
+        assert not sorts
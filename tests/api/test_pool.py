@@ -0,0 +1,237 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试主体对象池和延迟移除。
+1. 死亡的主体被回收并在出生时复用
+2. 复用的主体被重置
+3. 过期引用不会指向新的主体
+4. 激活过程中死亡的主体被批量移除
+5. 复用比新建快（heavy，默认跳过）
+"""
+
+from __future__ import annotations
+
+from time import perf_counter
+
+import mesa_geo as mg
+import pytest
+
+from abses import Actor, MainModel, SlotActor
+
+
+class Sheep(Actor):
+    """测试用的羊"""
+
+    def setup(self):
+        self.energy = 5
+
+
+class SlotSheep(SlotActor):
+    """测试用的 slot 羊"""
+
+    __slots__ = ("energy",)
+
+    def setup(self):
+        self.energy = 5
+
+
+class Shepherd(Actor):
+    """重写了构造函数的牧羊人"""
+
+    def __init__(self, *args, dogs: int = 1, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.dogs = dogs
+
+
+class TestActorPool:
+    """测试对象池"""
+
+    @pytest.mark.parametrize("breed", [Sheep, SlotSheep])
+    def test_reuse_and_reset(self, model: MainModel, breed):
+        """复用的对象获得新的 ID，属性被重置"""
+        module = model.nature.create_module(shape=(3, 3))
+        model.agents.enable_pool(breed)
+        sheep = module.array_cells[1, 1].agents.new(breed, singleton=True)
+        old_id = sheep.unique_id
+        sheep.energy = 1
+        sheep.tmp = "dirty"
+        sheep.die()
+        model.time.go()
+
+        lamb = module.array_cells[0, 0].agents.new(breed, singleton=True)
+        assert lamb is sheep
+        assert lamb.alive and lamb.unique_id != old_id
+        assert lamb.energy == 5 and not hasattr(lamb, "tmp")
+        assert lamb.age() == 0
+        assert lamb.at is module.array_cells[0, 0]
+        assert module.array_cells[1, 1].is_empty
+        assert model.agents.has(breed) == 1
+
+    @pytest.mark.parametrize("breed", [Sheep, SlotSheep])
+    def test_reuse_without_init(self, model: MainModel, breed, monkeypatch):
+        """复用时不再运行构造函数，原地清空模型元素的容器"""
+        model.agents.enable_pool(breed)
+        sheep = model.agents.new(breed, singleton=True)
+        observers = sheep._observers
+        sheep.die()
+        inits = []
+        init = mg.GeoAgent.__init__
+        monkeypatch.setattr(
+            mg.GeoAgent,
+            "__init__",
+            lambda *args, **kwargs: inits.append(1) or init(*args, **kwargs),
+        )
+        lamb = model.agents.new(breed, singleton=True)
+        assert lamb is sheep and not inits
+        assert lamb in model.agents and lamb.energy == 5
+        assert lamb.crs == model.nature.crs
+        if breed is Sheep:
+            assert lamb._observers is observers
+        model.agents.new(breed, singleton=True)
+        assert inits == [1]
+
+    def test_custom_init(self, model: MainModel):
+        """重写构造函数的品种被完整地重新初始化"""
+        model.agents.enable_pool(Shepherd)
+        shepherd = model.agents.new(Shepherd, singleton=True, dogs=3)
+        shepherd.die()
+        again = model.agents.new(Shepherd, singleton=True)
+        assert again is shepherd and again.dogs == 1
+        assert again.generation == 1
+
+    def test_stale_ref(self, model: MainModel):
+        """代际计数器让旧引用失效"""
+        model.agents.enable_pool(Sheep)
+        sheep = model.agents.new(Sheep, singleton=True)
+        ref = sheep.ref()
+        assert ref.get() is sheep
+        sheep.die()
+        assert ref.get() is None
+        lamb = model.agents.new(Sheep, singleton=True)
+        assert lamb is sheep and lamb.generation == 1
+        assert not ref
+        assert lamb.ref().get() is lamb
+
+    def test_stats(self, model: MainModel):
+        """命中率等统计"""
+        model.agents.enable_pool(Sheep, max_size=1)
+        flock = model.agents.new(Sheep, 3)
+        for sheep in flock:
+            sheep.die()
+        model.agents.new(Sheep, 2)
+        stats = model.agents.pool_stats().loc["Sheep"]
+        assert stats["hits"] == 1 and stats["misses"] == 4
+        assert stats["released"] == 1 and stats["discarded"] == 2
+        assert stats["hit_rate"] == pytest.approx(0.2)
+
+    def test_not_pooled(self, model: MainModel):
+        """没有启用对象池的品种不会复用"""
+        sheep = model.agents.new(Sheep, singleton=True)
+        sheep.die()
+        assert model.agents.new(Sheep, singleton=True) is not sheep
+        with pytest.raises(TypeError):
+            model.agents.enable_pool(int)
+        model.agents.enable_pool(Sheep)
+        model.agents.disable_pool(Sheep)
+        assert not model.agents.pools
+
+
+class Prey(Actor):
+    """测试用的猎物"""
+
+    def step(self):
+        """记录死亡后仍被调用的次数"""
+        self.model.zombie_steps += not self.alive
+
+    def eaten(self):
+        """死亡"""
+        self.die()
+
+
+class Predator(Actor):
+    """测试用的捕食者，每步吃掉所有猎物"""
+
+    def step(self):
+        """吃掉所有猎物"""
+        for prey in self.model.agents[Prey]:
+            if prey.alive:
+                prey.eaten()
+
+
+class TestDeferredRemoval:
+    """测试延迟移除"""
+
+    @pytest.fixture(name="world")
+    def setup_world(self, model: MainModel):
+        """一个捕食者、九个猎物"""
+        module = model.nature.create_module(shape=(3, 3))
+        model.zombie_steps = 0
+        module.cells_lst.apply(lambda c: c.agents.new(Prey))
+        predator = model.agents.new(Predator, singleton=True)
+        predator.link.to(model.agents[Prey][0], "hunts")
+        return module
+
+    def test_bulk_removal(self, model: MainModel, world):
+        """死亡在激活结束后被批量处理，死亡的主体被跳过"""
+        model.agents.defer_removal = True
+        model.agents.shuffle_do("step")
+        assert model.agents.has(Prey) == 0
+        assert world.count_agents().sum() == 0
+        assert model.zombie_steps == 0
+        predator = model.agents.select(agent_type=Predator).item()
+        assert len(predator.link.get("hunts")) == 0
+
+    def test_context_manager(self, model: MainModel, world):
+        """在上下文中死亡的主体仍然被计数，离开上下文后被移除"""
+        prey = model.agents[Prey][0]
+        with model.agents.deferred_removal() as queue:
+            prey.die()
+            assert not prey.alive and not prey.on_earth
+            assert prey in model.agents
+            assert queue == [prey]
+            assert prey.die() is None
+        assert prey not in model.agents
+        assert model.agents.has(Prey) == 8
+
+    def test_recycle_after_flush(self, model: MainModel, world):
+        """延迟移除也会把主体交给对象池"""
+        model.agents.enable_pool(Prey)
+        with model.agents.deferred_removal():
+            model.agents[Prey].do("eaten")
+        assert len(model.agents.pools[Prey]) == 9
+
+    def test_flush_deregisters(self, model: MainModel, world, monkeypatch):
+        """批量移除通过模型的注销接口，不直接修改 mesa 的内部结构"""
+        removed = []
+        deregister = model.deregister_agent
+        monkeypatch.setattr(
+            model,
+            "deregister_agent",
+            lambda agent: removed.append(agent) or deregister(agent),
+        )
+        preys = list(model.agents[Prey])
+        with model.agents.deferred_removal():
+            model.agents[Prey].do("eaten")
+            assert not removed
+        assert removed == preys
+        assert not model.agents_by_type.get(Prey)
+
+
+def test_reuse_faster_heavy(model: MainModel):
+    """复用死亡的主体比新建主体快"""
+    model.agents.new(Sheep, 10_000).do("die")
+    start = perf_counter()
+    model.agents.new(Sheep, 10_000).do("die")
+    created = perf_counter() - start
+    model.agents.enable_pool(Sheep)
+    model.agents.new(Sheep, 10_000).do("die")
+    start = perf_counter()
+    model.agents.new(Sheep, 10_000)
+    reused = perf_counter() - start
+    print(f"\n10k births: new {created:.3f}s, pooled {reused:.3f}s")
+    assert model.agents.pools[Sheep].hits == 10_000
+    assert reused < created
@@ -12,6 +12,7 @@ from numpy import isclose
 from abses import Actor, MainModel
 from abses.agents.sequences import ActorsList
 from abses.utils.errors import ABSESpyError
+from abses.utils.random import AliasTable, RandomStreams, sequence_seed
 
 
 class TestRandomActorsList:
@@ -164,3 +165,107 @@ class TestRandomActorsList:
         # assert
         assert isclose(agents.array("test").sum(), value)
         assert isclose(values.sum(), value)
+
+
+class TestRandomStreams:
+    """测试随机数流和缓存的随机接口"""
+
+    def test_streams_reproducible(self):
+        """相同种子得到相同的流，不同的键得到独立的流"""
+        streams1 = RandomStreams(42)
+        streams2 = RandomStreams(42)
+        rng = streams1.generator("breed", "Farmer")
+        assert rng is streams1.generator("breed", "Farmer")
+        streams2.generator("module", "land")  # 创建顺序不影响其他流
+        expected = streams2.generator("breed", "Farmer").random(5)
+        np.testing.assert_array_equal(rng.random(5), expected)
+        other = streams1.generator("breed", "Admin").random(5)
+        assert not np.allclose(other, expected)
+
+    def test_model_streams(self):
+        """模型的随机数流由种子决定"""
+        assert MainModel(seed=1).random_streams.generator("x").integers(
+            1e9
+        ) == MainModel(seed=1).random_streams.generator("x").integers(1e9)
+        assert MainModel(rng=7).random_streams.generator("x").integers(
+            1e9
+        ) == MainModel(rng=7).random_streams.generator("x").integers(1e9)
+
+    def test_seed_sequence_root(self):
+        """种子序列是模型随机数流的根，各模块的流相互独立"""
+        sequence = np.random.SeedSequence(42, spawn_key=(0, 1))
+        model = MainModel(seed=sequence)
+        assert model._seed == sequence_seed(sequence)
+        assert model.random_streams.root is sequence
+        land = model.nature.create_module(name="land", shape=(2, 2))
+        expected = RandomStreams(sequence).generator("module", "land").random(3)
+        # 其他模块抽取随机数，不影响这个模块的流
+        model.nature.create_module(name="sea", shape=(2, 2)).rng.random(10)
+        np.testing.assert_array_equal(land.rng.random(3), expected)
+        assert land.rng is land.random.rng
+
+    def test_cached_facade_not_reseeded(self, model: MainModel):
+        """随机接口被缓存，重复调用不会得到相同的结果"""
+        actors = model.agents.new(Actor, num=20)
+        assert actors.random is actors.random
+        assert model.agents.random is model.agents.random
+        first, second = list(range(20)), list(range(20))
+        actors.random.shuffle(first)
+        actors.random.shuffle(second)
+        assert first != second
+        assert sorted(first) == list(range(20))
+        sample = actors.random.sample(list(actors), 5)
+        assert len(set(sample)) == 5
+
+    def test_alias_table(self, model: MainModel):
+        """别名表的抽样频率符合权重"""
+        actors = model.agents.new(Actor, num=3)
+        actors.update("weight", [0.0, 1.0, 3.0])
+        table = actors.random.alias("weight")
+        assert table is actors.random.alias("weight")
+        chosen = actors.random.choice(size=4000, prob=table, replace=True, as_list=True)
+        counts = np.array([chosen.count(a) for a in actors])
+        assert counts[0] == 0
+        assert counts[2] / counts[1] == pytest.approx(3, rel=0.2)
+        with pytest.raises(ValueError):
+            actors.random.choice(size=2, prob=table, replace=False)
+        table = AliasTable([np.nan, -1])
+        assert set(table.draw(np.random.default_rng(0), 100)) == {0, 1}
+
+    def test_alias_members_changed(self, model: MainModel):
+        """成员变化但数量不变时，别名表重建，旧表不能再用"""
+        actors = model.agents.new(Actor, num=3)
+        actors.update("weight", [1.0, 1.0, 1.0])
+        table = actors.random.alias("weight")
+        poor = model.agents.new(Actor, singleton=True)
+        poor.weight = 0.0
+        actors.remove(actors[0])
+        actors.add(poor)
+        with pytest.raises(ABSESpyError, match="stale"):
+            actors.random.choice(size=10, prob=table, replace=True)
+        rebuilt = actors.random.alias("weight")
+        assert rebuilt is not table
+        chosen = actors.random.choice(
+            size=500, prob=rebuilt, replace=True, as_list=True
+        )
+        assert poor not in chosen
+
+    def test_breed_stream(self, model: MainModel):
+        """按品种选出的列表使用该品种的随机数流，不扫描主体"""
+        actors = model.agents.new(Actor, num=5)
+        breed = model.agents[Actor]
+        assert breed.random.rng is model.random_streams.generator("breed", "Actor")
+        assert actors.random.rng is model.random_streams.generator("actors")
+
+    def test_pick_without_copy(self, model: MainModel, monkeypatch):
+        """按索引挑选主体，不复制整个列表"""
+        actors = model.agents.new(Actor, num=10)
+        expected = list(actors)
+        monkeypatch.setattr(
+            ActorsList, "__getitem__", lambda *_: pytest.fail("indexed a copy")
+        )
+        indices = np.array([7, 2, 7, 0])
+        picked = actors.random._pick(actors, indices)
+        assert picked == [expected[i] for i in indices]
+        chosen = actors.random.choice(size=10, as_list=True)
+        assert chosen == expected
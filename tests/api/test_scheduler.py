@@ -0,0 +1,116 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试按品种调度主体。"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from abses import Actor, ActorsList, MainModel
+from abses.utils.errors import ABSESpyError
+
+
+class Grazer(Actor):
+    """定义了批量钩子的品种"""
+
+    def setup(self):
+        self.energy = 1.0
+
+    @classmethod
+    def step_batch(cls, agents: ActorsList, gain: float = 1.0) -> None:
+        """所有个体一起增长能量"""
+        agents[0].model.log.append(cls.__name__)
+        agents.update("energy", agents.array("energy") + gain)
+
+
+class Hunter(Actor):
+    """没有批量钩子的品种，逐个调用"""
+
+    def setup(self):
+        self.energy = 1.0
+
+    def step(self, gain: float = 1.0) -> None:
+        """逐个增长能量"""
+        self.model.log.append(self.breed)
+        self.energy += gain
+
+
+@pytest.fixture(name="zoo")
+def setup_zoo(model: MainModel) -> MainModel:
+    """三只猎人、五只食草动物"""
+    model.log = []
+    model.agents.new(Hunter, 3)
+    model.agents.new(Grazer, 5)
+    return model
+
+
+class TestBreedScheduler:
+    """测试按品种调度"""
+
+    def test_batch_and_fallback(self, zoo: MainModel):
+        """有批量钩子的品种调用一次，否则逐个调用"""
+        zoo.agents.do_by_breed("step", gain=2.0)
+        assert zoo.log == ["Hunter"] * 3 + ["Grazer"]
+        np.testing.assert_array_equal(zoo.agents.array("energy"), 3.0)
+
+    def test_order(self, zoo: MainModel):
+        """可以配置品种顺序"""
+        zoo.agents.do_by_breed(order="Grazer")
+        assert zoo.log == ["Grazer"] + ["Hunter"] * 3
+        zoo.log.clear()
+        zoo.agents.scheduler.order = [Grazer, Hunter]
+        zoo.agents.do_by_breed()
+        assert zoo.log[0] == "Grazer"
+        with pytest.raises(ABSESpyError):
+            zoo.agents.do_by_breed(order=[Grazer, "Grazer"])
+
+    def test_shuffle_reproducible(self):
+        """品种内部的随机顺序由模型的随机数种子决定"""
+
+        def visit_order(seed):
+            model = MainModel(seed=seed)
+            model.log = []
+            hunters = model.agents.new(Hunter, 10)
+            for i, hunter in enumerate(hunters):
+                hunter.step = lambda i=i: model.log.append(i)
+            model.agents.do_by_breed()
+            return model.log
+
+        assert visit_order(1) == visit_order(1)
+        assert sorted(visit_order(1)) == list(range(10))
+        model = MainModel(seed=1)
+        model.agents.new(Hunter, 10)
+        model.log = []
+        model.agents.do_by_breed(shuffle=False)
+        assert len(model.log) == 10
+
+    def test_timings(self, zoo: MainModel):
+        """记录每个品种的耗时"""
+        zoo.agents.do_by_breed()
+        zoo.agents.do_by_breed()
+        timings = zoo.agents.scheduler.timings
+        assert timings.loc[("Grazer", "step"), "batched"]
+        assert not timings.loc[("Hunter", "step"), "batched"]
+        assert timings.loc[("Hunter", "step"), "n_agents"] == 3
+        assert (timings["calls"] == 2).all()
+        assert (timings["total_time"] >= timings["last_time"]).all()
+        zoo.agents.scheduler.reset_timings()
+        assert zoo.agents.scheduler.timings.empty
+
+    def test_timings_match_profiler(self, zoo: MainModel):
+        """品种耗时与性能分析器的记录一致"""
+        profiler = zoo.enable_profiler()
+        zoo.agents.do_by_breed()
+        timings = zoo.agents.scheduler.timings
+        profiled = profiler.to_frame().loc["breed"]
+        for breed in ("Grazer", "Hunter"):
+            assert (
+                profiled.loc[f"{breed}.step", "total_time"]
+                == timings.loc[(breed, "step"), "total_time"]
+            )
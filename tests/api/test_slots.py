@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试基于 `__slots__` 的轻量主体和斑块。
+1. `SlotActor` 与 `Actor` 行为一致
+2. `SlotPatchCell` 与 `PatchCell` 行为一致
+3. 内存占用更小（大规模对比为 heavy，默认跳过）
+"""
+
+from __future__ import annotations
+
+import gc
+import sys
+import tracemalloc
+
+import numpy as np
+import pytest
+
+from abses import (
+    Actor,
+    MainModel,
+    PatchCell,
+    SlotActor,
+    SlotPatchCell,
+    raster_attribute,
+)
+from abses.core.base import BaseModelElement
+from abses.utils.errors import ABSESpyError
+
+
+class SlotFarmer(SlotActor):
+    """用户自定义 slot 字段的主体"""
+
+    __slots__ = ("wealth",)
+
+    def setup(self):
+        self.wealth = 10
+
+
+class SlotGrass(SlotPatchCell):
+    """用户自定义 slot 字段的斑块"""
+
+    __slots__ = ("_grass",)
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._grass = 1.0
+
+    @raster_attribute
+    def grass(self) -> float:
+        """草量"""
+        return self._grass
+
+    @grass.setter
+    def grass(self, value: float) -> None:
+        self._grass = value
+
+
+class TestSlotActor:
+    """测试 SlotActor"""
+
+    def test_user_slots(self, model: MainModel):
+        """用户声明的 slot 字段和临时属性都能用"""
+        farmer = model.agents.new(SlotFarmer, singleton=True)
+        assert isinstance(farmer, Actor)
+        assert farmer.wealth == 10
+        assert "wealth" not in farmer.__dict__
+        farmer.tmp = 1
+        assert farmer.get("tmp") == 1
+        assert farmer.alive and farmer.age() == 0
+
+    def test_shared_crs(self, model: MainModel):
+        """CRS 不单独存储，而是共享自斑块或 nature"""
+        module = model.nature.create_module(shape=(3, 3))
+        farmer = model.agents.new(SlotFarmer, singleton=True)
+        assert farmer.crs is model.nature.crs
+        farmer.move.to((1, 1), layer=module)
+        assert farmer.crs is module.crs
+        assert farmer._crs is None
+        farmer.crs = "epsg:3857"
+        assert farmer.crs.to_epsg() == 3857
+
+    def test_uncached_proxies(self, model: MainModel):
+        """移动和链接代理不缓存，但行为不变"""
+        module = model.nature.create_module(shape=(3, 3))
+        farmer1, farmer2 = model.agents.new(SlotFarmer, 2)
+        assert farmer1.move is not farmer1.move
+        farmer1.move.to((1, 1), layer=module)
+        assert farmer1.at is module.array_cells[1, 1]
+        farmer1.link.to(farmer2, "friend")
+        assert farmer1.link.has("friend", farmer2) == (True, False)
+        farmer1.die()
+        assert not farmer1.alive
+        assert len(farmer2.link.get("friend", direction="in")) == 0
+        assert module.array_cells[1, 1].is_empty
+
+    def test_init_chain(self, model: MainModel, monkeypatch):
+        """与 Actor 运行相同的初始化链，基类设置的属性不会缺失"""
+        init = BaseModelElement.__init__
+
+        def patched(self, *args, **kwargs):
+            init(self, *args, **kwargs)
+            self.__dict__["tag"] = "element"
+
+        monkeypatch.setattr(BaseModelElement, "__init__", patched)
+        farmer = model.agents.new(SlotFarmer, singleton=True)
+        assert farmer.tag == "element"
+        assert farmer._name is None and farmer.model is model
+
+    def test_footprint(self, model: MainModel):
+        """每个实例没有字典条目，占用的内存比 Actor 少"""
+        farmer = model.agents.new(SlotFarmer, singleton=True)
+        assert farmer.__dict__ == {}
+        actor = model.agents.new(Actor, singleton=True)
+        slot_actor = model.agents.new(SlotActor, singleton=True)
+        assert _own_bytes(slot_actor) * 3 < _own_bytes(actor)
+        # 包括模型中的注册在内，整体也更小
+        n_actors = 200
+        actor_bytes = _per_instance(lambda: model.agents.new(Actor, n_actors), n_actors)
+        slot_bytes = _per_instance(
+            lambda: model.agents.new(SlotActor, n_actors), n_actors
+        )
+        assert slot_bytes < actor_bytes * 0.85
+
+    def test_lazy_containers(self, model: MainModel):
+        """观察者和动态变量容器按需创建"""
+        farmer = model.agents.new(SlotFarmer, singleton=True)
+        assert not SlotActor._observers.is_created(farmer)
+        assert not farmer.dynamic_variables
+        farmer.add_dynamic_variable("double", data=None, function=lambda data: 2)
+        assert farmer.dynamic_var("double") == 2
+
+    def test_assign_container(self, model: MainModel):
+        """赋值的容器原样保存，即使是空容器"""
+        farmer = model.agents.new(SlotFarmer, singleton=True)
+        observers: set = set()
+        farmer._observers = observers
+        observers.add("observer")
+        assert farmer._observers is observers
+        assert "observer" in farmer.observers
+
+
+class TestSlotPatchCell:
+    """测试 SlotPatchCell"""
+
+    def test_pos_and_indices(self, model: MainModel):
+        """位置由行列号推导，与 PatchCell 一致"""
+        slot = model.nature.create_module(shape=(4, 3), cell_cls=SlotGrass)
+        normal = model.nature.create_module(shape=(4, 3), name="normal")
+        for cell, expected in zip(slot.cells_lst, normal.cells_lst):
+            assert isinstance(cell, PatchCell)
+            assert cell.pos == expected.pos
+            assert cell.indices == expected.indices
+            assert cell.coordinate == expected.coordinate
+            assert cell.model is model
+
+    def test_init_chain(self, model: MainModel, monkeypatch):
+        """与 PatchCell 运行相同的初始化链，基类设置的属性不会缺失"""
+        init = BaseModelElement.__init__
+
+        def patched(self, *args, **kwargs):
+            init(self, *args, **kwargs)
+            self.__dict__["tag"] = "element"
+
+        monkeypatch.setattr(BaseModelElement, "__init__", patched)
+        module = model.nature.create_module(shape=(2, 2), cell_cls=SlotGrass)
+        cell = module.array_cells[0, 0]
+        assert cell.tag == "element"
+        assert cell._name is None and cell.model is model
+        assert not SlotPatchCell._updated_ticks.is_created(cell)
+        assert cell._updated_ticks == []
+
+    def test_pos_checked(self, model: MainModel):
+        """给定的位置要与行列号一致"""
+        module = model.nature.create_module(shape=(2, 2), cell_cls=SlotGrass)
+        assert SlotGrass(module, indices=(0, 1), pos=(1, 1)).pos == (1, 1)
+        with pytest.raises(ABSESpyError, match="does not match"):
+            SlotGrass(module, indices=(0, 1), pos=(0, 0))
+
+    def test_raster_attribute(self, model: MainModel):
+        """用户 slot 字段可以作为栅格属性读写"""
+        module = model.nature.create_module(shape=(2, 2), cell_cls=SlotGrass)
+        assert "grass" in module.cell_properties
+        module.apply_raster(np.full((1, 2, 2), 3.0), attr_name="grass")
+        np.testing.assert_array_equal(module.get_raster("grass")[0], 3.0)
+
+    def test_model_setter(self, model: MainModel):
+        """斑块的模型就是图层的模型，不能改为其他模型"""
+        cell = model.nature.create_module(shape=(2, 2), cell_cls=SlotGrass).array_cells[
+            0, 0
+        ]
+        cell.model = model
+        with pytest.raises(ABSESpyError, match="belongs to the model"):
+            cell.model = MainModel()
+
+    def test_lazy_agents(self, model: MainModel):
+        """主体容器只在需要时创建"""
+        module = model.nature.create_module(shape=(2, 2), cell_cls=SlotGrass)
+        cell = module.array_cells[0, 0]
+        assert cell.is_empty
+        assert not SlotPatchCell._agents.is_created(cell)
+        actor = cell.agents.new(SlotFarmer, singleton=True)
+        assert actor.at is cell
+        assert not cell.is_empty
+        assert module.count_agents().sum() == 1
+
+
+def _own_bytes(obj) -> int:
+    """Bytes of an instance, its dictionary and its empty containers."""
+    size = sys.getsizeof(obj)
+    names = getattr(obj, "__dict__", {})
+    if names:
+        size += sys.getsizeof(names)
+        size += sum(
+            sys.getsizeof(v) for v in names.values() if isinstance(v, (set, dict, list))
+        )
+    return size
+
+
+def _per_instance(create, n: int) -> float:
+    """Average traced memory (bytes) per created instance."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        create()
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    return size / n
+
+
+def test_memory_footprint_heavy():
+    """对比 slot 版本和普通版本的内存占用"""
+    shape, n_actors = (40, 40), 400
+
+    def cells(cell_cls):
+        model = MainModel(seed=1)
+        return _per_instance(
+            lambda: model.nature.create_module(shape=shape, cell_cls=cell_cls),
+            n=shape[0] * shape[1],
+        )
+
+    def actors(actor_cls):
+        model = MainModel(seed=1)
+        module = model.nature.create_module(shape=(10, 10))
+
+        def create():
+            for actor in model.agents.new(actor_cls, n_actors):
+                actor.move.to("random", layer=module)
+
+        return _per_instance(create, n=n_actors)
+
+    cell_bytes, slot_cell_bytes = cells(PatchCell), cells(SlotPatchCell)
+    actor_bytes, slot_actor_bytes = actors(Actor), actors(SlotActor)
+    print(
+        f"\nPatchCell: {cell_bytes:.0f} B, SlotPatchCell: {slot_cell_bytes:.0f} B"
+        f"\nActor: {actor_bytes:.0f} B, SlotActor: {slot_actor_bytes:.0f} B"
+    )
+    assert slot_cell_bytes < cell_bytes / 2
+    assert slot_actor_bytes < actor_bytes * 0.75
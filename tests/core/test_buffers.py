@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试双缓冲的同步更新。
+1. 同步阶段读取之前的值，写入在阶段结束时生效
+2. 元胞的更新与顺序无关，可以分块用线程池运行
+3. 模型运行时每个时间步结束时交换
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from abses import Actor, MainModel, PatchCell, buffered
+
+
+class Forest(PatchCell):
+    """会被邻居点燃的森林"""
+
+    burning = buffered(False)
+
+    def spread(self):
+        """邻居着火时着火"""
+        if any(cell.burning for cell in self.neighboring(moore=True)):
+            self.burning = True
+
+
+class Trader(Actor):
+    """与伙伴交换财富的商人"""
+
+    wealth = buffered(0)
+
+    def trade(self):
+        """拿走伙伴的财富"""
+        self.wealth = self.partner.wealth
+
+
+class Fire(MainModel):
+    """每个时间步同步蔓延的火"""
+
+    def initialize(self):
+        self.nature.create_module(name="forest", shape=(7, 7), cell_cls=Forest)
+
+    def setup(self):
+        self.nature.forest.array_cells[3, 3].burning = True
+
+    def step(self):
+        self.nature.forest.cells_lst.sync_do("spread")
+
+
+@pytest.fixture(name="fire")
+def fire_model() -> Fire:
+    """运行两个时间步的火"""
+    return Fire(parameters={"time": {"end": 1}}, seed=1)
+
+
+def n_burning(model: Fire) -> int:
+    """着火的元胞数量"""
+    return int(model.nature.forest.get_raster("burning").sum())
+
+
+class TestSynchronous:
+    """测试同步阶段"""
+
+    def test_immediate_outside(self, fire: Fire):
+        """同步阶段之外，写入立即生效"""
+        trader = fire.agents.new(Trader, singleton=True)
+        assert trader.wealth == 0
+        trader.wealth = 5
+        assert trader.wealth == 5
+        assert Trader.wealth.next_value(trader) == 5
+
+    def test_swap_at_end(self, fire: Fire):
+        """同步阶段读取之前的值，结束时交换"""
+        alice, bob = fire.agents.new(Trader, 2)
+        alice.wealth, bob.wealth = 1, 2
+        alice.partner, bob.partner = bob, alice
+        with fire.synchronous() as buffer:
+            alice.trade()
+            bob.trade()
+            assert (alice.wealth, bob.wealth) == (1, 2)
+            assert Trader.wealth.next_value(alice) == 2
+            with fire.synchronous() as inner:
+                assert inner is buffer
+            assert len(buffer) == 2
+        assert (alice.wealth, bob.wealth) == (2, 1)
+        assert buffer.swaps == 2
+
+    def test_discard_on_error(self, fire: Fire):
+        """出错时丢弃写入"""
+        trader = fire.agents.new(Trader, singleton=True)
+        with pytest.raises(RuntimeError):
+            with fire.synchronous():
+                trader.wealth = 5
+                raise RuntimeError("interrupted")
+        assert trader.wealth == 0
+        assert fire._write_buffer is None
+
+
+class TestSyncDo:
+    """测试同步激活"""
+
+    def test_order_independent(self, fire: Fire):
+        """元胞的更新与顺序无关"""
+        fire.do_each("setup")
+        cells = fire.nature.forest.cells_lst
+        cells[::-1].sync_do("spread")
+        assert n_burning(fire) == 9
+        cells.sync_do("spread")
+        assert n_burning(fire) == 25
+
+    @pytest.mark.parametrize("workers, chunk_size", [(4, None), (3, 5)])
+    def test_threads(self, fire: Fire, workers, chunk_size):
+        """分块用线程池运行，结果一致"""
+        fire.do_each("setup")
+        cells = fire.nature.forest.cells_lst
+        cells.sync_do("spread", workers=workers, chunk_size=chunk_size)
+        burning = fire.nature.forest.get_raster("burning")[0]
+        expected = np.zeros((7, 7), dtype=bool)
+        expected[2:5, 2:5] = True
+        np.testing.assert_array_equal(burning, expected)
+
+    def test_run_model(self, fire: Fire):
+        """模型运行时，每个时间步结束时交换"""
+        fire.run_model()
+        assert fire.time.tick == 2
+        assert n_burning(fire) == 25
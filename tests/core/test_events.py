@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试离散事件调度。
+1. 只在到期的时间步运行事件，同一时间步按优先级和调度顺序
+2. 取消的事件和死亡主体的事件不运行
+3. 以时长指定的延迟
+"""
+
+from __future__ import annotations
+
+import pendulum
+import pytest
+
+from abses import Actor, MainModel
+
+
+class Farmer(Actor):
+    """记录事件的农民"""
+
+    def setup(self):
+        self.log = []
+
+    def plant(self):
+        """种植，三个时间步之后收获"""
+        self.log.append(("plant", self.time.tick))
+        self.schedule("harvest", after=3)
+
+    def harvest(self, bonus: int = 0):
+        """收获"""
+        self.log.append(("harvest", self.time.tick, bonus))
+
+
+@pytest.fixture(name="farm")
+def farm_model() -> MainModel:
+    """运行十个时间步的模型"""
+    return MainModel(parameters={"time": {"end": 10}}, seed=1)
+
+
+class TestEventScheduler:
+    """测试事件调度器"""
+
+    def test_due_events(self, farm: MainModel):
+        """事件在到期的时间步运行，并可以调度新的事件"""
+        farmers = farm.agents.new(Farmer, 2)
+        for farmer in farmers:
+            farmer.schedule("plant", at_tick=2)
+        farmers[1].schedule("harvest", at_tick=5, bonus=1)
+        assert farm.events.next_tick == 2
+        farm.run_model()
+        assert farmers[0].log == [("plant", 2), ("harvest", 5, 0)]
+        assert farmers[1].log == [("plant", 2), ("harvest", 5, 1), ("harvest", 5, 0)]
+        assert farm.events.executed == 5
+        assert not farm.events
+
+    def test_tie_break(self, farm: MainModel):
+        """同一时间步按优先级，再按调度顺序"""
+        order = []
+        farmers = farm.agents.new(Farmer, 3)
+        farmers[0].schedule(lambda f: order.append(0), at_tick=1)
+        farmers[1].schedule(lambda f: order.append(1), at_tick=1, priority=-1)
+        farmers[2].schedule(lambda f: order.append(2), at_tick=1)
+        assert farm.events.run_due(1) == 3
+        assert order == [1, 0, 2]
+
+    def test_cancel_and_dead(self, farm: MainModel):
+        """取消的事件和死亡主体的事件被丢弃"""
+        farmers = farm.agents.new(Farmer, 2)
+        event = farmers[0].schedule("plant", at_tick=1)
+        farmers[1].schedule("plant", at_tick=1)
+        event.cancel()
+        farmers[1].die()
+        assert farm.events.run_due(1) == 0
+        assert not farmers[0].log
+
+    def test_invalid(self, farm: MainModel):
+        """必须且只能指定一种时间"""
+        farmer = farm.agents.new(Farmer, singleton=True)
+        with pytest.raises(ValueError, match="either"):
+            farmer.schedule("plant")
+        with pytest.raises(ValueError, match="either"):
+            farmer.schedule("plant", at_tick=1, after=1)
+        farm.run_model(steps=2)
+        with pytest.raises(ValueError, match="Cannot schedule"):
+            farmer.schedule("plant", at_tick=1)
+        with pytest.raises(ValueError, match="tick mode"):
+            farmer.schedule("plant", after=pendulum.duration(days=1))
+
+
+def test_duration_delay():
+    """以时长指定的延迟换算为时间步"""
+    model = MainModel(
+        parameters={"time": {"start": "2000-01-01", "end": "2001-01-01", "days": 1}}
+    )
+    farmer = model.agents.new(Farmer, singleton=True)
+    event = farmer.schedule("plant", after=pendulum.duration(months=1))
+    assert event.tick == 31
+    assert model.time.ticks_after(pendulum.duration(years=2)) == 731
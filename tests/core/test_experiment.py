@@ -8,15 +8,41 @@
 3. 实验的并行计算
 4. 实验的钩子函数
 5. 实验结果的收集
+6. 从共同的预热状态分支运行情景
 """
 
+import os
+import sys
+
+import numpy as np
 import pytest
 
-from abses import MainModel
-from abses.core.experiment import Experiment
+from abses import Actor, MainModel
+from abses.core import experiment
+from abses.core.experiment import Experiment, _fork_branch, _reseed
+from abses.utils.random import sequence_seed
 from tests.helper import RandomAddingMod
 
 
+class Growth(MainModel):
+    """每步按参数中的速率随机增长"""
+
+    def setup(self):
+        self.value = 0.0
+
+    def step(self):
+        self.value += self.p.rate * self.random.random()
+
+
+class Fragile(Growth):
+    """速率为负时出错"""
+
+    def step(self):
+        if self.p.rate < 0:
+            raise ValueError("negative rate")
+        super().step()
+
+
 class TestExperimentBasic:
     """测试实验的基本功能"""
 
@@ -100,3 +126,119 @@ class TestExperimentRandom:
         assert results1.equals(results2)
         # 验证不同种子产生不同结果
         assert not results1.equals(results3)
+
+    def test_seed_tree(self, test_config):
+        """每次运行的种子序列是实验种子树上 (job_id, run_id) 的节点"""
+        exp = Experiment.new(RandomAddingMod, test_config, seed=42)
+        sequence = exp._get_seed(run_id=2, job_id=1)
+        assert sequence.entropy == 42
+        assert sequence.spawn_key == (1, 2)
+        assert sequence.generate_state(1) == exp._get_seed(2, 1).generate_state(1)
+        assert Experiment.new(RandomAddingMod, test_config)._get_seed(1) is None
+        exp.batch_run(repeats=2, display_progress=False)
+        seeds = exp.summary()["seed"].tolist()
+        assert seeds == [sequence_seed(exp._get_seed(run_id, 0)) for run_id in (1, 2)]
+
+
+class TestBranchRun:
+    """测试从预热状态分支运行情景"""
+
+    @pytest.fixture(autouse=True)
+    def reset_manager(self, monkeypatch):
+        """重置实验管理器，以使用增长模型"""
+        from abses.core.job_manager import ExperimentManager
+
+        monkeypatch.setattr(ExperimentManager, "_instance", None)
+
+    @pytest.fixture(name="cfg")
+    def growth_config(self, tmp_path, monkeypatch):
+        """增长模型的配置，在临时目录中运行"""
+        monkeypatch.chdir(tmp_path)
+        return {
+            "time": {"end": 9},
+            "tracker": {"final": {"value": "value"}},
+            "model": {"rate": 1},
+        }
+
+    def branch(self, cfg, method: str):
+        """两个情景、两次预热"""
+        exp = Experiment.new(Growth, cfg, seed=7)
+        exp.branch_run(
+            5,
+            overrides={"model.rate": [0, 10]},
+            repeats=2,
+            method=method,
+            display_progress=False,
+        )
+        return exp.summary()
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork")
+    def test_fork_and_checkpoint(self, cfg, tmp_path):
+        """分叉与检查点的结果一致，且可复现"""
+        forked = self.branch(cfg, "fork")
+        assert len(forked) == 4
+        assert forked["job_id"].tolist() == [0, 1, 0, 1]
+        assert forked["model.rate"].tolist() == [0, 10, 0, 10]
+        assert forked["seed"].nunique() == 4
+        # 速率为零时，只有预热期间的增长
+        stopped = forked[forked["model.rate"] == 0]["value"]
+        assert (stopped < 5).all()
+        assert (forked[forked["model.rate"] == 10]["value"] > stopped.max()).all()
+        assert forked.equals(self.branch(cfg, "fork"))
+        assert forked.equals(self.branch(cfg, "checkpoint"))
+        assert not list(tmp_path.glob("*.pkl"))
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="fork")
+    def test_fork_failure(self, cfg, monkeypatch):
+        """一个分支失败时，同一批的其他子进程也被回收，管道被关闭"""
+        pids = []
+
+        def fork(*args, **kwargs):
+            pid, read_fd = _fork_branch(*args, **kwargs)
+            pids.append(pid)
+            return pid, read_fd
+
+        monkeypatch.setattr(experiment, "_fork_branch", fork)
+        exp = Experiment.new(Fragile, cfg, seed=7)
+        fds = len(os.listdir("/proc/self/fd"))
+        with pytest.raises(RuntimeError, match="negative rate") as info:
+            exp.branch_run(
+                5,
+                overrides={"model.rate": [1, -1, 10, -2]},
+                parallels=4,
+                method="fork",
+                display_progress=False,
+            )
+        assert str(info.value).count("failed") == 2
+        assert len(pids) == 4
+        for pid in pids:
+            with pytest.raises(ChildProcessError):
+                os.waitpid(pid, os.WNOHANG)
+        assert len(os.listdir("/proc/self/fd")) == fds
+
+    def test_invalid_method(self, cfg):
+        """未知的分支方式"""
+        exp = Experiment.new(Growth, cfg)
+        with pytest.raises(ValueError, match="Unknown branch method"):
+            exp.branch_run(5, method="thread")
+
+    def test_reseed_facades(self):
+        """重设种子后，已创建的随机接口也使用新的随机流"""
+        model = MainModel(seed=1)
+        module = model.nature.create_module(name="land", shape=(5, 5))
+        model.agents.new(Actor, 10)
+
+        def draws():
+            agent = model.agents.random.choice(as_list=True, size=3)
+            cell = module.random.choice(as_list=True, size=3)
+            return [a.unique_id for a in agent] + [c.indices for c in cell]
+
+        agents_rng, module_rng = model.agents.random.rng, module.random.rng
+        _reseed(model, np.random.SeedSequence(7))
+        first = draws()
+        assert model.agents.random.rng is agents_rng
+        assert module.random.rng is module_rng
+        _reseed(model, np.random.SeedSequence(7))
+        assert draws() == first
+        _reseed(model, np.random.SeedSequence(8))
+        assert draws() != first
@@ -0,0 +1,135 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试内存占用的估计。
+1. 按图层、主体种类、链接类型和数据收集器估计字节数
+2. 抽样估计的深层大小
+3. 每个时间步记录峰值，超过阈值时触发钩子
+"""
+
+from __future__ import annotations
+
+import numpy as np
+import pytest
+
+from abses import Actor, MainModel
+from abses.core.memory import MemoryWatcher, deep_sizeof
+
+
+class Farmer(Actor):
+    """有一块田的农民"""
+
+    def setup(self):
+        self.field = np.zeros(100)
+
+
+class Village(MainModel):
+    """有图层、农民、链接和数据收集的模型"""
+
+    def initialize(self):
+        land = self.nature.create_module(name="land", shape=(10, 10))
+        land.apply_raster(np.ones((1, 10, 10)), "soil")
+
+    def setup(self):
+        farmers = self.agents.new(Farmer, 5)
+        farmers[0].link.to(farmers[1], link_name="friend")
+
+    def step(self):
+        self.agents.new(Farmer, 5)
+        self.datacollector.collect(self)
+
+
+@pytest.fixture(name="village")
+def village_model() -> Village:
+    """运行四个时间步的村庄"""
+    return Village(
+        parameters={"time": {"end": 3}, "reports": {"model": {"n": "n_farmers"}}},
+        seed=1,
+    )
+
+
+def test_deep_sizeof():
+    """深层大小包含容器的元素，大容器按样本估计"""
+    array = np.zeros(1000)
+    assert deep_sizeof(array) >= array.nbytes
+    assert deep_sizeof([array, array]) < 2 * array.nbytes
+    items = [str(i) * 10 for i in range(10_000)]
+    exact = deep_sizeof(items, sample=len(items))
+    assert deep_sizeof(items, sample=50) == pytest.approx(exact, rel=0.2)
+
+
+class TestMemoryReport:
+    """测试内存报告"""
+
+    def test_report(self, village: Village):
+        """报告各部分的数量和字节数"""
+        village.n_farmers = 0
+        village.run_model()
+        report = village.memory_report()
+        assert report.index.names == ["kind", "name", "part"]
+        assert list(report.columns) == ["count", "bytes"]
+        assert report.loc[("layer", "land", "cells"), "count"] == 100
+        assert report.loc[("layer", "land", "attributes"), "count"] == 1
+        farmers = report.loc[("breed", "Farmer", "actors")]
+        assert farmers["count"] == 25
+        assert farmers["bytes"] >= 25 * np.zeros(100).nbytes
+        assert report.loc[("link", "friend", "store"), "count"] == 1
+        assert report.loc[("collector", "model", "records"), "count"] == 4
+        assert (report["bytes"] > 0).all()
+
+
+class TestMemoryWatcher:
+    """测试内存峰值和阈值"""
+
+    def test_high_water_mark(self, village: Village):
+        """记录每个时间步的内存和峰值"""
+        village.n_farmers = 0
+        watcher = village.watch_memory(every=2)
+        village.run_model()
+        measures = watcher.to_frame()
+        assert list(measures.index) == [2, 4]
+        assert watcher.peak == measures["bytes"].max()
+        assert watcher.peak_tick == 4
+        assert village.unwatch_memory() is watcher
+        assert village.memory_watcher is None
+
+    def test_hook(self, village: Village):
+        """超过阈值时调用钩子"""
+        village.n_farmers = 0
+        exceeded = []
+        village.watch_memory(threshold=1, on_exceed=lambda m, n: exceeded.append(n))
+        village.run_model()
+        assert len(exceeded) == village.time.tick
+
+    def test_stop_and_raise(self, village: Village):
+        """超过阈值时停止模型或者抛出异常"""
+        village.n_farmers = 0
+        village.watch_memory(threshold=1, on_exceed="stop")
+        village.run_model()
+        assert village.time.tick == 1
+        village.running = True
+        village.watch_memory(threshold=1, on_exceed="raise")
+        with pytest.raises(MemoryError, match="exceeds"):
+            village.run_model(steps=1)
+
+    def test_tracemalloc(self, village: Village):
+        """用 tracemalloc 测量内存"""
+        village.n_farmers = 0
+        watcher = village.watch_memory(method="tracemalloc")
+        village.run_model()
+        village.unwatch_memory()
+        assert watcher.peak > 0
+        assert len(watcher.to_frame()) == village.time.tick
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [{"method": "psutil"}, {"on_exceed": "ignore"}, {"every": 0}],
+    )
+    def test_invalid(self, village: Village, kwargs):
+        """不合法的参数"""
+        with pytest.raises(ValueError):
+            MemoryWatcher(village, **kwargs)
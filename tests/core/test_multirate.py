@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试模块的运行频率。
+1. 每隔若干时间步、或按日历规则运行的模块
+2. 未声明频率的模块不被自动运行；频率可以来自参数
+3. 未到期的子系统被跳过
+4. 非法的频率报错
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from abses import MainModel
+from abses.human.human import HumanModule
+
+
+class Survey(HumanModule):
+    """每三个时间步调查一次"""
+
+    step_every = 3
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.ticks = []
+        self.days = []
+
+    def step(self):
+        self.ticks.append(self.time.tick)
+        self.days.append(self.time.dt.day)
+
+
+class Idle(HumanModule):
+    """没有声明频率的模块"""
+
+    def step(self):
+        raise AssertionError("Modules without frequency are not stepped.")
+
+
+class TestStepFrequency:
+    """测试模块的运行频率"""
+
+    def test_every_ticks(self):
+        """每隔若干时间步运行，并统计运行次数"""
+        model = MainModel(parameters={"time": {"end": 10}})
+        survey = model.human.create_module(name="survey", module_cls=Survey)
+        model.human.create_module(name="idle", module_cls=Idle)
+        model.run_model()
+        assert survey.ticks == [3, 6, 9]
+        assert survey.executions == 3
+        assert model.human.executions == model.time.tick
+
+    def test_calendar_rule(self):
+        """按日历规则运行，频率来自参数"""
+        model = MainModel(
+            parameters={
+                "time": {"start": "2000-01-01", "end": "2000-12-31", "days": 1},
+                "survey": {"step_every": {"day": 1}},
+            }
+        )
+        survey = model.human.create_module(name="survey", module_cls=Survey)
+        model.run_model()
+        assert survey.executions == 11
+        assert set(survey.days) == {1}
+
+    def test_closed_or_changed(self):
+        """关闭的模块不运行；修改频率后重新解析"""
+        model = MainModel(parameters={"time": {"end": 6}})
+        survey = model.human.create_module(name="survey", module_cls=Survey)
+        survey.reset(opening=False)
+        model.run_model(steps=3)
+        assert survey.executions == 0
+        survey.reset(opening=True)
+        survey.set_step_every(1)
+        model.run_model(steps=3)
+        assert survey.ticks == [4, 5, 6]
+
+    def test_subsystem_skipped(self):
+        """未到期的子系统被跳过"""
+        model = MainModel(parameters={"time": {"end": 8}})
+        model.nature.set_step_every(4)
+        model.run_model()
+        assert model.nature.executions == model.time.tick // 4
+        assert model.human.executions == model.time.tick
+
+    @pytest.mark.parametrize(
+        "every, error",
+        [(0, ValueError), (True, TypeError), ("daily", TypeError)],
+    )
+    def test_invalid(self, every, error):
+        """非法的频率"""
+        model = MainModel()
+        with pytest.raises(error, match="Step frequency"):
+            model.human.set_step_every(every)
@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试参数快照。
+1. 只读快照的读取方式与 `DictConfig` 一致
+2. 模型运行时，参数按类和名称解析一次；运行之外仍是 `DictConfig`
+3. 运行时修改设置后刷新参数
+4. 读取参数的微基准（heavy，默认跳过）
+"""
+
+from __future__ import annotations
+
+import pickle
+from time import perf_counter
+
+import pytest
+from omegaconf import DictConfig, OmegaConf
+
+from abses import Actor, MainModel
+from abses.utils import FrozenParams
+
+
+class Sheep(Actor):
+    """每步读取参数的羊"""
+
+    def step(self):
+        self.rate = self.model.params.get("rep_rate")
+        self.energy = self.params.energy
+
+
+@pytest.fixture(name="model")
+def sheep_model() -> MainModel:
+    """有参数的模型"""
+    return MainModel(
+        parameters={
+            "model": {"rep_rate": 0.04},
+            "Sheep": {"energy": 3, "diet": ["grass", {"name": "${model.rep_rate}"}]},
+            "time": {"end": 3},
+        }
+    )
+
+
+def test_frozen_params():
+    """读取方式、嵌套、不可修改、比较和序列化"""
+    params = FrozenParams(DictConfig({"a": {"b": [1, {"c": 2}]}, "d": None}))
+    assert params.a.b[1].c == params["a"]["b"][1]["c"] == 2
+    assert params.get("e", 5) == 5 and params.d is None
+    assert "a" in params and len(params) == 2
+    assert params == {"a": {"b": [1, {"c": 2}]}, "d": None}
+    assert pickle.loads(pickle.dumps(params)) == params
+    with pytest.raises(AttributeError, match="Missing parameter"):
+        _ = params.e
+    with pytest.raises(AttributeError, match="frozen"):
+        params.d = 1
+
+
+class TestParamsSnapshot:
+    """测试运行时的参数快照"""
+
+    def test_frozen_while_running(self, model: MainModel):
+        """运行时参数是按类和名称缓存的快照"""
+        sheep = model.agents.new(Sheep, 2)
+        snapshots = []
+        model.step = lambda: snapshots.append(
+            (model.params, sheep[0].params, sheep[1].params)
+        )
+        model.run_model(steps=2)
+        model_params, params, other = snapshots[0]
+        assert isinstance(params, FrozenParams)
+        assert params is other and snapshots[1][1] is params
+        assert model_params.rep_rate == 0.04
+        assert params.diet == ("grass", {"name": 0.04})
+        assert isinstance(sheep[0].params, DictConfig)
+
+    def test_refresh(self, model: MainModel):
+        """运行时修改设置后，刷新参数"""
+        sheep = model.agents.new(Sheep, singleton=True)
+
+        def step():
+            sheep.step()
+            OmegaConf.update(model.settings, "model.rep_rate", 0.5)
+            OmegaConf.update(model.settings, "Sheep.energy", 4)
+            assert model.params.rep_rate == 0.04
+            sheep.refresh_params()
+            assert sheep.params.energy == 4
+            assert model.params.rep_rate == 0.04
+            model.refresh_params()
+            assert model.params.rep_rate == 0.5
+
+        model.step = step
+        model.run_model(steps=1)
+
+
+def test_params_access_heavy(model: MainModel):
+    """读取快照比读取 DictConfig 快得多"""
+    sheep = model.agents.new(Sheep, 10_000)
+    start = perf_counter()
+    sheep.do("step")
+    slow = perf_counter() - start
+    model._params_cache = {}
+    start = perf_counter()
+    sheep.do("step")
+    fast = perf_counter() - start
+    print(f"\nParams of 10k actors: DictConfig {slow:.3f}s, snapshot {fast:.3f}s")
+    assert fast * 5 < slow
@@ -0,0 +1,154 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试步骤性能分析器。
+1. 默认不启用，不记录任何时间
+2. 按阶段、模块、主体种类和方法记录调用次数和耗时
+3. 每个时间步把耗时作为指标写入追踪器
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Tuple
+
+import numpy as np
+import pytest
+
+from abses import Actor, MainModel
+from abses.agents import sequences
+from abses.core.profiler import StepProfiler
+from abses.human.human import HumanModule
+from abses.utils.tracker.default import DefaultTracker
+
+
+class Sheep(Actor):
+    """吃草的羊"""
+
+    def graze(self):
+        """吃草"""
+
+
+class Wolf(Actor):
+    """狼"""
+
+    def graze(self):
+        """狼不吃草"""
+
+
+class Counter(HumanModule):
+    """让所有主体吃草的模块"""
+
+    step_every = 1
+
+    def step(self):
+        self.model.agents.shuffle_do("graze")
+
+
+class Farm(MainModel):
+    """每个时间步让所有主体行动的模型"""
+
+    def initialize(self):
+        self.human.create_module(name="counter", module_cls=Counter)
+        land = self.nature.create_module(name="land", shape=(3, 3))
+        land.apply_raster(np.ones((1, 3, 3)), "grass")
+
+    def setup(self):
+        self.agents.new(Sheep, 3)
+        self.agents.new(Wolf, 2)
+
+    def step(self):
+        self.nature.land.get_raster("grass")
+        self.datacollector.collect(self)
+
+
+class FakeTracker(DefaultTracker):
+    """记录指标的追踪器"""
+
+    def __init__(self):
+        self.metrics: List[Tuple[int, Dict[str, float]]] = []
+
+    def log_metrics(self, metrics, step=None):
+        self.metrics.append((step, metrics))
+
+
+@pytest.fixture(name="farm")
+def farm_model() -> Farm:
+    """运行四个时间步的模型"""
+    return Farm(parameters={"time": {"end": 3}}, seed=1)
+
+
+class TestStepProfiler:
+    """测试性能分析器"""
+
+    def test_disabled(self, farm: Farm, monkeypatch):
+        """默认不启用，也不为每个主体计时"""
+        assert farm.profiler is None
+        monkeypatch.setattr(
+            sequences, "perf_counter_ns", lambda: pytest.fail("timed an actor")
+        )
+        farm.agents.defer_removal = True
+        farm.run_model()
+        assert farm.disable_profiler() is None
+
+    def test_start_stop(self, farm: Farm):
+        """成对的开始和结束记录一次调用"""
+        profiler = farm.enable_profiler()
+        start = profiler.start()
+        profiler.stop("method", "block", start)
+        profiler.stop("method", "block", profiler.start())
+        assert profiler.record_of(("method", "block"))[1] == 2
+
+    def test_timings(self, farm: Farm):
+        """记录各阶段、模块、种类和方法"""
+        profiler = farm.enable_profiler()
+        assert isinstance(profiler, StepProfiler)
+        assert farm.enable_profiler() is profiler
+        farm.run_model()
+        steps = farm.time.tick
+        timings = profiler.to_frame()
+        assert list(timings.columns) == ["calls", "total_time", "mean_time"]
+        assert timings.index.names == ["kind", "name"]
+        assert timings.loc[("phase", "model.step"), "calls"] == steps
+        assert timings.loc[("phase", "model.setup"), "calls"] == 1
+        assert timings.loc[("module", "counter"), "calls"] == steps
+        assert timings.loc[("breed", "Sheep.graze"), "calls"] == 3 * steps
+        assert timings.loc[("breed", "Wolf.graze"), "calls"] == 2 * steps
+        assert timings.loc[("method", "PatchModule.get_raster"), "calls"] == steps
+        assert ("method", "PatchModule.apply_raster") not in timings.index
+        assert timings.loc[("method", "datacollector.collect"), "calls"] == steps
+        assert (timings["total_time"] >= 0).all()
+        assert timings["total_time"].is_monotonic_decreasing
+
+    def test_do_by_breed(self, farm: Farm):
+        """按种类调度时，调用次数是主体数量"""
+        farm.do_each("setup")
+        profiler = farm.enable_profiler()
+        farm.agents.do_by_breed("graze", order=[Sheep])
+        assert profiler.to_frame().loc[("breed", "Sheep.graze"), "calls"] == 3
+
+    def test_disable_and_reset(self, farm: Farm):
+        """停止后不再记录，重置后清空"""
+        profiler = farm.enable_profiler()
+        farm.run_model(steps=1)
+        assert farm.disable_profiler() is profiler
+        n_records = len(profiler.to_frame())
+        farm.run_model(steps=1)
+        assert len(profiler.to_frame()) == n_records
+        profiler.reset()
+        assert profiler.to_frame().empty
+
+    def test_stream(self, farm: Farm):
+        """每个时间步把本步的耗时写入追踪器"""
+        tracker = FakeTracker()
+        farm.datacollector.tracker = tracker
+        farm.enable_profiler(stream=True)
+        farm.run_model()
+        assert [step for step, _ in tracker.metrics] == [1, 2, 3, 4]
+        _, metrics = tracker.metrics[-1]
+        assert "profile/module/counter" in metrics
+        assert "profile/breed/Sheep.graze" in metrics
+        assert "profile/phase/model.setup" not in metrics
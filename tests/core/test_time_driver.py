@@ -6,6 +6,8 @@
 # Website: https://cv.songshgeo.com/
 
 
+import numpy as np
+import pandas as pd
 import pendulum
 import pytest
 
@@ -254,3 +256,70 @@ class TestTimeComparison:
         """
         other_dt = parse_datetime(other_time)  # 使用我们自己的parse_datetime
         assert (yearly_time_driver > other_dt) == expected
+
+
+class TestCalendar:
+    """测试预先计算的日历"""
+
+    @pytest.mark.parametrize(
+        "config",
+        [
+            "time_config_year_start_end",
+            "time_config_month_start_end_duration",
+            "time_config_day_start_end_duration",
+        ],
+    )
+    def test_calendar_matches_progression(self, config, request):
+        """日历与逐步推进的时间一致，预期步数精确"""
+        driver = TimeDriver(MainModel({"time": request.getfixturevalue(config)}))
+        calendar = driver.calendar
+        assert driver.expected_ticks == len(calendar) - 1
+        ticks = 0
+        while not driver.should_end:
+            driver.go()
+            ticks += 1
+            expected = pendulum.instance(
+                pd.Timestamp(calendar.datetimes[ticks]).to_pydatetime()
+            )
+            assert driver.dt == expected.naive()
+        assert ticks == len(calendar) - 1
+        assert driver.expected_ticks == 0
+
+    def test_calendar_fields(self, time_config_day_start_end_duration):
+        """日历的字段与 pendulum 的属性一致"""
+        driver = TimeDriver(MainModel({"time": time_config_day_start_end_duration}))
+        calendar = driver.calendar
+        for tick in (0, 7, len(calendar) - 1):
+            dt = pendulum.instance(
+                pd.Timestamp(calendar.datetimes[tick]).to_pydatetime()
+            )
+            for field in ("year", "day", "day_of_week", "day_of_year", "week_of_year"):
+                assert calendar.field(field)[tick] == getattr(dt, field)
+        with pytest.raises(KeyError):
+            calendar.field("freqstr")
+        assert calendar.mask({"freqstr": "D"}) is None
+
+    def test_jump_and_tick_mode(self, yearly_time_driver, time_config_tick_end):
+        """跳转后在日历中定位，不在日历中时重新计算；刻度模式没有日历"""
+        calendar = yearly_time_driver.calendar
+        yearly_time_driver.to("2010")
+        assert yearly_time_driver.calendar is calendar
+        assert yearly_time_driver.expected_ticks == 10
+        assert yearly_time_driver.match({"year": 2010})
+        yearly_time_driver.to("2010-06")
+        assert yearly_time_driver.calendar is not calendar
+        assert yearly_time_driver.expected_ticks == 10
+        assert TimeDriver(MainModel({"time": time_config_tick_end})).calendar is None
+
+    def test_history(self, yearly_time_driver):
+        """历史记录的类型与从 DateTime 对象构建时一致"""
+        yearly_time_driver.go(3)
+        history = yearly_time_driver.history
+        assert len(history) == 3
+        assert history.iloc[-1] == pendulum.datetime(2003, 1, 1).naive()
+        expected = pd.Series([pendulum.datetime(2003, 1, 1).naive()])
+        assert history.dtype == expected.dtype == "datetime64[ns]"
+        assert isinstance(history.iloc[-1], pd.Timestamp)
+        assert history.iloc[-1].year == 2003
+        # 历史记录是视图，不复制
+        assert np.shares_memory(history.to_numpy(), yearly_time_driver._history)
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+# -*-coding:utf-8 -*-
+# @Author  : Shuang (Twist) Song
+# @Contact   : SongshGeo@gmail.com
+# GitHub   : https://github.com/SongshGeo
+# Website: https://cv.songshgeo.com/
+
+"""测试导入 `abses` 的耗时（`python -X importtime`）。
+1. 使用模型和主体时，不导入可选的重依赖
+2. ABSESpy 自身模块的导入耗时不超过预算
+3. 公开名称在首次访问时导入
+"""
+
+from __future__ import annotations
+
+import subprocess
+import sys
+from typing import Dict
+
+import pytest
+
+import abses
+
+# 仅在绘图、实验、栅格/矢量读写时才需要的依赖
+DEFERRED = (
+    "matplotlib",
+    "seaborn",
+    "hydra",
+    "xarray",
+    "rioxarray",
+    "geocube",
+    "netCDF4",
+)
+# ABSESpy 自身模块导入耗时的预算（秒）
+BUDGET = 0.5
+
+
+def import_times(code: str) -> Dict[str, int]:
+    """在新的解释器中运行代码，返回各模块导入的自身耗时（微秒）"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, _, name = line.split(":", 1)[1].split("|")
+        times[name.strip()] = int(self_us)
+    return times
+
+
+@pytest.fixture(scope="module", name="times")
+def core_import_times() -> Dict[str, int]:
+    """创建模型和主体时的导入耗时"""
+    return import_times(
+        "from abses import MainModel, Actor\n"
+        "model = MainModel()\n"
+        "model.agents.new(Actor, 2)\n"
+        "model.nature.create_module(shape=(3, 3))"
+    )
+
+
+def test_deferred_dependencies(times: Dict[str, int]):
+    """使用模型和主体时，不导入重依赖"""
+    loaded = {name.split(".")[0] for name in times}
+    assert loaded.isdisjoint(DEFERRED), loaded.intersection(DEFERRED)
+
+
+def test_import_budget(times: Dict[str, int]):
+    """ABSESpy 自身模块的导入耗时"""
+    own = sum(t for name, t in times.items() if name.split(".")[0] == "abses")
+    assert own / 1e6 < BUDGET
+
+
+def test_lazy_names():
+    """公开名称在首次访问时导入"""
+    assert "Experiment" in dir(abses)
+    assert abses.Experiment.__name__ == "Experiment"
+    with pytest.raises(AttributeError, match="no attribute"):
+        _ = abses.Unknown